@@ -0,0 +1,328 @@
+"""
+Partition climate_data by year (declarative RANGE) with BRIN date index.
+
+Revision ID: 003_partition_climate
+Revises: 002_regional_coverage
+Create Date: 2026-10-16
+
+Esta migration converte climate_data (heap único) em tabela particionada:
+
+1. climate_data PARTITION BY RANGE (date), uma partição por ano
+   (climate_data_y1981, climate_data_y1982, ...)
+2. Índice BRIN em date (dados chegam em ordem cronológica por
+   localização; o BRIN ocupa KBs onde o B-tree ocupava centenas de MB)
+3. B-trees (latitude, longitude, date) e (source_api, date) e a chave
+   única uq_climate_data_location_date, agora por partição
+4. Função ensure_climate_data_partition(date): cria a partição do ano
+   sob demanda (chamada pelo data_storage antes de gravar)
+5. Dados existentes copiados para as novas partições
+
+Benefícios:
+- get_climate_data (filtro por período) lê só as partições do período
+- Retenção por DROP de partição inteira em vez de DELETE linha a linha
+
+Sub-particionamento por source_api não foi adotado: multiplicaria as
+partições por 6 sem ganho nas consultas atuais, que sempre filtram por
+período e quase nunca por fonte isolada.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = "003_partition_climate"
+down_revision = "002_regional_coverage"
+branch_labels = None
+depends_on = None
+
+
+ENSURE_PARTITION_FUNCTION = """
+CREATE OR REPLACE FUNCTION public.ensure_climate_data_partition(p_day date)
+RETURNS text AS $$
+DECLARE
+    v_year integer := extract(year FROM p_day)::integer;
+    v_name text := format('climate_data_y%s', v_year);
+BEGIN
+    -- Caminho comum: partição já existe, sem lock no pai
+    IF to_regclass(format('public.%I', v_name)) IS NULL THEN
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS public.%I '
+                'PARTITION OF public.climate_data '
+                'FOR VALUES FROM (%L) TO (%L)',
+                v_name,
+                make_date(v_year, 1, 1),
+                make_date(v_year + 1, 1, 1)
+            );
+        EXCEPTION WHEN duplicate_table OR unique_violation THEN
+            -- Outra transação criou a mesma partição ao mesmo tempo
+            NULL;
+        END;
+    END IF;
+    RETURN v_name;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def _climate_data_columns(id_column: sa.Column) -> list:
+    """Colunas de climate_data (iguais às da migration 001)."""
+    return [
+        id_column,
+        sa.Column(
+            "source_api",
+            sa.String(50),
+            nullable=False,
+            comment=(
+                "Fonte dos dados: nasa_power, openmeteo_archive, "
+                "openmeteo_forecast, met_norway, nws_forecast, nws_stations"
+            ),
+        ),
+        sa.Column("latitude", sa.Float, nullable=False),
+        sa.Column("longitude", sa.Float, nullable=False),
+        sa.Column(
+            "elevation",
+            sa.Float,
+            nullable=True,
+            comment="Elevação em metros (crucial para ETo)",
+        ),
+        sa.Column(
+            "timezone",
+            sa.String(50),
+            nullable=True,
+            comment="Timezone IANA (ex: America/Sao_Paulo)",
+        ),
+        sa.Column("date", sa.Date, nullable=False),
+        sa.Column(
+            "raw_data",
+            postgresql.JSONB,
+            nullable=False,
+            comment="Dados brutos da API original",
+        ),
+        sa.Column(
+            "harmonized_data",
+            postgresql.JSONB,
+            nullable=True,
+            comment="Dados normalizados para formato padrão",
+        ),
+        sa.Column(
+            "eto_mm_day",
+            sa.Float,
+            nullable=True,
+            comment="ETo calculado em mm/dia",
+        ),
+        sa.Column(
+            "eto_method",
+            sa.String(50),
+            nullable=True,
+            comment="Método: penman_monteith, hargreaves, etc.",
+        ),
+        sa.Column(
+            "quality_flags",
+            postgresql.JSONB,
+            nullable=True,
+            comment="Flags de qualidade dos dados",
+        ),
+        sa.Column(
+            "processing_metadata",
+            postgresql.JSONB,
+            nullable=True,
+            comment="Metadados sobre o processamento",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime,
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime,
+            server_default=sa.func.now(),
+            onupdate=sa.func.now(),
+            nullable=True,
+        ),
+    ]
+
+
+_COLUMN_LIST = (
+    "id, source_api, latitude, longitude, elevation, timezone, date, "
+    "raw_data, harmonized_data, eto_mm_day, eto_method, quality_flags, "
+    "processing_metadata, created_at, updated_at"
+)
+
+
+def upgrade() -> None:
+    """
+    Troca climate_data por uma tabela particionada por ano.
+
+    A tabela antiga é renomeada (climate_data_legacy), os dados são
+    copiados para as partições e a antiga é removida. A sequence do id
+    é reaproveitada, então os ids existentes são preservados.
+    """
+    print("\n🗂️  Particionando climate_data por ano...")
+
+    # 1. Libera nomes da tabela antiga (índices, constraints, sequence)
+    op.execute("ALTER TABLE public.climate_data RENAME TO climate_data_legacy")
+    op.execute(
+        "ALTER TABLE public.climate_data_legacy "
+        "RENAME CONSTRAINT climate_data_pkey TO climate_data_legacy_pkey"
+    )
+    op.execute(
+        "ALTER TABLE public.climate_data_legacy "
+        "RENAME CONSTRAINT uq_climate_data_location_date "
+        "TO uq_climate_data_legacy_location_date"
+    )
+    for index_name in (
+        "idx_climate_data_source",
+        "idx_climate_data_location",
+        "idx_climate_data_date",
+        "idx_climate_data_source_date",
+    ):
+        op.drop_index(index_name, table_name="climate_data_legacy")
+    op.execute("ALTER SEQUENCE public.climate_data_id_seq OWNED BY NONE")
+
+    # 2. Tabela particionada (PK e UNIQUE precisam conter a chave date)
+    op.create_table(
+        "climate_data",
+        *_climate_data_columns(
+            sa.Column(
+                "id",
+                sa.Integer,
+                server_default=sa.text(
+                    "nextval('public.climate_data_id_seq'::regclass)"
+                ),
+                nullable=False,
+            )
+        ),
+        sa.PrimaryKeyConstraint("id", "date", name="climate_data_pkey"),
+        sa.UniqueConstraint(
+            "source_api",
+            "latitude",
+            "longitude",
+            "date",
+            name="uq_climate_data_location_date",
+        ),
+        postgresql_partition_by="RANGE (date)",
+    )
+    op.execute(
+        "ALTER SEQUENCE public.climate_data_id_seq "
+        "OWNED BY public.climate_data.id"
+    )
+
+    # 3. Índices particionados (propagados para cada partição)
+    op.create_index(
+        "idx_climate_data_date_brin",
+        "climate_data",
+        ["date"],
+        postgresql_using="brin",
+    )
+    op.create_index(
+        "idx_climate_data_location",
+        "climate_data",
+        ["latitude", "longitude", "date"],
+    )
+    op.create_index(
+        "idx_climate_data_source_date", "climate_data", ["source_api", "date"]
+    )
+
+    # 4. Criação automática de partições
+    op.execute(ENSURE_PARTITION_FUNCTION)
+
+    # 5. Partições dos anos existentes + ano corrente e seguinte
+    op.execute(
+        """
+        SELECT public.ensure_climate_data_partition(make_date(y, 1, 1))
+        FROM (
+            SELECT DISTINCT extract(year FROM date)::integer AS y
+            FROM public.climate_data_legacy
+            UNION
+            SELECT extract(year FROM current_date)::integer
+            UNION
+            SELECT extract(year FROM current_date)::integer + 1
+        ) AS years
+        """
+    )
+
+    # 6. Cópia dos dados e remoção da tabela antiga
+    op.execute(
+        f"INSERT INTO public.climate_data ({_COLUMN_LIST}) "
+        f"SELECT {_COLUMN_LIST} FROM public.climate_data_legacy"
+    )
+    op.drop_table("climate_data_legacy")
+    op.execute("ANALYZE public.climate_data")
+
+    print("✅ climate_data particionada por ano (BRIN em date)")
+
+
+def downgrade() -> None:
+    """Volta climate_data para um heap único (layout da migration 001)."""
+    print("\n❌ Removendo particionamento de climate_data...")
+
+    op.execute(
+        "ALTER TABLE public.climate_data RENAME TO climate_data_partitioned"
+    )
+    op.execute(
+        "ALTER TABLE public.climate_data_partitioned "
+        "RENAME CONSTRAINT climate_data_pkey "
+        "TO climate_data_partitioned_pkey"
+    )
+    op.execute(
+        "ALTER TABLE public.climate_data_partitioned "
+        "RENAME CONSTRAINT uq_climate_data_location_date "
+        "TO uq_climate_data_partitioned_location_date"
+    )
+    for index_name in (
+        "idx_climate_data_date_brin",
+        "idx_climate_data_location",
+        "idx_climate_data_source_date",
+    ):
+        op.drop_index(index_name, table_name="climate_data_partitioned")
+    op.execute("ALTER SEQUENCE public.climate_data_id_seq OWNED BY NONE")
+
+    op.create_table(
+        "climate_data",
+        *_climate_data_columns(
+            sa.Column(
+                "id",
+                sa.Integer,
+                server_default=sa.text(
+                    "nextval('public.climate_data_id_seq'::regclass)"
+                ),
+                primary_key=True,
+            )
+        ),
+        sa.UniqueConstraint(
+            "source_api",
+            "latitude",
+            "longitude",
+            "date",
+            name="uq_climate_data_location_date",
+        ),
+    )
+    op.execute(
+        "ALTER SEQUENCE public.climate_data_id_seq "
+        "OWNED BY public.climate_data.id"
+    )
+
+    op.execute(
+        f"INSERT INTO public.climate_data ({_COLUMN_LIST}) "
+        f"SELECT {_COLUMN_LIST} FROM public.climate_data_partitioned"
+    )
+    # Remove o pai e todas as partições
+    op.drop_table("climate_data_partitioned")
+    op.execute(
+        "DROP FUNCTION IF EXISTS public.ensure_climate_data_partition(date)"
+    )
+
+    op.create_index("idx_climate_data_source", "climate_data", ["source_api"])
+    op.create_index(
+        "idx_climate_data_location", "climate_data", ["latitude", "longitude"]
+    )
+    op.create_index("idx_climate_data_date", "climate_data", ["date"])
+    op.create_index(
+        "idx_climate_data_source_date", "climate_data", ["source_api", "date"]
+    )
+
+    print("✅ climate_data voltou a ser uma tabela única")
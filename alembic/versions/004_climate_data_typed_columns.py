@@ -0,0 +1,93 @@
+"""
+Add typed generated columns for the harmonized core variables.
+
+Revision ID: 004_climate_typed_columns
+Revises: 003_partition_climate
+Create Date: 2026-10-16
+
+As variáveis do ETo ficam só dentro de harmonized_data (JSONB); qualquer
+agregação precisa extrair JSON linha a linha. Esta migration adiciona:
+
+1. Colunas double precision GENERATED ALWAYS AS (...) STORED, extraídas
+   de harmonized_data (nomes padronizados de api_variables):
+   temp_max_c, temp_min_c, humidity_percent, wind_speed_ms,
+   solar_radiation_mjm2, precipitation_mm
+2. Índice de cobertura (latitude, longitude, date) INCLUDE (fonte,
+   variáveis, eto_mm_day): leitura por localização/período via
+   index-only scan, sem tocar o JSONB
+
+As colunas são calculadas pelo PostgreSQL em todo INSERT/UPDATE, então
+nenhum caminho de gravação (ORM ou COPY + upsert) precisa mudar.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = "004_climate_typed_columns"
+down_revision = "003_partition_climate"
+branch_labels = None
+depends_on = None
+
+
+# coluna -> chaves aceitas em harmonized_data (a primeira presente vale;
+# os scripts de sincronização antigos usam nomes sem sufixo de unidade)
+TYPED_COLUMNS = {
+    "temp_max_c": ("temp_max_c", "temp_max"),
+    "temp_min_c": ("temp_min_c", "temp_min"),
+    "humidity_percent": ("humidity_percent", "relative_humidity_mean"),
+    "wind_speed_ms": ("wind_speed_ms", "wind_speed_2m_mean"),
+    "solar_radiation_mjm2": ("solar_radiation_mjm2", "solar_radiation"),
+    "precipitation_mm": ("precipitation_mm", "precipitation_sum_mm"),
+}
+
+
+def _number_expr(keys) -> str:
+    """Extrai o primeiro valor numérico entre `keys` (NULL se nenhum)."""
+    parts = [
+        f"CASE WHEN jsonb_typeof(harmonized_data -> '{key}') = 'number' "
+        f"THEN (harmonized_data ->> '{key}')::double precision END"
+        for key in keys
+    ]
+    return f"COALESCE({', '.join(parts)})"
+
+
+def upgrade() -> None:
+    """Adiciona as colunas geradas e o índice de cobertura."""
+    print("\n🔢 Adicionando colunas numéricas geradas em climate_data...")
+
+    # Um único ALTER TABLE: uma única reescrita das partições
+    add_columns = ",\n".join(
+        f"ADD COLUMN {column} double precision "
+        f"GENERATED ALWAYS AS ({_number_expr(keys)}) STORED"
+        for column, keys in TYPED_COLUMNS.items()
+    )
+    op.execute(f"ALTER TABLE public.climate_data\n{add_columns}")
+
+    op.drop_index("idx_climate_data_location", table_name="climate_data")
+    op.create_index(
+        "idx_climate_data_location",
+        "climate_data",
+        ["latitude", "longitude", "date"],
+        postgresql_include=[
+            "source_api",
+            *TYPED_COLUMNS,
+            "eto_mm_day",
+        ],
+    )
+    op.execute("ANALYZE public.climate_data")
+
+    print("✅ Colunas numéricas e índice de cobertura criados")
+
+
+def downgrade() -> None:
+    """Remove as colunas geradas e volta ao índice simples."""
+    op.drop_index("idx_climate_data_location", table_name="climate_data")
+    op.create_index(
+        "idx_climate_data_location",
+        "climate_data",
+        ["latitude", "longitude", "date"],
+    )
+    drop_columns = ",\n".join(
+        f"DROP COLUMN IF EXISTS {column}" for column in TYPED_COLUMNS
+    )
+    op.execute(f"ALTER TABLE public.climate_data\n{drop_columns}")
@@ -0,0 +1,49 @@
+"""
+Add visitor_hourly_stats time series.
+
+Revision ID: 005_visitor_hourly_stats
+Revises: 004_climate_typed_columns
+Create Date: 2026-10-16
+
+O contador de visitantes grava buckets por hora no Redis (INCR de page
+views + HyperLogLog de únicos); a task sync_visitor_data consolida as
+últimas horas nesta tabela com um único INSERT ... ON CONFLICT (bucket).
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers
+revision = "005_visitor_hourly_stats"
+down_revision = "004_climate_typed_columns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Cria a série horária de visitas."""
+    op.create_table(
+        "visitor_hourly_stats",
+        sa.Column("bucket", sa.DateTime, primary_key=True),
+        sa.Column(
+            "page_views", sa.Integer, nullable=False, server_default="0"
+        ),
+        sa.Column(
+            "unique_visitors",
+            sa.Integer,
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime,
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+    print("✅ Tabela visitor_hourly_stats criada")
+
+
+def downgrade() -> None:
+    """Remove a série horária de visitas."""
+    op.drop_table("visitor_hourly_stats")
@@ -1,45 +1,143 @@
 """
 Middleware para monitoramento de requisições.
+
+ASGI puro (sem BaseHTTPMiddleware): não cria task nem stream por
+request, só embrulha `send`/`receive` para medir status e tamanhos.
+
+- endpoint: template da rota casada (ex.:
+  "/api/v1/geolocation/visitor/{visitor_id}"), lido de scope["route"]
+  depois do roteamento (Route/Mount puros do Starlette, como /metrics e
+  os assets estáticos, são achados pelo endpoint); caminhos sem rota
+  caem em UNMATCHED_ENDPOINT. As séries ficam limitadas ao número de
+  rotas
+- Requisições em andamento: por método (o template só é conhecido
+  depois do roteamento; resolvê-lo antes exigiria rotear duas vezes)
+- Tamanhos de request/response em bytes (corpo efetivamente lido e
+  enviado, não o Content-Length declarado)
+
+Esta é a única camada de instrumentação HTTP; /metrics é servido por
+metrics_endpoint.
 """
 
+import os
 import time
-from collections.abc import Callable
+from typing import Optional
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+)
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import BaseRoute, Mount
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from backend.api.middleware.prometheus_metrics import (
     API_ACTIVE_REQUESTS,
     API_REQUEST_DURATION,
+    API_REQUEST_SIZE,
     API_REQUESTS,
+    API_RESPONSE_SIZE,
 )
 
+# Label de caminhos que não casaram com nenhuma rota (404, scanners)
+UNMATCHED_ENDPOINT = "<unmatched>"
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        method = request.method
-        path = request.url.path
 
-        # Incrementar contador de requisições ativas
-        API_ACTIVE_REQUESTS.labels(method=method, endpoint=path).inc()
+def route_template(scope: Scope) -> str:
+    """Template da rota casada pelo roteador (ou UNMATCHED_ENDPOINT)."""
+    route = scope.get("route") or _matched_route(scope)
+    return getattr(route, "path_format", None) or UNMATCHED_ENDPOINT
 
-        # Medir tempo de resposta
-        start_time = time.time()
 
-        try:
-            response = await call_next(request)
+def _matched_route(scope: Scope) -> Optional[BaseRoute]:
+    """
+    Rota pelo endpoint que o roteador deixou no scope.
+
+    Até o Starlette 0.49 só a APIRoute do FastAPI grava scope["route"];
+    Route (app.add_route) e Mount (StaticFiles) deixam apenas "endpoint".
+    """
+    endpoint = scope.get("endpoint")
+    router = scope.get("router")
+    if endpoint is None or router is None:
+        return None
+    for route in router.routes:
+        if getattr(route, "endpoint", None) is endpoint or (
+            isinstance(route, Mount) and route.app is endpoint
+        ):
+            return route
+    return None
+
+
+class PrometheusMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        request_size = 0
+        response_size = 0
 
-            # Registrar métricas
+        async def receive_wrapper() -> Message:
+            nonlocal request_size
+            message = await receive()
+            if message["type"] == "http.request":
+                request_size += len(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        active = API_ACTIVE_REQUESTS.labels(method=method)
+        active.inc()
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start_time
+            active.dec()
+            endpoint = route_template(scope)
             API_REQUESTS.labels(
-                method=method, endpoint=path, status_code=response.status_code
+                method=method, endpoint=endpoint, status_code=status_code
             ).inc()
-
-            API_REQUEST_DURATION.labels(method=method, endpoint=path).observe(
-                time.time() - start_time
+            API_REQUEST_DURATION.labels(
+                method=method, endpoint=endpoint
+            ).observe(duration)
+            API_REQUEST_SIZE.labels(method=method, endpoint=endpoint).observe(
+                request_size
+            )
+            API_RESPONSE_SIZE.labels(method=method, endpoint=endpoint).observe(
+                response_size
             )
 
-            return response
 
-        finally:
-            # Decrementar contador de requisições ativas
-            API_ACTIVE_REQUESTS.labels(method=method, endpoint=path).dec()
+def _registry() -> CollectorRegistry:
+    """Registry padrão ou, com vários workers, o agregado multiprocess."""
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+    from prometheus_client import multiprocess
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Exposição das métricas no formato texto do Prometheus."""
+    return Response(
+        generate_latest(_registry()), media_type=CONTENT_TYPE_LATEST
+    )
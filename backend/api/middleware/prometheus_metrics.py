@@ -24,7 +24,24 @@ API_REQUEST_DURATION = Histogram(
 API_ACTIVE_REQUESTS = Gauge(
     "api_active_requests",
     "Number of currently active requests",
+    ["method"],
+)
+
+# Tamanhos em bytes: 100 B a 10 MB
+_SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+API_REQUEST_SIZE = Histogram(
+    "api_request_size_bytes",
+    "API request body size in bytes",
     ["method", "endpoint"],
+    buckets=_SIZE_BUCKETS,
+)
+
+API_RESPONSE_SIZE = Histogram(
+    "api_response_size_bytes",
+    "API response body size in bytes",
+    ["method", "endpoint"],
+    buckets=_SIZE_BUCKETS,
 )
 
 # ============================================================================
@@ -49,6 +66,20 @@ POPULAR_DATA_ACCESSES = Counter(
     ["key"],
 )
 
+# ============================================================================
+# MÉTRICAS DO POOL DE CONEXÕES (PostgreSQL)
+# ============================================================================
+
+# DB_POOL_CAPACITY e DB_POOL_CHECKED_OUT ficam em backend.database.metrics,
+# para que a camada de banco não dependa do pacote da API.
+
+# ============================================================================
+# MÉTRICAS DO PIPELINE ETo
+# ============================================================================
+
+# ETO_STAGE_DURATION fica em backend.core.utils.stage_timer, junto dos
+# spans que o alimentam (o núcleo não depende do pacote da API).
+
 # ============================================================================
 # MÉTRICAS DO CELERY
 # ============================================================================
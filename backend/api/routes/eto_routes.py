@@ -3,13 +3,14 @@ ETo Calculation Routes
 """
 
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel, Field
 from loguru import logger
 
-from backend.database.connection import get_db
+from backend.database.connection import get_async_db
 from backend.database.models.user_favorites import UserFavorites
 
 # Importar 5 módulos de clima
@@ -20,6 +21,11 @@ from backend.api.services.climate_source_availability import (
 from backend.api.services.climate_source_manager import ClimateSourceManager
 
 # Importar task Celery para cálculos assíncronos
+from backend.infrastructure.celery.tasks.eto_batch import (
+    BATCH_CHUNK_SIZE,
+    MAX_BATCH_LOCATIONS,
+    calculate_eto_batch,
+)
 from backend.infrastructure.celery.tasks.eto_calculation import (
     calculate_eto_task,
 )
@@ -52,6 +58,28 @@ class EToCalculationRequest(BaseModel):
     elevation: Optional[float] = None
     estado: Optional[str] = None
     cidade: Optional[str] = None
+    include_timings: bool = False  # bloco "timings" (segundos por etapa)
+
+
+class EToBatchLocation(BaseModel):
+    """Local de um cálculo ETo em lote."""
+
+    lat: float
+    lng: float
+    id: Optional[str] = None  # ex.: código IBGE do município
+    elevation: Optional[float] = None
+
+
+class EToBatchRequest(BaseModel):
+    """Request para cálculo ETo em lote (mesmo período)."""
+
+    locations: List[EToBatchLocation] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_LOCATIONS
+    )
+    start_date: str
+    end_date: str
+    sources: Optional[str] = "auto"
+    period_type: Optional[str] = "dashboard"
 
 
 class LocationInfoRequest(BaseModel):
@@ -78,9 +106,7 @@ class FavoriteRequest(BaseModel):
 
 
 @eto_router.post("/calculate")
-async def calculate_eto(
-    request: EToCalculationRequest, db: Session = Depends(get_db)
-) -> Dict[str, Any]:
+async def calculate_eto(request: EToCalculationRequest) -> Dict[str, Any]:
     """
     🚀 Cálculo ETo assíncrono com progresso em tempo real.
 
@@ -209,6 +235,7 @@ async def calculate_eto(
             sources=[selected_source],  # Lista de fontes
             elevation=elevation,
             mode=operation_mode.value,  # String do modo
+            include_timings=request.include_timings,
         )
 
         task_id = task.id
@@ -253,6 +280,98 @@ async def calculate_eto(
         )
 
 
+@eto_router.post("/calculate-batch")
+async def calculate_eto_batch_route(
+    request: EToBatchRequest,
+) -> Dict[str, Any]:
+    """
+    🚀 Cálculo ETo assíncrono para vários locais (ex.: MATOPIBA inteiro).
+
+    Uma única task Celery para o lote: locais agrupados por fonte e
+    período, downloads concorrentes e cálculo FAO-56 em lote. Lotes
+    acima de BATCH_CHUNK_SIZE locais são divididos em um chord.
+
+    Fontes: "auto" escolhe por local (EUA, nórdicos e resto do mundo
+    podem usar fontes diferentes no mesmo lote); uma fonte explícita
+    vale para todos.
+
+    Monitore progresso do lote: WebSocket /ws/task_status/{task_id}
+    """
+    operation_mode = OPERATION_MODE_MAPPING.get(
+        (request.period_type or "dashboard_current").lower(),
+        OperationMode.DASHBOARD_CURRENT,
+    )
+
+    # Período validado uma vez; coordenadas, local a local
+    first = request.locations[0]
+    is_valid, validation_result = ClimateValidationService().validate_all(
+        lat=first.lat,
+        lon=first.lng,
+        start_date=request.start_date,
+        end_date=request.end_date,
+        variables=["et0_fao_evapotranspiration"],
+        source="auto",
+        mode=operation_mode.value,
+    )
+    if not is_valid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Validação falhou: {validation_result.get('errors', {})}",
+        )
+
+    validate = ClimateValidationService.validate_coordinates
+    invalid = [
+        i
+        for i, loc in enumerate(request.locations)
+        if not validate(loc.lat, loc.lng)[0]
+    ]
+    if invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Coordenadas inválidas nos locais {invalid[:20]}",
+        )
+
+    sources = None
+    if request.sources and request.sources != "auto":
+        sources = [request.sources]
+
+    try:
+        task = calculate_eto_batch.delay(
+            locations=[
+                {
+                    "lat": loc.lat,
+                    "lon": loc.lng,
+                    "id": loc.id,
+                    "elevation": loc.elevation,
+                }
+                for loc in request.locations
+            ],
+            start_date=request.start_date,
+            end_date=request.end_date,
+            sources=sources,
+            mode=operation_mode.value,
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"ETo batch failed: {str(e)}"
+        )
+
+    total = len(request.locations)
+    logger.info(f"✅ Lote ETo iniciado: {task.id} com {total} locais")
+    return {
+        "status": "accepted",
+        "task_id": task.id,
+        "message": (
+            "Cálculo ETo em lote iniciado. Use WebSocket "
+            "para acompanhar progresso."
+        ),
+        "websocket_url": f"/ws/task_status/{task.id}",
+        "total_locations": total,
+        "chunks": -(-total // BATCH_CHUNK_SIZE),
+        "operation_mode": operation_mode.value,
+    }
+
+
 @eto_router.post("/location-info")
 async def get_location_info(request: LocationInfoRequest) -> Dict[str, Any]:
     """
@@ -280,19 +399,19 @@ async def get_location_info(request: LocationInfoRequest) -> Dict[str, Any]:
 
 @eto_router.post("/favorites/add")
 async def add_favorite(
-    request: FavoriteRequest, db: Session = Depends(get_db)
+    request: FavoriteRequest, db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     ✅ Adicionar favorito.
     """
     try:
         # Verificar duplicata
-        existing = (
-            db.query(UserFavorites)
+        existing = await db.scalar(
+            select(UserFavorites)
             .filter_by(
                 user_id=request.user_id, lat=request.lat, lng=request.lng
             )
-            .first()
+            .limit(1)
         )
 
         if existing:
@@ -312,8 +431,8 @@ async def add_favorite(
             estado=request.estado,
         )
         db.add(favorite)
-        db.commit()
-        db.refresh(favorite)
+        await db.commit()
+        await db.refresh(favorite)
 
         return {
             "status": "success",
@@ -322,7 +441,7 @@ async def add_favorite(
         }
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500, detail=f"Failed to add favorite: {str(e)}"
         )
@@ -330,18 +449,19 @@ async def add_favorite(
 
 @eto_router.get("/favorites/list")
 async def list_favorites(
-    user_id: str = "default", db: Session = Depends(get_db)
+    user_id: str = "default", db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     ✅ Listar favoritos do usuário.
     """
     try:
         favorites = (
-            db.query(UserFavorites)
-            .filter_by(user_id=user_id)
-            .order_by(UserFavorites.created_at.desc())
-            .all()
-        )
+            await db.scalars(
+                select(UserFavorites)
+                .filter_by(user_id=user_id)
+                .order_by(UserFavorites.created_at.desc())
+            )
+        ).all()
 
         return {
             "status": "success",
@@ -368,16 +488,18 @@ async def list_favorites(
 
 @eto_router.delete("/favorites/remove/{favorite_id}")
 async def remove_favorite(
-    favorite_id: int, user_id: str = "default", db: Session = Depends(get_db)
+    favorite_id: int,
+    user_id: str = "default",
+    db: AsyncSession = Depends(get_async_db),
 ) -> Dict[str, Any]:
     """
     ✅ Remover favorito.
     """
     try:
-        favorite = (
-            db.query(UserFavorites)
+        favorite = await db.scalar(
+            select(UserFavorites)
             .filter_by(id=favorite_id, user_id=user_id)
-            .first()
+            .limit(1)
         )
 
         if not favorite:
@@ -385,8 +507,8 @@ async def remove_favorite(
                 status_code=404, detail="Favorito não encontrado"
             )
 
-        db.delete(favorite)
-        db.commit()
+        await db.delete(favorite)
+        await db.commit()
 
         return {
             "status": "success",
@@ -396,7 +518,7 @@ async def remove_favorite(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500, detail=f"Failed to remove favorite: {str(e)}"
         )
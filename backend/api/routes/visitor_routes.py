@@ -2,7 +2,11 @@
 Rotas para contador de visitantes em tempo real
 """
 
-from fastapi import APIRouter, Depends
+import hmac
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 import redis
 
@@ -10,13 +14,30 @@ from backend.database.connection import get_db
 from backend.database.redis_pool import get_redis_client
 from backend.core.analytics.visitor_counter_service import (
     VisitorCounterService,
+    visitor_fingerprint,
 )
 
 router = APIRouter(prefix="/visitors", tags=["Visitors"])
 
+# Token compartilhado com o frontend (Dash), enviado em X-Frontend-Token.
+# Sem ele configurado, só chamadas locais (mesmo host) são do frontend.
+FRONTEND_API_TOKEN = os.getenv("FRONTEND_API_TOKEN")
+LOCAL_CLIENTS = {"127.0.0.1", "::1"}
+
+
+def _from_frontend(request: Request) -> bool:
+    """Chamada feita pelo frontend em nome do navegador?"""
+    if FRONTEND_API_TOKEN:
+        return hmac.compare_digest(
+            request.headers.get("x-frontend-token", ""), FRONTEND_API_TOKEN
+        )
+    return request.client is not None and request.client.host in LOCAL_CLIENTS
+
 
 @router.post("/increment")
 async def increment_visitor_count(
+    request: Request,
+    visitor_id: Optional[str] = Query(None, max_length=64),
     redis_client: redis.Redis = Depends(get_redis_client),
     db: Session = Depends(get_db),
 ):
@@ -24,11 +45,21 @@ async def increment_visitor_count(
     Incrementa contador de visitantes.
     Chamado quando um usuário acessa a aplicação.
 
+    Args:
+        visitor_id: ID do visitante (cookie do navegador), aceito só do
+            frontend; nos demais casos vale o hash de IP + User-Agent da
+            própria conexão (cabeçalhos do cliente são ignorados)
+
     Returns:
         Dict com estatísticas atualizadas
     """
+    if not (visitor_id and _from_frontend(request)):
+        visitor_id = visitor_fingerprint(
+            request.client.host if request.client else None,
+            request.headers.get("user-agent"),
+        )
     service = VisitorCounterService(redis_client, db)
-    return service.increment_visitor()
+    return service.increment_visitor(visitor_id)
 
 
 @router.get("/stats")
@@ -43,6 +74,8 @@ async def get_visitor_stats(
         Dict com:
         - total_visitors: Total de visitas
         - current_hour_visitors: Visitas na hora atual
+        - current_hour_unique_visitors: Visitantes únicos na hora
+        - unique_visitors_today: Visitantes únicos hoje (UTC)
         - current_hour: Hora atual (formato HH:00)
         - timestamp: Timestamp UTC
     """
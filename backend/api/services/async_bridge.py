@@ -0,0 +1,144 @@
+# backend/api/services/async_bridge.py
+"""
+Ponte síncrona → assíncrona com um event loop persistente por processo.
+
+Os sync adapters (Celery, Dash) executavam cada chamada com
+asyncio.run — quando já havia um loop rodando, dentro de um
+ThreadPoolExecutor novo. Cada chamada criava thread + event loop e,
+como os pools HTTP (http_pool) e o registro de coalescência
+(request_coalescer) são por loop, também clientes e conexões novas.
+
+Aqui um único loop roda numa thread daemon por processo e
+run_coro_sync() agenda a coroutine nele (run_coroutine_threadsafe),
+bloqueando só a thread chamadora. Clientes httpx, conexões Redis
+assíncronas e o singleflight persistem entre chamadas.
+
+Ciclo de vida:
+- O loop sobe na primeira chamada
+- Celery: reset_bridge_loop() no processo filho após o fork
+  (sinal worker_process_init em celery_config.py) — a thread do loop
+  não existe no filho
+- Saída do processo: shutdown_bridge_loop() (atexit) fecha os pools
+  HTTP do loop e encerra a thread
+
+Usage:
+    from backend.api.services.async_bridge import run_coro_sync
+
+    data = run_coro_sync(client.get_daily_data(lat, lon, start, end))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import os
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+_lock = threading.Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_pid: Optional[int] = None
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+
+def get_bridge_loop() -> asyncio.AbstractEventLoop:
+    """Loop persistente do processo (iniciado na primeira chamada)."""
+    global _loop, _thread, _pid
+    if _loop is not None and _pid == os.getpid() and _thread.is_alive():
+        return _loop
+    with _lock:
+        if _loop is None or _pid != os.getpid() or not _thread.is_alive():
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(
+                target=_run_loop,
+                args=(_loop,),
+                name="async-bridge",
+                daemon=True,
+            )
+            _thread.start()
+            _pid = os.getpid()
+            logger.debug(f"Async bridge: event loop iniciado (pid={_pid})")
+    return _loop
+
+
+def run_coro_sync(
+    coro: Coroutine[Any, Any, T], timeout: float | None = None
+) -> T:
+    """
+    Executa `coro` no loop persistente e espera o resultado.
+
+    Pode ser chamada de qualquer thread, inclusive de uma que tenha o
+    próprio loop rodando (a thread chamadora fica bloqueada, como
+    antes com o ThreadPoolExecutor).
+
+    Args:
+        coro: Coroutine a executar
+        timeout: Tempo máximo de espera em segundos (None = sem limite)
+
+    Raises:
+        RuntimeError: Se chamada de dentro do próprio loop da ponte
+            (esperaria por si mesma para sempre)
+        TimeoutError: Se `timeout` expirar (a coroutine é cancelada)
+    """
+    loop = get_bridge_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError(
+            "run_coro_sync chamado dentro do loop da ponte; use await"
+        )
+
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result(timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+
+def shutdown_bridge_loop(timeout: float = 5.0) -> None:
+    """Fecha os pools HTTP do loop e encerra a thread."""
+    global _loop, _thread, _pid
+    with _lock:
+        loop, thread = _loop, _thread
+        _loop = _thread = _pid = None
+    if loop is None or not thread.is_alive():
+        return
+
+    from backend.api.services.http_pool import close_http_clients
+
+    try:
+        asyncio.run_coroutine_threadsafe(close_http_clients(), loop).result(
+            timeout
+        )
+    except Exception as e:
+        logger.warning(f"Async bridge: erro ao fechar pools HTTP: {e}")
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout)
+
+
+def reset_bridge_loop() -> None:
+    """
+    Esquece o loop herdado sem tocá-lo.
+
+    Usado no processo filho após fork (Celery prefork): a thread do
+    loop ficou no processo pai; o próximo run_coro_sync cria outra.
+    """
+    global _loop, _thread, _pid
+    with _lock:
+        _loop = _thread = _pid = None
+
+
+atexit.register(shutdown_bridge_loop)
@@ -188,8 +188,10 @@ class ClimateClientFactory:
         # Limpa o singleton (importante para testes e reinícios)
         get_climate_cache_service.cache_clear()
 
-        # Nota: httpx.AsyncClient é criado por request
-        # cada cliente já tem seu próprio .aclose() se necessário
+        # Fecha os pools HTTP compartilhados do loop corrente
+        from .http_pool import close_http_clients
+
+        await close_http_clients()
         logger.info("ClimateClientFactory: cleanup completo")
 
     @classmethod
@@ -1,5 +1,6 @@
+import asyncio
 from datetime import datetime
-from typing import List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -13,6 +14,7 @@ try:
     from backend.api.services.climate_source_manager import (
         ClimateSourceManager,
     )
+    from backend.core.utils.stage_timer import stage
 
 except ImportError:
     from ...api.services.climate_validation import (
@@ -21,6 +23,32 @@ except ImportError:
     from ...api.services.climate_source_manager import (
         ClimateSourceManager,
     )
+    from ...core.utils.stage_timer import stage
+
+# Per-source timeout (seconds) for the concurrent download.
+# Archive sources fetch long periods in chunks and get more headroom.
+SOURCE_TIMEOUTS: Dict[str, float] = {
+    "nasa_power": 120.0,
+    "openmeteo_archive": 180.0,
+    "openmeteo_forecast": 60.0,
+    "met_norway": 60.0,
+    "nws_forecast": 60.0,
+    "nws_stations": 60.0,
+}
+DEFAULT_SOURCE_TIMEOUT = 60.0
+
+# Open-Meteo -> NASA POWER names used by ETo
+# ETo: T2M_MAX, T2M_MIN, T2M (mean), RH2M, WS2M,
+# ALLSKY_SFC_SW_DWN, PRECTOTCORR
+OPENMETEO_HARMONIZATION = {
+    "temperature_2m_max": "T2M_MAX",
+    "temperature_2m_min": "T2M_MIN",
+    "temperature_2m_mean": "T2M",
+    "relative_humidity_2m_mean": "RH2M",
+    "wind_speed_2m_mean": "WS2M",
+    "shortwave_radiation_sum": "ALLSKY_SFC_SW_DWN",
+    "precipitation_sum": "PRECTOTCORR",
+}
 
 
 async def download_weather_data(
@@ -29,6 +57,7 @@ async def download_weather_data(
     data_final: str,
     longitude: float,
     latitude: float,
+    source_timeouts: Optional[Dict[str, float]] = None,
 ) -> Tuple[pd.DataFrame, List[str]]:
     """
     Download weather data from specified sources for coordinates and period.
@@ -52,6 +81,11 @@ async def download_weather_data(
         data_final: End date in YYYY-MM-DD format
         longitude: Longitude (-180 to 180)
         latitude: Latitude (-90 to 90)
+        source_timeouts: Overrides for SOURCE_TIMEOUTS (seconds per source)
+
+    Sources are downloaded concurrently; a source that fails or exceeds
+    its timeout is cancelled and reported in the warnings, and the
+    remaining sources are still returned.
     """
     logger.info(
         f"Starting download - Source: {data_source}, "
@@ -192,313 +226,27 @@ async def download_weather_data(
         logger.error(msg)
         raise ValueError(msg)
 
-    weather_data_sources: List[pd.DataFrame] = []
-    for source in sources:
-        logger.info(f"Processing source: {source}")
-
-        # Temporal limit validations
-        # Each client (adapter) validates its own internal limits
-        # NO need to validate here (duplication removed)
-        # Canonical limits in: climate_source_availability.py
-        data_final_adjusted = data_final_formatted
-
-        # Download data
-        # NOTE: Temporal limit validations are done by
-        # clients/adapters themselves. Each API knows its limits
-        # and validates internally.
-        # Initialize variables
-        weather_df = None
-
-        try:
-            if source == "nasa_power":
-                from backend.api.services.nasa_power.nasa_power_sync_adapter import (
-                    NASAPowerSyncAdapter,
-                )
-
-                client = NASAPowerSyncAdapter()
-                nasa_data = client.get_daily_data_sync(
-                    lat=latitude,
-                    lon=longitude,
-                    start_date=data_inicial_formatted,
-                    end_date=data_final_adjusted,
-                )
-
-                # Convert to pandas DataFrame - NASA POWER variables
-                data_records = []
-                for record in nasa_data:
-                    data_records.append(
-                        {
-                            "date": record.date,
-                            "T2M_MAX": record.temp_max,
-                            "T2M_MIN": record.temp_min,
-                            "T2M": record.temp_mean,
-                            "RH2M": record.humidity,
-                            "WS2M": record.wind_speed,
-                            "ALLSKY_SFC_SW_DWN": record.solar_radiation,
-                            "PRECTOTCORR": record.precipitation,
-                        }
-                    )
-
-                weather_df = pd.DataFrame(data_records)
-                weather_df["date"] = pd.to_datetime(weather_df["date"])
-                weather_df.set_index("date", inplace=True)
-
-                logger.info(
-                    f"NASA POWER: {len(nasa_data)} daily records "
-                    f"for ({latitude}, {longitude})"
-                )
-
-            elif source == "openmeteo_archive":
-                # Open-Meteo Archive (historical since 1950)
-                from backend.api.services.openmeteo_archive.openmeteo_archive_sync_adapter import (
-                    OpenMeteoArchiveSyncAdapter,
-                )
-
-                client = OpenMeteoArchiveSyncAdapter()
-                openmeteo_data = client.get_daily_data_sync(
-                    lat=latitude,
-                    lon=longitude,
-                    start_date=data_inicial_formatted,
-                    end_date=data_final_adjusted,
-                )
-
-                if not openmeteo_data:
-                    msg = (
-                        f"No data from Open-Meteo Archive for "
-                        f"({latitude}, {longitude}) "
-                        f"between {data_inicial} and {data_final}"
-                    )
-                    logger.warning(msg)
-                    warnings_list.append(msg)
-                    continue
-
-                # Convert to DataFrame - ALL Open-Meteo variables
-                weather_df = pd.DataFrame(openmeteo_data)
-                weather_df["date"] = pd.to_datetime(weather_df["date"])
-                weather_df.set_index("date", inplace=True)
-
-                # Harmonize OpenMeteo -> NASA format for ETo
-                # ETo: T2M_MAX, T2M_MIN, T2M (mean), RH2M, WS2M,
-                # ALLSKY_SFC_SW_DWN, PRECTOTCORR
-                harmonization = {
-                    "temperature_2m_max": "T2M_MAX",
-                    "temperature_2m_min": "T2M_MIN",
-                    "temperature_2m_mean": "T2M",
-                    "relative_humidity_2m_mean": "RH2M",
-                    "wind_speed_2m_mean": "WS2M",
-                    "shortwave_radiation_sum": "ALLSKY_SFC_SW_DWN",
-                    "precipitation_sum": "PRECTOTCORR",
-                }
-
-                for openmeteo_var, nasa_var in harmonization.items():
-                    if openmeteo_var in weather_df.columns:
-                        weather_df[nasa_var] = weather_df[openmeteo_var]
-
-                logger.info(
-                    f"Open-Meteo Archive: {len(openmeteo_data)} "
-                    f"daily records for ({latitude}, {longitude})"
-                )
-
-            elif source == "openmeteo_forecast":
-                # Open-Meteo Forecast (forecast + recent: -29d to +5d)
-                from backend.api.services.openmeteo_forecast.openmeteo_forecast_sync_adapter import (
-                    OpenMeteoForecastSyncAdapter,
-                )
-
-                client = OpenMeteoForecastSyncAdapter()
-                forecast_data = client.get_daily_data_sync(
-                    lat=latitude,
-                    lon=longitude,
-                    start_date=data_inicial_formatted,
-                    end_date=data_final_formatted,
-                )
-
-                if not forecast_data:
-                    msg = (
-                        f"No data from Open-Meteo Forecast for "
-                        f"({latitude}, {longitude}) "
-                        f"between {data_inicial} and {data_final}"
-                    )
-                    logger.warning(msg)
-                    warnings_list.append(msg)
-                    continue
-
-                # Convert to DataFrame - ALL Open-Meteo variables
-                weather_df = pd.DataFrame(forecast_data)
-                weather_df["date"] = pd.to_datetime(weather_df["date"])
-                weather_df.set_index("date", inplace=True)
-
-                # Harmonize OpenMeteo -> NASA format for ETo
-                # ETo: T2M_MAX, T2M_MIN, T2M (mean), RH2M, WS2M,
-                # ALLSKY_SFC_SW_DWN, PRECTOTCORR
-                harmonization = {
-                    "temperature_2m_max": "T2M_MAX",
-                    "temperature_2m_min": "T2M_MIN",
-                    "temperature_2m_mean": "T2M",
-                    "relative_humidity_2m_mean": "RH2M",
-                    "wind_speed_2m_mean": "WS2M",
-                    "shortwave_radiation_sum": "ALLSKY_SFC_SW_DWN",
-                    "precipitation_sum": "PRECTOTCORR",
-                }
-
-                # Rename existing columns
-                for openmeteo_var, nasa_var in harmonization.items():
-                    if openmeteo_var in weather_df.columns:
-                        weather_df[nasa_var] = weather_df[openmeteo_var]
-
-                logger.info(
-                    f"Open-Meteo Forecast: {len(forecast_data)} "
-                    f"daily records for ({latitude}, {longitude})"
-                )
-
-            elif source == "met_norway":
-                # MET Norway Locationforecast (Global, async)
-                from backend.api.services.met_norway.met_norway_client import (
-                    METNorwayClient,
-                )
-
-                client = METNorwayClient()
-                met_data = await client.get_daily_forecast(
-                    lat=latitude,
-                    lon=longitude,
-                    start_date=data_inicial_formatted,
-                    end_date=data_final_adjusted,
-                )
-
-                if not met_data:
-                    msg = (
-                        f"No data from MET Norway for "
-                        f"({latitude}, {longitude}) "
-                        f"between {data_inicial} and {data_final}"
-                    )
-                    logger.warning(msg)
-                    warnings_list.append(msg)
-                    continue
-
-                # Get recommended variables for region
-                from backend.api.services.met_norway.met_norway_client import (
-                    METNorwayClient,
-                )
-
-                recommended_vars = METNorwayClient.get_recommended_variables(
-                    latitude, longitude
-                )
-
-                # Check if precipitation should be included
-                include_precipitation = "precipitation_sum" in recommended_vars
-
-                # Log regional strategy
-                if include_precipitation:
-                    region_info = (
-                        "Nordic Region: using high-quality "
-                        "precipitation (1km + radar)"
-                    )
-                else:
-                    region_info = (
-                        "Global: using temperature/humidity only "
-                        "(precipitation from Open-Meteo)"
-                    )
-
-                logger.info(f"MET Norway - {region_info}")
-
-                # Convert to DataFrame - FILTER variables by region
-                data_records = []
-                for record in met_data:
-                    row = {
-                        "date": record.date,
-                        "temp_max": record.temp_max,
-                        "temp_min": record.temp_min,
-                        "temp_mean": record.temp_mean,
-                        "humidity_mean": record.humidity_mean,
-                    }
-                    # Add precipitation only if recommended
-                    if include_precipitation:
-                        row["precipitation_sum"] = record.precipitation_sum
-                    data_records.append(row)
-
-                weather_df = pd.DataFrame(data_records)
-                weather_df["date"] = pd.to_datetime(weather_df["date"])
-                weather_df.set_index("date", inplace=True)
-
-                # Add CC-BY 4.0 attribution to warnings
-                warnings_list.append(
-                    "MET Norway data: CC-BY 4.0 - Attribution required"
-                )
-
-                # Log included variables
-                logger.info(
-                    "MET Norway: %d records (%s, %s), " "variables: %s",
-                    len(met_data),
-                    latitude,
-                    longitude,
-                    list(weather_df.columns),
-                )
-
-            elif source == "nws_forecast":
-                # NWS Forecast (USA, forecasts)
-                from backend.api.services.nws_forecast.nws_forecast_sync_adapter import (
-                    NWSDailyForecastSyncAdapter,
-                )
-
-                client = NWSDailyForecastSyncAdapter()
-                nws_forecast_data = client.get_daily_data_sync(
-                    lat=latitude,
-                    lon=longitude,
-                    start_date=data_inicial_formatted,
-                    end_date=data_final_adjusted,
-                )
-
-                if not nws_forecast_data:
-                    msg = (
-                        f"No data from NWS Forecast for "
-                        f"({latitude}, {longitude}) "
-                        f"between {data_inicial} and {data_final}"
-                    )
-                    logger.warning(msg)
-                    warnings_list.append(msg)
-                    continue
-
-                # Convert to DataFrame - NWS Forecast variables
-                data_records = []
-                for record in nws_forecast_data:
-                    data_records.append(
-                        {
-                            "date": record.date,
-                            "temp_max": record.temp_max,
-                            "temp_min": record.temp_min,
-                            "temp_mean": record.temp_mean,
-                            "humidity_mean": record.humidity_mean,
-                            "wind_speed_2m_mean": record.wind_speed_mean,
-                            "precipitation_sum": record.precipitation_sum,
-                        }
-                    )
-
-                weather_df = pd.DataFrame(data_records)
-                weather_df["date"] = pd.to_datetime(weather_df["date"])
-                weather_df.set_index("date", inplace=True)
-
-                logger.info(
-                    "NWS Forecast: %d records (%s, %s)",
-                    len(nws_forecast_data),
-                    latitude,
-                    longitude,
-                )
-
-            elif source == "nws_stations":
-                from backend.api.services.nws_stations.nws_stations_sync_adapter import (
-                    NWSStationsSyncAdapter,
-                )
-
-                client = NWSStationsSyncAdapter()
-                # NWS Stations implementation would go here
-
-        except Exception as e:
-            logger.error(
-                f"{source}: error downloading data: {str(e)}",
-                exc_info=True,
+    # 6. CONCURRENT DOWNLOAD (one task per source, independent timeouts)
+    # Total latency is bounded by the slowest source instead of the sum;
+    # a source that times out or fails only adds a warning.
+    timeouts = {**SOURCE_TIMEOUTS, **(source_timeouts or {})}
+    results = await asyncio.gather(
+        *(
+            _fetch_source_with_timeout(
+                source,
+                timeouts.get(source, DEFAULT_SOURCE_TIMEOUT),
+                latitude,
+                longitude,
+                data_inicial_formatted,
+                data_final_formatted,
             )
-            warnings_list.append(f"{source}: error downloading data: {str(e)}")
-            continue
+            for source in sources
+        )
+    )
+
+    weather_data_sources: List[pd.DataFrame] = []
+    for source, weather_df, source_warnings in results:
+        warnings_list.extend(source_warnings)
 
         # Validate DataFrame
         if weather_df is None or weather_df.empty:
@@ -597,3 +345,264 @@ async def download_weather_data(
     logger.info("Final data obtained successfully")
     logger.debug("Final DataFrame:\n%s", weather_data)
     return weather_data, warnings_list
+
+
+async def _fetch_source_with_timeout(
+    source: str,
+    timeout: float,
+    latitude: float,
+    longitude: float,
+    start_date: pd.Timestamp,
+    end_date: pd.Timestamp,
+) -> Tuple[str, Optional[pd.DataFrame], List[str]]:
+    """
+    Run _fetch_source under a timeout, turning failures into warnings.
+
+    Returns:
+        Tuple (source, DataFrame or None, warnings for this source)
+    """
+    logger.info(f"Processing source: {source}")
+    try:
+        # A task do wait_for herda o span: o cache marca HIT/MISS nele
+        with stage("fetch", source=source):
+            weather_df, warnings_list = await asyncio.wait_for(
+                _fetch_source(
+                    source, latitude, longitude, start_date, end_date
+                ),
+                timeout=timeout,
+            )
+        return source, weather_df, warnings_list
+    except asyncio.TimeoutError:
+        msg = f"{source}: timed out after {timeout:g}s"
+        logger.warning(msg)
+        return source, None, [msg]
+    except Exception as e:
+        logger.error(
+            f"{source}: error downloading data: {str(e)}",
+            exc_info=True,
+        )
+        return source, None, [f"{source}: error downloading data: {str(e)}"]
+
+
+async def _fetch_source(
+    source: str,
+    latitude: float,
+    longitude: float,
+    start_date: pd.Timestamp,
+    end_date: pd.Timestamp,
+) -> Tuple[Optional[pd.DataFrame], List[str]]:
+    """
+    Download one source with its async client and convert to DataFrame.
+
+    Temporal limit validations are done by the clients/adapters
+    themselves (canonical limits in climate_source_availability.py).
+
+    Returns:
+        Tuple (DataFrame indexed by date or None, warnings)
+    """
+    from backend.api.services.climate_factory import (
+        get_climate_cache_service,
+    )
+
+    warnings_list: List[str] = []
+    period = (
+        f"({latitude}, {longitude}) between "
+        f"{start_date.strftime('%Y-%m-%d')} and "
+        f"{end_date.strftime('%Y-%m-%d')}"
+    )
+
+    if source == "nasa_power":
+        from backend.api.services.nasa_power.nasa_power_sync_adapter import (
+            NASAPowerSyncAdapter,
+        )
+
+        nasa_data = await NASAPowerSyncAdapter(
+            cache=get_climate_cache_service()
+        ).get_daily_data(
+            lat=latitude,
+            lon=longitude,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        # Convert to pandas DataFrame - NASA POWER variables
+        weather_df = _records_to_frame(
+            [
+                {
+                    "date": record.date,
+                    "T2M_MAX": record.temp_max,
+                    "T2M_MIN": record.temp_min,
+                    "T2M": record.temp_mean,
+                    "RH2M": record.humidity,
+                    "WS2M": record.wind_speed,
+                    "ALLSKY_SFC_SW_DWN": record.solar_radiation,
+                    "PRECTOTCORR": record.precipitation,
+                }
+                for record in nasa_data
+            ]
+        )
+        logger.info(
+            f"NASA POWER: {len(nasa_data)} daily records "
+            f"for ({latitude}, {longitude})"
+        )
+        return weather_df, warnings_list
+
+    if source in ("openmeteo_archive", "openmeteo_forecast"):
+        if source == "openmeteo_archive":
+            # Open-Meteo Archive (historical since 1950)
+            from backend.api.services.openmeteo_archive import (
+                OpenMeteoArchiveSyncAdapter as Adapter,
+            )
+
+            label = "Open-Meteo Archive"
+            # Per-day Redis cache: overlapping dashboard windows only
+            # fetch the days not seen yet
+            adapter = Adapter(cache=get_climate_cache_service())
+        else:
+            # Open-Meteo Forecast (forecast + recent: -29d to +5d)
+            from backend.api.services.openmeteo_forecast import (
+                OpenMeteoForecastSyncAdapter as Adapter,
+            )
+
+            label = "Open-Meteo Forecast"
+            adapter = Adapter()
+
+        openmeteo_data = await adapter.get_daily_data(
+            lat=latitude,
+            lon=longitude,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        if not openmeteo_data:
+            msg = f"No data from {label} for {period}"
+            logger.warning(msg)
+            return None, [msg]
+
+        # Convert to DataFrame - ALL Open-Meteo variables
+        weather_df = _records_to_frame(openmeteo_data)
+        for openmeteo_var, nasa_var in OPENMETEO_HARMONIZATION.items():
+            if openmeteo_var in weather_df.columns:
+                weather_df[nasa_var] = weather_df[openmeteo_var]
+
+        logger.info(
+            f"{label}: {len(openmeteo_data)} "
+            f"daily records for ({latitude}, {longitude})"
+        )
+        return weather_df, warnings_list
+
+    if source == "met_norway":
+        # MET Norway Locationforecast (Global, async)
+        from backend.api.services.met_norway.met_norway_client import (
+            METNorwayClient,
+        )
+
+        client = METNorwayClient()
+        try:
+            met_data = await client.get_daily_forecast(
+                lat=latitude,
+                lon=longitude,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        finally:
+            await client.close()
+
+        if not met_data:
+            msg = f"No data from MET Norway for {period}"
+            logger.warning(msg)
+            return None, [msg]
+
+        # Check if precipitation should be included for the region
+        recommended_vars = METNorwayClient.get_recommended_variables(
+            latitude, longitude
+        )
+        include_precipitation = "precipitation_sum" in recommended_vars
+
+        # Log regional strategy
+        if include_precipitation:
+            region_info = (
+                "Nordic Region: using high-quality "
+                "precipitation (1km + radar)"
+            )
+        else:
+            region_info = (
+                "Global: using temperature/humidity only "
+                "(precipitation from Open-Meteo)"
+            )
+        logger.info(f"MET Norway - {region_info}")
+
+        # Convert to DataFrame - FILTER variables by region
+        data_records = []
+        for record in met_data:
+            row = {
+                "date": record.date,
+                "temp_max": record.temp_max,
+                "temp_min": record.temp_min,
+                "temp_mean": record.temp_mean,
+                "humidity_mean": record.humidity_mean,
+            }
+            # Add precipitation only if recommended
+            if include_precipitation:
+                row["precipitation_sum"] = record.precipitation_sum
+            data_records.append(row)
+
+        weather_df = _records_to_frame(data_records)
+
+        # Add CC-BY 4.0 attribution to warnings
+        warnings_list.append(
+            "MET Norway data: CC-BY 4.0 - Attribution required"
+        )
+        logger.info(
+            f"MET Norway: {len(met_data)} records "
+            f"({latitude}, {longitude}), "
+            f"variables: {list(weather_df.columns)}"
+        )
+        return weather_df, warnings_list
+
+    if source == "nws_forecast":
+        # NWS Forecast (USA, forecasts)
+        from backend.api.services.nws_forecast import (
+            NWSDailyForecastSyncAdapter,
+        )
+
+        nws_forecast_data = await NWSDailyForecastSyncAdapter().get_daily_data(
+            lat=latitude,
+            lon=longitude,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        if not nws_forecast_data:
+            msg = f"No data from NWS Forecast for {period}"
+            logger.warning(msg)
+            return None, [msg]
+
+        # Convert to DataFrame - NWS Forecast variables
+        weather_df = _records_to_frame(
+            [
+                {
+                    "date": record.date,
+                    "temp_max": record.temp_max,
+                    "temp_min": record.temp_min,
+                    "temp_mean": record.temp_mean,
+                    "humidity_mean": record.humidity_mean,
+                    "wind_speed_2m_mean": record.wind_speed_mean,
+                    "precipitation_sum": record.precipitation_sum,
+                }
+                for record in nws_forecast_data
+            ]
+        )
+        logger.info(
+            f"NWS Forecast: {len(nws_forecast_data)} records "
+            f"({latitude}, {longitude})"
+        )
+        return weather_df, warnings_list
+
+    # nws_stations: NWS Stations implementation would go here
+    return None, warnings_list
+
+
+def _records_to_frame(records: list) -> pd.DataFrame:
+    """Build a DataFrame indexed by date from a list of daily records."""
+    weather_df = pd.DataFrame(records)
+    weather_df["date"] = pd.to_datetime(weather_df["date"])
+    return weather_df.set_index("date")
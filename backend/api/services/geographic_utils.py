@@ -38,6 +38,7 @@ from loguru import logger
 from typing import Literal
 from functools import wraps
 import inspect
+import math
 
 
 class GeographicUtils:
@@ -228,6 +229,86 @@ class GeographicUtils:
         west, south, east, north = bbox
         return (west <= lon <= east) and (south <= lat <= north)
 
+    @staticmethod
+    def snap_to_grid(
+        lat: float,
+        lon: float,
+        lat_step: float,
+        lon_step: float | None = None,
+    ) -> tuple[float, float]:
+        """
+        Ajusta coordenadas para o centro da célula de uma grade regular.
+
+        Usado para chaves de cache (Open-Meteo ~0.1°): cliques próximos
+        compartilham a mesma chave. Células com bordas em múltiplos do
+        passo, a partir de (-90, -180). Para grades cujos pontos de
+        dado ficam nos múltiplos do passo (NASA POWER), use
+        snap_to_node.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            lat_step: Tamanho da célula em latitude (graus)
+            lon_step: Tamanho da célula em longitude (padrão: lat_step)
+
+        Returns:
+            tuple: (lat, lon) do centro da célula
+
+        Exemplo:
+            GeographicUtils.snap_to_grid(-22.7085, -47.6476, 0.5)
+            # Retorna: (-22.75, -47.75)
+        """
+        lon_step = lon_step or lat_step
+
+        def _center(value: float, step: float, low: float, high: float):
+            cell = math.floor((value - low) / step)
+            # Borda superior (90°/180°) pertence à última célula
+            cell = min(cell, math.ceil((high - low) / step) - 1)
+            return round(low + (cell + 0.5) * step, 6)
+
+        return (
+            _center(lat, lat_step, -90.0, 90.0),
+            _center(lon, lon_step, -180.0, 180.0),
+        )
+
+    @staticmethod
+    def snap_to_node(
+        lat: float,
+        lon: float,
+        lat_step: float,
+        lon_step: float | None = None,
+    ) -> tuple[float, float]:
+        """
+        Ajusta coordenadas para o nó mais próximo de uma grade regular.
+
+        Nós em (-90 + j * lat_step, -180 + i * lon_step), como a grade
+        MERRA-2 do NASA POWER (0.5° x 0.625°): o dado de um nó vale
+        para a célula centrada nele. A longitude dá a volta em 180°
+        (180 vira -180).
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            lat_step: Espaçamento dos nós em latitude (graus)
+            lon_step: Espaçamento em longitude (padrão: lat_step)
+
+        Returns:
+            tuple: (lat, lon) do nó
+
+        Exemplo:
+            GeographicUtils.snap_to_node(-22.7085, -47.6476, 0.5, 0.625)
+            # Retorna: (-22.5, -47.5)
+        """
+        lon_step = lon_step or lat_step
+        lat_nodes = round(180.0 / lat_step)
+        lon_nodes = round(360.0 / lon_step)
+        j = min(max(round((lat + 90.0) / lat_step), 0), lat_nodes)
+        i = round((lon + 180.0) / lon_step) % lon_nodes
+        return (
+            round(-90.0 + j * lat_step, 6),
+            round(-180.0 + i * lon_step, 6),
+        )
+
     @staticmethod
     def get_region(
         lat: float, lon: float
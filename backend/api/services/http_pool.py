@@ -0,0 +1,221 @@
+# backend/api/services/http_pool.py
+"""
+Pool compartilhado de conexões HTTP para os clientes climáticos.
+
+Cada cliente (NASA POWER, MET Norway, NWS, OpenTopo) pedia um
+httpx.AsyncClient novo por instância e o fechava ao fim do request,
+pagando DNS + TCP + TLS a cada chamada. Aqui os clientes pegam
+emprestado um AsyncClient de longa duração por host, com keep-alive
+e HTTP/2 (extra `httpx[http2]`; sem o pacote `h2` o pool cai para
+HTTP/1.1 e registra um aviso).
+
+Conexões httpx pertencem ao event loop em que foram abertas, então o
+registro é separado por loop: o loop do Uvicorn e o loop persistente
+dos sync adapters (async_bridge.run_coro_sync) reaproveitam o mesmo
+pool durante toda a vida do processo; loops temporários (asyncio.run
+em scripts) recebem um pool próprio, descartado na próxima consulta
+depois que o loop é fechado.
+
+Quota: com `quota="<api>"`, um event hook de request reserva a
+chamada em api_usage_tracker antes de cada envio (inclusive retries);
+quota esgotada levanta APIQuotaExceededError sem tocar a rede.
+
+Ciclo de vida:
+- FastAPI: close_http_clients() no shutdown (lifespan em main.py)
+- Celery: reset_http_clients() no processo filho após o fork
+  (sinal worker_process_init em celery_config.py)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from loguru import logger
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_http2_warned = False
+
+
+@dataclass
+class PoolStats:
+    """Contadores de reuso de conexões de um pool."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    _streams: weakref.WeakSet = field(
+        default_factory=weakref.WeakSet, repr=False
+    )
+
+    @property
+    def reuse_rate(self) -> float:
+        """Fração de requests atendidos por conexão já aberta."""
+        if not self.requests:
+            return 0.0
+        return 1.0 - self.connections_opened / self.requests
+
+    def record(self, response: httpx.Response) -> None:
+        self.requests += 1
+        stream = response.extensions.get("network_stream")
+        if stream is not None and stream not in self._streams:
+            self._streams.add(stream)
+            self.connections_opened += 1
+
+
+# event loop -> {chave do pool -> (AsyncClient, PoolStats)}
+_registry: Dict[
+    asyncio.AbstractEventLoop,
+    Dict[Tuple[Any, ...], Tuple[httpx.AsyncClient, PoolStats]],
+] = {}
+
+
+def _prune_closed_loops() -> None:
+    """Descarta pools de loops já encerrados (asyncio.run terminado)."""
+    for loop in [lp for lp in _registry if lp.is_closed()]:
+        del _registry[loop]
+
+
+def _pool_settings() -> Dict[str, Any]:
+    global _http2_warned
+    from config.settings.app_config import get_settings
+
+    apis = get_settings().climate_apis
+    if apis.HTTP2_ENABLED and not HTTP2_AVAILABLE and not _http2_warned:
+        _http2_warned = True
+        logger.warning(
+            "HTTP2_ENABLED ativo, mas o pacote h2 não está instalado; "
+            "usando HTTP/1.1 (instale httpx[http2])"
+        )
+    return {
+        "limits": httpx.Limits(
+            max_connections=apis.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=apis.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=apis.HTTP_KEEPALIVE_EXPIRY,
+        ),
+        "http2": apis.HTTP2_ENABLED and HTTP2_AVAILABLE,
+    }
+
+
+def get_http_client(
+    host: str,
+    *,
+    base_url: str = "",
+    timeout: float = 30.0,
+    headers: Optional[Dict[str, str]] = None,
+    follow_redirects: bool = False,
+    limits: Optional[httpx.Limits] = None,
+    quota: Optional[str] = None,
+) -> httpx.AsyncClient:
+    """
+    Retorna o AsyncClient compartilhado para um host no loop corrente.
+
+    Clientes com a mesma configuração (host, base_url, timeout,
+    headers, redirects) compartilham o pool de conexões. O chamador
+    NÃO deve fechar o cliente retornado.
+
+    Args:
+        host: Identificador do host (ex.: "power.larc.nasa.gov")
+        base_url: URL base opcional
+        timeout: Timeout padrão em segundos
+        headers: Headers padrão (User-Agent, Accept...)
+        follow_redirects: Seguir redirecionamentos
+        limits: Limites do pool (padrão: settings CLIMATE_HTTP_*)
+        quota: API em api_usage_tracker.API_LIMITS a reservar antes
+            de cada request (None = sem controle de quota)
+    """
+    loop = asyncio.get_running_loop()
+    _prune_closed_loops()
+    key = (
+        host,
+        base_url,
+        timeout,
+        tuple(sorted((headers or {}).items())),
+        follow_redirects,
+        quota,
+    )
+    pools = _registry.setdefault(loop, {})
+    entry = pools.get(key)
+    if entry is not None and not entry[0].is_closed:
+        return entry[0]
+
+    options = _pool_settings()
+    stats = PoolStats()
+
+    async def _on_response(response: httpx.Response) -> None:
+        stats.record(response)
+
+    event_hooks: Dict[str, list] = {"response": [_on_response]}
+    if quota is not None:
+        from backend.infrastructure.cache.api_usage_tracker import (
+            ensure_api_quota,
+        )
+
+        async def _reserve_quota(request: httpx.Request) -> None:
+            await ensure_api_quota(quota)
+
+        event_hooks["request"] = [_reserve_quota]
+
+    client = httpx.AsyncClient(
+        base_url=base_url,
+        timeout=timeout,
+        headers=headers,
+        follow_redirects=follow_redirects,
+        limits=limits or options["limits"],
+        http2=options["http2"],
+        event_hooks=event_hooks,
+    )
+    pools[key] = (client, stats)
+    logger.debug(
+        f"HTTP pool criado para {host} (http2={options['http2']}, "
+        f"pools no loop={len(pools)})"
+    )
+    return client
+
+
+def http_pool_stats() -> Dict[str, Dict[str, float]]:
+    """Estatísticas de reuso por host, somadas sobre todos os loops."""
+    totals: Dict[str, PoolStats] = {}
+    for pools in list(_registry.values()):
+        for key, (_, stats) in pools.items():
+            total = totals.setdefault(key[0], PoolStats())
+            total.requests += stats.requests
+            total.connections_opened += stats.connections_opened
+    return {
+        host: {
+            "requests": stats.requests,
+            "connections_opened": stats.connections_opened,
+            "reuse_rate": round(stats.reuse_rate, 4),
+        }
+        for host, stats in totals.items()
+    }
+
+
+async def close_http_clients() -> None:
+    """Fecha os pools do loop corrente (shutdown da aplicação)."""
+    pools = _registry.pop(asyncio.get_running_loop(), {})
+    for client, _ in pools.values():
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.error(f"Erro ao fechar pool HTTP: {e}")
+    if pools:
+        logger.info(f"{len(pools)} pools HTTP fechados")
+
+
+def reset_http_clients() -> None:
+    """
+    Esquece todos os pools sem fechá-los.
+
+    Usado no processo filho após fork (Celery prefork): os sockets
+    herdados pertencem ao processo pai e não podem ser reaproveitados.
+    """
+    _registry.clear()
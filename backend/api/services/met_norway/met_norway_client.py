@@ -46,6 +46,7 @@ from backend.api.services.geographic_utils import (
     GeographicUtils,
     validate_coordinates,
 )
+from backend.api.services.http_pool import get_http_client
 from backend.api.services.weather_utils import (
     METNorwayAggregationUtils,  # Moved from here to weather_utils
     WeatherConversionUtils,
@@ -222,26 +223,30 @@ class METNorwayClient:
             cache: ClimateCacheService (optional)
         """
         self.config = config or METNorwayConfig()
+        self.cache = cache
 
-        # Required headers
-        headers = {
-            "User-Agent": self.config.user_agent,
-            "Accept": "application/json",
-        }
-
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client shared by all MET Norway clients."""
         # Rate limiting using configured values
-        limits = httpx.Limits(
-            max_keepalive_connections=self.config.max_keepalive_connections,
-            max_connections=self.config.max_connections,
-        )
-        self.client = httpx.AsyncClient(
-            timeout=self.config.timeout, headers=headers, limits=limits
+        return get_http_client(
+            httpx.URL(self.config.base_url).host,
+            timeout=self.config.timeout,
+            headers={
+                "User-Agent": self.config.user_agent,
+                "Accept": "application/json",
+            },
+            limits=httpx.Limits(
+                max_keepalive_connections=(
+                    self.config.max_keepalive_connections
+                ),
+                max_connections=self.config.max_connections,
+            ),
+            quota="met_norway",
         )
-        self.cache = cache
 
     async def close(self):
-        """Close HTTP connection."""
-        await self.client.aclose()
+        """Release the shared HTTP client (the pool stays open)."""
 
     @staticmethod
     def _round_coordinates(lat: float, lon: float) -> tuple[float, float]:
@@ -463,10 +468,6 @@ class METNorwayClient:
             params["altitude"] = altitude  # Add altitude if provided
         if timezone:
             params["timezone"] = timezone
-            logger.warning(
-                "Timezone parameter may affect date boundaries. "
-                "Ensure proper handling in aggregation."
-            )
 
         # Request with retry
         for attempt in range(self.config.retry_attempts):
@@ -566,7 +567,7 @@ class METNorwayClient:
                 # Process response
                 data = response.json()
                 parsed_data = self._parse_daily_response(
-                    data, variables, start_date, end_date
+                    data, variables, start_date, end_date, timezone
                 )
 
                 logger.info(
@@ -625,6 +626,7 @@ class METNorwayClient:
         variables: list[str],
         start_date: datetime,
         end_date: datetime,
+        timezone: str | None = None,
     ) -> list[METNorwayDailyData]:
         """
         Process MET Norway API response using METNorwayAggregator.
@@ -634,6 +636,7 @@ class METNorwayClient:
             variables: Requested variable names (for validation)
             start_date: Start of period
             end_date: End of period
+            timezone: IANA timezone for the day boundaries (default: UTC)
 
         Returns:
             List of daily aggregated records
@@ -667,7 +670,7 @@ class METNorwayClient:
 
             # 1. Aggregate hourly data to daily
             daily_raw_data = aggregator.aggregate_hourly_to_daily(
-                timeseries, start_date, end_date
+                timeseries, start_date, end_date, tz=timezone
             )
 
             # 2. Calculate final aggregations
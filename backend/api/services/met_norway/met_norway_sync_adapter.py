@@ -24,12 +24,12 @@ No coverage limits
 License: CC-BY 4.0 - Display in all visualizations with MET Norway data
 """
 
-import asyncio
 from datetime import datetime, timedelta
 from typing import Any
 
 from loguru import logger
 
+from backend.api.services.async_bridge import run_coro_sync
 from backend.api.services.geographic_utils import GeographicUtils
 
 from .met_norway_client import (
@@ -90,7 +90,7 @@ class METNorwaySyncAdapter:
             List of daily data
 
         """
-        return asyncio.run(
+        return run_coro_sync(
             self._async_get_daily_data(
                 lat=lat,
                 lon=lon,
@@ -143,7 +143,7 @@ class METNorwaySyncAdapter:
             data = await adapter.get_daily_data(...)
 
             # In synchronous code (if necessary)
-            data = asyncio.run(adapter.get_daily_data(...))
+            data = run_coro_sync(adapter.get_daily_data(...))
         """
         client = await self._get_client()  # Reuse client from pool
 
@@ -224,7 +224,7 @@ class METNorwaySyncAdapter:
         Returns:
             bool: True if API is accessible
         """
-        return asyncio.run(self._async_health_check())
+        return run_coro_sync(self._async_health_check())
 
     async def _async_health_check(self) -> bool:
         """
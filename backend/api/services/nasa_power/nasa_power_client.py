@@ -57,7 +57,7 @@ Spatial Resolution: 0.5 x 0.625 Degrees
 
 """
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from typing import Any
 
 import httpx
@@ -65,6 +65,10 @@ from loguru import logger
 from pydantic import BaseModel, Field
 
 from backend.api.services.geographic_utils import GeographicUtils
+from backend.api.services.http_pool import get_http_client
+
+# Value returned by POWER for days without data
+FILL_VALUE = -999.0
 
 
 class NASAPowerConfig(BaseModel):
@@ -74,6 +78,10 @@ class NASAPowerConfig(BaseModel):
     timeout: int = 30
     retry_attempts: int = 3
     retry_delay: float = 1.0
+    # Native POWER (MERRA-2) grid spacing in degrees: data points sit on
+    # -90 + 0.5j, -180 + 0.625i and cover the cell centred on them
+    grid_lat_step: float = 0.5
+    grid_lon_step: float = 0.625
 
 
 class NASAPowerData(BaseModel):
@@ -109,12 +117,19 @@ class NASAPowerClient:
             cache: ClimateCacheService (optional, injected via DI)
         """
         self.config = config or NASAPowerConfig()
-        self.client = httpx.AsyncClient(timeout=self.config.timeout)
         self.cache = cache  # Optional cache service
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client shared by all NASA POWER clients."""
+        return get_http_client(
+            httpx.URL(self.config.base_url).host,
+            timeout=self.config.timeout,
+            quota="nasa_power",
+        )
+
     async def close(self):
-        """Close HTTP connection."""
-        await self.client.aclose()
+        """Release the shared HTTP client (the pool stays open)."""
 
     async def get_daily_data(
         self,
@@ -156,20 +171,60 @@ class NASAPowerClient:
         # in climate_validation.py BEFORE calling this method.
         # This client assumes data pre-validated by climate_validation.
 
-        # 1. Try to fetch from cache (if available)
+        # Snap to the nearest POWER grid node: every point of its cell
+        # gets the same data, so nearby clicks share one fetch
+        lat, lon = GeographicUtils.snap_to_node(
+            lat, lon, self.config.grid_lat_step, self.config.grid_lon_step
+        )
+
+        # 1. Day-granular cache: only the missing days hit the API
         if self.cache:
-            cached_data = await self.cache.get(
-                source="nasa_power",
+            records = await self.cache.get_range(
+                source=f"nasa_power_{community.lower()}",
                 lat=lat,
                 lon=lon,
                 start=start_date,
                 end=end_date,
+                fetch=lambda start, end: self._fetch_days(
+                    lat, lon, start, end, community
+                ),
             )
-            if cached_data:
-                logger.info(f"Cache HIT: NASA POWER lat={lat}, lon={lon}")
-                return cached_data
-
-        # 2. Cache MISS - fetch from API
+            return [NASAPowerData(**record) for record in records.values()]
+
+        return await self._fetch_from_api(
+            lat, lon, start_date, end_date, community
+        )
+
+    async def _fetch_days(
+        self, lat: float, lon: float, start: date, end: date, community: str
+    ) -> dict[date, dict[str, Any]]:
+        """Fetch a sub-period for the day cache ({day: record})."""
+        data = await self._fetch_from_api(
+            lat,
+            lon,
+            datetime.combine(start, time()),
+            datetime.combine(end, time()),
+            community,
+        )
+        days = {}
+        for record in data:
+            values = record.model_dump(exclude={"date"}).values()
+            # Days not yet processed by POWER come back as fill values:
+            # leave them out so the cache retries them later
+            if all(v is None or v == FILL_VALUE for v in values):
+                continue
+            days[date.fromisoformat(record.date)] = record.model_dump()
+        return days
+
+    async def _fetch_from_api(
+        self,
+        lat: float,
+        lon: float,
+        start_date: datetime,
+        end_date: datetime,
+        community: str,
+    ) -> list[NASAPowerData]:
+        """Request a period from the NASA POWER API (with retries)."""
         logger.info(f"Fetching NASA API: lat={lat}, lon={lon}")
 
         # Format dates (YYYYMMDD)
@@ -211,21 +266,7 @@ class NASAPowerClient:
                 response.raise_for_status()
 
                 data = response.json()
-                parsed_data = self._parse_response(data)
-
-                # 3. Save to cache (if available)
-                if self.cache and parsed_data:
-                    await self.cache.set(
-                        source="nasa_power",
-                        lat=lat,
-                        lon=lon,
-                        start=start_date,
-                        end=end_date,
-                        data=parsed_data,
-                    )
-                    logger.info(f"Cache SAVE: NASA POWER lat={lat}, lon={lon}")
-
-                return parsed_data
+                return self._parse_response(data)
 
             except httpx.HTTPError as e:
                 logger.warning(
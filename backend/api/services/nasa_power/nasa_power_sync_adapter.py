@@ -9,12 +9,13 @@ This adapter allows using the asynchronous NASA POWER client in synchronous code
 (Celery tasks, sync endpoints).
 """
 
-import asyncio
 from datetime import datetime
 from typing import Any
 
 from loguru import logger
 
+from backend.api.services.async_bridge import run_coro_sync
+
 from .nasa_power_client import NASAPowerClient, NASAPowerConfig, NASAPowerData
 
 
@@ -66,7 +67,7 @@ class NASAPowerSyncAdapter:
                 end_date=datetime(2024, 1, 7)
             )
         """
-        return asyncio.run(
+        return run_coro_sync(
             self._async_get_daily_data(
                 lat=lat,
                 lon=lon,
@@ -76,6 +77,28 @@ class NASAPowerSyncAdapter:
             )
         )
 
+    async def get_daily_data(
+        self,
+        lat: float,
+        lon: float,
+        start_date: datetime,
+        end_date: datetime,
+        community: str = "AG",
+    ) -> list[NASAPowerData]:
+        """
+        Download NASA POWER data ASYNCHRONOUSLY.
+
+        Use this method in asynchronous contexts (FastAPI, fan-out of
+        multiple sources). For synchronous code, use get_daily_data_sync().
+        """
+        return await self._async_get_daily_data(
+            lat=lat,
+            lon=lon,
+            start_date=start_date,
+            end_date=end_date,
+            community=community,
+        )
+
     async def _async_get_daily_data(
         self,
         lat: float,
@@ -113,16 +136,7 @@ class NASAPowerSyncAdapter:
         Returns:
             bool: True if API is accessible
         """
-        try:
-            # Check if event loop is already running
-            asyncio.get_running_loop()
-            import nest_asyncio
-
-            nest_asyncio.apply()
-            return asyncio.run(self._async_health_check())
-        except RuntimeError:
-            # No loop running
-            return asyncio.run(self._async_health_check())
+        return run_coro_sync(self._async_health_check())
 
     async def _async_health_check(self) -> bool:
         """Internal asynchronous health check."""
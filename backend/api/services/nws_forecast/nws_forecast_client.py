@@ -48,8 +48,7 @@ General FAQs: https://weather-gov.github.io/api/general-faqs
 
 import asyncio
 import os
-from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import httpx
@@ -62,11 +61,14 @@ try:
         GeographicUtils,
     )
     from backend.api.services.weather_utils import (
+        HourlyResampler,
         WeatherConversionUtils,
     )
 except ImportError:
     from ..geographic_utils import GeographicUtils
-    from ..weather_utils import WeatherConversionUtils
+    from ..weather_utils import HourlyResampler, WeatherConversionUtils
+
+from backend.api.services.http_pool import get_http_client
 
 
 class NWSConfig(BaseModel):
@@ -265,9 +267,56 @@ class NWSForecastClient:
         Status: VALIDATED FOR PRODUCTION (Nov 2025).
     """
 
+    # Grid layer -> hourly expansion (HourlyResampler.expand_intervals)
+    GRID_LAYERS = {
+        "temperature": "repeat",
+        "dewpoint": "repeat",
+        "windSpeed": "repeat",
+        "relativeHumidity": "repeat",
+        "skyCover": "repeat",
+        # Period totals (6h/12h) spread over the hours of the period
+        "quantitativePrecipitation": "split",
+        "probabilityOfPrecipitation": "repeat",
+        # Official 12h extremes: kept at the start of the period
+        "maxTemperature": "start",
+        "minTemperature": "start",
+    }
+
+    # Layers whose hours define the hourly output
+    TIMESTAMP_LAYERS = (
+        "temperature",
+        "relativeHumidity",
+        "windSpeed",
+        "dewpoint",
+        "skyCover",
+    )
+
+    # Daily statistic -> (hourly column, aggregation)
+    DAILY_STATS = {
+        "temp_mean": ("temp", "mean"),
+        "temp_max": ("temp", "max"),
+        "temp_min": ("temp", "min"),
+        "official_max": ("max_temp", "max"),
+        "official_min": ("min_temp", "min"),
+        "humidity_mean": ("humidity", "mean"),
+        "wind_speed_mean": ("wind_2m", "mean"),
+        "dewpoint_mean": ("dewpoint", "mean"),
+        "pressure_mean": ("pressure", "mean"),
+        "precip_total": ("precip", "sum"),
+        "prob_precip_mean": ("prob_precip", "mean"),
+    }
+
     def __init__(self, config: NWSConfig | None = None):
         self.config = config or NWSConfig()
-        self.client = httpx.AsyncClient(
+        logger.info(
+            f"NWSForecastClient initialized | base_url={self.config.base_url}"
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client shared by all NWS Forecast clients."""
+        return get_http_client(
+            httpx.URL(self.config.base_url).host,
             base_url=self.config.base_url,
             timeout=self.config.timeout,
             headers={
@@ -275,14 +324,12 @@ class NWSForecastClient:
                 "Accept": "application/geo+json",
             },
             follow_redirects=True,
-        )
-        logger.info(
-            f"NWSForecastClient initialized | base_url={self.config.base_url}"
+            quota="nws_forecast",
         )
 
     async def close(self):
-        await self.client.aclose()
-        logger.debug("NWSForecastClient closed")
+        """Release the shared HTTP client (the pool stays open)."""
+        logger.debug("NWSForecastClient released")
 
     async def __aenter__(self):
         return self
@@ -304,7 +351,8 @@ class NWSForecastClient:
             lon: Longitude (-180 to 180)
 
         Returns:
-            dict with gridId, gridX, gridY, forecast_hourly_url
+            dict with gridId, gridX, gridY, forecast_hourly_url and
+            timeZone (IANA, used for the daily aggregation)
 
         Raises:
             httpx.HTTPStatusError: If coordinates outside coverage (404)
@@ -332,6 +380,7 @@ class NWSForecastClient:
                     "gridX": grid_x,
                     "gridY": grid_y,
                     "forecast_hourly_url": forecast_hourly_url,
+                    "timeZone": props.get("timeZone"),
                 }
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 404:
@@ -387,42 +436,48 @@ class NWSForecastClient:
         return layer_data.get("uom") if layer_data else None
 
     def _parse_grid_time_series(
-        self, values_array: list[dict]
-    ) -> dict[str, float]:
+        self, values_array: list[dict], how: str = "repeat"
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
-        Parse time series array from gridded data.
+        Parse time series array from gridded data into hourly steps.
 
         Format: [{"validTime": "ISO8601/DURATION", "value": number}, ...]
-        Returns: {timestamp_str: value}
+        Returns: (UTC datetime64[s] array, float array), sorted by time
 
-        Improvements: Added debug logging and timezone Z handling
+        Intervals ("2025-11-28T00:00:00+00:00/PT6H") are expanded to one
+        entry per hour (see HourlyResampler.expand_intervals for `how`).
         """
-        result = {}
-
+        valid_times = []
+        values = []
         for item in values_array:
-            try:
-                valid_time = item.get("validTime", "")
-                value = item.get("value")
-
-                if not valid_time or value is None:
-                    continue
-
-                # Parse "2025-11-28T00:00:00+00:00/PT1H" format
-                if "/" in valid_time:
-                    start_time_str = valid_time.split("/")[0]
-                else:
-                    start_time_str = valid_time
-
-                # Ensure consistent format (Z -> +00:00)
-                if start_time_str.endswith("Z"):
-                    start_time_str = start_time_str[:-1] + "+00:00"
-
-                result[start_time_str] = float(value)
-            except Exception as e:
-                logger.debug(f"Erro parsing time series item: {e}")
-                continue
-
-        return result
+            valid_time = item.get("validTime")
+            value = item.get("value")
+            if valid_time and value is not None:
+                valid_times.append(valid_time)
+                values.append(value)
+
+        return HourlyResampler.expand_intervals(valid_times, values, how)
+
+    @staticmethod
+    def _align_series(
+        times: np.ndarray, series: tuple[np.ndarray, np.ndarray]
+    ) -> np.ndarray:
+        """Values of `series` at each of `times` (NaN where missing)."""
+        series_times, series_values = series
+        # Overlapping intervals: first value for each hour wins
+        series_times, first = np.unique(series_times, return_index=True)
+        series_values = series_values[first]
+
+        aligned = np.full(len(times), np.nan)
+        if len(series_times) == 0:
+            return aligned
+        idx = np.searchsorted(series_times, times)
+        idx_clipped = np.minimum(idx, len(series_times) - 1)
+        match = (idx < len(series_times)) & (
+            series_times[idx_clipped] == times
+        )
+        aligned[match] = series_values[idx_clipped[match]]
+        return aligned
 
     def _parse_forecast_grid_data(
         self, response_data: dict[str, Any]
@@ -439,20 +494,23 @@ class NWSForecastClient:
         - windSpeed (m/s - already in correct unit)
         - dewpoint (°C - critical for ETo)
         - skyCover (% - for solar radiation estimation)
-        - quantitativePrecipitation (mm)
+        - quantitativePrecipitation (mm) - period totals spread evenly
+          over the hours of each period
         - probabilityOfPrecipitation (%)
 
         Note: maxTemperature/minTemperature are calculated during
         daily aggregation from hourly temperature values.
 
+        Every layer is expanded to hourly steps and aligned on the union
+        of the hourly timestamps with NumPy; unit conversions are applied
+        to whole columns at once.
+
         Args:
             response_data: JSON from /gridpoints/{wfo}/{x},{y} endpoint
 
         Returns:
             List of NWSHourlyData (complete hourly data for ETo)
         """
-        from datetime import timezone
-
         props = response_data.get("properties", {})
 
         # Log available variables for debugging
@@ -470,45 +528,18 @@ class NWSForecastClient:
 
         logger.debug(f"Available grid variables: {available_vars}")
 
-        # Extract time series and check units (uom property)
-        # NWS API uses WMO unit codes - typically SI (Celsius, km/h)
-        temp_layer = props.get("temperature", {})
-        temp_uom = self._get_uom_from_layer(temp_layer)
-        temps = self._parse_grid_time_series(temp_layer.get("values", []))
-
-        # Extract official max/min temperatures (12h/24h periods)
-        # More accurate than calculating from hourly values
-        max_temp_layer = props.get("maxTemperature", {})
-        max_temps_official = self._parse_grid_time_series(
-            max_temp_layer.get("values", [])
-        )
-        min_temp_layer = props.get("minTemperature", {})
-        min_temps_official = self._parse_grid_time_series(
-            min_temp_layer.get("values", [])
-        )
-
-        dewpoint_layer = props.get("dewpoint", {})
-        dewpoint_uom = self._get_uom_from_layer(dewpoint_layer)
-        dewpoint = self._parse_grid_time_series(
-            dewpoint_layer.get("values", [])
-        )
-
-        wind_layer = props.get("windSpeed", {})
-        wind_uom = self._get_uom_from_layer(wind_layer)
-        wind_speed = self._parse_grid_time_series(wind_layer.get("values", []))
+        series = {
+            name: self._parse_grid_time_series(
+                props.get(name, {}).get("values", []), how
+            )
+            for name, how in self.GRID_LAYERS.items()
+        }
 
-        humidity = self._parse_grid_time_series(
-            props.get("relativeHumidity", {}).get("values", [])
-        )
-        sky_cover = self._parse_grid_time_series(
-            props.get("skyCover", {}).get("values", [])
-        )
-        precip = self._parse_grid_time_series(
-            props.get("quantitativePrecipitation", {}).get("values", [])
-        )
-        precip_prob = self._parse_grid_time_series(
-            props.get("probabilityOfPrecipitation", {}).get("values", [])
-        )
+        # Check units (uom property)
+        # NWS API uses WMO unit codes - typically SI (Celsius, km/h)
+        temp_uom = self._get_uom_from_layer(props.get("temperature", {}))
+        dewpoint_uom = self._get_uom_from_layer(props.get("dewpoint", {}))
+        wind_uom = self._get_uom_from_layer(props.get("windSpeed", {}))
 
         # Log units for debugging (typically wmoUnit:degC, wmoUnit:km_h-1)
         logger.debug(
@@ -516,140 +547,115 @@ class NWSForecastClient:
             f"wind={wind_uom}"
         )
 
-        # Merge all timestamps
-        all_timestamps = set()
-        all_timestamps.update(temps.keys())
-        all_timestamps.update(humidity.keys())
-        all_timestamps.update(wind_speed.keys())
-        all_timestamps.update(dewpoint.keys())
-        all_timestamps.update(sky_cover.keys())
+        # Merge all hourly timestamps and filter past data
+        times = np.unique(
+            np.concatenate([series[name][0] for name in self.TIMESTAMP_LAYERS])
+        )
+        now_utc = HourlyResampler.to_datetime64(datetime.now(timezone.utc))
+        times = times[times >= now_utc]
+        if len(times) == 0:
+            return []
 
-        hourly_data = []
-        now_utc = datetime.now(timezone.utc)
+        column = {
+            name: self._align_series(times, series[name])
+            for name in self.GRID_LAYERS
+        }
 
-        for timestamp_str in sorted(all_timestamps):
-            try:
-                timestamp = datetime.fromisoformat(
-                    timestamp_str.replace("Z", "+00:00")
-                )
+        # Temperature / dewpoint - NWS typically uses wmoUnit:degC
+        temp_raw = column["temperature"]
+        if temp_uom and "degF" in temp_uom:
+            temp_fahrenheit = temp_raw
+            temp_celsius = WeatherConversionUtils.fahrenheit_to_celsius(
+                temp_raw
+            )
+        else:
+            temp_celsius = temp_raw
+            temp_fahrenheit = np.full(len(times), np.nan)
+
+        dewpoint_raw = column["dewpoint"]
+        if dewpoint_uom and "degF" in dewpoint_uom:
+            dewpoint_fahrenheit = dewpoint_raw
+            dewpoint_celsius = WeatherConversionUtils.fahrenheit_to_celsius(
+                dewpoint_raw
+            )
+        else:
+            dewpoint_celsius = dewpoint_raw
+            dewpoint_fahrenheit = np.full(len(times), np.nan)
+
+        # Wind speed - NWS uses wmoUnit:km_h-1 (km/h) as standard in 2025
+        wind_raw = column["windSpeed"]
+        wind_speed_mph = np.full(len(times), np.nan)
+        if wind_uom and ("m_s-1" in wind_uom or "m/s" in wind_uom):
+            wind_speed_ms = wind_raw
+        elif wind_uom and ("mph" in wind_uom or "mi_h" in wind_uom):
+            wind_speed_mph = wind_raw
+            wind_speed_ms = WeatherConversionUtils.mph_to_ms(wind_raw)
+        else:
+            wind_speed_ms = wind_raw / 3.6  # km/h to m/s
 
-                # Filter past data
-                if timestamp < now_utc:
-                    continue
-
-                # Temperature - check units and convert if needed
-                temp_raw = temps.get(timestamp_str)
-                if temp_raw is not None:
-                    # NWS typically uses wmoUnit:degC (Celsius)
-                    if temp_uom and "degF" in temp_uom:
-                        temp_fahrenheit = temp_raw
-                        temp_celsius = (
-                            WeatherConversionUtils.fahrenheit_to_celsius(
-                                temp_raw
-                            )
-                        )
-                    else:
-                        # Default: already in Celsius
-                        temp_celsius = temp_raw
-                        temp_fahrenheit = None
-                else:
-                    temp_celsius = None
-                    temp_fahrenheit = None
-
-                # Dewpoint - check units and convert if needed
-                dewpoint_raw = dewpoint.get(timestamp_str)
-                if dewpoint_raw is not None:
-                    if dewpoint_uom and "degF" in dewpoint_uom:
-                        dewpoint_fahrenheit = dewpoint_raw
-                        dewpoint_celsius = (
-                            WeatherConversionUtils.fahrenheit_to_celsius(
-                                dewpoint_raw
-                            )
-                        )
-                    else:
-                        # Default: already in Celsius
-                        dewpoint_celsius = dewpoint_raw
-                        dewpoint_fahrenheit = None
-                else:
-                    dewpoint_celsius = None
-                    dewpoint_fahrenheit = None
-
-                # Wind speed - check units and convert if needed
-                wind_raw = wind_speed.get(timestamp_str)
-                if wind_raw is not None:
-                    # NWS uses wmoUnit:km_h-1 (km/h) as standard in 2025
-                    if wind_uom and ("m_s-1" in wind_uom or "m/s" in wind_uom):
-                        # Explicitly m/s - use directly
-                        wind_speed_ms = wind_raw
-                        wind_speed_mph = None
-                    elif wind_uom and (
-                        "mph" in wind_uom or "mi_h" in wind_uom
-                    ):
-                        # Imperial mph - convert
-                        wind_speed_mph = wind_raw
-                        wind_speed_ms = WeatherConversionUtils.mph_to_ms(
-                            wind_raw
-                        )
-                    else:
-                        # Default: NWS uses km/h (wmoUnit:km_h-1) in 2025
-                        # Convert km/h to m/s
-                        wind_speed_mph = None
-                        wind_speed_ms = wind_raw / 3.6  # km/h to m/s
-                else:
-                    wind_speed_ms = None
-                    wind_speed_mph = None
-
-                # Convert wind 10m to 2m (FAO-56)
-                wind_speed_2m_ms = (
-                    WeatherConversionUtils.convert_wind_10m_to_2m(
-                        wind_speed_ms
-                    )
-                    if wind_speed_ms is not None
-                    else None
-                )
+        # Convert wind 10m to 2m (FAO-56)
+        wind_speed_2m_ms = WeatherConversionUtils.convert_wind_10m_to_2m(
+            wind_speed_ms
+        )
 
-                # Humidity
-                humidity_percent = humidity.get(timestamp_str)
-
-                # Sky cover (for solar radiation estimation)
-                sky_cover_percent = sky_cover.get(timestamp_str)
-
-                # Precipitation (typically in mm)
-                # WARNING: may be accumulated over period, not hourly
-                precip_mm = precip.get(timestamp_str)
-                prob_precip_percent = precip_prob.get(timestamp_str)
-
-                # Official max/min temps from NWS (12h/24h periods)
-                max_temp_official = max_temps_official.get(timestamp_str)
-                min_temp_official = min_temps_official.get(timestamp_str)
-
-                hourly_data.append(
-                    NWSHourlyData(
-                        timestamp=timestamp_str,
-                        temp_celsius=temp_celsius,
-                        temp_fahrenheit=temp_fahrenheit,
-                        humidity_percent=humidity_percent,
-                        wind_speed_ms=wind_speed_ms,
-                        wind_speed_mph=wind_speed_mph,
-                        wind_speed_2m_ms=wind_speed_2m_ms,
-                        dewpoint_celsius=dewpoint_celsius,
-                        dewpoint_fahrenheit=dewpoint_fahrenheit,
-                        sky_cover_percent=sky_cover_percent,
-                        precip_mm=precip_mm,
-                        probability_precip_percent=prob_precip_percent,
-                        pressure_hpa=None,  # Will be set later from elevation
-                        max_temp_celsius=max_temp_official,
-                        min_temp_celsius=min_temp_official,
-                        short_forecast=None,
-                    )
-                )
-            except Exception as e:
-                logger.warning(
-                    f"Erro ao parsear timestamp {timestamp_str}: {e}"
-                )
-                continue
+        def optional(values: np.ndarray) -> list[float | None]:
+            return [None if np.isnan(v) else float(v) for v in values]
 
-        return hourly_data
+        timestamps = [
+            f"{ts}+00:00" for ts in np.datetime_as_string(times, unit="s")
+        ]
+
+        return [
+            NWSHourlyData(
+                timestamp=timestamp,
+                temp_celsius=temp_c,
+                temp_fahrenheit=temp_f,
+                humidity_percent=humidity_percent,
+                wind_speed_ms=wind_ms,
+                wind_speed_mph=wind_mph,
+                wind_speed_2m_ms=wind_2m,
+                dewpoint_celsius=dewpoint_c,
+                dewpoint_fahrenheit=dewpoint_f,
+                sky_cover_percent=sky_cover_percent,
+                precip_mm=precip_mm,
+                probability_precip_percent=prob_precip_percent,
+                pressure_hpa=None,  # Will be set later from elevation
+                max_temp_celsius=max_temp_official,
+                min_temp_celsius=min_temp_official,
+                short_forecast=None,
+            )
+            for (
+                timestamp,
+                temp_c,
+                temp_f,
+                humidity_percent,
+                wind_ms,
+                wind_mph,
+                wind_2m,
+                dewpoint_c,
+                dewpoint_f,
+                sky_cover_percent,
+                precip_mm,
+                prob_precip_percent,
+                max_temp_official,
+                min_temp_official,
+            ) in zip(
+                timestamps,
+                optional(temp_celsius),
+                optional(temp_fahrenheit),
+                optional(column["relativeHumidity"]),
+                optional(wind_speed_ms),
+                optional(wind_speed_mph),
+                optional(wind_speed_2m_ms),
+                optional(dewpoint_celsius),
+                optional(dewpoint_fahrenheit),
+                optional(column["skyCover"]),
+                optional(column["quantitativePrecipitation"]),
+                optional(column["probabilityOfPrecipitation"]),
+                optional(column["maxTemperature"]),
+                optional(column["minTemperature"]),
+            )
+        ]
 
     async def _delay_retry(self, attempt: int):
         """Exponential delay between retry attempts."""
@@ -866,6 +872,13 @@ class NWSForecastClient:
             httpx.HTTPStatusError: If coordinates outside coverage
             ValueError: If grid metadata invalid
         """
+        hourly_data, _ = await self._get_hourly_forecast(lat, lon)
+        return hourly_data
+
+    async def _get_hourly_forecast(
+        self, lat: float, lon: float
+    ) -> tuple[list[NWSHourlyData], str | None]:
+        """Hourly data plus the grid point's IANA timezone."""
         grid_meta = await self._get_grid_metadata(lat, lon)
         forecast_data = await self._get_forecast_grid_data(
             grid_meta["gridId"], grid_meta["gridX"], grid_meta["gridY"]
@@ -880,7 +893,7 @@ class NWSForecastClient:
         for hour_data in hourly_data:
             hour_data.pressure_hpa = pressure_hpa
 
-        return hourly_data
+        return hourly_data, grid_meta.get("timeZone")
 
     async def get_daily_forecast_data(
         self, lat: float, lon: float
@@ -904,6 +917,8 @@ class NWSForecastClient:
             - Wind: mean at 2m (numpy, FAO-56 converted)
             - Precipitation: sum (numpy)
             - Precipitation probability: mean (numpy)
+            Days follow the grid point's local timezone (/points
+            timeZone); statistics come from HourlyResampler.
 
         5-day limit:
             Filters only data up to (now + 5 days) per NWS documentation.
@@ -915,183 +930,97 @@ class NWSForecastClient:
         Returns:
             List of NWSDailyData (aggregated daily data, max 5 days)
         """
-        hourly_data = await self.get_forecast_data(lat, lon)
+        hourly_data, tz = await self._get_hourly_forecast(lat, lon)
 
         if not hourly_data:
             return []
 
-        daily_groups = defaultdict(list)
+        # Columnar daily statistics, grouped by local day of the grid point
+        times = HourlyResampler.parse_timestamps(
+            [h.timestamp for h in hourly_data]
+        )
 
-        for hour in hourly_data:
-            try:
-                timestamp = datetime.fromisoformat(
-                    hour.timestamp.replace("Z", "+00:00")
-                )
-                date_key = timestamp.date()
-                daily_groups[date_key].append(hour)
-            except Exception:
-                continue
+        def column(attr: str) -> np.ndarray:
+            return np.array(
+                [getattr(h, attr) for h in hourly_data], dtype=float
+            )
+
+        columns = {
+            "temp": column("temp_celsius"),
+            "max_temp": column("max_temp_celsius"),
+            "min_temp": column("min_temp_celsius"),
+            "humidity": column("humidity_percent"),
+            # Use wind at 2m (FAO-56 converted)
+            "wind_2m": column("wind_speed_2m_ms"),
+            "dewpoint": column("dewpoint_celsius"),
+            "pressure": column("pressure_hpa"),
+            # Precipitation: period totals already spread per hour
+            # (see _parse_forecast_grid_data), so the sum is the total
+            "precip": column("precip_mm"),
+            "prob_precip": column("probability_precip_percent"),
+        }
+        days, rows, stats = HourlyResampler.resample_daily(
+            times, columns, self.DAILY_STATS, tz=tz
+        )
+
+        # Hourly records are time-ordered: each day is a contiguous slice
+        hour_days = HourlyResampler.local_days(times, tz)
+        starts = np.searchsorted(hour_days, days, side="left")
+        optional = HourlyResampler.to_optional
 
         daily_data = []
-        now = datetime.now()
-        five_days_limit = now + timedelta(days=5)
+        five_days_limit = (datetime.now() + timedelta(days=5)).date()
 
-        for date_key in sorted(daily_groups.keys()):
-            if date_key > five_days_limit.date():
+        for i, day in enumerate(days):
+            date_key = day.astype(object)
+            if date_key > five_days_limit:
                 break  # Limit to 5 days
 
-            hours = daily_groups[date_key]
-
             # Skip incomplete days (< 20 hours) to avoid bias
-            if len(hours) < 20:
+            if rows[i] < 20:
                 logger.warning(
-                    f"Discarding {date_key}: only {len(hours)} hours "
+                    f"Discarding {date_key}: only {rows[i]} hours "
                     f"(partial days cause statistical bias)"
                 )
                 continue
 
-            temps = [
-                h.temp_celsius for h in hours if h.temp_celsius is not None
-            ]
-            humidities = [
-                h.humidity_percent
-                for h in hours
-                if h.humidity_percent is not None
-            ]
-            # Use wind at 2m (FAO-56 converted)
-            wind_speeds = [
-                h.wind_speed_2m_ms
-                for h in hours
-                if h.wind_speed_2m_ms is not None
-            ]
-            # Dewpoint for ETo calculation
-            dewpoints = [
-                h.dewpoint_celsius
-                for h in hours
-                if h.dewpoint_celsius is not None
-            ]
-            # Pressure for ETo calculation
-            pressures = [
-                h.pressure_hpa for h in hours if h.pressure_hpa is not None
-            ]
-            # Precipitation (quantitative from gridpoints)
-            # WARNING: Values may be accumulated over periods (6h/12h/24h)
-            # Direct summation may overestimate daily total
-            # Consider this an estimate, not precise measurement
-            precips = [h.precip_mm for h in hours if h.precip_mm is not None]
-            prob_precips = [
-                h.probability_precip_percent
-                for h in hours
-                if h.probability_precip_percent is not None
-            ]
-
-            temp_mean = float(np.mean(temps)) if temps else None
-
-            # Use official max/min temps from NWS if available
-            # (more accurate than hourly max/min)
-            official_max_temps = [
-                h.max_temp_celsius
-                for h in hours
-                if h.max_temp_celsius is not None
-            ]
-            official_min_temps = [
-                h.min_temp_celsius
-                for h in hours
-                if h.min_temp_celsius is not None
-            ]
-
-            # Prefer official values, fallback to hourly max/min
-            if official_max_temps:
-                temp_max = float(np.max(official_max_temps))
-            elif temps:
-                temp_max = float(np.max(temps))
-            else:
-                temp_max = None
-
-            if official_min_temps:
-                temp_min = float(np.min(official_min_temps))
-            elif temps:
-                temp_min = float(np.min(temps))
-            else:
-                temp_min = None
-
-            humidity_mean = float(np.mean(humidities)) if humidities else None
-            wind_speed_mean = (
-                float(np.mean(wind_speeds)) if wind_speeds else None
-            )
-            dewpoint_mean = float(np.mean(dewpoints)) if dewpoints else None
-            pressure_mean = float(np.mean(pressures)) if pressures else None
-
-            # Precipitation (sum for daily total)
-            # WARNING: This is only an ESTIMATE!
-            # quantitativePrecipitation is accumulated over forecast periods
-            # (typically 6h, 12h, or 24h windows), NOT hourly values.
-            # Simply summing these values may overestimate the true daily
-            # total. For accurate precipitation, use NWS QPF or observation
-            # data.
-            precips = [h.precip_mm for h in hours if h.precip_mm is not None]
-            precip_total = float(np.sum(precips)) if precips else None
-
-            # Precipitation probability (mean)
-            prob_precips = [
-                h.probability_precip_percent
-                for h in hours
-                if h.probability_precip_percent is not None
-            ]
-            prob_precip_mean = (
-                float(np.mean(prob_precips)) if prob_precips else None
-            )
+            hours = hourly_data[starts[i] : starts[i] + rows[i]]
 
-            # Get short forecast from first hour of the day
-            short_forecast = hours[0].short_forecast if hours else None
+            # Prefer official max/min temps from NWS (more accurate than
+            # hourly max/min), fallback to hourly values
+            temp_max = optional(stats["official_max"][i])
+            if temp_max is None:
+                temp_max = optional(stats["temp_max"][i])
+            temp_min = optional(stats["official_min"][i])
+            if temp_min is None:
+                temp_min = optional(stats["temp_min"][i])
 
-            # Create daily data object first (needed for Rs calculation)
             daily_obj = NWSDailyData(
                 date=datetime.combine(date_key, datetime.min.time()),
-                temp_mean_celsius=temp_mean,
+                temp_mean_celsius=optional(stats["temp_mean"][i]),
                 temp_max_celsius=temp_max,
                 temp_min_celsius=temp_min,
-                humidity_mean_percent=humidity_mean,
-                wind_speed_mean_ms=wind_speed_mean,
-                dewpoint_mean_celsius=dewpoint_mean,
-                pressure_mean_hpa=pressure_mean,
+                humidity_mean_percent=optional(stats["humidity_mean"][i]),
+                wind_speed_mean_ms=optional(stats["wind_speed_mean"][i]),
+                dewpoint_mean_celsius=optional(stats["dewpoint_mean"][i]),
+                pressure_mean_hpa=optional(stats["pressure_mean"][i]),
                 solar_radiation_mj_m2_day=None,  # Calculated next
-                precip_total_mm=precip_total,
-                probability_precip_mean_percent=prob_precip_mean,
-                short_forecast=short_forecast,
+                precip_total_mm=optional(stats["precip_total"][i]),
+                probability_precip_mean_percent=optional(
+                    stats["prob_precip_mean"][i]
+                ),
+                # Short forecast from first hour of the day
+                short_forecast=hours[0].short_forecast,
                 hourly_data=hours,
             )
 
             # Solar radiation estimate using calibrated USA-ASOS method
-            solar_radiation = self.estimate_daily_solar_radiation(
-                lat, daily_obj, method="usa_asos"
-            )
-            daily_obj.solar_radiation_mj_m2_day = solar_radiation
-
-            # Precipitation (sum for daily total)
-            precip_total = float(np.sum(precips)) if precips else None
-            prob_precip_mean = (
-                float(np.mean(prob_precips)) if prob_precips else None
-            )
-            short_forecast = hours[0].short_forecast if hours else None
-
-            daily_data.append(
-                NWSDailyData(
-                    date=datetime.combine(date_key, datetime.min.time()),
-                    temp_mean_celsius=temp_mean,
-                    temp_max_celsius=temp_max,
-                    temp_min_celsius=temp_min,
-                    humidity_mean_percent=humidity_mean,
-                    wind_speed_mean_ms=wind_speed_mean,
-                    dewpoint_mean_celsius=dewpoint_mean,
-                    pressure_mean_hpa=pressure_mean,
-                    solar_radiation_mj_m2_day=solar_radiation,
-                    precip_total_mm=precip_total,
-                    probability_precip_mean_percent=prob_precip_mean,
-                    short_forecast=short_forecast,
-                    hourly_data=hours,
+            daily_obj.solar_radiation_mj_m2_day = (
+                self.estimate_daily_solar_radiation(
+                    lat, daily_obj, method="usa_asos"
                 )
             )
+            daily_data.append(daily_obj)
 
         # Data availability verification
         if not daily_data:
@@ -25,13 +25,14 @@ Related Files:
 - nws_stations_sync_adapter.py: Adapter for stations/observations
 """
 
-import asyncio
 from datetime import datetime
 from typing import List, Optional
 
 from loguru import logger
 from pydantic import BaseModel
 
+from backend.api.services.async_bridge import run_coro_sync
+
 from .nws_forecast_client import (
     create_nws_forecast_client,
 )
@@ -137,13 +138,7 @@ class NWSDailyForecastSyncAdapter:
                 await client.close()
 
         try:
-            # Always create new event loop to avoid conflicts
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(_health_check_async())
-            finally:
-                loop.close()
+            return run_coro_sync(_health_check_async())
         except Exception as e:
             logger.error(f"NWS Forecast health check failed: {e}")
             return False
@@ -238,18 +233,23 @@ class NWSDailyForecastSyncAdapter:
         Returns:
             List of aggregated daily records with ETo variables
         """
+        return run_coro_sync(
+            self.get_daily_data(lat, lon, start_date, end_date)
+        )
+
+    async def get_daily_data(
+        self, lat: float, lon: float, start_date: datetime, end_date: datetime
+    ) -> List[NWSDailyForecastRecord]:
+        """
+        Asynchronous counterpart of get_daily_data_sync().
+
+        Same contract as the sync wrapper: failures are logged and an
+        empty list is returned.
+        """
         try:
-            # Create new event loop (avoids "Event loop is closed")
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(
-                    self._get_daily_data_async(lat, lon, start_date, end_date)
-                )
-                return result
-            finally:
-                # Ensure loop cleanup
-                loop.close()
+            return await self._get_daily_data_async(
+                lat, lon, start_date, end_date
+            )
         except Exception as e:
             logger.error(f"NWS Forecast sync wrapper failed: {e}")
             return []
@@ -21,6 +21,8 @@ from pydantic import BaseModel, Field
 # Para lidar com timezone da estação
 import pytz
 
+from backend.api.services.http_pool import get_http_client
+
 
 # Import opcional para fallback geográfico
 class _GeographicUtilsFallback:
@@ -106,22 +108,25 @@ class NWSStationsClient:
     ):
         self.config = config or NWSStationsConfig()
         self.cache = cache
+        logger.success("NWSStationsClient initialized")
 
-        headers = {
-            "User-Agent": self.config.user_agent,
-            "Accept": "application/geo+json",
-        }
-
-        self.client = httpx.AsyncClient(
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client shared by all NWS Stations clients."""
+        return get_http_client(
+            httpx.URL(self.config.base_url).host,
             timeout=self.config.timeout,
-            headers=headers,
+            headers={
+                "User-Agent": self.config.user_agent,
+                "Accept": "application/geo+json",
+            },
             follow_redirects=True,
             limits=httpx.Limits(max_connections=50),
+            quota="nws_stations",
         )
-        logger.success("NWSStationsClient initialized")
 
     async def close(self):
-        await self.client.aclose()
+        """Release the shared HTTP client (the pool stays open)."""
 
     async def _get_grid(
         self, lat: float, lon: float
@@ -24,12 +24,13 @@ Known Issues Handled:
 - Null values in temperatures (max/min outside CST) - skipped
 """
 
-import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from loguru import logger
 
+from backend.api.services.async_bridge import run_coro_sync
+
 from .nws_stations_client import NWSStationsClient, NWSStationsConfig
 
 
@@ -83,7 +84,7 @@ class NWSStationsSyncAdapter:
     """
     Synchronous adapter for asynchronous NWSStationsClient.
 
-    Converts synchronous calls to asynchronous using asyncio.run(),
+    Converts synchronous calls to asynchronous using run_coro_sync(),
     maintaining compatibility with legacy code (Celery tasks).
 
     Responsibilities:
@@ -164,7 +165,7 @@ class NWSStationsSyncAdapter:
         )
 
         # Execute async function synchronously
-        return asyncio.run(
+        return run_coro_sync(
             self._async_get_daily_data(
                 lat=lat,
                 lon=lon,
@@ -325,7 +326,7 @@ class NWSStationsSyncAdapter:
         Returns:
             bool: True if API is accessible
         """
-        return asyncio.run(self._async_health_check())
+        return run_coro_sync(self._async_health_check())
 
     async def _async_health_check(self) -> bool:
         """
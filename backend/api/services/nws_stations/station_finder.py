@@ -5,27 +5,49 @@ Station Finder with PostGIS
 - Integration with historical data
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence, Union
 
+import numpy as np
 from loguru import logger
 from sqlalchemy import text
+from sqlalchemy.engine import Result
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from backend.api.services.async_bridge import run_coro_sync
+
 
 class StationFinder:
     """
     Station Locator with PostGIS support
 
+    Accepts an AsyncSession (FastAPI routes, via get_async_db) or a
+    synchronous Session (Celery/scripts). Sync sessions are executed in a
+    worker thread so a slow spatial query never blocks the event loop.
+    The *_sync wrappers run their own event loop and expect a sync
+    Session.
+
     Methods:
     - find_stations_in_radius: Search by radius (using spatial index)
     - get_weighted_climate_data: Distance-weighted data
     - find_studied_city: Search for city with historical data in DB
+    - find_stations_batch / find_studied_cities_batch: N targets in a
+      single KNN query, columnar results
     """
 
-    def __init__(self, db_session: Optional[Session] = None):
+    def __init__(
+        self, db_session: Optional[Union[AsyncSession, Session]] = None
+    ):
         self.db_session = db_session
         logger.info("StationFinder initialized with PostGIS support")
 
+    async def _execute(self, query, params: Dict[str, Any]) -> Result:
+        """Run a query on the async or sync session without blocking."""
+        if isinstance(self.db_session, AsyncSession):
+            return await self.db_session.execute(query, params)
+        return await asyncio.to_thread(self.db_session.execute, query, params)
+
     async def find_stations_in_radius(
         self,
         target_lat: float,
@@ -88,7 +110,7 @@ class StationFinder:
             """
             )
 
-            result = self.db_session.execute(
+            result = await self._execute(
                 query,
                 {
                     "lat": target_lat,
@@ -198,13 +220,15 @@ class StationFinder:
             """
             )
 
-            result = self.db_session.execute(
-                query,
-                {
-                    "lat": target_lat,
-                    "lon": target_lon,
-                    "max_distance_m": max_distance_km * 1000,
-                },
+            result = (
+                await self._execute(
+                    query,
+                    {
+                        "lat": target_lat,
+                        "lon": target_lon,
+                        "max_distance_m": max_distance_km * 1000,
+                    },
+                )
             ).first()
 
             if not result:
@@ -244,8 +268,8 @@ class StationFinder:
             """
             )
 
-            normals_result = self.db_session.execute(
-                normals_query, {"city_id": city_id}
+            normals_result = (
+                await self._execute(normals_query, {"city_id": city_id})
             ).fetchall()
 
             # Group by month (use most recent period)
@@ -343,13 +367,15 @@ class StationFinder:
                 """
                 )
 
-            result = self.db_session.execute(
-                query,
-                {
-                    "city_id": city_id,
-                    "month": month,
-                    "period_key": period_key,
-                },
+            result = (
+                await self._execute(
+                    query,
+                    {
+                        "city_id": city_id,
+                        "month": month,
+                        "period_key": period_key,
+                    },
+                )
             ).first()
 
             if result:
@@ -480,7 +506,7 @@ class StationFinder:
             """
             )
 
-            result = self.db_session.execute(
+            result = await self._execute(
                 query, {"city_id": city_id, "limit": limit}
             )
 
@@ -512,6 +538,111 @@ class StationFinder:
             logger.error(f"Error fetching nearby stations: {e}")
             return []
 
+    async def find_stations_batch(
+        self,
+        lats: Sequence[float],
+        lons: Sequence[float],
+        radius_km: float = 50,
+        k: int = 10,
+    ) -> Dict[str, np.ndarray]:
+        """
+        k nearest stations for N targets in one query.
+
+        Each target is matched with a LATERAL KNN subquery
+        (ORDER BY location <-> point LIMIT k) served by the GIST index,
+        so N targets cost one round-trip instead of N.
+
+        Args:
+            lats: Target latitudes
+            lons: Target longitudes (same length as lats)
+            radius_km: Search radius in km
+            k: Maximum stations per target
+
+        Returns:
+            Columnar arrays, one entry per (target, station) pair sorted
+            by target then distance. "target_index" maps each row back
+            to the position in lats/lons; targets without stations in
+            range have no rows.
+        """
+        if not self.db_session or len(lats) == 0:
+            return _empty_columns(_STATION_BATCH_COLUMNS)
+
+        try:
+            result = await self._execute(
+                _STATIONS_BATCH_QUERY,
+                {
+                    "lats": [float(lat) for lat in lats],
+                    "lons": [float(lon) for lon in lons],
+                    "radius_m": radius_km * 1000,
+                    "k": k,
+                },
+            )
+            columns = _to_columns(result.fetchall(), _STATION_BATCH_COLUMNS)
+            logger.info(
+                f"Batch station lookup: {len(columns['station_id'])} "
+                f"stations for {len(lats)} targets"
+            )
+            return columns
+
+        except Exception as e:
+            logger.error(f"Error in batch station lookup: {e}")
+            return _empty_columns(_STATION_BATCH_COLUMNS)
+
+    async def find_studied_cities_batch(
+        self,
+        lats: Sequence[float],
+        lons: Sequence[float],
+        max_distance_km: float = 10,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Nearest studied city and its monthly normals for N targets.
+
+        One query: LATERAL KNN for the city plus the most recent period
+        of each month's normals, aggregated per city.
+
+        Args:
+            lats: Target latitudes
+            lons: Target longitudes (same length as lats)
+            max_distance_km: Maximum distance to consider "nearby"
+
+        Returns:
+            Columnar arrays, one entry per target that has a city in
+            range ("target_index" maps back to lats/lons). Normals are
+            (n, 12) float arrays indexed by month - 1, NaN where a
+            month has no data.
+        """
+        if not self.db_session or len(lats) == 0:
+            return _empty_columns(_CITY_BATCH_COLUMNS, normals=True)
+
+        try:
+            result = await self._execute(
+                _CITIES_BATCH_QUERY,
+                {
+                    "lats": [float(lat) for lat in lats],
+                    "lons": [float(lon) for lon in lons],
+                    "max_distance_m": max_distance_km * 1000,
+                },
+            )
+            rows = result.fetchall()
+            columns = _to_columns(
+                [row[: len(_CITY_BATCH_COLUMNS)] for row in rows],
+                _CITY_BATCH_COLUMNS,
+            )
+            columns.update(
+                _normals_matrix(
+                    [row[len(_CITY_BATCH_COLUMNS) :] for row in rows]
+                )
+            )
+            logger.info(
+                f"Batch studied-city lookup: {len(rows)} of {len(lats)} "
+                f"targets matched"
+            )
+            return columns
+
+        except Exception as e:
+            logger.error(f"Error in batch studied-city lookup: {e}")
+            return _empty_columns(_CITY_BATCH_COLUMNS, normals=True)
+
     def find_studied_city_sync(
         self,
         target_lat: float,
@@ -521,7 +652,7 @@ class StationFinder:
         """
         Synchronous wrapper for find_studied_city() - compatible with synchronous code.
 
-        Uses asyncio.run() internally to execute coroutine.
+        Runs the coroutine on the process-wide loop (run_coro_sync).
 
         Args:
             target_lat: Target latitude
@@ -531,28 +662,9 @@ class StationFinder:
         Returns:
             Dict with city data and monthly normals, or None
         """
-        import asyncio
-
-        try:
-            # Try to execute directly with asyncio.run
-            return asyncio.run(
-                self.find_studied_city(target_lat, target_lon, max_distance_km)
-            )
-        except RuntimeError as e:
-            if "already running" in str(e):
-                # If event loop already running, create new task
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self.find_studied_city(
-                            target_lat, target_lon, max_distance_km
-                        ),
-                    )
-                    return future.result()
-            else:
-                raise
+        return run_coro_sync(
+            self.find_studied_city(target_lat, target_lon, max_distance_km)
+        )
 
     def find_stations_in_radius_sync(
         self,
@@ -564,7 +676,7 @@ class StationFinder:
         """
         Synchronous wrapper for find_stations_in_radius() - compatible with synchronous code.
 
-        Uses asyncio.run() internally to execute coroutine.
+        Runs the coroutine on the process-wide loop (run_coro_sync).
 
         Args:
             target_lat: Target latitude
@@ -575,27 +687,149 @@ class StationFinder:
         Returns:
             List of stations ordered by distance
         """
-        import asyncio
-
-        try:
-            # Try to execute directly with asyncio.run
-            return asyncio.run(
-                self.find_stations_in_radius(
-                    target_lat, target_lon, radius_km, limit
-                )
+        return run_coro_sync(
+            self.find_stations_in_radius(
+                target_lat, target_lon, radius_km, limit
             )
-        except RuntimeError as e:
-            if "already running" in str(e):
-                # If event loop already running, create new task
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self.find_stations_in_radius(
-                            target_lat, target_lon, radius_km, limit
-                        ),
-                    )
-                    return future.result()
-            else:
-                raise
+        )
+
+
+# ============================================================================
+# Batch lookups (columnar)
+# ============================================================================
+
+# Targets as parallel arrays; idx is the 0-based position in the input
+_TARGETS_CTE = """
+    WITH targets AS (
+        SELECT
+            t.idx - 1 AS idx,
+            ST_SetSRID(ST_MakePoint(t.lon, t.lat), 4326)::geography AS geog
+        FROM unnest(
+            CAST(:lats AS double precision[]),
+            CAST(:lons AS double precision[])
+        ) WITH ORDINALITY AS t(lat, lon, idx)
+    )
+"""
+
+_STATION_BATCH_COLUMNS = (
+    ("target_index", np.int64),
+    ("station_id", np.int64),
+    ("station_code", object),
+    ("station_name", object),
+    ("latitude", np.float64),
+    ("longitude", np.float64),
+    ("elevation_m", np.float64),
+    ("data_source", object),
+    ("distance_km", np.float64),
+)
+
+_STATIONS_BATCH_QUERY = text(_TARGETS_CTE + """
+    SELECT
+        t.idx, s.id, s.station_code, s.station_name, s.latitude,
+        s.longitude, s.elevation_m, s.data_source, s.distance_km
+    FROM targets t
+    CROSS JOIN LATERAL (
+        SELECT
+            ws.id, ws.station_code, ws.station_name, ws.latitude,
+            ws.longitude, ws.elevation_m, ws.data_source,
+            ST_Distance(ws.location, t.geog) / 1000.0 AS distance_km
+        FROM climate_history.weather_stations ws
+        WHERE ST_DWithin(ws.location, t.geog, :radius_m)
+        ORDER BY ws.location <-> t.geog
+        LIMIT :k
+    ) s
+    ORDER BY t.idx, s.distance_km
+    """)
+
+_CITY_BATCH_COLUMNS = (
+    ("target_index", np.int64),
+    ("city_id", np.int64),
+    ("city_name", object),
+    ("latitude", np.float64),
+    ("longitude", np.float64),
+    ("elevation_m", np.float64),
+    ("distance_km", np.float64),
+)
+
+# Normals aggregated per city: most recent period of each month
+_NORMAL_FIELDS = (
+    "eto_normal",
+    "eto_daily_std",
+    "precip_normal",
+    "precip_daily_std",
+    "rain_probability",
+)
+
+_CITIES_BATCH_QUERY = text(_TARGETS_CTE + """
+    SELECT
+        t.idx, c.id, c.city_name, c.latitude, c.longitude, c.elevation,
+        c.distance_km,
+        n.months, n.eto_normal, n.eto_daily_std, n.precip_normal,
+        n.precip_daily_std, n.rain_probability
+    FROM targets t
+    CROSS JOIN LATERAL (
+        SELECT
+            sc.id, sc.city_name, sc.latitude, sc.longitude, sc.elevation,
+            ST_Distance(sc.location, t.geog) / 1000.0 AS distance_km
+        FROM climate_history.studied_cities sc
+        WHERE ST_DWithin(sc.location, t.geog, :max_distance_m)
+        ORDER BY sc.location <-> t.geog
+        LIMIT 1
+    ) c
+    LEFT JOIN LATERAL (
+        SELECT
+            array_agg(m.month ORDER BY m.month) AS months,
+            array_agg(m.eto_normal ORDER BY m.month) AS eto_normal,
+            array_agg(m.eto_daily_std ORDER BY m.month) AS eto_daily_std,
+            array_agg(m.precip_normal ORDER BY m.month) AS precip_normal,
+            array_agg(m.precip_daily_std ORDER BY m.month)
+                AS precip_daily_std,
+            array_agg(m.rain_probability ORDER BY m.month)
+                AS rain_probability
+        FROM (
+            SELECT DISTINCT ON (month)
+                month, eto_normal, eto_daily_std, precip_normal,
+                precip_daily_std, rain_probability
+            FROM climate_history.monthly_climate_normals
+            WHERE city_id = c.id
+            ORDER BY month, period_key DESC
+        ) m
+    ) n ON true
+    ORDER BY t.idx
+    """)
+
+
+def _empty_columns(spec, normals: bool = False) -> Dict[str, np.ndarray]:
+    columns = {name: np.empty(0, dtype=dtype) for name, dtype in spec}
+    if normals:
+        columns.update(_normals_matrix([]))
+    return columns
+
+
+def _to_columns(rows: Sequence[Sequence[Any]], spec) -> Dict[str, np.ndarray]:
+    """Rows -> one array per column (NULL -> NaN in float columns)."""
+    if not rows:
+        return _empty_columns(spec)
+    values = list(zip(*rows))
+    columns = {}
+    for (name, dtype), column in zip(spec, values):
+        if dtype is np.float64:
+            column = [np.nan if v is None else v for v in column]
+        columns[name] = np.asarray(column, dtype=dtype)
+    return columns
+
+
+def _normals_matrix(rows: Sequence[Sequence[Any]]) -> Dict[str, np.ndarray]:
+    """(months, *field arrays) per city -> (n, 12) arrays per field."""
+    matrices = {
+        field: np.full((len(rows), 12), np.nan) for field in _NORMAL_FIELDS
+    }
+    for i, (months, *fields) in enumerate(rows):
+        if not months:
+            continue
+        month_idx = np.asarray(months, dtype=np.int64) - 1
+        for field, values in zip(_NORMAL_FIELDS, fields):
+            matrices[field][i, month_idx] = [
+                np.nan if v is None else v for v in values
+            ]
+    return matrices
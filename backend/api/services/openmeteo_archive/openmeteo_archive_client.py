@@ -27,21 +27,29 @@ Variables (10):
 - Relative Humidity: mean, max, min (%)
 - Wind Speed: mean at 10m (m/s)
 
-CACHE STRATEGY (Nov 2025):
-- Redis cache via ClimateCache
+CACHE STRATEGY:
+- Coordinates snapped to a 0.1° grid cell before cache lookup
+- Redis per-day cache via ClimateCacheService.get_range (only the
+  missing days of a period are requested; TTL by age of each day;
+  identical in-flight requests share one upstream call)
 - Fallback: requests_cache local
 - TTL: 24h
 """
 
-from datetime import datetime, timedelta
-from typing import Any, Dict
+import asyncio
+import math
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Tuple
 
+import numpy as np
 import openmeteo_requests
 import requests_cache
 from loguru import logger
 from retry_requests import retry
 
 from backend.api.services.geographic_utils import GeographicUtils
+from backend.api.services.rate_limiter import get_rate_limiter
+from backend.infrastructure.cache.api_usage_tracker import ensure_api_quota
 from backend.api.services.weather_utils import (
     WeatherConversionUtils,
 )
@@ -64,6 +72,10 @@ class OpenMeteoArchiveConfig:
     # Cache TTL (historical data is stable)
     CACHE_TTL = 86400  # 24 hours (may have corrections)
 
+    # Grid used for cache keys (degrees, ~11 km): close to the ~9 km
+    # IFS/ERA5-Land cells behind best_match
+    GRID_RESOLUTION = 0.1
+
     # 10 Climate variables
     DAILY_VARIABLES = [
         "temperature_2m_mean",
@@ -83,6 +95,13 @@ class OpenMeteoArchiveConfig:
     RETRY_ATTEMPTS = 5
     BACKOFF_FACTOR = 0.2
 
+    # Long periods: 5-year chunks fetched concurrently
+    CHUNK_THRESHOLD_DAYS = 3650
+    CHUNK_SIZE_DAYS = 1826
+    MAX_CONCURRENT_CHUNKS = 4
+    RATE_LIMIT_RETRIES = 3
+    RATE_LIMIT_BACKOFF = 60  # seconds
+
 
 class OpenMeteoArchiveClient:
     """
@@ -102,6 +121,10 @@ class OpenMeteoArchiveClient:
         self.config = OpenMeteoArchiveConfig()
         self.cache = cache  # Redis cache (opcional)
         self._setup_client(cache_dir)
+        # Token bucket shared across workers through Redis when available
+        self.rate_limiter = get_rate_limiter(
+            "openmeteo_archive", redis=getattr(cache, "redis", None)
+        )
 
         cache_type = "Redis" if cache else "Local"
         logger.info(
@@ -138,8 +161,8 @@ class OpenMeteoArchiveClient:
           climate_source_availability.py
         This client ONLY fetches data, without re-validating dates.
 
-        Uses Redis cache if available, with TTL 24h
-        (historical data is stable).
+        Uses the per-day Redis cache if available: only days missing
+        from the cache are requested from the API.
 
         Args:
             lat: Latitude (-90 to 90)
@@ -150,32 +173,104 @@ class OpenMeteoArchiveClient:
         # 1. Validate inputs
         self._validate_inputs(lat, lng, start_date, end_date)
 
-        # 2. Try Redis cache first (if available)
+        # 2. Day-granular Redis cache: only missing days hit the API
         if self.cache:
-            cache_key = self._get_cache_key(lat, lng, start_date, end_date)
-            cached_data = await self.cache.get(cache_key)
+            return await self._get_cached_climate_data(
+                lat, lng, start_date, end_date
+            )
 
-            if cached_data:
-                logger.info(
-                    f"Cache HIT (Redis): OpenMeteo Archive "
-                    f"({lat:.4f}, {lng:.4f})"
-                )
-                return cached_data
+        # 3. Fetch from API
+        return await self._fetch_climate_data(lat, lng, start_date, end_date)
 
-        # 3. Prepare API parameters
-        params = {
-            "latitude": lat,
-            "longitude": lng,
-            "start_date": start_date,
-            "end_date": end_date,
-            "daily": self.config.DAILY_VARIABLES,
-            "models": "best_match",
-            "timezone": "auto",
-            "wind_speed_unit": "ms",
+    async def _get_cached_climate_data(
+        self, lat: float, lng: float, start_date: str, end_date: str
+    ) -> Dict[str, Any]:
+        """
+        Serve a period from the per-day cache, fetching missing days.
+
+        Overlapping requests (e.g. dashboard windows of 7/14/21/30 days)
+        reuse the days already cached; each day expires according to
+        its own age (ClimateCacheService.get_range).
+
+        Cache entries are keyed by the grid cell (nearby clicks share
+        them), so the API is called at the cell centre too: Open-Meteo
+        downscales by the elevation of the requested point, and every
+        point in the cell must get the data the key stands for.
+        """
+        key_lat, key_lng = GeographicUtils.snap_to_grid(
+            lat, lng, self.config.GRID_RESOLUTION
+        )
+        fetched_location: Dict[str, Any] = {}
+
+        async def fetch_days(start: date, end: date) -> Dict[date, Any]:
+            result = await self._fetch_climate_data(
+                key_lat, key_lng, start.isoformat(), end.isoformat()
+            )
+            fetched_location.update(
+                (k, v.decode() if isinstance(v, bytes) else v)
+                for k, v in result["location"].items()
+            )
+            # Saved inside get_range so that requests coalesced onto
+            # this fetch (other workers) find the metadata too
+            await self.cache.set_meta(
+                "openmeteo_archive", key_lat, key_lng, fetched_location
+            )
+            climate_data = result["climate_data"]
+            variables = [k for k in climate_data if k != "dates"]
+            # The API returns exactly the requested days, in order; keying
+            # by position avoids server-vs-location timezone shifts
+            return {
+                start
+                + timedelta(days=i): {
+                    var: climate_data[var][i] for var in variables
+                }
+                for i in range(len(climate_data["dates"]))
+            }
+
+        days = await self.cache.get_range(
+            "openmeteo_archive",
+            key_lat,
+            key_lng,
+            datetime.strptime(start_date, "%Y-%m-%d").date(),
+            datetime.strptime(end_date, "%Y-%m-%d").date(),
+            fetch=fetch_days,
+        )
+
+        location = (
+            fetched_location
+            or await self.cache.get_meta("openmeteo_archive", key_lat, key_lng)
+            or {"latitude": key_lat, "longitude": key_lng}
+        )
+
+        climate_data: Dict[str, list] = {
+            "dates": [datetime.combine(day, time()) for day in days]
         }
+        for record in days.values():
+            for var, value in record.items():
+                climate_data.setdefault(var, []).append(value)
 
         logger.info(
-            f"Cache MISS: Archive API {start_date} to {end_date} | "
+            f"Archive: {len(days)} days | "
+            f"{'fetched' if fetched_location else 'all cached'}"
+        )
+        return {
+            "location": location,
+            "climate_data": climate_data,
+            "metadata": {
+                "api": "archive",
+                "url": self.config.BASE_URL,
+                "data_points": len(days),
+                "cache_ttl_hours": 24,
+                "cache": "daily",
+            },
+        }
+
+    async def _fetch_climate_data(
+        self, lat: float, lng: float, start_date: str, end_date: str
+    ) -> Dict[str, Any]:
+        """Fetch a period from the Archive API (chunked if > 10 years)."""
+        logger.info(
+            f"Archive API {start_date} to {end_date} | "
             f"({lat:.4f}, {lng:.4f})"
         )
 
@@ -185,7 +280,7 @@ class OpenMeteoArchiveClient:
         days_diff = (end_dt - start_dt).days
 
         # If period > 3650 days (10 years), split into 5-year chunks
-        if days_diff > 3650:
+        if days_diff > self.config.CHUNK_THRESHOLD_DAYS:
             logger.warning(
                 f"Long period ({days_diff} days) - "
                 f"Splitting into 5-year chunks"
@@ -194,82 +289,13 @@ class OpenMeteoArchiveClient:
 
         # 4. Fetch data from Archive API (normal flow for < 10 years)
         try:
-            responses = self.client.weather_api(
-                self.config.BASE_URL, params=params
-            )
-            response = responses[0]  # Single location
-
-            # 4. Extract location metadata
-            location = {
-                "latitude": response.Latitude(),
-                "longitude": response.Longitude(),
-                "elevation": response.Elevation(),
-                "timezone": response.Timezone(),
-                "timezone_abbreviation": response.TimezoneAbbreviation(),
-                "utc_offset_seconds": response.UtcOffsetSeconds(),
-            }
-
-            # 5. Extract climate data
-            daily = response.Daily()
-
-            # Extract time range - use TimeEnd() to get both start and end
-            time_start = daily.Time()
-            time_end = daily.TimeEnd()
-            time_interval = daily.Interval()
-
-            logger.debug(
-                f"time_start: {time_start}, time_end: {time_end}, "
-                f"interval: {time_interval}"
+            location, timestamps, columns = await self._fetch_period(
+                lat, lng, start_date, end_date
             )
+            climate_data = self._build_climate_data([timestamps], [columns])
+            dates = climate_data["dates"]
 
-            # Generate full date range
-            if time_start == time_end:
-                # Single day
-                timestamps = [int(time_start)]
-            else:
-                # Multiple days - generate range
-                # NOTE: time_end is already INCLUSIVE, don't add +1
-                timestamps = list(
-                    range(int(time_start), int(time_end), int(time_interval))
-                )
-
-            logger.debug(f"Generated {len(timestamps)} timestamps")
-
-            dates = [datetime.fromtimestamp(ts) for ts in timestamps]
-
-            climate_data = {"dates": dates}
-
-            # Map variables to data
-            for i, var_name in enumerate(self.config.DAILY_VARIABLES):
-                try:
-                    values = daily.Variables(i).ValuesAsNumpy()
-                    # Handle scalar values (single day) vs arrays
-                    if hasattr(values, "tolist"):
-                        climate_data[var_name] = values.tolist()
-                    else:
-                        # Scalar value - wrap in list
-                        climate_data[var_name] = [float(values)]
-                except Exception as e:
-                    logger.warning(f"Variable {var_name} not available: {e}")
-                    climate_data[var_name] = [None] * len(dates)
-
-            # Convert wind from 10m to 2m for FAO-56 PM equation
-            if "wind_speed_10m_mean" in climate_data:
-                wind_10m = climate_data["wind_speed_10m_mean"]
-                wind_2m = [
-                    (
-                        WeatherConversionUtils.convert_wind_10m_to_2m(w)
-                        if w is not None
-                        else None
-                    )
-                    for w in wind_10m
-                ]
-                climate_data["wind_speed_2m_mean"] = wind_2m
-                logger.debug(
-                    f"Converted wind 10m to 2m: {len(wind_2m)} values"
-                )
-
-            # 6. Add metadata
+            # 5. Add metadata
             metadata = {
                 "api": "archive",
                 "url": self.config.BASE_URL,
@@ -287,26 +313,175 @@ class OpenMeteoArchiveClient:
                 f"Archive: {len(dates)} days | "
                 f"Elevation: {location['elevation']:.0f}m"
             )
-
-            # 7. Save to Redis cache (if available)
-            if self.cache:
-                ttl = 86400  # 24h
-                cache_key = self._get_cache_key(lat, lng, start_date, end_date)
-                await self.cache.set(cache_key, result, ttl=ttl)
-                logger.debug(f"Cached with TTL {ttl}s (24h)")
-
             return result
 
         except Exception as e:
             logger.error(f"Archive API error: {str(e)}")
             raise
 
+    async def _fetch_period(
+        self, lat: float, lng: float, start_date: str, end_date: str
+    ) -> Tuple[Dict[str, Any], np.ndarray, Dict[str, np.ndarray | None]]:
+        """
+        Fetch one period without blocking the event loop.
+
+        Waits for the shared rate limiter (cost weighted like Open-Meteo
+        counts API calls), runs the blocking SDK request in a worker
+        thread and retries on rate-limit errors with a non-blocking
+        backoff.
+        """
+        days = (
+            datetime.strptime(end_date, "%Y-%m-%d")
+            - datetime.strptime(start_date, "%Y-%m-%d")
+        ).days + 1
+        cost = max(1.0, len(self.config.DAILY_VARIABLES) / 10) * max(
+            1.0, days / 14
+        )
+
+        for attempt in range(self.config.RATE_LIMIT_RETRIES + 1):
+            await self.rate_limiter.acquire(cost)
+            await ensure_api_quota("openmeteo_archive", math.ceil(cost))
+            try:
+                return await asyncio.to_thread(
+                    self._request_period, lat, lng, start_date, end_date
+                )
+            except Exception as e:
+                if (
+                    "request limit exceeded" not in str(e).lower()
+                    or attempt == self.config.RATE_LIMIT_RETRIES
+                ):
+                    raise
+                logger.warning(
+                    f"Rate limit reached! Retrying {start_date} to "
+                    f"{end_date} in {self.config.RATE_LIMIT_BACKOFF}s..."
+                )
+                await asyncio.sleep(self.config.RATE_LIMIT_BACKOFF)
+
+    def _request_period(
+        self, lat: float, lng: float, start_date: str, end_date: str
+    ) -> Tuple[Dict[str, Any], np.ndarray, Dict[str, np.ndarray | None]]:
+        """
+        Blocking Archive API request for one period.
+
+        Returns:
+            Tuple (location metadata, unix timestamps, values per
+            variable as NumPy arrays; None if variable unavailable)
+        """
+        params = {
+            "latitude": lat,
+            "longitude": lng,
+            "start_date": start_date,
+            "end_date": end_date,
+            "daily": self.config.DAILY_VARIABLES,
+            "models": "best_match",
+            "timezone": "auto",
+            "wind_speed_unit": "ms",
+        }
+        responses = self.client.weather_api(
+            self.config.BASE_URL, params=params
+        )
+        response = responses[0]  # Single location
+
+        # Extract location metadata
+        location = {
+            "latitude": response.Latitude(),
+            "longitude": response.Longitude(),
+            "elevation": response.Elevation(),
+            "timezone": response.Timezone(),
+            "timezone_abbreviation": response.TimezoneAbbreviation(),
+            "utc_offset_seconds": response.UtcOffsetSeconds(),
+        }
+
+        # Extract time range - use TimeEnd() to get both start and end
+        daily = response.Daily()
+        time_start = daily.Time()
+        time_end = daily.TimeEnd()
+        time_interval = daily.Interval()
+
+        logger.debug(
+            f"time_start: {time_start}, time_end: {time_end}, "
+            f"interval: {time_interval}"
+        )
+
+        if time_start == time_end:
+            # Single day
+            timestamps = np.array([int(time_start)])
+        else:
+            # Multiple days - NOTE: time_end is already INCLUSIVE
+            timestamps = np.arange(
+                int(time_start), int(time_end), int(time_interval)
+            )
+
+        columns: Dict[str, np.ndarray | None] = {}
+        for i, var_name in enumerate(self.config.DAILY_VARIABLES):
+            try:
+                # Scalar values (single day) become 1-element arrays
+                columns[var_name] = np.atleast_1d(
+                    daily.Variables(i).ValuesAsNumpy()
+                )
+            except Exception as e:
+                logger.warning(f"Variable {var_name} not available: {e}")
+                columns[var_name] = None
+
+        return location, timestamps, columns
+
+    def _build_climate_data(
+        self,
+        timestamps: List[np.ndarray],
+        columns: List[Dict[str, np.ndarray | None]],
+    ) -> Dict[str, list]:
+        """
+        Concatenate per-period columns into the climate_data dict.
+
+        Each variable is joined with a single np.concatenate and converted
+        to a list once. Wind is converted from 10m to 2m for the FAO-56
+        PM equation.
+        """
+        dates = [
+            datetime.fromtimestamp(ts)
+            for ts in np.concatenate(timestamps).tolist()
+        ]
+        climate_data: Dict[str, list] = {"dates": dates}
+
+        for var_name in self.config.DAILY_VARIABLES:
+            pieces = [chunk[var_name] for chunk in columns]
+            if all(piece is not None for piece in pieces):
+                climate_data[var_name] = np.concatenate(pieces).tolist()
+            else:
+                # Variable missing in some period: None for those days
+                values: list = []
+                for piece, ts in zip(pieces, timestamps):
+                    values += (
+                        piece.tolist()
+                        if piece is not None
+                        else [None] * len(ts)
+                    )
+                climate_data[var_name] = values
+
+        wind_10m = climate_data["wind_speed_10m_mean"]
+        if None in wind_10m:
+            climate_data["wind_speed_2m_mean"] = [
+                WeatherConversionUtils.convert_wind_10m_to_2m(w)
+                for w in wind_10m
+            ]
+        else:
+            # Same factor as WeatherConversionUtils, in float64
+            climate_data["wind_speed_2m_mean"] = (
+                np.asarray(wind_10m, dtype=np.float64) * 0.748
+            ).tolist()
+        logger.debug(f"Converted wind 10m to 2m: {len(dates)} values")
+
+        return climate_data
+
     async def _fetch_in_chunks(
         self, lat: float, lng: float, start_date: str, end_date: str
     ) -> Dict[str, Any]:
         """
         Fetch data in 5-year chunks to avoid buffer overflow errors.
 
+        Chunks run concurrently (up to MAX_CONCURRENT_CHUNKS), paced by
+        the shared token-bucket rate limiter.
+
         Args:
             lat: Latitude
             lng: Longitude
@@ -320,7 +495,7 @@ class OpenMeteoArchiveClient:
         end_dt = datetime.strptime(end_date, "%Y-%m-%d")
 
         # Split into 5-year chunks (1826 days)
-        chunk_size_days = 1826
+        chunk_size_days = self.config.CHUNK_SIZE_DAYS
         chunks = []
         current_start = start_dt
 
@@ -337,135 +512,42 @@ class OpenMeteoArchiveClient:
             current_start = current_end + timedelta(days=1)
 
         logger.info(f"Fetching {len(chunks)} chunks (5 years each)")
+        semaphore = asyncio.Semaphore(self.config.MAX_CONCURRENT_CHUNKS)
 
-        # Fetch all chunks
-        all_results = []
-        for i, chunk in enumerate(chunks, 1):
-            logger.info(
-                f"  Chunk {i}/{len(chunks)}: "
-                f"{chunk['start']} to {chunk['end']}"
-            )
-
-            # Recursive call with smaller period
-            params = {
-                "latitude": lat,
-                "longitude": lng,
-                "start_date": chunk["start"],
-                "end_date": chunk["end"],
-                "daily": self.config.DAILY_VARIABLES,
-                "models": "best_match",
-                "timezone": "auto",
-                "wind_speed_unit": "ms",
-            }
-
-            try:
-                responses = self.client.weather_api(
-                    self.config.BASE_URL, params=params
+        async def fetch_chunk(i: int, chunk: Dict[str, str]):
+            async with semaphore:
+                logger.info(
+                    f"  Chunk {i}/{len(chunks)}: "
+                    f"{chunk['start']} to {chunk['end']}"
                 )
-                response = responses[0]
-
-                # Extract data
-                daily = response.Daily()
-                time_start = daily.Time()
-                time_end = daily.TimeEnd()
-                time_interval = daily.Interval()
-
-                if time_start == time_end:
-                    timestamps = [int(time_start)]
-                else:
-                    timestamps = list(
-                        range(
-                            int(time_start), int(time_end), int(time_interval)
-                        )
+                try:
+                    result = await self._fetch_period(
+                        lat, lng, chunk["start"], chunk["end"]
                     )
+                except Exception as e:
+                    logger.error(f"  Chunk {i} failed: {str(e)}")
+                    raise
+                logger.success(f"  Chunk {i}: {len(result[1])} days")
+                return result
+
+        tasks = [
+            asyncio.ensure_future(fetch_chunk(i, chunk))
+            for i, chunk in enumerate(chunks, 1)
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
 
-                dates = [datetime.fromtimestamp(ts) for ts in timestamps]
-                climate_data = {"dates": dates}
-
-                for j, var_name in enumerate(self.config.DAILY_VARIABLES):
-                    try:
-                        values = daily.Variables(j).ValuesAsNumpy()
-                        if hasattr(values, "tolist"):
-                            climate_data[var_name] = values.tolist()
-                        else:
-                            climate_data[var_name] = [float(values)]
-                    except Exception as e:
-                        logger.warning(
-                            f"Variable {var_name} not available: {e}"
-                        )
-                        climate_data[var_name] = [None] * len(dates)
-
-                # Convert wind 10m to 2m
-                if "wind_speed_10m_mean" in climate_data:
-                    wind_10m = climate_data["wind_speed_10m_mean"]
-                    wind_2m = [
-                        (
-                            WeatherConversionUtils.convert_wind_10m_to_2m(w)
-                            if w is not None
-                            else None
-                        )
-                        for w in wind_10m
-                    ]
-                    climate_data["wind_speed_2m_mean"] = wind_2m
-
-                # Get location metadata from first chunk
-                if i == 1:
-                    location = {
-                        "latitude": response.Latitude(),
-                        "longitude": response.Longitude(),
-                        "elevation": response.Elevation(),
-                        "timezone": response.Timezone(),
-                        "timezone_abbreviation": (
-                            response.TimezoneAbbreviation()
-                        ),
-                        "utc_offset_seconds": response.UtcOffsetSeconds(),
-                    }
-
-                all_results.append(climate_data)
-                logger.success(f"  Chunk {i}: {len(dates)} days")
-
-                # Rate limiting: wait 12s between chunks
-                # 600 calls/min maximum - 5 chunks/min safe (12s each)
-                if i < len(chunks):  # Don't wait after last chunk
-                    import time
-
-                    time.sleep(12)
-                    logger.debug("  Waiting 12s (rate limit: 600/min)")
-
-            except Exception as e:
-                logger.error(f"  Chunk {i} failed: {str(e)}")
-                # If rate limit error, wait 60s and retry
-                if "request limit exceeded" in str(e).lower():
-                    import time
-
-                    logger.warning("  Rate limit reached! Waiting 60s...")
-                    time.sleep(60)
-                    logger.info(f"  Retry chunk {i}...")
-                    # Don't raise, continue to next chunk
-                    continue
-                raise
-
-        # Merge all chunks
+        # Merge all chunks (columnar, in chronological order)
         logger.info("Merging chunks...")
-        merged_data = {"dates": []}
-
-        for var_name in ["dates"] + self.config.DAILY_VARIABLES:
-            if var_name == "dates":
-                for chunk_data in all_results:
-                    merged_data["dates"].extend(chunk_data["dates"])
-            else:
-                merged_data[var_name] = []
-                for chunk_data in all_results:
-                    if var_name in chunk_data:
-                        merged_data[var_name].extend(chunk_data[var_name])
-
-        # Add wind_speed_2m_mean
-        if "wind_speed_2m_mean" in all_results[0]:
-            merged_data["wind_speed_2m_mean"] = []
-            for chunk_data in all_results:
-                merged_data["wind_speed_2m_mean"].extend(
-                    chunk_data["wind_speed_2m_mean"]
-                )
+        location = results[0][0]
+        merged_data = self._build_climate_data(
+            [timestamps for _, timestamps, _ in results],
+            [columns for _, _, columns in results],
+        )
 
         metadata = {
             "api": "archive",
@@ -485,27 +567,8 @@ class OpenMeteoArchiveClient:
         logger.success(
             f"Merged {len(chunks)} chunks to {len(merged_data['dates'])} days"
         )
-
-        # Cache the merged result
-        if self.cache:
-            ttl = 86400
-            cache_key = self._get_cache_key(lat, lng, start_date, end_date)
-            await self.cache.set(cache_key, result, ttl=ttl)
-            logger.debug(f"Cached merged result with TTL {ttl}s")
-
         return result
 
-    def _get_cache_key(
-        self, lat: float, lng: float, start_date: str, end_date: str
-    ) -> str:
-        """Generate Redis cache key."""
-        lat_rounded = round(lat, 2)
-        lng_rounded = round(lng, 2)
-        return (
-            f"climate:openmeteo:archive:{lat_rounded}:{lng_rounded}:"
-            f"{start_date}:{end_date}"
-        )
-
     def _validate_inputs(
         self, lat: float, lng: float, start_date: str, end_date: str
     ):
@@ -26,13 +26,14 @@ CACHE STRATEGY (Nov 2025):
 - TTL: 24h (historical data is stable)
 """
 
-import asyncio
 from datetime import datetime
 from typing import Any, Dict, List, Union
 
 import pandas as pd
 from loguru import logger
 
+from backend.api.services.async_bridge import run_coro_sync
+
 from .openmeteo_archive_client import (
     OpenMeteoArchiveClient,
 )
@@ -91,37 +92,31 @@ class OpenMeteoArchiveSyncAdapter:
         Returns:
             List of dictionaries with daily data
         """
+        # Execute async safely
+        return run_coro_sync(
+            self.get_daily_data(lat, lon, start_date, end_date)
+        )
+
+    async def get_daily_data(
+        self,
+        lat: float,
+        lon: float,
+        start_date: Union[str, datetime],
+        end_date: Union[str, datetime],
+    ) -> List[Dict[str, Any]]:
+        """
+        Download historical data ASYNCHRONOUSLY.
+
+        Use this method in asynchronous contexts.
+        For synchronous code, use get_daily_data_sync().
+        """
         # Convert strings to datetime if needed
         if isinstance(start_date, str):
             start_date = datetime.fromisoformat(start_date)
         if isinstance(end_date, str):
             end_date = datetime.fromisoformat(end_date)
 
-        # Execute async safely
-        try:
-            # Try to get existing loop
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Loop is already running (async server context)
-                # Create new task in existing loop
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._async_get_data(lat, lon, start_date, end_date),
-                    )
-                    return future.result()
-            else:
-                # Loop exists but is not running
-                return loop.run_until_complete(
-                    self._async_get_data(lat, lon, start_date, end_date)
-                )
-        except RuntimeError:
-            # No loop exists, create a new one
-            return asyncio.run(
-                self._async_get_data(lat, lon, start_date, end_date)
-            )
+        return await self._async_get_data(lat, lon, start_date, end_date)
 
     async def _async_get_data(
         self,
@@ -185,7 +180,7 @@ class OpenMeteoArchiveSyncAdapter:
         Returns:
             True if API is working, False otherwise
         """
-        return asyncio.run(self._async_health_check())
+        return run_coro_sync(self._async_health_check())
 
     async def _async_health_check(self) -> bool:
         """
@@ -28,14 +28,16 @@ Variables (10):
 - ET0 FAO Evapotranspiration (mm)
 
 CACHE STRATEGY (Nov 2025):
-- Redis cache via ClimateCache (optional)
+- Coordinates snapped to a 0.1° grid cell before cache lookup
+- Redis per-day cache via ClimateCacheService.get_range (optional;
+  only the missing days of a period are requested)
 - Fallback: requests_cache local (if Redis not available)
-- Dynamic TTL:
-  * Forecast (future): 1h
+- TTL by day:
+  * Forecast (today and future): 1h
   * Recent (past): 6h
 """
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from typing import Any, Dict
 
 import numpy as np
@@ -46,6 +48,7 @@ from loguru import logger
 from retry_requests import retry
 
 from backend.api.services.geographic_utils import GeographicUtils
+from backend.infrastructure.cache.api_usage_tracker import ensure_api_quota
 
 
 class OpenMeteoForecastConfig:
@@ -64,6 +67,12 @@ class OpenMeteoForecastConfig:
 
     # Cache TTL (data updates daily)
     CACHE_TTL = 3600 * 6  # 6 hours
+    # Today and future days change with each model run
+    FORECAST_CACHE_TTL = 3600  # 1 hour
+
+    # Grid used for cache keys (degrees, ~11 km): close to the ~9 km
+    # IFS/ICON cells behind best_match
+    GRID_RESOLUTION = 0.1
 
     # 10 Climate variables
     DAILY_VARIABLES = [
@@ -139,16 +148,14 @@ class OpenMeteoForecastClient:
           climate_source_availability.py
         This client ONLY fetches data, without re-validating dates.
 
-        Uses Redis cache if available, with TTL based on data type:
-        - Forecast (future): TTL 1h
+        Uses the per-day Redis cache if available, with TTL by day:
+        - Forecast (today and future): TTL 1h
         - Recent (past): TTL 6h
         """
         # 1. Validate inputs
         self._validate_inputs(lat, lng, start_date, end_date)
 
         # Ajustar datas para limites da API
-        from datetime import datetime, timedelta
-
         start_dt = datetime.fromisoformat(start_date)
         end_dt = datetime.fromisoformat(end_date)
         today = datetime.now().date()
@@ -167,49 +174,110 @@ class OpenMeteoForecastClient:
             logger.warning(f"Ajustando end_date de {end_date} para {max_date}")
             end_date = max_date.isoformat()
 
-        # 2. Try Redis cache first (if available)
+        # 2. Day-granular Redis cache: only missing days hit the API
         if self.cache:
-            cache_key = self._get_cache_key(lat, lng, start_date, end_date)
-            cached_data = await self.cache.get(cache_key)
+            return await self._get_cached_climate_data(
+                lat, lng, start_date, end_date
+            )
 
-            if cached_data:
-                days_cached = len(
-                    cached_data.get("climate_data", {}).get("dates", [])
-                )
-                logger.info(
-                    f"Cache HIT (Redis): OpenMeteo Forecast "
-                    f"({lat:.4f}, {lng:.4f}) - {days_cached} days cached"
-                )
-                return cached_data
+        # 3. Fetch from API
+        return await self._fetch_climate_data(lat, lng, start_date, end_date)
+
+    async def _get_cached_climate_data(
+        self, lat: float, lng: float, start_date: str, end_date: str
+    ) -> Dict[str, Any]:
+        """
+        Serve a period from the per-day cache, fetching missing days.
 
-        # 3. Prepare API parameters
-        # OpenMeteo Forecast API: usa past_days e forecast_days
-        from datetime import datetime, timedelta
+        Same store as the Archive client (ClimateCacheService.get_range):
+        overlapping dashboard windows reuse the days already cached, and
+        each day expires with the forecast TTLs (_get_day_ttl).
 
-        # Recalcular datas após ajustes
-        start_dt = datetime.fromisoformat(start_date)
-        end_dt = datetime.fromisoformat(end_date)
-        today_date = datetime.now().date()
-
-        # Calcular past_days e forecast_days
-        # Forecast API usa hoje como ponto de referência
-        if start_dt.date() <= today_date:
-            past_days = (today_date - start_dt.date()).days
-        else:
-            past_days = 0
-
-        if end_dt.date() > today_date:
-            # forecast_days conta a partir de amanhã, não hoje
-            forecast_days = (end_dt.date() - today_date).days
-        else:
-            forecast_days = 0
-
-        # Limites da API (conforme configurado no projeto)
-        past_days = min(past_days, 29)  # Project limit: 29 past days
-        forecast_days = min(forecast_days, 5)  # API supports up to 5
-
-        # API Forecast sempre inclui hoje (day 0) automaticamente
-        # past_days=29 + hoje + forecast_days=5 = 35 dias
+        Cache entries are keyed by the grid cell (nearby clicks share
+        them), so the API is called at the cell centre too: Open-Meteo
+        downscales by the elevation of the requested point, and every
+        point in the cell must get the data the key stands for.
+        """
+        key_lat, key_lng = GeographicUtils.snap_to_grid(
+            lat, lng, self.config.GRID_RESOLUTION
+        )
+        fetched_location: Dict[str, Any] = {}
+
+        async def fetch_days(start: date, end: date) -> Dict[date, Any]:
+            result = await self._fetch_climate_data(
+                key_lat, key_lng, start.isoformat(), end.isoformat()
+            )
+            fetched_location.update(
+                (k, v.decode() if isinstance(v, bytes) else v)
+                for k, v in result["location"].items()
+            )
+            # Saved inside get_range so that requests coalesced onto
+            # this fetch (other workers) find the metadata too
+            await self.cache.set_meta(
+                "openmeteo_forecast", key_lat, key_lng, fetched_location
+            )
+            climate_data = result["climate_data"]
+            variables = [k for k in climate_data if k != "dates"]
+            # start_date/end_date return exactly the requested days, in
+            # order; keying by position avoids UTC-vs-local date shifts
+            return {
+                start
+                + timedelta(days=i): {
+                    var: climate_data[var][i] for var in variables
+                }
+                for i in range(len(climate_data["dates"]))
+            }
+
+        days = await self.cache.get_range(
+            "openmeteo_forecast",
+            key_lat,
+            key_lng,
+            date.fromisoformat(start_date),
+            date.fromisoformat(end_date),
+            fetch=fetch_days,
+            day_ttl=self._get_day_ttl,
+        )
+
+        location = (
+            fetched_location
+            or await self.cache.get_meta(
+                "openmeteo_forecast", key_lat, key_lng
+            )
+            or {"latitude": key_lat, "longitude": key_lng}
+        )
+
+        climate_data: Dict[str, list] = {
+            "dates": [datetime.combine(day, time()) for day in days]
+        }
+        for record in days.values():
+            for var, value in record.items():
+                climate_data.setdefault(var, []).append(value)
+
+        logger.info(
+            f"Forecast: {len(days)} days | "
+            f"{'fetched' if fetched_location else 'all cached'}"
+        )
+        return {
+            "location": location,
+            "climate_data": climate_data,
+            "metadata": {
+                "api": "forecast",
+                "url": self.config.BASE_URL,
+                "data_points": len(days),
+                "cache_ttl_hours": self._get_ttl_hours(start_date, end_date),
+                "cache": "daily",
+            },
+        }
+
+    async def _fetch_climate_data(
+        self, lat: float, lng: float, start_date: str, end_date: str
+    ) -> Dict[str, Any]:
+        """
+        Fetch a period from the Forecast API.
+
+        Uses start_date/end_date (instead of past_days/forecast_days) so
+        that any sub-period missing from the cache can be requested.
+        """
         params = {
             "latitude": lat,
             "longitude": lng,
@@ -217,23 +285,18 @@ class OpenMeteoForecastClient:
             "models": "best_match",
             "timezone": "auto",
             "wind_speed_unit": "ms",
+            "start_date": start_date,
+            "end_date": end_date,
         }
 
-        # Adicionar past_days e forecast_days apenas se > 0
-        if past_days > 0:
-            params["past_days"] = past_days
-        if forecast_days > 0:
-            params["forecast_days"] = forecast_days
-
-        logger.info(f"Cache MISS: Forecast API | ({lat:.4f}, {lng:.4f})")
-        logger.info(f"Requested period: {start_date} to {end_date}")
         logger.info(
-            f"Calculated: past_days={past_days}, "
-            f"forecast_days={forecast_days}"
+            f"Forecast API {start_date} to {end_date} | "
+            f"({lat:.4f}, {lng:.4f})"
         )
-        logger.info(f"API params: {params}")
+        logger.debug(f"API params: {params}")
 
         # 4. Fetch data from Forecast API
+        await ensure_api_quota("openmeteo_forecast")
         try:
             responses = self.client.weather_api(
                 self.config.BASE_URL, params=params
@@ -326,13 +389,6 @@ class OpenMeteoForecastClient:
                 f"Elevation: {location['elevation']:.0f}m"
             )
 
-            # 8. Save to Redis cache (if available)
-            if self.cache:
-                ttl = self._get_ttl_seconds(start_date, end_date)
-                cache_key = self._get_cache_key(lat, lng, start_date, end_date)
-                await self.cache.set(cache_key, result, ttl=ttl)
-                logger.debug(f"Cached with TTL {ttl}s")
-
             return result
 
         except Exception as e:
@@ -362,17 +418,6 @@ class OpenMeteoForecastClient:
         u2 = u_height * (4.87 / np.log(67.8 * height - 5.42))
         return np.maximum(u2, 0.5)  # Physical minimum limit
 
-    def _get_cache_key(
-        self, lat: float, lng: float, start_date: str, end_date: str
-    ) -> str:
-        """Generate Redis cache key."""
-        lat_rounded = round(lat, 2)
-        lng_rounded = round(lng, 2)
-        return (
-            f"climate:openmeteo:forecast:{lat_rounded}:{lng_rounded}:"
-            f"{start_date}:{end_date}"
-        )
-
     def _get_ttl_seconds(self, start_date: str, end_date: str) -> int:
         """
         Calculate TTL based on data type.
@@ -380,15 +425,13 @@ class OpenMeteoForecastClient:
         - Forecast (future): 1h (data changes frequently)
         - Recent (past): 6h (data more stable)
         """
-        today = datetime.now().date()
-        end = datetime.fromisoformat(end_date).date()
-
-        if end > today:
-            # Forecast data (future)
-            return 3600  # 1 hour
-        else:
-            # Recent data (past)
-            return 3600 * 6  # 6 hours
+        return self._get_day_ttl(datetime.fromisoformat(end_date).date())
+
+    def _get_day_ttl(self, day: date) -> int:
+        """TTL of one cached day: today is still forecast, so 1h."""
+        if day >= datetime.now().date():
+            return self.config.FORECAST_CACHE_TTL
+        return self.config.CACHE_TTL
 
     def _get_ttl_hours(self, start_date: str, end_date: str) -> int:
         """Get TTL in hours for metadata."""
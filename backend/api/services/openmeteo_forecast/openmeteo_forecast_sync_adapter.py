@@ -27,13 +27,13 @@ CACHE STRATEGY (Nov 2025):
 - Dynamic TTL: 1h (forecast), 6h (recent)
 """
 
-import asyncio
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Union
 
 import pandas as pd
 from loguru import logger
 
+from backend.api.services.async_bridge import run_coro_sync
 from backend.api.services.openmeteo_forecast.openmeteo_forecast_client import (
     OpenMeteoForecastClient,
 )
@@ -89,6 +89,24 @@ class OpenMeteoForecastSyncAdapter:
         Returns:
             List of dictionaries with daily data
         """
+        # Execute async safely (same as Archive adapter)
+        return run_coro_sync(
+            self.get_daily_data(lat, lon, start_date, end_date)
+        )
+
+    async def get_daily_data(
+        self,
+        lat: float,
+        lon: float,
+        start_date: Union[str, datetime],
+        end_date: Union[str, datetime],
+    ) -> List[Dict[str, Any]]:
+        """
+        Download recent/future data ASYNCHRONOUSLY.
+
+        Use this method in asynchronous contexts.
+        For synchronous code, use get_daily_data_sync().
+        """
         # Convert strings to datetime if needed
         if isinstance(start_date, str):
             start_date = datetime.fromisoformat(start_date)
@@ -114,31 +132,7 @@ class OpenMeteoForecastSyncAdapter:
             )
             end_date = datetime.combine(max_date, datetime.min.time())
 
-        # Execute async safely (same as Archive adapter)
-        try:
-            # Try to get existing loop
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Loop is already running (async server context)
-                # Create new task in existing loop
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._async_get_data(lat, lon, start_date, end_date),
-                    )
-                    return future.result()
-            else:
-                # Loop exists but is not running
-                return loop.run_until_complete(
-                    self._async_get_data(lat, lon, start_date, end_date)
-                )
-        except RuntimeError:
-            # No loop exists, create a new one
-            return asyncio.run(
-                self._async_get_data(lat, lon, start_date, end_date)
-            )
+        return await self._async_get_data(lat, lon, start_date, end_date)
 
     async def _async_get_data(
         self,
@@ -150,7 +144,7 @@ class OpenMeteoForecastSyncAdapter:
         """
         Internal async implementation.
 
-        Uses best_match model, past_days=29, and wind_speed_unit=ms.
+        Uses best_match model, start_date/end_date and wind_speed_unit=ms.
         """
         try:
             client = OpenMeteoForecastClient(
@@ -215,24 +209,7 @@ class OpenMeteoForecastSyncAdapter:
         """
         Check if Forecast API is accessible (synchronous).
         """
-        try:
-            # Tentar obter loop existente
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Loop já está rodando
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run, self._async_health_check()
-                    )
-                    return future.result()
-            else:
-                # Loop exists but is not running
-                return loop.run_until_complete(self._async_health_check())
-        except RuntimeError:
-            # No loop exists, create a new one
-            return asyncio.run(self._async_health_check())
+        return run_coro_sync(self._async_health_check())
 
     async def _async_health_check(self) -> bool:
         """
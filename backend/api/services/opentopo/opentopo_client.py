@@ -54,6 +54,7 @@ from loguru import logger
 from pydantic import BaseModel, Field
 
 from backend.api.services.geographic_utils import GeographicUtils
+from backend.api.services.http_pool import get_http_client
 
 
 class OpenTopoConfig(BaseModel):
@@ -99,19 +100,24 @@ class OpenTopoClient:
         """
         self.config = config or OpenTopoConfig()
         self.cache = cache
-        self.client = httpx.AsyncClient(
-            base_url=self.config.base_url,
-            timeout=self.config.timeout,
-            follow_redirects=True,
-        )
         logger.info(
             f"OpenTopoClient initialized | "
             f"default dataset={self.config.default_dataset}"
         )
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client shared by all OpenTopoData clients."""
+        return get_http_client(
+            httpx.URL(self.config.base_url).host,
+            base_url=self.config.base_url,
+            timeout=self.config.timeout,
+            follow_redirects=True,
+            quota="opentopo",
+        )
+
     async def close(self):
-        """Close HTTP connection."""
-        await self.client.aclose()
+        """Release the shared HTTP client (the pool stays open)."""
 
     async def get_elevation(
         self,
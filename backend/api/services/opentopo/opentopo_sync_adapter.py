@@ -35,12 +35,11 @@ Use in FAO-56 ETo Calculation:
    Increases ~10% per 1000m altitude
 """
 
-import asyncio
-import concurrent.futures
 from typing import Any
 
 from loguru import logger
 
+from backend.api.services.async_bridge import run_coro_sync
 from backend.api.services.geographic_utils import GeographicUtils
 from backend.api.services.opentopo.opentopo_client import (
     OpenTopoClient,
@@ -110,27 +109,7 @@ class OpenTopoSyncAdapter:
                 print(f"Elevation: {location.elevation}m")
             Elevation: 1172m
         """
-        try:
-            # Try to get existing loop
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Loop is already running (async context)
-                # Use executor to avoid "RuntimeError: This event loop
-                # is already running"
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._async_get_elevation(lat, lon, dataset),
-                    )
-                    return future.result()
-            else:
-                # Loop exists but is not running
-                return loop.run_until_complete(
-                    self._async_get_elevation(lat, lon, dataset)
-                )
-        except RuntimeError:
-            # No loop exists, create a new one
-            return asyncio.run(self._async_get_elevation(lat, lon, dataset))
+        return run_coro_sync(self._async_get_elevation(lat, lon, dataset))
 
     async def _async_get_elevation(
         self,
@@ -175,27 +154,9 @@ class OpenTopoSyncAdapter:
             > for loc in results:
                 print(f"{loc.lat}, {loc.lon}: {loc.elevation}m")
         """
-        try:
-            # Tentar obter loop existente
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Loop já está rodando
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._async_get_elevations_batch(locations, dataset),
-                    )
-                    return future.result()
-            else:
-                # Loop exists but is not running
-                return loop.run_until_complete(
-                    self._async_get_elevations_batch(locations, dataset)
-                )
-        except RuntimeError:
-            # No loop exists, create a new one
-            return asyncio.run(
-                self._async_get_elevations_batch(locations, dataset)
-            )
+        return run_coro_sync(
+            self._async_get_elevations_batch(locations, dataset)
+        )
 
     async def _async_get_elevations_batch(
         self,
@@ -229,18 +190,7 @@ class OpenTopoSyncAdapter:
         Returns:
             bool: True if API is accessible
         """
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run, self._async_health_check()
-                    )
-                    return future.result()
-            else:
-                return loop.run_until_complete(self._async_health_check())
-        except RuntimeError:
-            return asyncio.run(self._async_health_check())
+        return run_coro_sync(self._async_health_check())
 
     async def _async_health_check(self) -> bool:
         """
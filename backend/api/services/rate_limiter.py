@@ -0,0 +1,148 @@
+# backend/api/services/rate_limiter.py
+"""
+Token bucket para limitar chamadas às APIs climáticas.
+
+O balde é compartilhado entre workers via Redis (script Lua atômico,
+relógio do próprio Redis) quando um cliente redis.asyncio é fornecido;
+sem Redis, ou se ele falhar, cai para um balde em memória por processo.
+
+Usage:
+    limiter = get_rate_limiter("openmeteo_archive", redis=cache.redis)
+    await limiter.acquire(cost)  # espera sem bloquear o event loop
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+# Limites por minuto (free tier) usados como taxa do balde
+RATE_LIMITS_PER_MINUTE = {
+    "openmeteo_archive": 600,
+    "openmeteo_forecast": 600,
+}
+
+# KEYS[1] = chave do balde
+# ARGV = taxa (tokens/s), capacidade, tokens pedidos
+# Retorna segundos de espera (0 = tokens consumidos)
+_TOKEN_BUCKET_LUA = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= requested then
+    tokens = tokens - requested
+else
+    wait = (requested - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+return tostring(wait)
+"""
+
+# Baldes em memória (fallback), compartilhados pelo processo
+_local_buckets: Dict[str, Tuple[float, float]] = {}
+_local_lock = threading.Lock()
+
+
+class TokenBucketRateLimiter:
+    """
+    Rate limiter token bucket (Redis com fallback em memória).
+
+    Args:
+        name: Nome da API (chave do balde)
+        rate_per_minute: Tokens repostos por minuto
+        capacity: Tamanho do balde (padrão: um minuto de tokens)
+        redis: Cliente redis.asyncio opcional (balde entre workers)
+    """
+
+    KEY_PREFIX = "ratelimit"
+
+    def __init__(
+        self,
+        name: str,
+        rate_per_minute: float,
+        capacity: Optional[float] = None,
+        redis: Any | None = None,
+    ):
+        self.name = name
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(capacity or rate_per_minute)
+        self.redis = redis
+        self.key = f"{self.KEY_PREFIX}:{name}"
+        # EVALSHA (recarrega o script se o Redis não o tiver em cache)
+        # em vez de enviar o Lua a cada acquire
+        self._bucket_script = None
+        if redis is not None:
+            try:
+                self._bucket_script = redis.register_script(_TOKEN_BUCKET_LUA)
+            except Exception as e:
+                self._use_local(e)
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Espera até haver `tokens` no balde e os consome.
+
+        Pedidos maiores que a capacidade são limitados à capacidade
+        (senão nunca seriam atendidos).
+
+        Returns:
+            Tempo total esperado em segundos
+        """
+        tokens = min(float(tokens), self.capacity)
+        waited = 0.0
+        while True:
+            wait = await self._try_acquire(tokens)
+            if wait <= 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+    async def _try_acquire(self, tokens: float) -> float:
+        if self._bucket_script is not None:
+            try:
+                wait = await self._bucket_script(
+                    keys=[self.key], args=[self.rate, self.capacity, tokens]
+                )
+                return float(wait)
+            except Exception as e:
+                self._use_local(e)
+        return self._try_acquire_local(tokens)
+
+    def _use_local(self, error: Exception) -> None:
+        logger.warning(
+            f"Rate limiter {self.name}: Redis indisponível "
+            f"({error}), usando balde local"
+        )
+        self.redis = None
+        self._bucket_script = None
+
+    def _try_acquire_local(self, tokens: float) -> float:
+        now = time.monotonic()
+        with _local_lock:
+            available, ts = _local_buckets.get(self.key, (self.capacity, now))
+            available = min(
+                self.capacity, available + max(0.0, now - ts) * self.rate
+            )
+            if available >= tokens:
+                _local_buckets[self.key] = (available - tokens, now)
+                return 0.0
+            _local_buckets[self.key] = (available, now)
+            return (tokens - available) / self.rate
+
+
+def get_rate_limiter(
+    name: str, redis: Any | None = None
+) -> TokenBucketRateLimiter:
+    """Rate limiter de uma API com a taxa de RATE_LIMITS_PER_MINUTE."""
+    return TokenBucketRateLimiter(
+        name, RATE_LIMITS_PER_MINUTE[name], redis=redis
+    )
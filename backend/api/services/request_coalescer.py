@@ -0,0 +1,192 @@
+# backend/api/services/request_coalescer.py
+"""
+Coalescência de requests idênticos em voo (singleflight).
+
+Vários cliques na mesma célula de grade chegam quase juntos e, sem
+coalescência, cada um faz a sua chamada à API. Aqui o primeiro
+request de uma chave vira o "líder" e os demais esperam o resultado
+dele:
+
+- No processo: uma Task por chave e por event loop; quem chega depois
+  aguarda a mesma Task (asyncio.shield, então cancelar um chamador
+  não cancela os outros).
+- Entre workers (Celery/Uvicorn): lock Redis `SET NX PX`. Quem não
+  consegue o lock espera a liberação e executa a função de novo, que
+  então é servida pelo cache preenchido pelo líder. Sem Redis, ou se
+  ele falhar, vale só a coalescência local.
+
+Usage:
+    result = await coalesce(key, lambda: fetch(...), redis=cache.redis)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+LOCK_PREFIX = "inflight"
+
+
+@dataclass
+class CoalescerStats:
+    """Contadores de coalescência (processo atual)."""
+
+    leaders: int = 0
+    coalesced: int = 0
+    remote_waits: int = 0
+
+
+stats = CoalescerStats()
+
+# event loop -> {chave -> Task do líder}
+_inflight: Dict[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]] = {}
+
+
+def _prune_closed_loops() -> None:
+    """Descarta registros de loops já encerrados (asyncio.run)."""
+    for loop in [lp for lp in _inflight if lp.is_closed()]:
+        del _inflight[loop]
+
+
+async def coalesce(
+    key: str,
+    fn: Callable[[], Awaitable[T]],
+    *,
+    redis: Any | None = None,
+    lock_ttl: float = 60.0,
+    poll_interval: float = 0.05,
+    max_poll_interval: float = 1.0,
+) -> T:
+    """
+    Executa `fn` uma única vez por chave entre chamadas concorrentes.
+
+    Args:
+        key: Identificador do request (ex.: fonte + célula + período)
+        fn: Coroutine factory que faz o trabalho (idempotente: em
+            outro worker ela é reexecutada após o líder terminar)
+        redis: Cliente redis.asyncio opcional (coalescência entre
+            workers)
+        lock_ttl: Validade do lock Redis em segundos; também é o
+            tempo máximo de espera por um líder remoto
+        poll_interval: Intervalo inicial de checagem do lock remoto
+        max_poll_interval: Intervalo máximo (backoff exponencial)
+
+    Returns:
+        Resultado compartilhado por todos os chamadores da chave
+    """
+    loop = asyncio.get_running_loop()
+    _prune_closed_loops()
+    inflight = _inflight.setdefault(loop, {})
+
+    task = inflight.get(key)
+    if task is not None:
+        stats.coalesced += 1
+        logger.debug(f"Request coalescido (em voo): {key}")
+        return await asyncio.shield(task)
+
+    stats.leaders += 1
+    task = loop.create_task(
+        _run_leader(
+            key, fn, redis, lock_ttl, poll_interval, max_poll_interval
+        )
+    )
+    inflight[key] = task
+
+    def _done(finished: asyncio.Task) -> None:
+        if inflight.get(key) is finished:
+            del inflight[key]
+        # Evita "exception was never retrieved" se todos cancelaram
+        if not finished.cancelled():
+            finished.exception()
+
+    task.add_done_callback(_done)
+    return await asyncio.shield(task)
+
+
+async def _run_leader(
+    key: str,
+    fn: Callable[[], Awaitable[T]],
+    redis: Any | None,
+    lock_ttl: float,
+    poll_interval: float,
+    max_poll_interval: float,
+) -> T:
+    if redis is None:
+        return await fn()
+
+    lock_key = f"{LOCK_PREFIX}:{key}"
+    token = uuid.uuid4().hex
+    try:
+        acquired = await redis.set(
+            lock_key, token, nx=True, px=int(lock_ttl * 1000)
+        )
+    except Exception as e:
+        logger.warning(f"Coalescer: Redis indisponível ({e}), só local")
+        return await fn()
+
+    if not acquired:
+        stats.remote_waits += 1
+        logger.debug(f"Request em voo em outro worker, aguardando: {key}")
+        await _wait_for_release(
+            redis, lock_key, lock_ttl, poll_interval, max_poll_interval
+        )
+        return await fn()
+
+    try:
+        return await fn()
+    finally:
+        await _release(redis, lock_key, token)
+
+
+async def _release(redis: Any, lock_key: str, token: str) -> None:
+    """
+    Libera o lock só se ainda for nosso (o TTL pode ter expirado e
+    outro worker assumido). GET + DEL não é atômico, mas a janela é
+    de um round trip e o pior caso é um fetch duplicado.
+    """
+    try:
+        owner = await redis.get(lock_key)
+        if isinstance(owner, bytes):
+            owner = owner.decode()
+        if owner == token:
+            await redis.delete(lock_key)
+    except Exception as e:
+        # Expira sozinho pelo TTL
+        logger.warning(f"Coalescer: falha ao liberar {lock_key}: {e}")
+
+
+async def _wait_for_release(
+    redis: Any,
+    lock_key: str,
+    timeout: float,
+    poll_interval: float,
+    max_poll_interval: float,
+) -> None:
+    """Espera o lock remoto sumir (liberado ou expirado)."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    delay = poll_interval
+    while asyncio.get_running_loop().time() < deadline:
+        try:
+            if not await redis.exists(lock_key):
+                return
+        except Exception:
+            return
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, max_poll_interval)
+    logger.warning(f"Coalescer: líder remoto não terminou ({lock_key})")
+
+
+def coalescer_stats() -> Dict[str, int]:
+    """Contadores de líderes, requests coalescidos e esperas remotas."""
+    return {
+        "leaders": stats.leaders,
+        "coalesced": stats.coalesced,
+        "remote_waits": stats.remote_waits,
+        "in_flight": sum(len(tasks) for tasks in _inflight.values()),
+    }
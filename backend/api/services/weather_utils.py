@@ -10,17 +10,17 @@ SINGLE SOURCE OF TRUTH para:
 - Conversão de velocidade (mph → m/s)
 - Conversão de radiação solar
 - Validações meteorológicas comuns
-- Agregação hourly-to-daily (ex.: MET Norway)
+- Agregação hourly-to-daily vetorizada (MET Norway, NWS, Open-Meteo)
 - Cache handling para APIs
 - Correções de elevação FAO-56
 - Métricas Prometheus para validações
 """
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List
-from collections import defaultdict
+from typing import Any, Dict, List, Sequence
 
 import numpy as np
+import pandas as pd
 from email.utils import parsedate_to_datetime
 from loguru import logger
 
@@ -619,6 +619,7 @@ class WeatherAggregationUtils:
         end_date: datetime,
         field_mapping: dict[str, str],
         timezone_utils=None,
+        tz: str | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
         """
         Aggregate hourly weather data into daily buckets.
@@ -634,9 +635,9 @@ class WeatherAggregationUtils:
             end_date: End date for aggregation (timezone-aware)
             field_mapping: Mapping of API field names to internal names
                           e.g., {'air_temperature': 'temperature_2m'}
-            timezone_utils: Optional TimezoneUtils instance for timezone
-                           handling (if None, uses datetime.date() for
-                           grouping)
+            timezone_utils: Kept for compatibility; naive timestamps
+                           are always taken as UTC (as make_aware does)
+            tz: IANA timezone for the day boundaries (default: UTC)
 
         Returns:
             Dictionary mapping dates (YYYY-MM-DD) to lists of hourly data
@@ -657,65 +658,266 @@ class WeatherAggregationUtils:
             dict_keys(['2024-01-15'])
         """
         daily_data: dict[str, list[dict[str, Any]]] = {}
+        if not timeseries:
+            return daily_data
 
-        for entry in timeseries:
-            try:
-                time_str = entry.get("time")
-                if not time_str:
-                    continue
-
-                # Parse timestamp
-                if isinstance(time_str, str):
-                    # Handle ISO 8601 format
-                    if "T" in time_str:
-                        dt = datetime.fromisoformat(
-                            time_str.replace("Z", "+00:00")
-                        )
-                    else:
-                        dt = datetime.fromisoformat(time_str)
-                elif isinstance(time_str, datetime):
-                    dt = time_str
-                else:
-                    logger.warning(f"Invalid time format: {time_str}")
-                    continue
-
-                # Make timezone-aware if needed
-                if timezone_utils and hasattr(timezone_utils, "make_aware"):
-                    dt = timezone_utils.make_aware(dt)
-                elif dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-
-                # Filter by date range
-                if not (start_date <= dt <= end_date):
-                    continue
-
-                # Extract date key (YYYY-MM-DD)
-                date_key = dt.date().isoformat()
-
-                # Initialize daily bucket
-                if date_key not in daily_data:
-                    daily_data[date_key] = []
-
-                # Map fields to internal names
-                mapped_entry = {"time": dt}
-                for api_field, internal_field in field_mapping.items():
-                    if api_field in entry:
-                        value = entry[api_field]
-                        # Handle nested data structures
-                        if isinstance(value, dict):
-                            mapped_entry[internal_field] = value
-                        else:
-                            mapped_entry[internal_field] = value
-
-                daily_data[date_key].append(mapped_entry)
+        # Parse em lote (inválidos/ausentes viram NaT; sem offset = UTC)
+        times = HourlyResampler.parse_timestamps(
+            [entry.get("time") for entry in timeseries]
+        )
+        start = HourlyResampler.to_datetime64(start_date)
+        end = HourlyResampler.to_datetime64(end_date)
+        in_range = ~np.isnat(times) & (times >= start) & (times <= end)
 
-            except Exception as e:
-                logger.warning(f"Error processing hourly entry: {e}")
-                continue
+        indices = np.flatnonzero(in_range)
+        day_keys = np.datetime_as_string(
+            HourlyResampler.local_days(times[indices], tz), unit="D"
+        )
+        aware_times = (
+            pd.DatetimeIndex(times[indices]).tz_localize("UTC").to_pydatetime()
+        )
+
+        for index, date_key, dt in zip(indices, day_keys, aware_times):
+            entry = timeseries[index]
+            # Map fields to internal names
+            mapped_entry = {"time": dt}
+            for api_field, internal_field in field_mapping.items():
+                if api_field in entry:
+                    mapped_entry[internal_field] = entry[api_field]
+            daily_data.setdefault(str(date_key), []).append(mapped_entry)
 
         return daily_data
 
 
+class HourlyResampler:
+    """
+    Reamostragem colunar horária → diária com NumPy.
+
+    Substitui o caminho entrada-a-entrada (datetime.fromisoformat, listas
+    por dia, redução em Python) dos clientes MET Norway, NWS e do
+    agregador genérico:
+
+    - timestamps convertidos em lote para datetime64[s] (UTC);
+    - intervalos ISO 8601 do NWS ("início/PT6H") expandidos em passos
+      horários sem laço em Python;
+    - dia local calculado pelo fuso (fronteira de meia-noite correta) e
+      estatísticas por dia via np.bincount / ufunc.at.
+
+    Valores ausentes são NaN; um dia sem nenhum valor válido resulta
+    em NaN na estatística (nunca 0 de uma soma vazia).
+
+    Exemplo:
+        >>> times = HourlyResampler.parse_timestamps(
+        ...     ["2024-01-15T12:00:00Z", "2024-01-15T13:00:00Z"]
+        ... )
+        >>> days, rows, stats = HourlyResampler.resample_daily(
+        ...     times,
+        ...     {"temp": np.array([20.5, 21.0])},
+        ...     {"temp_max": ("temp", "max")},
+        ... )
+        >>> stats["temp_max"]
+        array([21.])
+    """
+
+    HOUR = np.timedelta64(3600, "s")
+
+    _DURATION_PATTERN = (
+        r"^P(?:(?P<days>\d+)D)?"
+        r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?)?$"
+    )
+
+    @staticmethod
+    def parse_timestamps(values: Sequence[Any]) -> np.ndarray:
+        """
+        Converte timestamps ISO 8601 em lote para datetime64[s] UTC.
+
+        Aceita strings com offset ("Z", "+00:00", "-05:00"), strings sem
+        offset (tratadas como UTC, como TimezoneUtils.make_aware) e
+        objetos datetime. Valores inválidos ou vazios viram NaT.
+        """
+        if len(values) == 0:
+            return np.array([], dtype="datetime64[s]")
+        series = pd.Series(values, dtype=object)
+        parsed = pd.Series(pd.NaT, index=series.index, dtype="datetime64[s]")
+
+        # Com e sem offset em lotes separados: num lote misto o pandas
+        # aplicaria o offset de uma string às strings sem offset.
+        # Objetos datetime vão num lote próprio (sem o accessor .str)
+        is_str = series.map(lambda v: isinstance(v, str)).astype(bool)
+        with_offset = series.where(is_str, "").str.contains(
+            r"(?:Z|[+-]\d{2}:?\d{2})$"
+        )
+        for mask in (with_offset, is_str & ~with_offset, ~is_str):
+            if mask.any():
+                parsed[mask] = (
+                    pd.to_datetime(
+                        series[mask],
+                        utc=True,
+                        errors="coerce",
+                        format="ISO8601",
+                    )
+                    .dt.tz_localize(None)
+                    .astype("datetime64[s]")
+                )
+        return parsed.to_numpy()
+
+    @classmethod
+    def expand_intervals(
+        cls,
+        valid_times: Sequence[str],
+        values: Sequence[Any],
+        how: str = "repeat",
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Expande intervalos "início/duração" (NWS) em passos horários.
+
+        Args:
+            valid_times: Strings "2025-11-28T00:00:00+00:00/PT6H" (sem
+                duração conta como uma hora)
+            values: Valor de cada intervalo
+            how: 'repeat' (grandeza instantânea: repete em cada hora),
+                'split' (acumulado: divide igualmente entre as horas) ou
+                'start' (só a hora inicial, ex. máximas de 12h)
+
+        Returns:
+            (times datetime64[s] UTC, values float), ordenados por tempo
+        """
+        values = np.asarray(values, dtype=float)
+        if len(valid_times) == 0:
+            return np.array([], dtype="datetime64[s]"), values[:0]
+
+        parts = pd.Series(valid_times, dtype=object).str.split(
+            "/", n=1, expand=True
+        )
+        starts = cls.parse_timestamps(parts[0].to_numpy())
+
+        if how == "start" or parts.shape[1] == 1:
+            steps = np.ones(len(starts), dtype=np.int64)
+        else:
+            duration = (
+                parts[1]
+                .str.extract(cls._DURATION_PATTERN)
+                .fillna("0")
+                .astype(np.int64)
+            )
+            steps = (
+                duration["days"].to_numpy() * 24
+                + duration["hours"].to_numpy()
+                + (duration["minutes"].to_numpy() > 0)
+            )
+            steps = np.maximum(steps, 1)
+
+        valid = ~np.isnat(starts) & ~np.isnan(values)
+        starts, values, steps = starts[valid], values[valid], steps[valid]
+        if how == "split":
+            values = values / steps
+
+        # Deslocamento (em horas) de cada passo dentro do seu intervalo
+        first_step = np.repeat(np.cumsum(steps) - steps, steps)
+        offsets = np.arange(int(steps.sum())) - first_step
+        times = np.repeat(starts, steps) + offsets * cls.HOUR
+        values = np.repeat(values, steps)
+
+        order = np.argsort(times, kind="stable")
+        return times[order], values[order]
+
+    @staticmethod
+    def to_datetime64(dt: datetime) -> np.datetime64:
+        """Datetime (naive = UTC) → datetime64[s] UTC."""
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+        return np.datetime64(dt, "s")
+
+    @staticmethod
+    def local_days(times: np.ndarray, tz: str | None = None) -> np.ndarray:
+        """
+        Dia (datetime64[D]) de cada instante UTC no fuso `tz`.
+
+        Sem fuso (ou 'UTC') usa o dia UTC; NaT é preservado.
+        """
+        if tz is None or tz.upper() == "UTC":
+            return times.astype("datetime64[D]")
+        local = (
+            pd.DatetimeIndex(times)
+            .tz_localize("UTC")
+            .tz_convert(tz)
+            .tz_localize(None)
+        )
+        return local.to_numpy(dtype="datetime64[D]")
+
+    @staticmethod
+    def reduce(
+        groups: np.ndarray, n_groups: int, values: np.ndarray, how: str
+    ) -> np.ndarray:
+        """
+        Reduz `values` por grupo ignorando NaN.
+
+        Args:
+            groups: Índice do grupo (0..n_groups-1) de cada valor
+            n_groups: Número de grupos
+            values: Valores float (NaN = ausente)
+            how: 'mean', 'sum', 'min', 'max' ou 'count'
+        """
+        values = np.asarray(values, dtype=float)
+        valid = ~np.isnan(values)
+        counts = np.bincount(groups, weights=valid, minlength=n_groups)
+        if how == "count":
+            return counts
+        if how in ("mean", "sum"):
+            sums = np.bincount(
+                groups,
+                weights=np.where(valid, values, 0.0),
+                minlength=n_groups,
+            )
+            with np.errstate(invalid="ignore", divide="ignore"):
+                result = sums / counts if how == "mean" else sums
+            return np.where(counts > 0, result, np.nan)
+        if how in ("min", "max"):
+            # fmin/fmax ignoram NaN: o NaN inicial só sobra em dia vazio
+            result = np.full(n_groups, np.nan)
+            ufunc = np.fmin if how == "min" else np.fmax
+            ufunc.at(result, groups, values)
+            return result
+        raise ValueError(f"Unknown aggregation: {how}")
+
+    @classmethod
+    def resample_daily(
+        cls,
+        times: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        how: Dict[str, tuple[str, str]],
+        tz: str | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Estatísticas diárias de séries horárias alinhadas a `times`.
+
+        Args:
+            times: Instantes UTC (datetime64); NaT é descartado
+            columns: nome -> array de valores (NaN = ausente)
+            how: estatística de saída -> (coluna, agregação)
+            tz: Fuso IANA das fronteiras de dia (default: UTC)
+
+        Returns:
+            (dias datetime64[D] ordenados, linhas por dia, estatísticas)
+        """
+        days = cls.local_days(np.asarray(times, dtype="datetime64[s]"), tz)
+        keep = ~np.isnat(days)
+        unique_days, groups = np.unique(days[keep], return_inverse=True)
+        n_groups = len(unique_days)
+        rows = np.bincount(groups, minlength=n_groups)
+
+        stats = {}
+        for name, (column, aggregation) in how.items():
+            values = np.asarray(columns[column], dtype=float)[keep]
+            stats[name] = cls.reduce(groups, n_groups, values, aggregation)
+        return unique_days, rows, stats
+
+    @staticmethod
+    def to_optional(value: float) -> float | None:
+        """NaN → None (para os modelos de saída)."""
+        return None if np.isnan(value) else float(value)
+
+
 class CacheUtils:
     """
     Utilitários para cache de respostas HTTP de APIs climáticas.
@@ -798,22 +1000,43 @@ class METNorwayAggregationUtils:
     - Validar consistência de dados agregados
     """
 
+    # estatística -> (coluna horária, agregação)
+    DAILY_STATS = {
+        "temp_mean": ("temp", "mean"),
+        "temp_max": ("temp", "max"),
+        "temp_min": ("temp", "min"),
+        "temp_max_6h": ("temp_max_6h", "max"),
+        "temp_min_6h": ("temp_min_6h", "min"),
+        "humidity_mean": ("humidity", "mean"),
+        "wind_speed_mean": ("wind_speed", "mean"),
+        "precipitation_1h_sum": ("precipitation_1h", "sum"),
+        "precipitation_6h_mean": ("precipitation_6h", "mean"),
+        "precipitation_6h_count": ("precipitation_6h", "count"),
+    }
+
     @staticmethod
     def aggregate_hourly_to_daily(
         timeseries: List[Dict[str, Any]],
         start_date: datetime,
         end_date: datetime,
-    ) -> Dict[str, Dict[str, Any]]:
+        tz: str | None = None,
+    ) -> Dict[Any, Dict[str, Any]]:
         """
-        Agrega dados horários MET Norway em buckets diários.
+        Agrega dados horários MET Norway em estatísticas diárias.
+
+        Uma passada em Python extrai as colunas do JSON; parse dos
+        timestamps, filtro de período e redução por dia são vetorizados
+        (HourlyResampler).
 
         Args:
             timeseries: Lista de entradas horárias da API
-            start_date: Data inicial (timezone-aware)
-            end_date: Data final (timezone-aware)
+            start_date: Data inicial (naive = UTC)
+            end_date: Data final (naive = UTC)
+            tz: Fuso IANA das fronteiras de dia (default: UTC)
 
         Returns:
-            Dict mapeando date -> dados agregados brutos
+            Dict mapeando date -> estatísticas (chaves de DAILY_STATS,
+            NaN quando o dia não tem valores) e "count" (horas no dia)
 
         Exemplo:
             >>> daily_raw = METNorwayAggregationUtils
@@ -823,97 +1046,50 @@ class METNorwayAggregationUtils:
             >>> print(daily_raw.keys())
             dict_keys([datetime.date(2024, 1, 15), ...])
         """
-        from .geographic_utils import TimezoneUtils
-
-        tz_utils = TimezoneUtils()
-        daily_data: Dict[Any, Dict[str, Any]] = defaultdict(
-            lambda: {
-                "temp_values": [],
-                "humidity_values": [],
-                "wind_speed_values": [],
-                "precipitation_1h": [],
-                "precipitation_6h": [],
-                "temp_max_6h": [],
-                "temp_min_6h": [],
-                "count": 0,
-            }
-        )
-
-        # Ensure timezone-aware dates
-        if start_date.tzinfo is None:
-            start_date = tz_utils.make_aware(start_date)
-        if end_date.tzinfo is None:
-            end_date = tz_utils.make_aware(end_date)
-
-        for entry in timeseries:
-            try:
-                time_str = entry.get("time")
-                if not time_str:
-                    continue
-
-                dt = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
-                date_key = dt.date()
-
-                # Filtrar por período usando comparação segura
-                if not (start_date <= dt <= end_date):
-                    continue
-
-                day_data = daily_data[date_key]
-
-                # Extrair valores instantâneos
-                instant = (
-                    entry.get("data", {}).get("instant", {}).get("details", {})
-                )
-
-                # Temperatura
-                if (temp := instant.get("air_temperature")) is not None:
-                    day_data["temp_values"].append(temp)
-
-                # Umidade
-                if (humidity := instant.get("relative_humidity")) is not None:
-                    day_data["humidity_values"].append(humidity)
-
-                # Vento
-                if (wind_speed := instant.get("wind_speed")) is not None:
-                    day_data["wind_speed_values"].append(wind_speed)
-
-                # Precipitação 1h
-                next_1h = (
-                    entry.get("data", {})
-                    .get("next_1_hours", {})
-                    .get("details", {})
-                )
-                precip_1h = next_1h.get("precipitation_amount")
-                if precip_1h is not None:
-                    day_data["precipitation_1h"].append(precip_1h)
-
-                # Precipitação 6h
-                next_6h = (
-                    entry.get("data", {})
-                    .get("next_6_hours", {})
-                    .get("details", {})
-                )
-                precip_6h = next_6h.get("precipitation_amount")
-                if precip_6h is not None:
-                    day_data["precipitation_6h"].append(precip_6h)
-
-                # Temperaturas extremas 6h
-                temp_max = next_6h.get("air_temperature_max")
-                if temp_max is not None:
-                    day_data["temp_max_6h"].append(temp_max)
-                temp_min = next_6h.get("air_temperature_min")
-                if temp_min is not None:
-                    day_data["temp_min_6h"].append(temp_min)
+        if not timeseries:
+            return {}
+
+        data = [entry.get("data") or {} for entry in timeseries]
+        instant = [d.get("instant", {}).get("details", {}) for d in data]
+        next_1h = [d.get("next_1_hours", {}).get("details", {}) for d in data]
+        next_6h = [d.get("next_6_hours", {}).get("details", {}) for d in data]
+
+        def column(details: List[Dict[str, Any]], key: str) -> np.ndarray:
+            return np.array([d.get(key) for d in details], dtype=float)
+
+        columns = {
+            "temp": column(instant, "air_temperature"),
+            "humidity": column(instant, "relative_humidity"),
+            "wind_speed": column(instant, "wind_speed"),
+            "precipitation_1h": column(next_1h, "precipitation_amount"),
+            "precipitation_6h": column(next_6h, "precipitation_amount"),
+            "temp_max_6h": column(next_6h, "air_temperature_max"),
+            "temp_min_6h": column(next_6h, "air_temperature_min"),
+        }
 
-                day_data["count"] += 1
+        times = HourlyResampler.parse_timestamps(
+            [entry.get("time") for entry in timeseries]
+        )
+        in_range = (
+            ~np.isnat(times)
+            & (times >= HourlyResampler.to_datetime64(start_date))
+            & (times <= HourlyResampler.to_datetime64(end_date))
+        )
 
-            except Exception as e:
-                logger.warning(
-                    f"Erro processando entrada horária MET Norway: {e}"
-                )
-                continue
+        days, rows, stats = HourlyResampler.resample_daily(
+            times[in_range],
+            {name: values[in_range] for name, values in columns.items()},
+            METNorwayAggregationUtils.DAILY_STATS,
+            tz=tz,
+        )
 
-        return dict(daily_data)
+        return {
+            day.astype(object): {
+                **{name: float(values[i]) for name, values in stats.items()},
+                "count": int(rows[i]),
+            }
+            for i, day in enumerate(days)
+        }
 
     @staticmethod
     def calculate_daily_aggregations(
@@ -921,114 +1097,69 @@ class METNorwayAggregationUtils:
         weather_utils: WeatherConversionUtils,
     ) -> List[Any]:
         """
-        Calcula agregações diárias finais (mean, max, min, sum).
+        Monta os registros diários finais a partir das estatísticas.
 
         Args:
-            daily_raw_data: Dados brutos agrupados por data
+            daily_raw_data: Estatísticas por data
+                (aggregate_hourly_to_daily)
             weather_utils: Instância de WeatherConversionUtils
 
         Returns:
-            Lista de registros diários agregados
+            Lista de registros diários agregados, ordenada por data
 
-        Melhorias:
-        - Precipitação 6h: soma ponderada se múltiplos valores
+        Regras:
+        - Temperaturas extremas: preferir 6h, fallback instantâneo
+        - Precipitação: soma 1h; senão média dos valores 6h (sobrepostos)
         - Conversão de vento 10m → 2m usando FAO-56
-        - Logging detalhado com logger.bind
         """
+        optional = HourlyResampler.to_optional
         result = []
 
-        for date_key, day_values in daily_raw_data.items():
+        for date_key in sorted(daily_raw_data):
+            day = daily_raw_data[date_key]
             try:
-                # Temperatura média
-                temp_mean = (
-                    float(np.nanmean(day_values["temp_values"]))
-                    if day_values["temp_values"]
-                    else None
-                )
-
-                # Temperaturas extremas: preferir 6h, fallback instant
-                temp_max = (
-                    float(np.nanmax(day_values["temp_max_6h"]))
-                    if day_values["temp_max_6h"]
-                    else (
-                        float(np.nanmax(day_values["temp_values"]))
-                        if day_values["temp_values"]
-                        else None
-                    )
-                )
-
-                temp_min = (
-                    float(np.nanmin(day_values["temp_min_6h"]))
-                    if day_values["temp_min_6h"]
-                    else (
-                        float(np.nanmin(day_values["temp_values"]))
-                        if day_values["temp_values"]
-                        else None
-                    )
-                )
-
-                # Umidade média
-                humidity_mean = (
-                    float(np.nanmean(day_values["humidity_values"]))
-                    if day_values["humidity_values"]
-                    else None
-                )
-
-                # Vento: converter 10m → 2m usando FAO-56
-                wind_10m_mean = (
-                    float(np.nanmean(day_values["wind_speed_values"]))
-                    if day_values["wind_speed_values"]
-                    else None
-                )
+                temp_max = optional(day["temp_max_6h"])
+                if temp_max is None:
+                    temp_max = optional(day["temp_max"])
+                temp_min = optional(day["temp_min_6h"])
+                if temp_min is None:
+                    temp_min = optional(day["temp_min"])
+
+                wind_10m_mean = optional(day["wind_speed_mean"])
                 wind_2m_mean = (
                     weather_utils.convert_wind_10m_to_2m(wind_10m_mean)
                     if wind_10m_mean is not None
                     else None
                 )
 
-                # Precipitação: priorizar 1h, fallback 6h ponderado
-                if day_values["precipitation_1h"]:
-                    precipitation_sum = float(
-                        np.sum(day_values["precipitation_1h"])
-                    )
-                elif day_values["precipitation_6h"]:
-                    # MELHORIA: Soma ponderada se múltiplos valores
-                    if len(day_values["precipitation_6h"]) > 1:
-                        # Média dos valores 6h (assume overlap)
-                        precipitation_sum = float(
-                            np.mean(day_values["precipitation_6h"])
-                        )
+                precipitation_sum = optional(day["precipitation_1h_sum"])
+                if precipitation_sum is None:
+                    precipitation_sum = optional(day["precipitation_6h_mean"])
+                    if precipitation_sum is None:
+                        precipitation_sum = 0.0
                     else:
-                        # Valor único: usar direto
-                        precipitation_sum = float(
-                            day_values["precipitation_6h"][0]
+                        logger.bind(date=date_key).debug(
+                            f"Precip 6h: "
+                            f"{int(day['precipitation_6h_count'])} "
+                            f"valores → {precipitation_sum:.2f}mm"
                         )
-                    logger.bind(date=date_key).debug(
-                        f"Precip 6h: {len(day_values['precipitation_6h'])} "
-                        f"valores → {precipitation_sum:.2f}mm"
-                    )
-                else:
-                    precipitation_sum = 0.0
-
-                # Criar registro diário (dict genérico)
-                daily_record = {
-                    "date": date_key,
-                    "temp_max": temp_max,
-                    "temp_min": temp_min,
-                    "temp_mean": temp_mean,
-                    "humidity_mean": humidity_mean,
-                    "precipitation_sum": precipitation_sum,
-                    "wind_speed_2m_mean": wind_2m_mean,
-                }
-
-                result.append(daily_record)
+
+                result.append(
+                    {
+                        "date": date_key,
+                        "temp_max": temp_max,
+                        "temp_min": temp_min,
+                        "temp_mean": optional(day["temp_mean"]),
+                        "humidity_mean": optional(day["humidity_mean"]),
+                        "precipitation_sum": precipitation_sum,
+                        "wind_speed_2m_mean": wind_2m_mean,
+                    }
+                )
 
             except Exception as e:
                 logger.bind(date=date_key).error(f"Erro agregando dia: {e}")
                 continue
 
-        # Ordenar por data
-        result.sort(key=lambda x: x["date"])
         return result
 
     @staticmethod
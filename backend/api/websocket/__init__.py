@@ -10,9 +10,11 @@ COMPONENTS:
 WebSocket Services:
 ├── websocket_service - Serviço principal de WebSocket
 │   ├── Task monitoring endpoints
-│   ├── Redis pub/sub integration
 │   ├── Timeout handling
 │   └── Error management
+├── progress_hub - Assinante Redis único por processo
+│   ├── PSUBSCRIBE task_status:* (redis.asyncio)
+│   └── Fan-out com fila limitada por socket (backpressure)
 
 FEATURES:
 ========
@@ -49,7 +51,7 @@ PERFORMANCE:
 ===========
 
 - Conexões assíncronas não-bloqueantes
-- Monitoramento paralelo de Redis e tarefas
+- Sem polling: progresso empurrado pelas tasks via pub/sub
 - Gerenciamento eficiente de memória
 - Limitação automática de timeout
 
@@ -0,0 +1,189 @@
+"""
+Hub de progresso: um assinante Redis por processo, fan-out para sockets.
+
+Antes cada WebSocket abria o seu pubsub síncrono e fazia polling de
+get_message (100 ms) e de AsyncResult.state (1 s). Aqui um único
+assinante redis.asyncio por processo faz PSUBSCRIBE em task_status:* e
+entrega cada mensagem às filas dos sockets que observam aquela task.
+
+Backpressure: cada socket tem uma fila limitada; se o cliente estiver
+lento, a mensagem mais antiga é descartada (progresso intermediário é
+substituível; a mensagem final sempre entra por ser a mais nova).
+
+subscribe() só retorna com o PSUBSCRIBE ativo. Se o assinante cair e
+reconectar, as mensagens publicadas no intervalo se perdem; cada fila
+recebe então RESYNC para o socket reler o estado no result backend.
+
+Usage:
+    queue = await progress_hub.subscribe(task_id)
+    try:
+        message = await queue.get()
+    finally:
+        progress_hub.unsubscribe(task_id, queue)
+"""
+
+import asyncio
+import contextlib
+import json
+import os
+from collections import defaultdict
+from typing import Any, Dict, Optional, Set
+
+from loguru import logger
+from redis.asyncio import Redis
+
+CHANNEL_PREFIX = "task_status:"
+
+# Marcador (comparado por identidade) entregue após uma reconexão
+RESYNC: Dict[str, Any] = {"resync": True}
+
+
+class ProgressHub:
+    """Multiplexa os canais task_status:* para os WebSockets do processo."""
+
+    def __init__(
+        self,
+        redis_url: str,
+        queue_size: int = 64,
+        reconnect_delay: float = 1.0,
+        subscribe_timeout: float = 5.0,
+    ):
+        self.redis_url = redis_url
+        self.queue_size = queue_size
+        self.reconnect_delay = reconnect_delay
+        self.subscribe_timeout = subscribe_timeout
+        self._queues: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self._listener: Optional[asyncio.Task] = None
+        self._subscribed = asyncio.Event()
+        self._redis: Optional[Redis] = None
+        self.delivered = 0
+        self.dropped = 0
+
+    async def subscribe(self, task_id: str) -> asyncio.Queue:
+        """
+        Registra um observador da task; inicia o assinante se preciso.
+
+        Retorna só depois de o PSUBSCRIBE estar ativo, para que o snapshot
+        lido em seguida não deixe mensagens sem entregar.
+
+        Raises:
+            TimeoutError: assinante sem conexão após subscribe_timeout
+        """
+        self._ensure_listener()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._queues[task_id].add(queue)
+        try:
+            await asyncio.wait_for(
+                self._subscribed.wait(), self.subscribe_timeout
+            )
+        except BaseException as e:
+            self.unsubscribe(task_id, queue)
+            if isinstance(e, asyncio.TimeoutError):
+                raise TimeoutError(
+                    "ProgressHub: assinante Redis indisponível"
+                ) from None
+            raise
+        return queue
+
+    def unsubscribe(self, task_id: str, queue: asyncio.Queue) -> None:
+        queues = self._queues.get(task_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._queues[task_id]
+
+    def publish_local(self, task_id: str, message: Dict[str, Any]) -> None:
+        """Entrega uma mensagem aos observadores deste processo."""
+        for queue in self._queues.get(task_id, ()):
+            if queue.full():
+                # Cliente lento: descarta o progresso mais antigo
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(message)
+            self.delivered += 1
+
+    def _ensure_listener(self) -> None:
+        loop = asyncio.get_running_loop()
+        if (
+            self._listener is not None
+            and not self._listener.done()
+            and self._listener.get_loop() is loop
+        ):
+            return
+        self._subscribed = asyncio.Event()
+        self._listener = loop.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        """Loop do assinante: reconecta sozinho se o Redis cair."""
+        reconnecting = False
+        while True:
+            pubsub = None
+            try:
+                self._redis = Redis.from_url(
+                    self.redis_url, decode_responses=True
+                )
+                pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+                await pubsub.psubscribe(f"{CHANNEL_PREFIX}*")
+                logger.info("ProgressHub: assinando task_status:*")
+                self._subscribed.set()
+                if reconnecting:
+                    # O que foi publicado com o assinante fora se perdeu
+                    for task_id in list(self._queues):
+                        self.publish_local(task_id, RESYNC)
+                reconnecting = True
+
+                async for message in pubsub.listen():
+                    if message["type"] != "pmessage":
+                        continue
+                    task_id = message["channel"][len(CHANNEL_PREFIX) :]
+                    if task_id not in self._queues:
+                        continue
+                    try:
+                        payload = json.loads(message["data"])
+                    except (TypeError, ValueError):
+                        logger.warning(
+                            f"ProgressHub: mensagem inválida em {task_id}"
+                        )
+                        continue
+                    self.publish_local(task_id, payload)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"ProgressHub: assinante caiu ({e}), reconectando"
+                )
+            finally:
+                self._subscribed.clear()
+                await self._close_connection(pubsub)
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _close_connection(self, pubsub) -> None:
+        try:
+            if pubsub is not None:
+                await pubsub.aclose()
+            if self._redis is not None:
+                await self._redis.aclose()
+        except Exception:
+            pass
+        self._redis = None
+
+    async def close(self) -> None:
+        """Encerra o assinante (shutdown da aplicação)."""
+        if self._listener is not None and not self._listener.done():
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._listener
+        self._listener = None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "watched_tasks": len(self._queues),
+            "sockets": sum(len(q) for q in self._queues.values()),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+        }
+
+
+progress_hub = ProgressHub(os.getenv("REDIS_URL", "redis://redis:6379/0"))
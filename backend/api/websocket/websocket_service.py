@@ -1,49 +1,45 @@
 import asyncio
-import json
-import os
-import redis
+import contextlib
 from datetime import datetime
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from celery.result import AsyncResult
-import asyncio
-
+from typing import Any, Dict
 
 from celery.result import AsyncResult
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from loguru import logger
 
+from backend.api.websocket.progress_hub import RESYNC, progress_hub
+
 # Criar roteador
 router = APIRouter()
 
-# Conexão com Redis
-REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
-redis_client = redis.Redis.from_url(REDIS_URL)
+# Tempo máximo de monitoramento de uma tarefa
+TASK_TIMEOUT_MINUTES = 30
 
 
-async def broadcast_to_task_subscribers(task_id: str, message: dict):
-    """
-    Publica mensagem no canal Redis correspondente ao task_id.
+def _task_snapshot(task_id: str) -> Dict[str, Any]:
     """
-    channel = f"task_status:{task_id}"
-    redis_client.publish(channel, json.dumps(message))
+    Estado atual da tarefa no result backend (chamada bloqueante).
 
-
-async def monitor_task_timeout(
-    websocket: WebSocket, task_id: str, timeout_minutes: int = 30
-):
-    """
-    Monitora o timeout da tarefa e fecha a conexão se exceder o limite.
+    Lido na conexão, para cobrir as mensagens publicadas antes de o
+    cliente assinar, e de novo se o ProgressHub reconectar (RESYNC).
+    No resto do tempo tudo chega via pub/sub.
     """
-    try:
-        await asyncio.sleep(timeout_minutes * 60)
-        await websocket.send_json(
-            {
-                "status": "TIMEOUT",
-                "error": f"Monitoramento excedeu {timeout_minutes} minutos",
-            }
-        )
-        await websocket.close()
-    except Exception as e:
-        logger.error(f"Erro no monitor de timeout: {str(e)}")
+    task = AsyncResult(task_id)
+    state = task.state
+    snapshot = {
+        "status": state,
+        "timestamp": datetime.now().isoformat(),
+    }
+    if task.ready():
+        snapshot["final"] = True
+        if task.successful():
+            snapshot["result"] = task.result
+        else:
+            snapshot["error"] = str(task.info)
+    else:
+        info = task.info
+        snapshot["info"] = info if isinstance(info, dict) else {}
+    return snapshot
 
 
 @router.websocket("/task_status/{task_id}")
@@ -51,78 +47,51 @@ async def websocket_endpoint(websocket: WebSocket, task_id: str):
     """
     Endpoint WebSocket para monitorar status de tarefas Celery.
 
+    Envia o estado atual e depois repassa, sem polling, as mensagens
+    publicadas pela tarefa em task_status:{task_id} (via ProgressHub).
+    Fecha ao receber a mensagem final (SUCCESS/FAILURE) ou no timeout.
+
     Args:
         websocket: Conexão WebSocket
         task_id: ID da tarefa Celery a ser monitorada
     """
     await websocket.accept()
 
-    # Assinar canal Redis para o task_id
-    pubsub = redis_client.pubsub()
-    channel = f"task_status:{task_id}"
-    pubsub.subscribe(channel)
-
-    # Iniciar monitor de timeout
-    timeout_task = asyncio.create_task(
-        monitor_task_timeout(websocket, task_id)
-    )
+    queue = None
+    deadline = asyncio.get_running_loop().time() + TASK_TIMEOUT_MINUTES * 60
 
     try:
-        task = AsyncResult(task_id)
-
-        # Enviar estado inicial
-        current_state = {
-            "status": task.state,
-            "info": task.info or {},
-            "timestamp": datetime.now().isoformat(),
-        }
-        await websocket.send_json(current_state)
-        await broadcast_to_task_subscribers(task_id, current_state)
-
-        # Monitorar mensagens do Redis
-        async def listen_redis():
-            while True:
-                message = pubsub.get_message(timeout=1.0)
-                if message and message["type"] == "message":
-                    await websocket.send_json(json.loads(message["data"]))
-                await asyncio.sleep(0.1)
-
-        # Monitorar tarefa Celery
-        async def monitor_task():
-            while not task.ready():
-                if task.state == "PROGRESS":
-                    current_state = {
-                        "status": "PROGRESS",
-                        "info": task.info or {},
-                        "timestamp": datetime.now().isoformat(),
+        # Assina antes do snapshot; subscribe() só retorna com o
+        # PSUBSCRIBE ativo, então nada publicado entre os dois se perde
+        queue = await progress_hub.subscribe(task_id)
+        snapshot = await asyncio.to_thread(_task_snapshot, task_id)
+        await websocket.send_json(snapshot)
+        if snapshot.get("final"):
+            return
+
+        while True:
+            remaining = deadline - asyncio.get_running_loop().time()
+            try:
+                message = await asyncio.wait_for(queue.get(), remaining)
+            except asyncio.TimeoutError:
+                await websocket.send_json(
+                    {
+                        "status": "TIMEOUT",
+                        "error": (
+                            f"Monitoramento excedeu "
+                            f"{TASK_TIMEOUT_MINUTES} minutos"
+                        ),
                     }
-                    await broadcast_to_task_subscribers(task_id, current_state)
-                await asyncio.sleep(1)
-
-            if task.failed():
-                error_info = {
-                    "status": "FAILURE",
-                    "error": str(task.info),
-                    "timestamp": datetime.now().isoformat(),
-                }
-                await broadcast_to_task_subscribers(task_id, error_info)
-            else:
-                task_result = task.get()
-                result, warnings = task_result if task_result else (None, None)
-                success_info = {
-                    "status": "SUCCESS",
-                    "result": (
-                        result.to_dict()
-                        if hasattr(result, "to_dict")
-                        else result
-                    ),
-                    "warnings": warnings,
-                    "timestamp": datetime.now().isoformat(),
-                }
-                await broadcast_to_task_subscribers(task_id, success_info)
-
-        # Executar monitoramento do Redis e da tarefa em paralelo
-        await asyncio.gather(listen_redis(), monitor_task())
+                )
+                return
+
+            if message is RESYNC or message.get("status") == "SUCCESS":
+                # Assinante reconectou, ou a tarefa terminou (o resultado
+                # não vai no pub/sub): relê o estado no result backend
+                message = await asyncio.to_thread(_task_snapshot, task_id)
+            await websocket.send_json(message)
+            if message.get("final"):
+                return
 
     except WebSocketDisconnect:
         logger.info(
@@ -141,6 +110,7 @@ async def websocket_endpoint(websocket: WebSocket, task_id: str):
                 f"Erro ao enviar mensagem de erro para o cliente: {str(e)}"
             )
     finally:
-        timeout_task.cancel()
-        pubsub.close()
-        await websocket.close()
+        if queue is not None:
+            progress_hub.unsubscribe(task_id, queue)
+        with contextlib.suppress(Exception):
+            await websocket.close()
@@ -1,14 +1,44 @@
 """
 Serviço de contagem de visitantes usando Redis + PostgreSQL
+
+Por carregamento de página, um único pipeline Redis de tamanho fixo:
+- INCR do total e do bucket da hora (page views)
+- PFADD do visitante nos HyperLogLogs da hora e do dia (únicos, ~12 KB
+  por chave independentemente do tráfego, erro padrão ~0,81%)
+
+A task periódica (sync_to_database) consolida os buckets horários em
+visitor_hourly_stats com um único INSERT ... ON CONFLICT e atualiza a
+linha agregada de visitor_stats.
 """
 
-from datetime import datetime
-from typing import Dict, Optional
+import hashlib
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
 
 import redis
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
-from backend.database.models.visitor_stats import VisitorStats
+from backend.database.models.visitor_stats import (
+    VisitorHourlyStats,
+    VisitorStats,
+)
+
+# Validade dos buckets por hora e por dia no Redis (segundos)
+HOURLY_TTL = 48 * 3600
+DAILY_TTL = 32 * 86400
+
+# Horas (até a atual) relidas a cada consolidação; cobre o TTL horário
+ROLLUP_HOURS = 48
+
+
+def visitor_fingerprint(
+    ip_address: Optional[str], user_agent: Optional[str]
+) -> str:
+    """Identificador anônimo do visitante (IP + User-Agent)."""
+    raw = f"{ip_address or ''}|{user_agent or ''}"
+    return hashlib.sha1(raw.encode()).hexdigest()
 
 
 class VisitorCounterService:
@@ -18,34 +48,55 @@ class VisitorCounterService:
         self.redis = redis_client
         self.db = db_session
         self.REDIS_KEY_VISITORS = "visitors:count"
-        self.REDIS_KEY_UNIQUE_TODAY = "visitors:unique:today"
         self.REDIS_KEY_PEAK_HOUR = "visitors:peak_hour"
-        self.REDIS_KEY_HOURLY = "visitors:hourly"  # Contador por hora
+        self.REDIS_KEY_HOURLY = "visitors:hourly"  # Page views por hora
+        self.REDIS_KEY_UNIQUE_HOUR = "visitors:unique:hour"  # HLL
+        self.REDIS_KEY_UNIQUE_DAY = "visitors:unique:day"  # HLL
+
+    def _hour_keys(self, bucket: datetime) -> tuple:
+        """(page views, HLL de únicos) do bucket horário."""
+        stamp = bucket.strftime("%Y-%m-%dT%H")
+        return (
+            f"{self.REDIS_KEY_HOURLY}:{stamp}",
+            f"{self.REDIS_KEY_UNIQUE_HOUR}:{stamp}",
+        )
 
-    def increment_visitor(self) -> Dict:
+    def _day_key(self, day: datetime) -> str:
+        return f"{self.REDIS_KEY_UNIQUE_DAY}:{day.strftime('%Y-%m-%d')}"
+
+    def increment_visitor(self, visitor_id: Optional[str] = None) -> Dict:
         """
-        Incrementa contador de visitantes no Redis
+        Registra um carregamento de página (uma ida ao Redis).
+
+        Args:
+            visitor_id: Identificador do visitante (ver
+                visitor_fingerprint); sem ele só as page views contam
+
         Retorna status atual
         """
         try:
-            # Incrementar contador total
-            self.redis.incr(self.REDIS_KEY_VISITORS)
+            now = datetime.utcnow()
+            hourly_key, unique_hour_key = self._hour_keys(now)
+            day_key = self._day_key(now)
 
-            # Incrementar hora atual
-            current_hour = datetime.utcnow().strftime("%H:00")
-            hourly_key = f"{self.REDIS_KEY_HOURLY}:{current_hour}"
-            self.redis.incr(hourly_key)
-            self.redis.expire(hourly_key, 86400)  # TTL 24h
-
-            # Obter counts
-            total = int(self.redis.get(self.REDIS_KEY_VISITORS) or 0)
-            hourly = int(self.redis.get(hourly_key) or 0)
+            with self.redis.pipeline(transaction=False) as pipe:
+                pipe.incr(self.REDIS_KEY_VISITORS)
+                pipe.incr(hourly_key)
+                pipe.expire(hourly_key, HOURLY_TTL)
+                if visitor_id:
+                    pipe.pfadd(unique_hour_key, visitor_id)
+                    pipe.expire(unique_hour_key, HOURLY_TTL)
+                    pipe.pfadd(day_key, visitor_id)
+                    pipe.expire(day_key, DAILY_TTL)
+                pipe.pfcount(day_key)
+                results = pipe.execute()
 
             return {
-                "total_visitors": total,
-                "current_hour_visitors": hourly,
-                "current_hour": current_hour,
-                "timestamp": datetime.utcnow().isoformat(),
+                "total_visitors": int(results[0]),
+                "current_hour_visitors": int(results[1]),
+                "unique_visitors_today": int(results[-1]),
+                "current_hour": now.strftime("%H:00"),
+                "timestamp": now.isoformat(),
             }
         except Exception as e:
             return {"error": str(e)}
@@ -53,56 +104,149 @@ class VisitorCounterService:
     def get_stats(self) -> Dict:
         """Retorna estatísticas atuais dos visitantes"""
         try:
-            total = int(self.redis.get(self.REDIS_KEY_VISITORS) or 0)
-            current_hour = datetime.utcnow().strftime("%H:00")
-            hourly_key = f"{self.REDIS_KEY_HOURLY}:{current_hour}"
-            hourly = int(self.redis.get(hourly_key) or 0)
+            now = datetime.utcnow()
+            hourly_key, unique_hour_key = self._hour_keys(now)
+
+            with self.redis.pipeline(transaction=False) as pipe:
+                pipe.get(self.REDIS_KEY_VISITORS)
+                pipe.get(hourly_key)
+                pipe.pfcount(unique_hour_key)
+                pipe.pfcount(self._day_key(now))
+                pipe.get(self.REDIS_KEY_PEAK_HOUR)
+                total, hourly, unique_hour, unique_today, peak_hour = (
+                    pipe.execute()
+                )
 
             # Obter pico de hora do dia
-            peak_hour = self.redis.get(self.REDIS_KEY_PEAK_HOUR)
             if peak_hour:
-                peak_hour = peak_hour.decode() if isinstance(peak_hour, bytes) else peak_hour
+                peak_hour = (
+                    peak_hour.decode()
+                    if isinstance(peak_hour, bytes)
+                    else peak_hour
+                )
 
             return {
-                "total_visitors": total,
-                "current_hour_visitors": hourly,
-                "current_hour": current_hour,
+                "total_visitors": int(total or 0),
+                "current_hour_visitors": int(hourly or 0),
+                "current_hour_unique_visitors": int(unique_hour),
+                "unique_visitors_today": int(unique_today),
+                "current_hour": now.strftime("%H:00"),
                 "peak_hour": peak_hour,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now.isoformat(),
             }
         except Exception as e:
             return {"error": str(e)}
 
+    def _read_buckets(self, now: datetime) -> Dict:
+        """
+        Lê buckets horários, HLLs diários e o total em um pipeline.
+
+        Únicos da semana/mês vêm do PFCOUNT de vários dias (união dos
+        HyperLogLogs, sem contar duas vezes o mesmo visitante).
+        """
+        current = now.replace(minute=0, second=0, microsecond=0)
+        buckets = [current - timedelta(hours=h) for h in range(ROLLUP_HOURS)]
+        days = [self._day_key(now - timedelta(days=d)) for d in range(30)]
+
+        with self.redis.pipeline(transaction=False) as pipe:
+            for bucket in buckets:
+                hourly_key, unique_hour_key = self._hour_keys(bucket)
+                pipe.get(hourly_key)
+                pipe.pfcount(unique_hour_key)
+            pipe.get(self.REDIS_KEY_VISITORS)
+            pipe.pfcount(days[0])
+            pipe.pfcount(*days[:7])
+            pipe.pfcount(*days)
+            results = pipe.execute()
+
+        hours = []
+        for i, bucket in enumerate(buckets):
+            views, unique = results[2 * i : 2 * i + 2]
+            if views or unique:
+                hours.append(
+                    {
+                        "bucket": bucket,
+                        "page_views": int(views or 0),
+                        "unique_visitors": int(unique),
+                    }
+                )
+        total, today, week, month = results[2 * len(buckets) :]
+        return {
+            "hours": hours,
+            "total": int(total or 0),
+            "today": int(today),
+            "week": int(week),
+            "month": int(month),
+        }
+
+    def _upsert_hours(self, hours: List[Dict]) -> None:
+        """Um INSERT ... ON CONFLICT para todos os buckets."""
+        if not hours:
+            return
+        stmt = insert(VisitorHourlyStats).values(hours)
+        # Bucket que expirou/zerou no Redis não apaga o valor gravado
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[VisitorHourlyStats.bucket],
+            set_={
+                "page_views": func.greatest(
+                    stmt.excluded.page_views, VisitorHourlyStats.page_views
+                ),
+                "unique_visitors": func.greatest(
+                    stmt.excluded.unique_visitors,
+                    VisitorHourlyStats.unique_visitors,
+                ),
+                "updated_at": func.now(),
+            },
+        )
+        self.db.execute(stmt)
+
     def sync_to_database(self) -> Dict:
         """
-        Sincroniza dados de Redis para PostgreSQL
-        Útil para persistência em longo prazo
+        Consolida os buckets do Redis no PostgreSQL.
+
+        Idempotente: as últimas ROLLUP_HOURS horas são regravadas a
+        cada execução (a hora corrente, parcial, é completada na
+        próxima).
         """
         try:
-            total = int(self.redis.get(self.REDIS_KEY_VISITORS) or 0)
-            current_hour = datetime.utcnow().strftime("%H:%M")
+            now = datetime.utcnow()
+            snapshot = self._read_buckets(now)
+            today = now.date()
+            today_hours = [
+                h for h in snapshot["hours"] if h["bucket"].date() == today
+            ]
+            peak_hour = (
+                max(today_hours, key=lambda h: h["page_views"])[
+                    "bucket"
+                ].strftime("%H:00")
+                if today_hours
+                else None
+            )
 
-            # Buscar ou criar registro no banco
+            self._upsert_hours(snapshot["hours"])
+
+            # Buscar ou criar registro agregado no banco
             stats = self.db.query(VisitorStats).first()
             if not stats:
-                stats = VisitorStats(
-                    total_visitors=total,
-                    unique_visitors_today=total,
-                    last_sync=datetime.utcnow(),
-                    peak_hour=current_hour,
-                )
+                stats = VisitorStats()
                 self.db.add(stats)
-            else:
-                stats.total_visitors = total
-                stats.last_sync = datetime.utcnow()
-                stats.peak_hour = current_hour
+            stats.total_visitors = snapshot["total"]
+            stats.unique_visitors_today = snapshot["today"]
+            stats.unique_visitors_week = snapshot["week"]
+            stats.unique_visitors_month = snapshot["month"]
+            stats.last_sync = now
+            stats.peak_hour = peak_hour
 
             self.db.commit()
+            if peak_hour:
+                self.redis.set(self.REDIS_KEY_PEAK_HOUR, peak_hour)
 
             return {
                 "status": "synced",
-                "total_visitors": total,
-                "last_sync": datetime.utcnow().isoformat(),
+                "total_visitors": snapshot["total"],
+                "unique_visitors_today": snapshot["today"],
+                "hours_synced": len(snapshot["hours"]),
+                "last_sync": now.isoformat(),
             }
         except Exception as e:
             self.db.rollback()
@@ -116,6 +260,8 @@ class VisitorCounterService:
                 return {
                     "total_visitors": stats.total_visitors,
                     "unique_visitors_today": stats.unique_visitors_today,
+                    "unique_visitors_week": stats.unique_visitors_week,
+                    "unique_visitors_month": stats.unique_visitors_month,
                     "peak_hour": stats.peak_hour,
                     "last_sync": (stats.last_sync.isoformat() if stats.last_sync else None),
                     "created_at": (stats.created_at.isoformat() if stats.created_at else None),
@@ -69,6 +69,14 @@ def __getattr__(name: str) -> Any:
             "backend.core.data_processing.kalman_ensemble",
             "AdaptiveKalmanFilter",
         ),
+        "adaptive_kalman_scan": (
+            "backend.core.data_processing.kalman_ensemble",
+            "adaptive_kalman_scan",
+        ),
+        "simple_kalman_scan": (
+            "backend.core.data_processing.kalman_ensemble",
+            "simple_kalman_scan",
+        ),
         # Station finder
         "StationFinder": (
             "backend.core.data_processing.station_finder",
@@ -1,7 +1,6 @@
 import os
-import pickle
 from datetime import timedelta
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -9,6 +8,12 @@ import redis
 from celery import shared_task
 from loguru import logger
 
+from backend.infrastructure.cache.cache_codecs import (
+    CacheCodecError,
+    dumps,
+    loads,
+)
+
 # Redis configuration
 REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
 CACHE_EXPIRY_HOURS = 24  # 24 hours
@@ -106,66 +111,82 @@ def _get_validation_limits(
         return global_limits
 
 
-@shared_task
-def data_initial_validate(
-    weather_df: pd.DataFrame, latitude: float, region: str = "global"
-) -> Tuple[pd.DataFrame, List[str]]:
-    """
-    Validates weather data based on physical limits.
-
-    Physical limits follow scientific literature:
-    - **Brazil** (Xavier et al. 2016, 2022):
-      - 0 mm < precipitation < 450 mm
-      - 0.03Ra ≤ solar_radiation < Ra
-      - 0 m/s ≤ wind_speed < 100 m/s
-      - -30°C < temperature_max
-      - temperature_min < 50°C
-    - **Global** (conservative world limits):
-      - More relaxed ranges based on world records
+# Parâmetros astronômicos calculados (não passam por IQR nem imputação)
+_DERIVED_COLS = {"Ra", "dr", "delta", "omega_s"}
+
+# Variáveis com limites físicos estritos já validados: IQR é redundante
+_IQR_EXCLUDED_COLS = _DERIVED_COLS | {
+    # Temperature variables (already validated with physical limits)
+    "T2M_MAX",
+    "T2M_MIN",
+    "T2M",
+    "temperature_2m_max",
+    "temperature_2m_min",
+    "temperature_2m_mean",
+    "temp_celsius",
+    # Humidity variables (already validated 0-100%)
+    "RH2M",
+    "relative_humidity_2m_max",
+    "relative_humidity_2m_mean",
+    "relative_humidity_2m_min",
+    "humidity_percent",
+    # Wind variables (already validated 0-100 m/s)
+    "WS2M",
+    "wind_speed_10m_max",
+    "wind_speed_10m_mean",
+    "wind_speed_ms",
+    # Precipitation variables (already validated 0-450 mm)
+    "PRECTOTCORR",
+    "precipitation_sum",
+    "precipitation_mm",
+    # Radiation variables (validated with Ra)
+    "ALLSKY_SFC_SW_DWN",
+    "shortwave_radiation_sum",
+    # Duration variables (validated 0-24h)
+    "daylight_duration",
+    "sunshine_duration",
+    # Pressure variables (validated 900-1100 hPa)
+    "pressure_mean_sea_level",
+    # ETo variables (validated 0-15 mm/day)
+    "et0_fao_evapotranspiration",
+}
+
+_NUMERIC_DTYPES = (np.float64, np.int64, np.float32, np.int32)
+
+
+def _numeric_columns(weather_df: pd.DataFrame, excluded: set) -> List[str]:
+    """Colunas numéricas do DataFrame fora de `excluded`."""
+    return [
+        col
+        for col, dtype in weather_df.dtypes.items()
+        if col not in excluded and dtype in _NUMERIC_DTYPES
+    ]
 
-    Args:
-        weather_df (pd.DataFrame): Weather data with index as datetime and
-            columns T2M_MAX, T2M_MIN, T2M, RH2M, WS2M, ALLSKY_SFC_SW_DWN,
-            PRECTOTCORR.
-        latitude (float): Latitude for calculating extraterrestrial radiation
-            (Ra), between -90 and 90.
-        region (str): "brazil" for Xavier et al. limits or "global" for
-            conservative world limits. Defaults to "global".
-
-    Returns:
-        Tuple[pd.DataFrame, List[str]]: Validated DataFrame and list of
-            warnings with metrics.
 
+def _write_columns(
+    weather_df: pd.DataFrame,
+    cols: List[str],
+    block: np.ndarray,
+    changed: np.ndarray,
+) -> None:
+    """Grava de volta só as colunas alteradas do bloco 2-D."""
+    for j in np.flatnonzero(changed):
+        weather_df[cols[j]] = block[:, j]
+
+
+def _extraterrestrial_radiation(
+    day_of_year: np.ndarray, latitude: float
+) -> Tuple[np.ndarray, ...]:
     """
-    logger.info("Validating weather data")
-    warnings = []
+    Ra, dr, delta e omega_s por linha (FAO-56 Eqs. 21-25).
 
-    # Validate latitude
-    if not (-90 <= latitude <= 90):
-        warnings.append("Latitude must be between -90 and 90.")
-        logger.error(warnings[-1])
-        raise ValueError(warnings[-1])
-
-    # Validate index
-    if not pd.api.types.is_datetime64_any_dtype(weather_df.index):
-        msg = "DataFrame index must be in datetime format (YYYY-MM-DD)."
-        warnings.append(msg)
-        logger.error(msg)
-        raise ValueError(msg)
-
-    weather_df = weather_df.copy()
-    if isinstance(weather_df.index, pd.DatetimeIndex):
-        weather_df["day_of_year"] = weather_df.index.dayofyear.astype(float)
-    else:
-        raise ValueError("DataFrame index must be DatetimeIndex")
-
-    # Calculate extraterrestrial radiation (Ra) - FAO-56 Eqs. 21-25
-    # (Allen et al., 1998) - Optimized with vectorization
+    Calculados uma vez por dia do ano distinto e expandidos com o
+    índice inverso de np.unique.
+    """
     Gsc = 0.0820  # Solar constant [MJ m^-2 min^-1]
     phi = np.radians(latitude)  # Latitude in radians
 
-    unique_days = weather_df["day_of_year"].unique()
-    doy_unique = unique_days.astype(float)
+    doy_unique, inverse = np.unique(day_of_year, return_inverse=True)
 
     # Eq. 23: Inverse relative distance Earth-Sun
     dr = 1.0 + 0.033 * np.cos(2.0 * np.pi * doy_unique / 365.0)
@@ -186,7 +207,7 @@ def data_initial_validate(
     # cos_ws >= 1.0 -> sun never rises -> ws = 0 (already zero)
 
     # Eq. 21: Extraterrestrial radiation
-    Ra_unique = (
+    Ra = (
         (24.0 * 60.0 / np.pi)
         * Gsc
         * dr
@@ -195,22 +216,70 @@ def data_initial_validate(
             + np.cos(phi) * np.cos(delta) * np.sin(omega_s)
         )
     )
-    Ra_unique = np.maximum(Ra_unique, 0.0)  # Ensure non-negative
+    Ra = np.maximum(Ra, 0.0)  # Ensure non-negative
+
+    return Ra[inverse], dr[inverse], delta[inverse], omega_s[inverse]
+
+
+def _between(
+    values: np.ndarray,
+    low: np.ndarray | float,
+    high: np.ndarray | float,
+    left_closed: np.ndarray | bool,
+    right_closed: np.ndarray | bool,
+) -> np.ndarray:
+    """pd.Series.between em arrays (NaN -> False), limites por coluna."""
+    above = np.where(left_closed, values >= low, values > low)
+    below = np.where(right_closed, values <= high, values < high)
+    return above & below
+
+
+def _validate(
+    weather_df: pd.DataFrame, latitude: float, region: str
+) -> Tuple[pd.DataFrame, List[str], Dict[str, int]]:
+    """
+    Corpo de data_initial_validate.
+
+    Returns:
+        (DataFrame validado, warnings, {coluna: valores substituídos})
+    """
+    logger.info("Validating weather data")
+    warnings = []
+
+    # Validate latitude
+    if not (-90 <= latitude <= 90):
+        warnings.append("Latitude must be between -90 and 90.")
+        logger.error(warnings[-1])
+        raise ValueError(warnings[-1])
+
+    # Validate index
+    if not pd.api.types.is_datetime64_any_dtype(weather_df.index):
+        msg = "DataFrame index must be in datetime format (YYYY-MM-DD)."
+        warnings.append(msg)
+        logger.error(msg)
+        raise ValueError(msg)
+
+    if not isinstance(weather_df.index, pd.DatetimeIndex):
+        raise ValueError("DataFrame index must be DatetimeIndex")
 
-    # Create mapping from day_of_year to calculated values
-    ra_mapping = dict(zip(unique_days, Ra_unique))
-    dr_mapping = dict(zip(unique_days, dr))
-    delta_mapping = dict(zip(unique_days, delta))
-    omega_s_mapping = dict(zip(unique_days, omega_s))
+    # Cópia rasa: colunas substituídas inteiras, o original não muda
+    weather_df = weather_df.copy(deep=False)
+    n_rows = len(weather_df)
+    day_of_year = weather_df.index.dayofyear.to_numpy(dtype=np.float64)
+    weather_df["day_of_year"] = day_of_year
 
-    # Apply values to DataFrame
-    weather_df["Ra"] = weather_df["day_of_year"].map(ra_mapping)
-    weather_df["dr"] = weather_df["day_of_year"].map(dr_mapping)
-    weather_df["delta"] = weather_df["day_of_year"].map(delta_mapping)
-    weather_df["omega_s"] = weather_df["day_of_year"].map(omega_s_mapping)
+    # Calculate extraterrestrial radiation (Ra) - FAO-56 Eqs. 21-25
+    # (Allen et al., 1998)
+    Ra, dr, delta, omega_s = _extraterrestrial_radiation(
+        day_of_year, latitude
+    )
+    weather_df["Ra"] = Ra
+    weather_df["dr"] = dr
+    weather_df["delta"] = delta
+    weather_df["omega_s"] = omega_s
 
     # Validate Ra values
-    if not (weather_df["Ra"] > 0).all():
+    if not (Ra > 0).all():
         warnings.append("Invalid Ra values detected.")
         logger.error(warnings[-1])
 
@@ -219,52 +288,56 @@ def data_initial_validate(
     # NASA POWER, Open-Meteo Archive/Forecast,
     # MET Norway Locationforecast/FROST, NWS Forecast/Stations
     limits = _get_validation_limits(region)
-
-    # Validate numeric columns
-    for col, (min_val, max_val, inclusive) in limits.items():
-        if col in weather_df.columns:
-            # Cast inclusive to the correct type for pandas.between()
-            inclusive_type = inclusive  # type: ignore
-            invalid_mask = ~weather_df[col].between(
-                min_val, max_val, inclusive=inclusive_type
-            )
-            invalid_count = invalid_mask.sum()
-            if invalid_count > 0:
-                percent_invalid = (invalid_count / len(weather_df)) * 100
-                warnings.append(
-                    f"Invalid values in {col}: {invalid_count} records "
-                    f"({percent_invalid:.2f}%) replaced with NaN."
-                )
-                logger.warning(warnings[-1])
-            weather_df[col] = weather_df[col].where(~invalid_mask, np.nan)
+    cols = [col for col in limits if col in weather_df.columns]
+    counts: Dict[str, int] = {}
+
+    if cols:
+        # Todas as variáveis de uma vez: bloco (dias x colunas)
+        block = weather_df[cols].to_numpy(dtype=np.float64, copy=True)
+        bounds = [limits[col] for col in cols]
+        low = np.array([b[0] for b in bounds], dtype=np.float64)
+        high = np.array([b[1] for b in bounds], dtype=np.float64)
+        left_closed = np.array([b[2] in ("both", "left") for b in bounds])
+        right_closed = np.array([b[2] in ("both", "right") for b in bounds])
+
+        # NaN já existente não conta como valor substituído
+        invalid = ~_between(block, low, high, left_closed, right_closed)
+        invalid &= ~np.isnan(block)
+        block[invalid] = np.nan
+        invalid_counts = invalid.sum(axis=0)
+        _write_columns(weather_df, cols, block, invalid_counts > 0)
+        counts.update(zip(cols, invalid_counts.tolist()))
 
     # Validate solar radiation (NASA: ALLSKY_SFC_SW_DWN MJ/m²/day,
     # Open-Meteo/MET Norway: shortwave_radiation_sum may be in J/m²/day)
-    radiation_cols = ["ALLSKY_SFC_SW_DWN"]
-    for rad_col in radiation_cols:
-        if rad_col in weather_df.columns:
-            # Validate against physical limits (0.03*Ra to Ra)
-            invalid_rad_mask = ~weather_df[rad_col].between(
-                0.03 * weather_df["Ra"], weather_df["Ra"], inclusive="left"
-            )
-            invalid_count = invalid_rad_mask.sum()
-            if invalid_count > 0:
-                percent_invalid = (invalid_count / len(weather_df)) * 100
-                warnings.append(
-                    f"Invalid values in {rad_col}: {invalid_count} records "
-                    f"({percent_invalid:.2f}%) replaced with NaN."
-                )
-                logger.warning(warnings[-1])
-            weather_df[rad_col] = weather_df[rad_col].where(
-                ~invalid_rad_mask, np.nan
+    if "ALLSKY_SFC_SW_DWN" in weather_df.columns:
+        # Validate against physical limits (0.03*Ra to Ra)
+        rad = weather_df["ALLSKY_SFC_SW_DWN"].to_numpy(
+            dtype=np.float64, copy=True
+        )
+        invalid_rad = ~_between(rad, 0.03 * Ra, Ra, True, False)
+        invalid_rad &= ~np.isnan(rad)
+        if invalid_rad.any():
+            rad[invalid_rad] = np.nan
+            weather_df["ALLSKY_SFC_SW_DWN"] = rad
+        counts["ALLSKY_SFC_SW_DWN"] = counts.get(
+            "ALLSKY_SFC_SW_DWN", 0
+        ) + int(invalid_rad.sum())
+
+    for col, invalid_count in counts.items():
+        if invalid_count > 0:
+            percent_invalid = (invalid_count / n_rows) * 100
+            warnings.append(
+                f"Invalid values in {col}: {invalid_count} records "
+                f"({percent_invalid:.2f}%) replaced with NaN."
             )
+            logger.warning(warnings[-1])
 
     # Metric: Total invalid values
-    invalid_rows = weather_df[weather_df.isna().any(axis=1)]
-    if not invalid_rows.empty:
-        total_invalid = invalid_rows.isna().sum().sum()
+    total_invalid = int(weather_df.isna().to_numpy().sum())
+    if total_invalid:
         percent_invalid = (
-            total_invalid / (len(weather_df) * len(weather_df.columns))
+            total_invalid / (n_rows * len(weather_df.columns))
         ) * 100
         warnings.append(
             f"Total invalid values replaced with NaN: {total_invalid} "
@@ -272,98 +345,91 @@ def data_initial_validate(
         )
         logger.info(warnings[-1])
 
-    return weather_df, warnings
+    return weather_df, warnings, counts
 
 
 @shared_task
-def detect_outliers_iqr(
-    weather_df: pd.DataFrame,
-    iqr_factor: float = 1.5,
-    max_outlier_percent: float = 5.0,
+def data_initial_validate(
+    weather_df: pd.DataFrame, latitude: float, region: str = "global"
 ) -> Tuple[pd.DataFrame, List[str]]:
     """
-    Detect outliers using IQR method with adaptive factors for short-term data.
+    Validates weather data based on physical limits.
 
-    - Excludes variables with strict physical limits already validated
-    - Uses global IQR detection for climate data (optimized for 7-30 days)
-    - Applies adaptive IQR factors based on variable type
-    - Limits maximum percentage of outliers removed
-    - Validates data quality before outlier detection
+    Physical limits follow scientific literature:
+    - **Brazil** (Xavier et al. 2016, 2022):
+      - 0 mm < precipitation < 450 mm
+      - 0.03Ra ≤ solar_radiation < Ra
+      - 0 m/s ≤ wind_speed < 100 m/s
+      - -30°C < temperature_max
+      - temperature_min < 50°C
+    - **Global** (conservative world limits):
+      - More relaxed ranges based on world records
+
+    All limits are applied at once as a 2-D comparison over the block
+    of validated columns; only columns with replaced values are
+    written back (the input DataFrame is not modified).
 
     Args:
-        weather_df (pd.DataFrame): Weather data with datetime index.
-        iqr_factor (float): Base factor for IQR bounds (default: 1.5).
-        max_outlier_percent (float): Maximum percentage of outliers allowed
-            per variable (default: 5.0%).
+        weather_df (pd.DataFrame): Weather data with index as datetime and
+            columns T2M_MAX, T2M_MIN, T2M, RH2M, WS2M, ALLSKY_SFC_SW_DWN,
+            PRECTOTCORR.
+        latitude (float): Latitude for calculating extraterrestrial radiation
+            (Ra), between -90 and 90.
+        region (str): "brazil" for Xavier et al. limits or "global" for
+            conservative world limits. Defaults to "global".
 
     Returns:
-        Tuple[pd.DataFrame, List[str]]: DataFrame with outliers replaced by NaN
-        and list of warnings with metrics.
+        Tuple[pd.DataFrame, List[str]]: Validated DataFrame and list of
+            warnings with metrics.
+
+    """
+    weather_df, warnings, _ = _validate(weather_df, latitude, region)
+    return weather_df, warnings
+
+
+def _get_iqr_factor(col_name: str, iqr_factor: float) -> float:
+    """Adaptive IQR factor based on variable name."""
+    col_lower = col_name.lower()
+
+    # Strict factors for variables with low expected variability
+    if any(term in col_lower for term in ["pressure", "duration", "sunshine"]):
+        return iqr_factor * 0.8  # 1.2
+
+    # Lenient factors for variables with high natural variability
+    elif any(term in col_lower for term in ["evapotranspiration", "eto"]):
+        return iqr_factor * 1.5  # 2.25
+
+    # Default factor for others
+    else:
+        return iqr_factor  # 1.5
+
+
+def _remove_outliers(
+    weather_df: pd.DataFrame,
+    iqr_factor: float = 1.5,
+    max_outlier_percent: float = 5.0,
+) -> Tuple[pd.DataFrame, List[str], Dict[str, int]]:
+    """
+    Corpo de detect_outliers_iqr.
+
+    Returns:
+        (DataFrame, warnings, {coluna: outliers removidos})
     """
     logger.info("Detecting outliers with IQR method (optimized for 7-30 days)")
     warnings = []
-
-    weather_df = weather_df.copy()
+    n_rows = len(weather_df)
 
     # Validate data range for this application version
-    if len(weather_df) < 7 or len(weather_df) > 30:
+    if n_rows < 7 or n_rows > 30:
         warnings.append(
-            f"WARNING: Data length ({len(weather_df)} days) "
+            f"WARNING: Data length ({n_rows} days) "
             f"outside supported range (7-30 days). "
             f"Results may be unreliable."
         )
         logger.warning(warnings[-1])
 
-    # Exclude columns that already have strict physical validation
-    # These variables have well-defined physical limits, so IQR is redundant
-    excluded_cols = {
-        "Ra",
-        "dr",
-        "delta",
-        "omega_s",  # Calculated parameters
-        # Temperature variables (already validated with physical limits)
-        "T2M_MAX",
-        "T2M_MIN",
-        "T2M",
-        "temperature_2m_max",
-        "temperature_2m_min",
-        "temperature_2m_mean",
-        "temp_celsius",
-        # Humidity variables (already validated 0-100%)
-        "RH2M",
-        "relative_humidity_2m_max",
-        "relative_humidity_2m_mean",
-        "relative_humidity_2m_min",
-        "humidity_percent",
-        # Wind variables (already validated 0-100 m/s)
-        "WS2M",
-        "wind_speed_10m_max",
-        "wind_speed_10m_mean",
-        "wind_speed_ms",
-        # Precipitation variables (already validated 0-450 mm)
-        "PRECTOTCORR",
-        "precipitation_sum",
-        "precipitation_mm",
-        # Radiation variables (validated with Ra)
-        "ALLSKY_SFC_SW_DWN",
-        "shortwave_radiation_sum",
-        # Duration variables (validated 0-24h)
-        "daylight_duration",
-        "sunshine_duration",
-        # Pressure variables (validated 900-1100 hPa)
-        "pressure_mean_sea_level",
-        # ETo variables (validated 0-15 mm/day)
-        "et0_fao_evapotranspiration",
-    }
-
     # Get numeric columns excluding already validated ones
-    numeric_cols = [
-        col
-        for col in weather_df.columns
-        if col not in excluded_cols
-        and weather_df[col].dtype
-        in [np.float64, np.int64, np.float32, np.int32]
-    ]
+    numeric_cols = _numeric_columns(weather_df, _IQR_EXCLUDED_COLS)
 
     if not numeric_cols:
         warnings.append(
@@ -371,102 +437,79 @@ def detect_outliers_iqr(
             "(all variables already have physical validation)."
         )
         logger.info(warnings[-1])
-        return weather_df, warnings
-
-    # Adaptive IQR factors based on variable characteristics
-    adaptive_factors = {
-        # Variables that might have natural variability - use stricter IQR
-        "default": iqr_factor,  # 1.5
-        # Variables with high natural variability - use more lenient IQR
-        "lenient": iqr_factor * 1.5,  # 2.25
-        # Variables with low variability - use stricter IQR
-        "strict": iqr_factor * 0.8,  # 1.2
-    }
-
-    # Determine IQR factor for each variable
-    def get_iqr_factor(col_name: str) -> float:
-        """Get adaptive IQR factor based on variable name."""
-        col_lower = col_name.lower()
-
-        # Strict factors for variables with low expected variability
-        if any(
-            term in col_lower for term in ["pressure", "duration", "sunshine"]
-        ):
-            return adaptive_factors["strict"]
-
-        # Lenient factors for variables with high natural variability
-        elif any(term in col_lower for term in ["evapotranspiration", "eto"]):
-            return adaptive_factors["lenient"]
-
-        # Default factor for others
-        else:
-            return adaptive_factors["default"]
-
-    total_outliers_removed = 0
-
-    for col in numeric_cols:
-        col_data = weather_df[col].dropna()
-
-        # Skip if insufficient data for reliable IQR calculation
-        if len(col_data) < 5:  # Minimum for quartile calculation
+        return weather_df, warnings, {}
+
+    weather_df = weather_df.copy(deep=False)
+    block = weather_df[numeric_cols].to_numpy(dtype=np.float64, copy=True)
+    present = ~np.isnan(block)
+    n_valid = present.sum(axis=0)
+    col_min = np.min(block, axis=0, initial=np.inf, where=present)
+    col_max = np.max(block, axis=0, initial=-np.inf, where=present)
+
+    # Minimum for quartile calculation, and data must vary
+    enough = n_valid >= 5
+    varies = col_max > col_min
+    eligible = enough & varies
+
+    factors = np.array(
+        [_get_iqr_factor(col, iqr_factor) for col in numeric_cols]
+    )
+    outliers = np.zeros_like(present)
+    if eligible.any():
+        # Global IQR for all eligible columns at once (linear, as pandas)
+        sub = block[:, eligible]
+        q1, q3 = np.nanquantile(sub, [0.25, 0.75], axis=0)
+        iqr = q3 - q1
+        lower = q1 - factors[eligible] * iqr
+        upper = q3 + factors[eligible] * iqr
+        sub_outliers = (sub < lower) | (sub > upper)
+        sub_outliers[:, iqr <= 0] = False
+        outliers[:, eligible] = sub_outliers
+
+    outlier_counts = outliers.sum(axis=0)
+    block[outliers] = np.nan
+    _write_columns(weather_df, numeric_cols, block, outlier_counts > 0)
+
+    for j, col in enumerate(numeric_cols):
+        if not enough[j]:
             warnings.append(
                 f"Skipping outlier detection for {col}: "
-                f"insufficient data ({len(col_data)} values)."
+                f"insufficient data ({n_valid[j]} values)."
             )
             continue
-
-        # Check data quality before outlier detection
-        if col_data.std() == 0:
+        if not varies[j]:
             warnings.append(
                 f"Skipping outlier detection for {col}: "
                 "no variance in data."
             )
             continue
 
-        iqr_factor_adaptive = get_iqr_factor(col)
-
-        # Global IQR detection for short-term data (7-30 days)
-        Q1 = col_data.quantile(0.25)
-        Q3 = col_data.quantile(0.75)
-        IQR = Q3 - Q1
-
-        if IQR > 0:
-            lower_bound = Q1 - iqr_factor_adaptive * IQR
-            upper_bound = Q3 + iqr_factor_adaptive * IQR
-            outlier_mask = (weather_df[col] < lower_bound) | (
-                weather_df[col] > upper_bound
-            )
-            outlier_count = outlier_mask.sum()
-
-            weather_df[col] = weather_df[col].where(~outlier_mask, np.nan)
-        else:
-            outlier_count = 0
+        outlier_count = int(outlier_counts[j])
+        if outlier_count == 0:
+            continue
 
         # Check if outlier percentage exceeds maximum allowed
-        if outlier_count > 0:
-            percent_outliers = (outlier_count / len(weather_df)) * 100
-
-            if percent_outliers > max_outlier_percent:
-                warnings.append(
-                    f"WARNING: High outlier percentage in {col}: "
-                    f"{outlier_count} outliers ({percent_outliers:.2f}%) "
-                    f"exceeds limit of {max_outlier_percent}%. "
-                    f"Consider reviewing data quality."
-                )
-                logger.warning(warnings[-1])
-
+        percent_outliers = (outlier_count / n_rows) * 100
+        if percent_outliers > max_outlier_percent:
             warnings.append(
-                f"Detected {outlier_count} outliers in {col} "
-                f"({percent_outliers:.2f}%) using global IQR "
-                f"(factor: {iqr_factor_adaptive:.2f})."
+                f"WARNING: High outlier percentage in {col}: "
+                f"{outlier_count} outliers ({percent_outliers:.2f}%) "
+                f"exceeds limit of {max_outlier_percent}%. "
+                f"Consider reviewing data quality."
             )
-            logger.info(warnings[-1])
+            logger.warning(warnings[-1])
 
-            total_outliers_removed += outlier_count
+        warnings.append(
+            f"Detected {outlier_count} outliers in {col} "
+            f"({percent_outliers:.2f}%) using global IQR "
+            f"(factor: {factors[j]:.2f})."
+        )
+        logger.info(warnings[-1])
 
+    total_outliers_removed = int(outlier_counts.sum())
     if total_outliers_removed > 0:
         total_percent = (
-            total_outliers_removed / (len(weather_df) * len(numeric_cols))
+            total_outliers_removed / (n_rows * len(numeric_cols))
         ) * 100
         warnings.append(
             f"Total outliers removed: {total_outliers_removed} "
@@ -477,21 +520,55 @@ def detect_outliers_iqr(
         warnings.append("No outliers detected with IQR method.")
         logger.info(warnings[-1])
 
-    return weather_df, warnings
+    return (
+        weather_df,
+        warnings,
+        dict(zip(numeric_cols, outlier_counts.tolist())),
+    )
 
 
 @shared_task
-def data_impute(weather_df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
+def detect_outliers_iqr(
+    weather_df: pd.DataFrame,
+    iqr_factor: float = 1.5,
+    max_outlier_percent: float = 5.0,
+) -> Tuple[pd.DataFrame, List[str]]:
     """
-    Impute missing weather data using linear interpolation
-    (FAO-56 recommendation).
+    Detect outliers using IQR method with adaptive factors for short-term data.
+
+    - Excludes variables with strict physical limits already validated
+    - Uses global IQR detection for climate data (optimized for 7-30 days)
+    - Applies adaptive IQR factors based on variable type
+    - Limits maximum percentage of outliers removed
+    - Validates data quality before outlier detection
+
+    Quartiles of all candidate columns are computed in one
+    np.nanquantile call over the column block.
 
     Args:
-        weather_df (pd.DataFrame): Weather data with missing values.
+        weather_df (pd.DataFrame): Weather data with datetime index.
+        iqr_factor (float): Base factor for IQR bounds (default: 1.5).
+        max_outlier_percent (float): Maximum percentage of outliers allowed
+            per variable (default: 5.0%).
 
     Returns:
-        Tuple[pd.DataFrame, List[str]]: Imputed DataFrame and list of
-        warnings with metrics.
+        Tuple[pd.DataFrame, List[str]]: DataFrame with outliers replaced by NaN
+        and list of warnings with metrics.
+    """
+    weather_df, warnings, _ = _remove_outliers(
+        weather_df, iqr_factor, max_outlier_percent
+    )
+    return weather_df, warnings
+
+
+def _impute(
+    weather_df: pd.DataFrame,
+) -> Tuple[pd.DataFrame, List[str], Dict[str, int]]:
+    """
+    Corpo de data_impute.
+
+    Returns:
+        (DataFrame, warnings, {coluna: valores imputados})
     """
     logger.info("Imputing missing weather data")
     warnings = []
@@ -500,65 +577,84 @@ def data_impute(weather_df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
     if weather_df.empty:
         warnings.append("Input DataFrame is empty.")
         logger.warning(warnings[-1])
-        return weather_df, warnings
+        return weather_df, warnings, {}
 
     if not pd.api.types.is_datetime64_any_dtype(weather_df.index):
         warnings.append("DataFrame index must be in datetime format.")
         logger.warning(warnings[-1])
-        return weather_df, warnings
+        return weather_df, warnings, {}
 
-    weather_df = weather_df.copy()
-    numeric_cols = [
-        col
-        for col in weather_df.columns
-        if col not in ["Ra", "dr", "delta", "omega_s"]
-        and weather_df[col].dtype
-        in [np.float64, np.int64, np.float32, np.int32]
-    ]
+    numeric_cols = _numeric_columns(weather_df, _DERIVED_COLS)
+    if not numeric_cols:
+        return weather_df, warnings, {}
+
+    n_rows = len(weather_df)
+    block = weather_df[numeric_cols].to_numpy(dtype=np.float64, copy=True)
+    missing = np.isnan(block)
+    missing_counts = missing.sum(axis=0)
+    if not missing_counts.any():
+        return weather_df, warnings, {}
+
+    weather_df = weather_df.copy(deep=False)
+    positions = np.arange(n_rows, dtype=np.float64)
+    imputed: Dict[str, int] = {}
+    empty_cols = []
+
+    for j in np.flatnonzero(missing_counts):
+        col = numeric_cols[j]
+        gaps = missing[:, j]
+        if gaps.all():
+            empty_cols.append(col)
+            continue
+        # Linear by position; edges take the nearest value, like
+        # interpolate(method="linear", limit_direction="both")
+        block[gaps, j] = np.interp(
+            positions[gaps], positions[~gaps], block[~gaps, j]
+        )
+        weather_df[col] = block[:, j]
 
-    for col in numeric_cols:
-        missing_count = weather_df[col].isna().sum()
-        if missing_count > 0:
-            percent_missing = (missing_count / len(weather_df)) * 100
-            weather_df[col] = weather_df[col].interpolate(
-                method="linear", limit_direction="both"
-            )
-            warnings.append(
-                f"Imputed {missing_count} missing values in {col} "
-                f"({percent_missing:.2f}%) using linear interpolation."
-            )
-            logger.info(warnings[-1])
+        missing_count = int(missing_counts[j])
+        imputed[col] = missing_count
+        percent_missing = (missing_count / n_rows) * 100
+        warnings.append(
+            f"Imputed {missing_count} missing values in {col} "
+            f"({percent_missing:.2f}%) using linear interpolation."
+        )
+        logger.info(warnings[-1])
 
-    # Check for remaining NaNs and apply fallback
-    remaining_nans = weather_df[numeric_cols].isna().sum().sum()
-    if remaining_nans > 0:
+    # Columns without any value cannot be interpolated nor filled
+    if empty_cols:
+        remaining_nans = n_rows * len(empty_cols)
         percent_remaining = (
-            remaining_nans / (len(weather_df) * len(numeric_cols))
+            remaining_nans / (n_rows * len(numeric_cols))
         ) * 100
         warnings.append(
             f"Warning: {remaining_nans} missing values "
             f"({percent_remaining:.2f}%) could not be imputed "
-            f"with interpolation."
+            f"with interpolation (no data in {', '.join(empty_cols)})."
         )
         logger.warning(warnings[-1])
-        # Fallback: Forward-fill, then backward-fill, then mean
-        for col in numeric_cols:
-            if weather_df[col].isna().any():
-                # Try forward-fill first
-                weather_df[col] = weather_df[col].ffill()
-                # Then backward-fill for remaining NaNs
-                weather_df[col] = weather_df[col].bfill()
-                # Finally, use mean for any remaining NaNs
-                if weather_df[col].isna().any():
-                    weather_df[col] = weather_df[col].fillna(
-                        weather_df[col].mean()
-                    )
-                    warnings.append(
-                        f"Filled remaining NaNs in {col} with "
-                        f"mean value after forward/backward fill."
-                    )
-                    logger.info(warnings[-1])
 
+    return weather_df, warnings, imputed
+
+
+@shared_task
+def data_impute(weather_df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Impute missing weather data using linear interpolation
+    (FAO-56 recommendation).
+
+    Gaps are interpolated column by column directly in a single float
+    block; leading/trailing gaps take the nearest valid value.
+
+    Args:
+        weather_df (pd.DataFrame): Weather data with missing values.
+
+    Returns:
+        Tuple[pd.DataFrame, List[str]]: Imputed DataFrame and list of
+        warnings with metrics.
+    """
+    weather_df, warnings, _ = _impute(weather_df)
     return weather_df, warnings
 
 
@@ -623,14 +719,14 @@ def preprocessing(
             cached_data = redis_client.get(cache_key)
             if cached_data:
                 try:
-                    df = pickle.loads(cached_data)
+                    df = loads(cached_data)
                     logger.info(
                         f"Loaded preprocessed data from Redis cache: "
                         f"{cache_key}"
                     )
                     return df, ["Loaded from cache"]
-                except (pickle.UnpicklingError, EOFError) as e:
-                    warnings.append(f"Failed to unpickle cached data: {e}")
+                except CacheCodecError as e:
+                    warnings.append(f"Failed to decode cached data: {e}")
                     logger.warning(warnings[-1])
                     # Continue with processing if cache is corrupted
         except redis.ConnectionError as e:
@@ -644,19 +740,19 @@ def preprocessing(
             logger.error(warnings[-1])
 
     # Step 1: Initial validation
-    weather_df, validate_warnings = data_initial_validate(
+    weather_df, validate_warnings, invalid_counts = _validate(
         weather_df, latitude, region
     )
     warnings.extend(validate_warnings)
 
     # Step 2: Outlier detection with IQR
-    weather_df, outlier_warnings = detect_outliers_iqr(
+    weather_df, outlier_warnings, outlier_counts = _remove_outliers(
         weather_df, iqr_factor=1.5
     )
     warnings.extend(outlier_warnings)
 
     # Step 3: Imputation
-    weather_df, impute_warnings = data_impute(weather_df)
+    weather_df, impute_warnings, imputed_counts = _impute(weather_df)
     warnings.extend(impute_warnings)
 
     # Save to cache
@@ -665,14 +761,14 @@ def preprocessing(
             redis_client.setex(
                 cache_key,
                 timedelta(hours=CACHE_EXPIRY_HOURS),
-                pickle.dumps(weather_df),
+                dumps(weather_df),
             )
             logger.info(f"Saved preprocessed data to Redis cache: {cache_key}")
         except redis.ConnectionError as e:
             warnings.append(f"Redis connection failed during save: {e}")
             logger.warning(warnings[-1])
-        except (pickle.PicklingError, TypeError) as e:
-            warnings.append(f"Failed to pickle data for cache: {e}")
+        except (CacheCodecError, TypeError) as e:
+            warnings.append(f"Failed to encode data for cache: {e}")
             logger.warning(warnings[-1])
         except redis.RedisError as e:
             warnings.append(f"Redis save error: {e}")
@@ -681,27 +777,11 @@ def preprocessing(
             warnings.append(f"Unexpected cache save error: {e}")
             logger.error(warnings[-1])
 
-    # Final summary: Count total operations performed
-    total_invalid = sum(
-        1
-        for w in warnings
-        if "Invalid values" in w and any(char.isdigit() for char in w)
-    )
-    total_outliers = sum(
-        1
-        for w in warnings
-        if "outliers" in w and any(char.isdigit() for char in w)
-    )
-    total_imputed = sum(
-        1
-        for w in warnings
-        if "missing values" in w and any(char.isdigit() for char in w)
-    )
-
+    # Final summary: values touched by each step
     warnings.append(
-        f"Preprocessing summary: {total_invalid} validation "
-        f"corrections, {total_outliers} outlier removals, "
-        f"{total_imputed} imputations performed."
+        f"Preprocessing summary: {sum(invalid_counts.values())} validation "
+        f"corrections, {sum(outlier_counts.values())} outlier removals, "
+        f"{sum(imputed_counts.values())} imputations performed."
     )
     logger.info(warnings[-1])
 
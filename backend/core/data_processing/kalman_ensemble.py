@@ -3,13 +3,16 @@
 # 84% de cobertura nos testes.
 
 import json
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from loguru import logger
+from scipy.spatial import cKDTree
 
 
 @dataclass
@@ -90,7 +93,289 @@ class SimpleKalmanFilter:
         return round(self.estimate, 3)
 
 
+# ---------------------------------------------------------------------------
+# Kernels vetorizados (sem objetos Python por passo)
+#
+# Reproduzem exatamente AdaptiveKalmanFilter/SimpleKalmanFilter sobre arrays
+# float64. Aceitam uma série (T,) ou várias localidades de uma vez (L, T):
+# o laço percorre o tempo e cada passo atualiza todas as localidades.
+# ---------------------------------------------------------------------------
+
+# Defaults usados quando um mês não existe no relatório de referência
+_TABLE_DEFAULTS = {
+    "eto": {"normals": np.nan, "stds": np.nan, "p01": np.nan, "p99": np.nan},
+    "precip": {"normals": 100.0, "stds": 10.0, "p01": np.nan, "p99": np.nan},
+}
+
+# Abaixo disto, um laço escalar por série supera o passo vetorizado
+_VECTORIZE_MIN_LOCATIONS = 48
+
+
+def monthly_tables(ref: dict, kind: str = "eto") -> Dict[str, np.ndarray]:
+    """
+    Converte as normais mensais de uma referência em tabelas (13,).
+
+    O índice é o mês (1-12); a posição 0 não é usada. p01/p99 ausentes
+    ficam NaN e o kernel aplica normal ± 3.5·std, como o filtro escalar.
+
+    Args:
+        ref: Dict retornado por HistoricalDataLoader
+        kind: "eto" ou "precip"
+
+    Returns:
+        Dict com arrays 'normals', 'stds', 'p01' e 'p99'
+    """
+    tables = {}
+    for name, default in _TABLE_DEFAULTS[kind].items():
+        table = np.full(13, default, dtype=np.float64)
+        for month, value in ref.get(f"{kind}_{name}", {}).items():
+            if value is not None:
+                table[int(month)] = value
+        tables[name] = table
+    return tables
+
+
+def month_resets(
+    months: np.ndarray, valid: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Marca os passos onde um novo filtro mensal deve ser criado.
+
+    Um filtro reinicia quando o mês difere do último passo considerado.
+    Com `valid`, passos inválidos são ignorados na comparação (regra da
+    ETo); sem ele, todos os passos contam (regra da precipitação).
+
+    Args:
+        months: Meses (1-12), shape (T,) ou (L, T)
+        valid: Máscara opcional de observações válidas
+
+    Returns:
+        Máscara booleana com o mesmo shape de `months`
+    """
+    months = np.asarray(months)
+    steps = np.arange(months.shape[-1])
+    if valid is None:
+        valid = np.ones(months.shape, dtype=bool)
+    last_valid = np.maximum.accumulate(np.where(valid, steps, -1), axis=-1)
+    previous = np.concatenate(
+        [np.full(months.shape[:-1] + (1,), -1), last_valid[..., :-1]],
+        axis=-1,
+    )
+    previous_month = np.take_along_axis(
+        months, np.maximum(previous, 0), axis=-1
+    )
+    return valid & ((previous < 0) | (months != previous_month))
+
+
+def adaptive_kalman_scan(
+    observations: np.ndarray,
+    months: np.ndarray,
+    resets: np.ndarray,
+    normals: np.ndarray,
+    stds: np.ndarray,
+    p01: np.ndarray,
+    p99: np.ndarray,
+) -> np.ndarray:
+    """
+    AdaptiveKalmanFilter com reinício mensal, sobre arrays.
+
+    Equivale a criar `AdaptiveKalmanFilter(normal, std, p01, p99)` do mês
+    em cada passo marcado em `resets` e chamar `update` nas observações
+    válidas. Observações NaN produzem NaN e não alteram o estado.
+
+    Args:
+        observations: Observações, shape (T,) ou (L, T)
+        months: Mês (1-12) de cada passo, mesmo shape
+        resets: Passos onde o filtro reinicia (ver `month_resets`)
+        normals, stds, p01, p99: Tabelas mensais (13,) ou (L, 13)
+
+    Returns:
+        Estimativas arredondadas a 3 casas, mesmo shape de `observations`
+    """
+    obs = np.asarray(observations, dtype=np.float64)
+    shape = obs.shape
+    obs = np.atleast_2d(obs)
+    n_loc, n_steps = obs.shape
+    months = np.broadcast_to(np.asarray(months), obs.shape).astype(np.intp)
+    resets = np.broadcast_to(np.asarray(resets, dtype=bool), obs.shape)
+    tables = [
+        np.broadcast_to(np.asarray(t, dtype=np.float64), (n_loc, 13))
+        for t in (normals, stds, p01, p99)
+    ]
+    out = np.full(obs.shape, np.nan)
+    R_base = 0.55**2
+
+    if n_loc < _VECTORIZE_MIN_LOCATIONS:
+        # Poucas séries: laço em floats Python é mais rápido que NumPy
+        for i in range(n_loc):
+            _adaptive_scan_row(
+                obs[i], months[i], resets[i], [t[i] for t in tables], out[i]
+            )
+        return _round_half_even(out, 3).reshape(shape)
+
+    locations = np.arange(n_loc)
+    estimate, error, Q, last_error, std, lo, hi = (
+        np.full(n_loc, np.nan) for _ in range(7)
+    )
+    for t in range(n_steps):
+        reset = resets[:, t]
+        if reset.any():
+            sel = locations[reset]
+            m = months[sel, t]
+            normal = tables[0][sel, m]
+            s = np.maximum(tables[1][sel, m], 0.4)
+            p_lo, p_hi = tables[2][sel, m], tables[3][sel, m]
+            std[sel] = s
+            lo[sel] = np.where(np.isnan(p_lo), normal - 3.5 * s, p_lo)
+            hi[sel] = np.where(np.isnan(p_hi), normal + 3.5 * s, p_hi)
+            estimate[sel] = normal
+            error[sel] = s**2
+            Q[sel] = s**2 * 0.08
+            last_error[sel] = 0.0
+
+        z = obs[:, t]
+        valid = ~np.isnan(z)
+        if not valid.any():
+            continue
+        R = np.where(
+            (z < lo * 0.8) | (z > hi * 1.25),
+            R_base * 500,
+            np.where((z < lo) | (z > hi), R_base * 50, R_base),
+        )
+        current_error = np.abs(z - estimate)
+        grow = valid & (current_error > last_error * 1.5)
+        Q = np.where(grow, np.minimum(Q * 1.8, std**2 * 0.5), Q)
+        last_error = np.where(valid, current_error, last_error)
+        priori_err = error + Q
+        K = priori_err / (priori_err + R)
+        estimate = np.where(valid, estimate + K * (z - estimate), estimate)
+        error = np.where(valid, (1 - K) * priori_err, error)
+        out[valid, t] = estimate[valid]
+    return _round_half_even(out, 3).reshape(shape)
+
+
+def _adaptive_scan_row(
+    obs: np.ndarray,
+    months: np.ndarray,
+    resets: np.ndarray,
+    tables: List[np.ndarray],
+    out: np.ndarray,
+) -> None:
+    """Versão escalar de `adaptive_kalman_scan` para uma única série."""
+    normal_t, std_t, p01_t, p99_t = (t.tolist() for t in tables)
+    R_base = 0.55**2
+    estimate = error = Q = last_error = std = lo = hi = np.nan
+    for t, (z, m, reset) in enumerate(
+        zip(obs.tolist(), months.tolist(), resets.tolist())
+    ):
+        if reset:
+            normal = normal_t[m]
+            std = max(std_t[m], 0.4)
+            lo = p01_t[m] if p01_t[m] == p01_t[m] else normal - 3.5 * std
+            hi = p99_t[m] if p99_t[m] == p99_t[m] else normal + 3.5 * std
+            estimate, error = normal, std**2
+            Q, last_error = std**2 * 0.08, 0.0
+        if z != z:
+            continue
+        if z < lo * 0.8 or z > hi * 1.25:
+            R = R_base * 500
+        elif z < lo or z > hi:
+            R = R_base * 50
+        else:
+            R = R_base
+        current_error = abs(z - estimate)
+        if current_error > last_error * 1.5:
+            Q = min(Q * 1.8, std**2 * 0.5)
+        last_error = current_error
+        priori_err = error + Q
+        K = priori_err / (priori_err + R)
+        estimate = estimate + K * (z - estimate)
+        error = (1 - K) * priori_err
+        out[t] = estimate
+
+
+def simple_kalman_scan(
+    observations: np.ndarray,
+    estimate: float = 5.0,
+    error: float = 1.0,
+    Q: float = 0.05,
+    R: float = 0.8,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    SimpleKalmanFilter sobre arrays (fallback global).
+
+    Args:
+        observations: Observações, shape (T,) ou (L, T)
+        estimate, error: Estado inicial (escalar ou por localidade)
+        Q, R: Ruídos de processo e de medição
+
+    Returns:
+        Tuple (estimativas arredondadas a 3 casas, estimativa final,
+        erro final). NaN produz NaN e não altera o estado.
+    """
+    obs = np.asarray(observations, dtype=np.float64)
+    shape = obs.shape
+    obs = np.atleast_2d(obs)
+    out = np.full(obs.shape, np.nan)
+    estimate = np.broadcast_to(
+        np.asarray(estimate, dtype=np.float64), obs.shape[:1]
+    ).copy()
+    error = np.broadcast_to(
+        np.asarray(error, dtype=np.float64), obs.shape[:1]
+    ).copy()
+
+    for t in range(obs.shape[1]):
+        z = obs[:, t]
+        valid = ~np.isnan(z)
+        priori_err = error + Q
+        K = priori_err / (priori_err + R)
+        estimate = np.where(valid, estimate + K * (z - estimate), estimate)
+        error = np.where(valid, (1 - K) * priori_err, error)
+        out[valid, t] = estimate[valid]
+    return _round_half_even(out, 3).reshape(shape), estimate, error
+
+
+def _round_half_even(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    Arredonda como `round()` do Python, de forma vetorizada.
+
+    `np.round` só diverge de `round()` quando o valor escalado fica
+    a um ulp de x.5; esses poucos casos são refeitos com `round()`.
+    """
+    rounded = np.round(values, ndigits)
+    scaled = values * 10.0**ndigits
+    with np.errstate(invalid="ignore"):
+        tie = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6
+    if tie.any():
+        rounded[tie] = [round(v, ndigits) for v in values[tie].tolist()]
+    return rounded
+
+
 class HistoricalDataLoader:
+    """
+    Normais climáticas 1991-2020 das cidades de referência.
+
+    Na construção, indexa as cidades de `info_cities.csv` que têm
+    relatório em uma KD-tree sobre a esfera unitária (distância
+    haversine) e converte as normais mensais em uma tabela NumPy
+    compacta. Consultas não fazem I/O nem parse de JSON.
+    """
+
+    EARTH_RADIUS_KM = 6371.0088
+    CACHE_MAXSIZE = 4096
+
+    # Campo do relatório → (chave no ref, default, mínimo)
+    NORMAL_FIELDS = {
+        "eto_normals": ("normal", 5.0, None),
+        "eto_stds": ("daily_std", 1.0, 0.5),
+        "eto_p01": ("p01", 2.0, None),
+        "eto_p99": ("p99", 8.0, None),
+        "precip_normals": ("precip_normal", 100.0, None),
+        "precip_stds": ("precip_daily_std", 10.0, 5.0),
+        "precip_p01": ("precip_p01", 0.0, None),
+        "precip_p99": ("precip_p99", 450.0, None),
+    }
+
     def __init__(self):
         base_dir = Path(__file__).resolve().parent.parent.parent.parent
         self.historical_dir = base_dir / "data" / "historical" / "cities"
@@ -98,7 +383,10 @@ class HistoricalDataLoader:
             base_dir / "data" / "historical" / "info_cities.csv"
         )
         self.city_coords = self._load_city_coords()
-        self._cache: Dict[Tuple[float, float], Dict] = {}
+        self._cache: OrderedDict[Tuple[float, float], Optional[Dict]] = (
+            OrderedDict()
+        )
+        self._build_index()
 
     def _load_city_coords(self):
         if not self.city_coords_path.exists():
@@ -106,86 +394,153 @@ class HistoricalDataLoader:
         try:
             df = pd.read_csv(self.city_coords_path)
             return {
-                str(row["city"]): (float(row["lat"]), float(row["lon"]))
-                for _, row in df.iterrows()
+                str(city): (float(lat), float(lon))
+                for city, lat, lon in zip(df["city"], df["lat"], df["lon"])
             }
         except Exception as e:
             logger.error(f"Erro carregando coordenadas: {e}")
             return {}
 
+    def _build_index(self) -> None:
+        """Lê todos os relatórios uma vez e monta índice + tabelas."""
+        cities, coords, tables = [], [], []
+        for json_path in sorted(self.historical_dir.glob("report_*.json")):
+            city_key = json_path.stem.removeprefix("report_")
+            if city_key not in self.city_coords:
+                continue
+            try:
+                with open(json_path) as f:
+                    data = json.load(f)
+                monthly = data["climate_normals_all_periods"]["1991-2020"][
+                    "monthly"
+                ]
+            except Exception as e:
+                logger.error(f"Erro lendo {json_path}: {e}")
+                continue
+            cities.append(city_key)
+            coords.append(self.city_coords[city_key])
+            tables.append(self._parse_monthly(monthly))
+
+        self.cities: List[str] = cities
+        # (cidades, campos, 13 meses); NaN onde o mês não existe
+        self.normals = (
+            np.stack(tables)
+            if tables
+            else np.empty((0, len(self.NORMAL_FIELDS), 13))
+        )
+        self.normals.setflags(write=False)
+        self._tree = (
+            cKDTree(self._to_unit_vectors(np.array(coords)))
+            if coords
+            else None
+        )
+
+    def _parse_monthly(self, monthly: Dict) -> np.ndarray:
+        table = np.full((len(self.NORMAL_FIELDS), 13), np.nan)
+        for m, v in monthly.items():
+            for row, (key, default, minimum) in enumerate(
+                self.NORMAL_FIELDS.values()
+            ):
+                value = float(v.get(key, default))
+                table[row, int(m)] = (
+                    max(value, minimum) if minimum is not None else value
+                )
+        return table
+
+    @staticmethod
+    def _to_unit_vectors(coords: np.ndarray) -> np.ndarray:
+        lat, lon = np.radians(coords[:, 0]), np.radians(coords[:, 1])
+        return np.column_stack(
+            (
+                np.cos(lat) * np.cos(lon),
+                np.cos(lat) * np.sin(lon),
+                np.sin(lat),
+            )
+        )
+
+    def nearest_cities(
+        self,
+        lats: np.ndarray,
+        lons: np.ndarray,
+        max_dist_km: float = 200.0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cidade de referência mais próxima para N pontos de uma vez.
+
+        Returns:
+            Tuple (índice em `self.cities` ou -1, distância haversine km)
+        """
+        points = np.column_stack(
+            (np.atleast_1d(lats), np.atleast_1d(lons))
+        ).astype(np.float64)
+        if self._tree is None:
+            return np.full(len(points), -1), np.full(len(points), np.inf)
+
+        max_angle = min(max_dist_km / self.EARTH_RADIUS_KM, np.pi)
+        chord, idx = self._tree.query(
+            self._to_unit_vectors(points),
+            k=1,
+            distance_upper_bound=2 * np.sin(max_angle / 2) + 1e-12,
+        )
+        found = np.isfinite(chord)
+        dist_km = np.full(len(points), np.inf)
+        dist_km[found] = (
+            2
+            * self.EARTH_RADIUS_KM
+            * np.arcsin(np.minimum(chord[found] / 2, 1))
+        )
+        found &= dist_km <= max_dist_km
+        return np.where(found, idx, -1), dist_km
+
+    def _build_reference(self, city_idx: int, dist_km: float) -> Dict:
+        table = self.normals[city_idx]
+        months = np.flatnonzero(~np.isnan(table[0]))
+        ref = {"city": self.cities[city_idx], "distance_km": round(dist_km, 1)}
+        for row, name in enumerate(self.NORMAL_FIELDS):
+            ref[name] = {int(m): float(table[row, m]) for m in months}
+        return ref
+
     def get_reference_for_location(
         self, lat: float, lon: float, max_dist_km: float = 200.0
     ) -> Tuple[bool, Optional[Dict]]:
         key = (round(lat, 2), round(lon, 2))
         if key in self._cache:
-            return True, self._cache[key]
-
-        best_dist = float("inf")
-        best_path = None
-
-        for json_path in self.historical_dir.glob("report_*.json"):
-            city_key = json_path.stem.removeprefix("report_")
-            if city_key not in self.city_coords:
-                continue
-            c_lat, c_lon = self.city_coords[city_key]
-            dist = ((lat - c_lat) ** 2 + (lon - c_lon) ** 2) ** 0.5 * 111
-            if dist < best_dist and dist <= max_dist_km:
-                best_dist = dist
-                best_path = json_path
-
-        if not best_path:
-            self._cache[key] = None
-            return False, None
+            self._cache.move_to_end(key)
+            ref = self._cache[key]
+            return ref is not None, ref
+
+        idx, dist_km = self.nearest_cities(lat, lon, max_dist_km)
+        ref = (
+            self._build_reference(int(idx[0]), float(dist_km[0]))
+            if idx[0] >= 0
+            else None
+        )
 
-        try:
-            with open(best_path) as f:
-                data = json.load(f)
-        except Exception as e:
-            logger.error(f"Erro lendo {best_path}: {e}")
-            self._cache[key] = None
+        self._cache[key] = ref
+        if len(self._cache) > self.CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
+        if ref is None:
             return False, None
 
-        monthly = data["climate_normals_all_periods"]["1991-2020"]["monthly"]
-        ref = {
-            "city": city_key,
-            "distance_km": round(best_dist, 1),
-            "eto_normals": {
-                int(m): float(v.get("normal", 5.0)) for m, v in monthly.items()
-            },
-            "eto_stds": {
-                int(m): max(float(v.get("daily_std", 1.0)), 0.5)
-                for m, v in monthly.items()
-            },
-            "eto_p01": {
-                int(m): float(v.get("p01", 2.0)) for m, v in monthly.items()
-            },
-            "eto_p99": {
-                int(m): float(v.get("p99", 8.0)) for m, v in monthly.items()
-            },
-            "precip_normals": {
-                int(m): float(v.get("precip_normal", 100.0))
-                for m, v in monthly.items()
-            },
-            "precip_stds": {
-                int(m): max(float(v.get("precip_daily_std", 10.0)), 5.0)
-                for m, v in monthly.items()
-            },
-            "precip_p01": {
-                int(m): float(v.get("precip_p01", 0.0))
-                for m, v in monthly.items()
-            },
-            "precip_p99": {
-                int(m): float(v.get("precip_p99", 450.0))
-                for m, v in monthly.items()
-            },
-        }
-        self._cache[key] = ref
         logger.info(
-            f"Referência local encontrada: {ref['city']} ({best_dist:.1f} km)"
+            f"Referência local encontrada: {ref['city']} "
+            f"({ref['distance_km']:.1f} km)"
         )
         return True, ref
 
 
+@lru_cache(maxsize=1)
+def get_historical_loader() -> HistoricalDataLoader:
+    """
+    Loader compartilhado pelo processo.
+
+    Criado uma única vez; em workers prefork (Celery/Gunicorn) carregados
+    antes do fork, as tabelas NumPy somente-leitura são compartilhadas
+    entre os processos filhos por copy-on-write.
+    """
+    return HistoricalDataLoader()
+
+
 class ClimateKalmanEnsemble:
     """
     FUSÃO HÍBRIDA MUNDIAL — Dois modos automáticos:
@@ -227,7 +582,7 @@ class ClimateKalmanEnsemble:
     }
 
     def __init__(self):
-        self.loader = HistoricalDataLoader()
+        self.loader = get_historical_loader()
         self.kalman_precip = None
         self.kalman_eto = None
         self.current_month = None
@@ -325,20 +680,17 @@ class ClimateKalmanEnsemble:
     def _apply_precip_kalman(
         self, precip: pd.Series, dates: pd.Series, ref: dict
     ) -> pd.Series:
-        result = []
-        month = None
-        for p, date in zip(precip, dates):
-            m = pd.to_datetime(date).month
-            if month != m:
-                n = ref["precip_normals"].get(m, 100.0)
-                s = ref["precip_stds"].get(m, 10.0)
-                p01 = ref["precip_p01"].get(m)
-                p99 = ref["precip_p99"].get(m)
-                self.kalman_precip = AdaptiveKalmanFilter(n, s, p01, p99)
-                month = m
-            result.append(
-                self.kalman_precip.update(p) if pd.notna(p) else np.nan
-            )
+        months = pd.DatetimeIndex(pd.to_datetime(dates)).month.to_numpy()
+        tables = monthly_tables(ref, "precip")
+        result = adaptive_kalman_scan(
+            precip.to_numpy(dtype=np.float64),
+            months,
+            month_resets(months),
+            tables["normals"],
+            tables["stds"],
+            tables["p01"],
+            tables["p99"],
+        )
         return pd.Series(result, index=precip.index)
 
     def _apply_final_eto_kalman_high_precision(
@@ -346,23 +698,23 @@ class ClimateKalmanEnsemble:
     ) -> pd.DataFrame:
         df = df.copy()
         df["month"] = pd.to_datetime(df["date"]).dt.month
-        result = []
-        month = None
-        for _, row in df.iterrows():
-            m = row["month"]
-            et0 = row["et0_mm"]
-            if pd.isna(et0):
-                result.append(np.nan)
-                continue
-            if month != m:
-                n = ref["eto_normals"][m]
-                s = ref["eto_stds"][m]
-                p01 = ref["eto_p01"].get(m)
-                p99 = ref["eto_p99"].get(m)
-                self.kalman_eto = AdaptiveKalmanFilter(n, s, p01, p99)
-                month = m
-            result.append(self.kalman_eto.update(et0))
-        df["eto_final"] = np.round(result, 3)
+        et0 = df["et0_mm"].to_numpy(dtype=np.float64)
+        months = df["month"].to_numpy()
+        valid = ~np.isnan(et0)
+        for m in pd.unique(months[valid]):
+            if m not in ref["eto_normals"] or m not in ref["eto_stds"]:
+                raise KeyError(m)
+
+        tables = monthly_tables(ref, "eto")
+        df["eto_final"] = adaptive_kalman_scan(
+            et0,
+            months,
+            month_resets(months, valid),
+            tables["normals"],
+            tables["stds"],
+            tables["p01"],
+            tables["p99"],
+        )
         df["anomaly_eto_mm"] = df["eto_final"] - df["month"].map(
             ref["eto_normals"].get
         )
@@ -372,11 +724,18 @@ class ClimateKalmanEnsemble:
         self, df: pd.DataFrame, lat: float
     ) -> pd.DataFrame:
         df = df.copy()
-        if self.kalman_eto is None:
+        if not isinstance(self.kalman_eto, SimpleKalmanFilter):
             self.kalman_eto = SimpleKalmanFilter(initial_value=5.0)
-        df["eto_final"] = df["et0_mm"].apply(
-            lambda x: self.kalman_eto.update(x) if pd.notna(x) else np.nan
+        kf = self.kalman_eto
+        eto_final, estimate, error = simple_kalman_scan(
+            df["et0_mm"].to_numpy(dtype=np.float64),
+            estimate=kf.estimate,
+            error=kf.error,
+            Q=kf.Q,
+            R=kf.R,
         )
+        kf.estimate, kf.error = float(estimate[0]), float(error[0])
+        df["eto_final"] = eto_final
         df["anomaly_eto_mm"] = np.nan
         df["fusion_mode"] = "global_fallback"
         return df
@@ -16,6 +16,7 @@ Benefícios:
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
@@ -84,25 +85,30 @@ def calculate_eto(
             f"Solar={elevation_factors['solar_factor']:.4f}"
         )
 
-        # Processar cada linha
-        et0_results = []
-        for idx, row in weather_df.iterrows():
-            measurements = row.to_dict()
-            measurements["latitude"] = latitude
-            measurements["longitude"] = 0  # Padrão para compatibilidade
-            measurements["date"] = (
+        # Calcular todas as linhas em uma única passada vetorizada
+        if isinstance(weather_df.index, pd.DatetimeIndex):
+            dates = weather_df.index.strftime("%Y-%m-%d")
+        else:
+            dates = [
                 str(idx.date()) if hasattr(idx, "date") else str(idx)
-            )
-            measurements["elevation_m"] = elevation
-
-            # ✅ PASSAR elevation_factors PRÉ-CALCULADOS
-            result = service.calculate_et0(
-                measurements,
-                elevation_factors=elevation_factors,  # ← CORREÇÃO AQUI
-            )
-            et0_results.append(result["et0_mm_day"])
+                for idx in weather_df.index
+            ]
+        columns = {col: weather_df[col].to_numpy() for col in weather_df}
+        columns.update(
+            {
+                "latitude": latitude,
+                "longitude": 0,  # Padrão para compatibilidade
+                "date": np.asarray(dates),
+                "elevation_m": elevation,
+            }
+        )
 
-        weather_df["ETo"] = et0_results
+        # ✅ PASSAR elevation_factors PRÉ-CALCULADOS
+        result = service.calculate_et0_batch(
+            columns,
+            elevation_factors=elevation_factors,  # ← CORREÇÃO AQUI
+        )
+        weather_df["ETo"] = result["et0_mm_day"]
 
         result_columns = [
             "T2M_MAX",
@@ -12,9 +12,10 @@ Benefícios:
 - Manutenibilidade: Responsabilidades claras e bem-definidas
 """
 
+import asyncio
 import math
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -23,10 +24,18 @@ from loguru import logger
 from backend.core.data_processing.kalman_ensemble import ClimateKalmanEnsemble
 from backend.api.services.opentopo import OpenTopoClient
 from backend.api.services.weather_utils import (
+    PROMETHEUS_AVAILABLE,
+    VALIDATION_ERRORS,
     ElevationUtils,
     WeatherValidationUtils,
 )
 from backend.api.services.geographic_utils import GeographicUtils
+from backend.core.utils.stage_timer import (
+    collect_timings,
+    profile_if_slow,
+    stage,
+    timed,
+)
 
 
 class EToCalculationService:
@@ -54,6 +63,20 @@ class EToCalculationService:
         "lng_min": -50.0,
         "lng_max": -41.5,
     }
+    # Variáveis obrigatórias em cada medição
+    REQUIRED_VARS = [
+        "T2M_MAX",
+        "T2M_MIN",
+        "T2M_MEAN",
+        "RH2M",
+        "WS2M",
+        "PRECTOTCORR",
+        "ALLSKY_SFC_SW_DWN",
+        "latitude",
+        "longitude",
+        "date",
+        "elevation_m",
+    ]
 
     def __init__(self):
         """Inicializa o serviço de cálculo ETo."""
@@ -72,22 +95,8 @@ class EToCalculationService:
         Raises:
             ValueError: Se alguma variável obrigatória está ausente
         """
-        required_vars = [
-            "T2M_MAX",
-            "T2M_MIN",
-            "T2M_MEAN",
-            "RH2M",
-            "WS2M",
-            "PRECTOTCORR",
-            "ALLSKY_SFC_SW_DWN",
-            "latitude",
-            "longitude",
-            "date",
-            "elevation_m",
-        ]
-
         missing_vars = [
-            var for var in required_vars if var not in measurements
+            var for var in self.REQUIRED_VARS if var not in measurements
         ]
 
         if missing_vars:
@@ -283,6 +292,321 @@ class EToCalculationService:
                 "error": str(e),
             }
 
+    def calculate_et0_batch(
+        self,
+        measurements: Union[pd.DataFrame, Dict[str, Any]],
+        method: str = "pm",
+        elevation_factors: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Calcula ET0 FAO-56 para N dias de uma vez (versão colunar).
+
+        Equivalente a chamar `calculate_et0` linha a linha, mas operando
+        sobre arrays NumPy em uma única passada. Validação, mensagens de
+        erro e classificação de qualidade seguem exatamente o caminho
+        escalar: uma linha que falharia em `calculate_et0` recebe
+        et0=0, quality='low' e a mesma mensagem em `errors`.
+
+        Args:
+            measurements: DataFrame ou dict de arrays com as mesmas
+                variáveis de `calculate_et0`. Valores escalares (ex.:
+                latitude, elevation_m) são replicados para todas as
+                linhas. 'date' aceita strings YYYY-MM-DD ou datetime64.
+            method: Método de cálculo ('pm' para Penman-Monteith)
+            elevation_factors: Fatores pré-calculados (pressure, gamma)
+
+        Returns:
+            Dict com arrays de tamanho N:
+            {
+                'et0_mm_day': np.ndarray,   # ET0 diária (mm/dia)
+                'quality': np.ndarray,      # 'high' ou 'low'
+                'method': str,
+                'components': {             # NaN nas linhas com erro
+                    'Ra', 'Rn', 'slope', 'gamma', 'Vpd': np.ndarray
+                },
+                'errors': np.ndarray        # None ou mensagem de erro
+            }
+        """
+        columns, n = self._as_columns(measurements)
+        errors = np.full(n, None, dtype=object)
+        nan_array = np.full(n, np.nan)
+
+        missing_vars = [
+            var for var in self.REQUIRED_VARS if var not in columns
+        ]
+        if missing_vars:
+            errors[:] = (
+                f"Variáveis obrigatórias ausentes: {', '.join(missing_vars)}"
+            )
+            return self._batch_result(
+                np.zeros(n), errors, method, {}, nan_array
+            )
+
+        def column(name: str) -> np.ndarray:
+            return np.broadcast_to(
+                np.asarray(columns[name], dtype=np.float64), (n,)
+            )
+
+        def flag(mask: np.ndarray, message) -> None:
+            # Primeira falha vence, como no `raise` do caminho escalar
+            for i in np.flatnonzero(mask & (errors == None)):  # noqa: E711
+                errors[i] = message(i)
+
+        T_max = column("T2M_MAX")
+        T_min = column("T2M_MIN")
+        T_mean = column("T2M_MEAN")
+        RH_mean = column("RH2M")
+        u2 = column("WS2M")
+        Rs = column("ALLSKY_SFC_SW_DWN")
+        z = column("elevation_m")
+        lat = column("latitude")
+        lon = column("longitude")
+
+        # 1. Validação (mesma ordem de _validate_measurements)
+        lon_min, lat_min, lon_max, lat_max = GeographicUtils.GLOBAL_BBOX
+        limits = WeatherValidationUtils.get_validation_limits(region="global")
+        temp_lo, temp_hi = limits["temperature"]
+        hum_lo, hum_hi = limits["humidity"]
+        wind_lo, wind_hi = limits["wind"]
+
+        flag(
+            ~(
+                (lon_min <= lon)
+                & (lon <= lon_max)
+                & (lat_min <= lat)
+                & (lat <= lat_max)
+            ),
+            lambda i: (
+                f"Coordenadas inválidas: lat={lat[i].item()}, "
+                f"lon={lon[i].item()}"
+            ),
+        )
+        flag(
+            (z < -500) | (z > 9000),
+            lambda i: (
+                f"Elevação {z[i].item()}m fora do range válido "
+                f"(-500 a 9000m)"
+            ),
+        )
+        temp_errors_before = np.count_nonzero(errors != None)  # noqa: E711
+        flag(
+            ~((temp_lo <= T_max) & (T_max <= temp_hi)),
+            lambda i: f"T2M_MAX inválida: {T_max[i].item()}°C",
+        )
+        flag(
+            ~((temp_lo <= T_min) & (T_min <= temp_hi)),
+            lambda i: f"T2M_MIN inválida: {T_min[i].item()}°C",
+        )
+        temp_errors = (
+            np.count_nonzero(errors != None) - temp_errors_before  # noqa: E711
+        )
+        if temp_errors and PROMETHEUS_AVAILABLE:
+            VALIDATION_ERRORS.labels(
+                region="global", variable="temperature"
+            ).inc(temp_errors)
+        flag(
+            ~((hum_lo <= RH_mean) & (RH_mean <= hum_hi)),
+            lambda i: f"Umidade relativa inválida: {RH_mean[i].item()}%",
+        )
+        flag(
+            ~((wind_lo <= u2) & (u2 <= wind_hi)),
+            lambda i: f"Velocidade do vento inválida: {u2[i].item()} m/s",
+        )
+        flag(
+            T_max < T_min,
+            lambda i: (
+                f"T2M_MAX ({T_max[i].item()}°C) < "
+                f"T2M_MIN ({T_min[i].item()}°C)"
+            ),
+        )
+
+        with np.errstate(all="ignore"):
+            # 2. Pressão e constante psicrométrica (FAO-56 Eq. 7 e 8)
+            if elevation_factors:
+                P = elevation_factors.get("pressure", 101.3)
+                gamma = np.broadcast_to(
+                    np.asarray(
+                        elevation_factors.get("gamma", 0.665e-3 * P),
+                        dtype=np.float64,
+                    ),
+                    (n,),
+                )
+            else:
+                P = 101.3 * ((293.0 - 0.0065 * z) / 293.0) ** 5.26
+                gamma = 0.000665 * P
+
+            # 3. Pressões de vapor (FAO-56 Eq. 11, 12, 19)
+            es_T_max = 0.6108 * np.exp((17.27 * T_max) / (T_max + 237.3))
+            es_T_min = 0.6108 * np.exp((17.27 * T_min) / (T_min + 237.3))
+            es = (es_T_max + es_T_min) / 2
+            ea = (RH_mean / 100.0) * es
+            Vpd = es - ea
+
+            # 4. Dia do ano, declinação e Ra (FAO-56 Eq. 21, 23, 24, 25)
+            dates = np.broadcast_to(np.asarray(columns["date"]), (n,))
+            N, bad_dates = self._day_of_year_batch(dates)
+            flag(
+                bad_dates,
+                lambda i: self._scalar_error(self._day_of_year, str(dates[i])),
+            )
+            b = 2 * np.pi * (N - 1) / 365.0
+            delta = 0.409 * np.sin(b - 1.39)
+            phi = np.radians(lat)
+            dr = 1 + 0.033 * np.cos(2 * np.pi * N / 365.0)
+            ws_arg = -np.tan(phi) * np.tan(delta)
+            flag(np.abs(ws_arg) > 1, lambda i: "math domain error")
+            omega_s = np.arccos(ws_arg)
+            Ra = (
+                (24 * 60 / np.pi)
+                * 0.0820
+                * dr
+                * (
+                    omega_s * np.sin(phi) * np.sin(delta)
+                    + np.cos(phi) * np.cos(delta) * np.sin(omega_s)
+                )
+            )
+            Ra = np.where(Ra < 0, 0.0, Ra)
+
+            # 5. Radiação net (mesma simplificação do caminho escalar)
+            Rn = (1 - self.ALBEDO) * Rs - 0.23 * Rs
+            G = 0
+
+            # 6. Declividade da curva de vapor (FAO-56 Eq. 13)
+            flag(
+                (T_mean + 237.3 == 0) | (T_mean + 273 == 0),
+                lambda i: "float division by zero",
+            )
+            exp_slope = np.exp((17.27 * T_mean) / (T_mean + 237.3))
+            flag(np.isinf(exp_slope), lambda i: "math range error")
+            slope = (4098 * 0.6108 * exp_slope) / ((T_mean + 237.3) ** 2)
+
+            # 7. Penman-Monteith (FAO-56 Eq. 6)
+            Cn = 900
+            Cd = 0.34
+            numerator = (
+                0.408 * slope * (Rn - G)
+                + gamma * (Cn / (T_mean + 273)) * u2 * Vpd
+            )
+            denominator = slope + gamma * (1 + Cd * u2)
+            ET0 = np.where(denominator == 0, np.nan, numerator / denominator)
+
+        failed = errors != None  # noqa: E711
+        if failed.any():
+            first = int(np.flatnonzero(failed)[0])
+            self.logger.error(
+                f"Erro no cálculo de ETo em {int(failed.sum())}/{n} "
+                f"linhas (primeira: {errors[first]})"
+            )
+
+        components = {
+            "Ra": self._round_array(np.where(failed, np.nan, Ra), 2),
+            "Rn": self._round_array(np.where(failed, np.nan, Rn), 2),
+            "slope": self._round_array(np.where(failed, np.nan, slope), 4),
+            "gamma": self._round_array(np.where(failed, np.nan, gamma), 4),
+            "Vpd": self._round_array(np.where(failed, np.nan, Vpd), 2),
+        }
+        return self._batch_result(ET0, errors, method, components, nan_array)
+
+    @staticmethod
+    def _as_columns(
+        measurements: Union[pd.DataFrame, Dict[str, Any]],
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Normaliza a entrada do cálculo em lote para dict de colunas.
+
+        Returns:
+            Tuple (dict de colunas, número de linhas)
+        """
+        if isinstance(measurements, pd.DataFrame):
+            columns = {
+                col: measurements[col].to_numpy()
+                for col in measurements.columns
+            }
+            return columns, len(measurements)
+
+        sizes = {
+            len(value) for value in measurements.values() if np.ndim(value) > 0
+        }
+        if len(sizes) > 1:
+            raise ValueError(
+                f"Colunas com tamanhos diferentes: {sorted(sizes)}"
+            )
+        return dict(measurements), sizes.pop() if sizes else 1
+
+    @staticmethod
+    def _day_of_year_batch(dates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Dia do ano vetorizado.
+
+        Strings seguem o mesmo formato estrito de `_day_of_year`
+        (YYYY-MM-DD); datas inválidas retornam NaN e são sinalizadas.
+
+        Returns:
+            Tuple (dia do ano como float, máscara de datas inválidas)
+        """
+        values = pd.Series(dates)
+        if not pd.api.types.is_datetime64_any_dtype(values):
+            values = pd.to_datetime(
+                values.astype(str), format="%Y-%m-%d", errors="coerce"
+            )
+        invalid = values.isna().to_numpy()
+        day_of_year = values.dt.dayofyear.to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        return day_of_year, invalid
+
+    @staticmethod
+    def _scalar_error(func, *args) -> str:
+        """Reproduz a mensagem de erro do caminho escalar."""
+        try:
+            func(*args)
+        except Exception as e:
+            return str(e)
+        return "Erro no cálculo de ETo"
+
+    @staticmethod
+    def _round_array(values: np.ndarray, ndigits: int) -> np.ndarray:
+        """
+        Arredonda como `round()` do Python, elemento a elemento.
+
+        `np.round` escala por 10**ndigits e pode divergir do
+        arredondamento do caminho escalar em valores limítrofes.
+        """
+        return np.fromiter(
+            (round(v, ndigits) for v in values.tolist()),
+            dtype=np.float64,
+            count=len(values),
+        )
+
+    def _batch_result(
+        self,
+        ET0: np.ndarray,
+        errors: np.ndarray,
+        method: str,
+        components: Dict[str, np.ndarray],
+        nan_array: np.ndarray,
+    ) -> Dict[str, Any]:
+        """Monta o resultado do lote com a regra de qualidade escalar."""
+        failed = errors != None  # noqa: E711
+        ET0 = np.where(failed, 0.0, ET0)
+        is_nan = np.isnan(ET0)
+        low = is_nan | (ET0 < 0) | (ET0 > 15) | failed
+        ET0 = np.where(is_nan | (ET0 < 0), 0.0, ET0)
+
+        if not components:
+            components = {
+                name: nan_array.copy()
+                for name in ("Ra", "Rn", "slope", "gamma", "Vpd")
+            }
+
+        return {
+            "et0_mm_day": self._round_array(ET0, 2),
+            "quality": np.where(low, "low", "high").astype(object),
+            "method": method,
+            "components": components,
+            "errors": errors,
+        }
+
     def _saturation_vapor_pressure(self, T: float) -> float:
         """
         Pressão de saturação de vapor (FAO-56 Eq. 11).
@@ -413,6 +737,9 @@ class EToCalculationService:
 
 
 class EToProcessingService:
+    # Locais baixados/fundidos ao mesmo tempo em process_locations
+    BATCH_CONCURRENCY = 8
+
     def __init__(self):
         self.et0_calc = EToCalculationService()
         self.kalman = ClimateKalmanEnsemble()
@@ -427,107 +754,268 @@ class EToProcessingService:
         sources: List[str],
         elevation: Optional[float] = None,
         use_precise_elevation: bool = True,
+        include_timings: bool = False,
     ) -> Dict[str, Any]:
+        """
+        Pipeline completo de um local.
+
+        Com include_timings=True, o resultado ganha o bloco "timings"
+        (segundos por etapa; ver backend.core.utils.stage_timer).
+        """
+        with profile_if_slow("process_location"), collect_timings() as timings:
+            result = await self._process_location(
+                latitude,
+                longitude,
+                start_date,
+                end_date,
+                sources,
+                elevation,
+                use_precise_elevation,
+            )
+        if include_timings:
+            result["timings"] = timings.as_dict()
+        return result
+
+    async def _process_location(
+        self,
+        latitude: float,
+        longitude: float,
+        start_date: str,
+        end_date: str,
+        sources: List[str],
+        elevation: Optional[float],
+        use_precise_elevation: bool,
+    ) -> Dict[str, Any]:
+        warnings: List[str] = []
         try:
             # 1. Elevação precisa
-            final_elevation, elev_info = await self._get_best_elevation(
-                latitude, longitude, elevation, use_precise_elevation
-            )
-            elevation_factors = ElevationUtils.get_elevation_correction_factor(
-                final_elevation
+            with stage("elevation"):
+                final_elevation, elev_info = await self._get_best_elevation(
+                    latitude, longitude, elevation, use_precise_elevation
+                )
+
+            # 2-4. Download, pré-processamento e fusão
+            fused_df = await self._download_and_fuse(
+                latitude, longitude, start_date, end_date, sources, warnings
             )
 
-            # 2. Download de múltiplas fontes
-            from backend.api.services.data_download import (
-                download_weather_data,
+            # 5. Garantir cálculo ETo bruto se ainda não tiver
+            if "et0_mm" not in fused_df.columns:
+                fused_df = self._calculate_raw_eto(
+                    fused_df,
+                    latitude,
+                    final_elevation,
+                    ElevationUtils.get_elevation_correction_factor(
+                        final_elevation
+                    ),
+                )
+
+            with stage("build_result"):
+                return self._build_result(
+                    fused_df,
+                    latitude,
+                    longitude,
+                    start_date,
+                    end_date,
+                    sources,
+                    elev_info,
+                    warnings,
+                )
+
+        except Exception as e:
+            logger.error(f"Erro fatal: {e}")
+            return {"error": str(e), "warnings": warnings}
+
+    async def process_locations(
+        self,
+        locations: List[Dict[str, Any]],
+        start_date: str,
+        end_date: str,
+        sources: List[str],
+        use_precise_elevation: bool = True,
+        concurrency: int = BATCH_CONCURRENCY,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Versão em lote de process_location (mesmo período e fontes).
+
+        - Elevação: uma requisição OpenTopo para até 100 pontos
+        - Download + fusão: até `concurrency` locais ao mesmo tempo
+        - ETo FAO-56: uma única chamada de calculate_et0_batch sobre as
+          linhas de todos os locais
+
+        Args:
+            locations: Dicts com "lat", "lon" e, opcional, "elevation"
+            on_progress: Chamado com o nº de locais já baixados
+
+        Returns:
+            Um resultado por local, na ordem de `locations` e no mesmo
+            formato de process_location (falhas viram {"error": ...})
+        """
+        with stage("elevation"):
+            elevations = await self._get_best_elevations(
+                locations, use_precise_elevation
+            )
+        semaphore = asyncio.Semaphore(concurrency)
+        done = 0
+
+        async def fetch(location):
+            nonlocal done
+            warnings: List[str] = []
+            async with semaphore:
+                try:
+                    fused = await self._download_and_fuse(
+                        location["lat"],
+                        location["lon"],
+                        start_date,
+                        end_date,
+                        sources,
+                        warnings,
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Erro em ({location['lat']}, {location['lon']}): {e}"
+                    )
+                    fused = e
+            done += 1
+            if on_progress is not None:
+                on_progress(done)
+            return fused, warnings
+
+        fetched = await asyncio.gather(*(fetch(loc) for loc in locations))
+
+        pending = [
+            i
+            for i, (fused, _) in enumerate(fetched)
+            if isinstance(fused, pd.DataFrame)
+            and "et0_mm" not in fused.columns
+        ]
+        if pending:
+            self._calculate_raw_eto_batch(
+                [fetched[i][0] for i in pending],
+                [locations[i]["lat"] for i in pending],
+                [elevations[i][0] for i in pending],
             )
 
-            multi_source_df, warnings = await download_weather_data(
+        results = []
+        for location, (_, elev_info), (fused, warnings) in zip(
+            locations, elevations, fetched
+        ):
+            if isinstance(fused, Exception):
+                results.append({"error": str(fused), "warnings": warnings})
+                continue
+            try:
+                results.append(
+                    self._build_result(
+                        fused,
+                        location["lat"],
+                        location["lon"],
+                        start_date,
+                        end_date,
+                        sources,
+                        elev_info,
+                        warnings,
+                    )
+                )
+            except Exception as e:
+                logger.error(f"Erro fatal: {e}")
+                results.append({"error": str(e), "warnings": warnings})
+        return results
+
+    async def _download_and_fuse(
+        self,
+        latitude: float,
+        longitude: float,
+        start_date: str,
+        end_date: str,
+        sources: List[str],
+        warnings: List[str],
+    ) -> pd.DataFrame:
+        """Download multi-fonte, limpeza e fusão Kalman de um local."""
+        # 2. Download de múltiplas fontes
+        from backend.api.services.data_download import (
+            download_weather_data,
+        )
+
+        with stage("download"):
+            multi_source_df, download_warnings = await download_weather_data(
                 data_source=sources,
                 data_inicial=start_date,
                 data_final=end_date,
                 latitude=latitude,
                 longitude=longitude,
             )
+        warnings.extend(download_warnings)
 
-            if multi_source_df.empty:
-                raise ValueError("Nenhuma fonte retornou dados válidos")
+        if multi_source_df.empty:
+            raise ValueError("Nenhuma fonte retornou dados válidos")
 
-            # 3. Pré-processamento (limpeza, harmonização)
-            from backend.core.data_processing.data_preprocessing import (
-                preprocessing,
-            )
+        # 3. Pré-processamento (limpeza, harmonização)
+        from backend.core.data_processing.data_preprocessing import (
+            preprocessing,
+        )
 
+        with stage("preprocessing"):
             df_clean, prep_warnings = preprocessing(multi_source_df, latitude)
-            warnings.extend(prep_warnings)
+        warnings.extend(prep_warnings)
 
-            # 4. FUSÃO INTELIGENTE MULTI-SOURCE (NOVA FUNÇÃO DO KALMAN)
-            logger.info(
-                f"Fusão Kalman com {len(sources)} fontes + normais locais"
-            )
-            # auto_fuse_multi_source
-            fused_df = self.kalman.auto_fuse_multi_source(
+        # 4. FUSÃO INTELIGENTE MULTI-SOURCE (NOVA FUNÇÃO DO KALMAN)
+        logger.info(f"Fusão Kalman com {len(sources)} fontes + normais locais")
+        with stage("fusion"):
+            return self.kalman.auto_fuse_multi_source(
                 df_multi_source=df_clean, lat=latitude, lon=longitude
             )
 
-            # 5. Garantir cálculo ETo bruto se ainda não tiver
-            if "et0_mm" not in fused_df.columns:
-                fused_df = self._calculate_raw_eto(
-                    fused_df, latitude, final_elevation, elevation_factors
-                )
-
-            # 6. Kalman já aplicou eto_final → usar!
-            if "eto_final" not in fused_df.columns:
-                fused_df["eto_final"] = fused_df["et0_mm"]
-
-            # 7. Preparar resposta final
-            fused_df["date"] = pd.to_datetime(fused_df["date"]).dt.strftime(
-                "%Y-%m-%d"
-            )
-            result_series = fused_df[
-                ["date", "eto_final", "PRECTOTCORR"]
-            ].round(3)
-            result_series = result_series.rename(
-                columns={"eto_final": "et0_mm_day"}
-            )
+    def _build_result(
+        self,
+        fused_df: pd.DataFrame,
+        latitude: float,
+        longitude: float,
+        start_date: str,
+        end_date: str,
+        sources: List[str],
+        elev_info: Dict[str, Any],
+        warnings: List[str],
+    ) -> Dict[str, Any]:
+        # 6. Kalman já aplicou eto_final → usar!
+        if "eto_final" not in fused_df.columns:
+            fused_df["eto_final"] = fused_df["et0_mm"]
 
-            # 8. Detectar modo de fusão
-            mode = fused_df["fusion_mode"].iloc[0]
-            if mode == "high_precision":
-                mode_text = "Alta precisão (normais locais 1991-2020)"
-                city = fused_df.get("reference_city", ["Desconhecida"])[0]
-                dist = round(fused_df.get("reference_distance_km", [0])[0], 1)
-                mode_text += f" — Ref: {city} ({dist} km)"
-            else:
-                mode_text = (
-                    "Cobertura mundial (fusão robusta de múltiplas fontes)"
-                )
+        # 7. Preparar resposta final
+        fused_df["date"] = pd.to_datetime(fused_df["date"]).dt.strftime(
+            "%Y-%m-%d"
+        )
+        result_series = fused_df[["date", "eto_final", "PRECTOTCORR"]].round(3)
+        result_series = result_series.rename(
+            columns={"eto_final": "et0_mm_day"}
+        )
 
-            return {
-                "location": {
-                    "lat": round(latitude, 4),
-                    "lon": round(longitude, 4),
-                },
-                "elevation": elev_info,
-                "period": {"start": start_date, "end": end_date},
-                "sources_used": sources,
-                "fusion_mode": mode,
-                "fusion_description": mode_text,
-                "et0_series": result_series.to_dict(orient="records"),
-                "summary": self._summarize(result_series),
-                "recommendations": self._generate_recommendations(
-                    result_series
-                ),
-                "warnings": warnings,
-                "message": f"ETo calculado com {len(sources)} fontes. {mode_text}",
-            }
+        # 8. Detectar modo de fusão
+        mode = fused_df["fusion_mode"].iloc[0]
+        if mode == "high_precision":
+            mode_text = "Alta precisão (normais locais 1991-2020)"
+            city = fused_df.get("reference_city", ["Desconhecida"])[0]
+            dist = round(fused_df.get("reference_distance_km", [0])[0], 1)
+            mode_text += f" — Ref: {city} ({dist} km)"
+        else:
+            mode_text = "Cobertura mundial (fusão robusta de múltiplas fontes)"
 
-        except Exception as e:
-            logger.error(f"Erro fatal: {e}")
-            return {
-                "error": str(e),
-                "warnings": warnings if "warnings" in locals() else [],
-            }
+        return {
+            "location": {
+                "lat": round(latitude, 4),
+                "lon": round(longitude, 4),
+            },
+            "elevation": elev_info,
+            "period": {"start": start_date, "end": end_date},
+            "sources_used": sources,
+            "fusion_mode": mode,
+            "fusion_description": mode_text,
+            "et0_series": result_series.to_dict(orient="records"),
+            "summary": self._summarize(result_series),
+            "recommendations": self._generate_recommendations(result_series),
+            "warnings": warnings,
+            "message": f"ETo calculado com {len(sources)} fontes. {mode_text}",
+        }
 
     async def _get_best_elevation(self, lat, lon, user_elev, use_precise):
         if user_elev is not None:
@@ -548,33 +1036,142 @@ class EToProcessingService:
 
         return 0.0, {"value": 0.0, "source": "padrão (nível do mar)"}
 
-    def _calculate_raw_eto(self, df, lat, elevation, factors):
-        df["elevation_m"] = elevation
-        et0_values = []
-        for _, row in df.iterrows():
-            measurements = row.to_dict()
-            measurements.update(
-                {
-                    "latitude": lat,
-                    "longitude": (
-                        df.get("longitude", 0).iloc[0]
-                        if "longitude" in df.columns
-                        else 0
-                    ),
-                    "date": (
-                        str(row.name)[:10]
-                        if isinstance(row.name, pd.Timestamp)
-                        else str(row.get("date", ""))[:10]
-                    ),
-                    "elevation_m": elevation,
+    async def _get_best_elevations(
+        self, locations: List[Dict[str, Any]], use_precise: bool
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        _get_best_elevation para N locais com uma requisição em lote.
+
+        O lote da OpenTopo omite pontos sem dado; se faltar algum, os
+        pontos voltam para a consulta individual.
+        """
+        missing = [
+            i
+            for i, loc in enumerate(locations)
+            if loc.get("elevation") is None
+        ]
+        found: Dict[int, float] = {}
+        batch_complete = False
+        if use_precise and missing:
+            try:
+                client = OpenTopoClient()
+                try:
+                    batch = await client.get_elevations_batch(
+                        [
+                            (locations[i]["lat"], locations[i]["lon"])
+                            for i in missing
+                        ]
+                    )
+                finally:
+                    await client.close()
+                batch_complete = len(batch) == len(missing)
+                if batch_complete:
+                    found = {
+                        i: point.elevation
+                        for i, point in zip(missing, batch)
+                        if point.elevation
+                    }
+            except Exception as e:
+                logger.warning(f"Elevação em lote falhou: {e}")
+
+        semaphore = asyncio.Semaphore(self.BATCH_CONCURRENCY)
+
+        async def best(i: int, location: Dict[str, Any]):
+            if i in found:
+                return found[i], {
+                    "value": found[i],
+                    "source": "OpenTopo (~1m)",
                 }
+            # Com lote completo, ausência = sem dado: não consultar de novo
+            async with semaphore:
+                return await self._get_best_elevation(
+                    location["lat"],
+                    location["lon"],
+                    location.get("elevation"),
+                    use_precise and not batch_complete,
+                )
+
+        return list(
+            await asyncio.gather(
+                *(best(i, loc) for i, loc in enumerate(locations))
             )
-            result = self.et0_calc.calculate_et0(
-                measurements, elevation_factors=factors
+        )
+
+    def _calculate_raw_eto(self, df, lat, elevation, factors):
+        return self._calculate_raw_eto_batch(
+            [df], [lat], [elevation], [factors]
+        )[0]
+
+    @timed("fao56")
+    def _calculate_raw_eto_batch(
+        self,
+        frames: List[pd.DataFrame],
+        lats: List[float],
+        elevations: List[float],
+        factors: Optional[List[Dict[str, float]]] = None,
+    ) -> List[pd.DataFrame]:
+        """
+        ETo bruto (coluna et0_mm) de vários locais em uma passada.
+
+        As linhas de todos os DataFrames vão juntas para
+        calculate_et0_batch; latitude, elevação e fatores FAO-56 de
+        cada local são repetidos nas suas linhas.
+        """
+        if factors is None:
+            factors = [
+                ElevationUtils.get_elevation_correction_factor(elevation)
+                for elevation in elevations
+            ]
+        sizes = [len(df) for df in frames]
+
+        def per_row(values) -> np.ndarray:
+            return np.repeat(np.asarray(values, dtype=np.float64), sizes)
+
+        dates = []
+        longitudes = []
+        for df, elevation in zip(frames, elevations):
+            df["elevation_m"] = elevation
+            if isinstance(df.index, pd.DatetimeIndex):
+                dates.append(np.asarray(df.index.astype(str).str[:10]))
+            elif "date" in df.columns:
+                dates.append(df["date"].astype(str).str[:10].to_numpy())
+            else:
+                dates.append(np.full(len(df), ""))
+            longitudes.append(
+                df["longitude"].iloc[0] if "longitude" in df.columns else 0
             )
-            et0_values.append(result["et0_mm_day"])
-        df["et0_mm"] = et0_values
-        return df
+
+        combined = pd.concat(frames, ignore_index=True)
+        columns = {col: combined[col].to_numpy() for col in combined.columns}
+        columns.update(
+            {
+                "latitude": per_row(lats),
+                "longitude": per_row(longitudes),
+                "date": np.concatenate(dates),
+                "elevation_m": per_row(elevations),
+            }
+        )
+        elevation_factors = None
+        if all(factors):
+            elevation_factors = {
+                "pressure": per_row(
+                    [f.get("pressure", 101.3) for f in factors]
+                ),
+                "gamma": per_row(
+                    [
+                        f.get("gamma", 0.665e-3 * f.get("pressure", 101.3))
+                        for f in factors
+                    ]
+                ),
+            }
+        result = self.et0_calc.calculate_et0_batch(
+            columns, elevation_factors=elevation_factors
+        )
+
+        offsets = np.cumsum([0] + sizes)
+        for df, start, stop in zip(frames, offsets[:-1], offsets[1:]):
+            df["et0_mm"] = result["et0_mm_day"][start:stop]
+        return frames
 
     def _summarize(self, series_df):
         values = series_df["et0_mm_day"]
@@ -0,0 +1,280 @@
+"""
+Tempo por etapa do pipeline ETo (elevação, download por fonte,
+pré-processamento, fusão Kalman, FAO-56).
+
+Cada etapa é um span: context manager `stage(...)` ou decorator
+`timed(...)`, com custo de um perf_counter e uma observação de
+histograma. O span ativo fica num ContextVar, então código mais
+abaixo (ex.: o cache climático) pode marcar HIT/MISS sem receber o
+span como argumento (`mark_cache`).
+
+- Prometheus: eto_stage_duration_seconds{stage, source, cache}
+- Bloco `timings` do resultado: dentro de `collect_timings()`, os
+  spans da execução (inclusive de tasks filhas do gather) são somados
+  num StageTimings
+- Profiler: com ETO_PROFILE=cprofile|pyinstrument, `profile_if_slow`
+  perfila uma fração (ETO_PROFILE_SAMPLE_RATE) das execuções e salva
+  o perfil das que passam de ETO_PROFILE_THRESHOLD segundos
+
+Usage:
+    with stage("fetch", source="nasa_power"):
+        df = await download(...)
+
+    @timed("fao56")
+    def calculate(...): ...
+
+    with collect_timings() as timings:
+        result = await service.process_location(...)
+    result["timings"] = timings.as_dict()
+"""
+
+import asyncio
+import cProfile
+import functools
+import io
+import os
+import pstats
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from loguru import logger
+from prometheus_client import Histogram
+
+# Definido aqui (e não em backend.api.middleware.prometheus_metrics)
+# para que o núcleo do cálculo não dependa do pacote da API
+ETO_STAGE_DURATION = Histogram(
+    "eto_stage_duration_seconds",
+    "Duração de cada etapa do pipeline ETo",
+    ["stage", "source", "cache"],
+    buckets=(0.005, 0.025, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+
+# Fonte das etapas que não são de uma fonte específica
+ALL_SOURCES = "all"
+
+# Diretório dos perfis salvos
+PROFILE_DIR = Path(os.getenv("ETO_PROFILE_DIR", "logs/profiles"))
+
+
+@dataclass
+class Span:
+    """Uma etapa em execução (ou concluída)."""
+
+    stage: str
+    source: str = ALL_SOURCES
+    cache: str = "none"  # none | hit | miss | partial
+    seconds: float = 0.0
+
+    def mark_cache(self, hit: bool) -> None:
+        result = "hit" if hit else "miss"
+        if self.cache == "none":
+            self.cache = result
+        elif self.cache != result:
+            self.cache = "partial"
+
+
+class StageTimings:
+    """Soma dos spans de uma execução (bloco `timings`)."""
+
+    def __init__(self) -> None:
+        self.total_seconds = 0.0
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, span: Span) -> None:
+        key = (
+            span.stage
+            if span.source == ALL_SOURCES
+            else f"{span.stage}:{span.source}"
+        )
+        with self._lock:
+            entry = self._stages.setdefault(key, {"seconds": 0.0, "calls": 0})
+            entry["seconds"] += span.seconds
+            entry["calls"] += 1
+            if span.cache != "none":
+                previous = entry.get("cache", span.cache)
+                entry["cache"] = (
+                    span.cache if previous == span.cache else "partial"
+                )
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            stages = {
+                key: {**entry, "seconds": round(entry["seconds"], 4)}
+                for key, entry in self._stages.items()
+            }
+        return {
+            "total_seconds": round(self.total_seconds, 4),
+            "stages": stages,
+        }
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar(
+    "eto_stage_span", default=None
+)
+_collector: ContextVar[Optional[StageTimings]] = ContextVar(
+    "eto_stage_timings", default=None
+)
+
+
+@contextmanager
+def stage(name: str, source: str = ALL_SOURCES) -> Iterator[Span]:
+    """Mede uma etapa (histograma + bloco `timings`, se ativo)."""
+    span = Span(name, source)
+    token = _current_span.set(span)
+    started = time.perf_counter()
+    try:
+        yield span
+    finally:
+        span.seconds = time.perf_counter() - started
+        _current_span.reset(token)
+        ETO_STAGE_DURATION.labels(
+            stage=name, source=source, cache=span.cache
+        ).observe(span.seconds)
+        collector = _collector.get()
+        if collector is not None:
+            collector.add(span)
+
+
+def timed(name: str, source: str = ALL_SOURCES) -> Callable:
+    """Decorator de `stage` para funções síncronas e assíncronas."""
+
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with stage(name, source):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name, source):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def mark_cache(hit: bool) -> None:
+    """Marca HIT/MISS de cache no span ativo (sem span, não faz nada)."""
+    span = _current_span.get()
+    if span is not None:
+        span.mark_cache(hit)
+
+
+@contextmanager
+def collect_timings() -> Iterator[StageTimings]:
+    """Acumula os spans executados dentro do bloco."""
+    timings = StageTimings()
+    token = _collector.set(timings)
+    started = time.perf_counter()
+    try:
+        yield timings
+    finally:
+        timings.total_seconds = time.perf_counter() - started
+        _collector.reset(token)
+
+
+# Só um profiler por processo (cProfile/sys.monitoring é exclusivo)
+_profiler_lock = threading.Lock()
+
+
+def _profile_settings() -> Optional[Dict[str, Any]]:
+    mode = os.getenv("ETO_PROFILE", "").strip().lower()
+    if mode not in ("cprofile", "pyinstrument"):
+        return None
+    return {
+        "mode": mode,
+        "threshold": float(os.getenv("ETO_PROFILE_THRESHOLD", "5")),
+        "sample_rate": float(os.getenv("ETO_PROFILE_SAMPLE_RATE", "1")),
+    }
+
+
+def _start_profiler(mode: str):
+    if mode == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+
+            profiler = Profiler(async_mode="enabled")
+            profiler.start()
+            return profiler
+        except ImportError:
+            logger.warning("pyinstrument não instalado, usando cProfile")
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def _save_profile(profiler, label: str, seconds: float) -> Path:
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+    if isinstance(profiler, cProfile.Profile):
+        path = PROFILE_DIR / f"{label}-{stamp}.prof"
+        profiler.dump_stats(path)
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats(
+            "cumulative"
+        ).print_stats(15)
+        logger.warning(
+            f"🐢 {label} lento ({seconds:.2f}s), perfil em {path}\n"
+            f"{summary.getvalue()}"
+        )
+    else:
+        path = PROFILE_DIR / f"{label}-{stamp}.html"
+        path.write_text(profiler.output_html())
+        logger.warning(f"🐢 {label} lento ({seconds:.2f}s), perfil em {path}")
+    return path
+
+
+@contextmanager
+def profile_if_slow(label: str) -> Iterator[None]:
+    """
+    Perfila o bloco se ETO_PROFILE estiver ativo e a amostragem cair.
+
+    O perfil é salvo só quando o bloco passa do limiar. Desligado
+    (padrão), custa uma leitura de variável de ambiente. Com outra
+    execução já sendo perfilada, o bloco roda sem profiler.
+    """
+    settings = _profile_settings()
+    if (
+        settings is None
+        or random.random() >= settings["sample_rate"]
+        or not _profiler_lock.acquire(blocking=False)
+    ):
+        yield
+        return
+
+    try:
+        profiler = _start_profiler(settings["mode"])
+    except Exception as e:
+        # Outro profiler ativo no interpretador (ex.: debugger)
+        logger.warning(f"Profiler indisponível para {label}: {e}")
+        profiler = None
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - started
+        try:
+            if isinstance(profiler, cProfile.Profile):
+                profiler.disable()
+            elif profiler is not None:
+                profiler.stop()
+            if profiler is not None and seconds >= settings["threshold"]:
+                _save_profile(profiler, label, seconds)
+        except Exception as e:
+            logger.error(f"Falha ao salvar perfil de {label}: {e}")
+        finally:
+            _profiler_lock.release()
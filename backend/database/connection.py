@@ -3,14 +3,17 @@ Módulo base para configuração e conexão com o banco de dados PostgreSQL.
 """
 
 import os
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from urllib.parse import quote_plus
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+from backend.database.metrics import DB_POOL_CAPACITY, DB_POOL_CHECKED_OUT
+
 # Carregar variáveis de ambiente do arquivo .env
 load_dotenv()
 
@@ -57,6 +60,40 @@ engine = create_engine(
 # Criar fábrica de sessões
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Engine assíncrona para rotas FastAPI (psycopg3 tem driver async nativo,
+# mesma URL). Pool próprio: conexões de um event loop não são
+# compartilháveis com o pool síncrono usado por Celery e scripts.
+async_engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_pre_ping=True,
+    echo=False,
+    echo_pool=False,
+)
+
+# expire_on_commit=False: objetos seguem legíveis após o commit sem
+# lazy load implícito (que exigiria await)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+def _instrument_pool(pool, name: str) -> None:
+    """Exporta ocupação do pool para o Prometheus a cada checkout/checkin."""
+    DB_POOL_CAPACITY.labels(engine=name).set(pool.size())
+    checked_out = DB_POOL_CHECKED_OUT.labels(engine=name)
+
+    # inc/dec: no evento "checkin" o pool ainda conta a conexão
+    event.listen(pool, "checkout", lambda *_: checked_out.inc())
+    event.listen(pool, "checkin", lambda *_: checked_out.dec())
+
+
+_instrument_pool(engine.pool, "sync")
+_instrument_pool(async_engine.sync_engine.pool, "async")
+
 # Base para modelos declarativos
 Base = declarative_base()
 
@@ -99,3 +136,37 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+@asynccontextmanager
+async def get_async_db_context():
+    """
+    Context manager assíncrono para sessões de banco de dados.
+
+    Yields:
+        AsyncSession: Uma sessão assíncrona
+
+    Exemplo:
+        async with get_async_db_context() as db:
+            await db.execute(...)
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_db():
+    """
+    FastAPI dependency para obter sessão assíncrona.
+    Consultas lentas não bloqueiam o event loop do worker uvicorn.
+
+    Yields:
+        AsyncSession: Uma sessão assíncrona
+
+    Exemplo:
+        @app.get("/")
+        async def read_root(db: AsyncSession = Depends(get_async_db)):
+            result = await db.execute(select(...))
+            return result.scalars().all()
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -3,16 +3,27 @@ Funções para armazenamento de dados climáticos no banco de dados.
 
 Suporta múltiplas fontes de dados (NASA POWER, Open-Meteo, MET Norway,
 NWS Forecast, NWS Stations) com harmonização automática de variáveis.
+
+Ingestão em massa (bulk_upsert_climate_data): linhas enviadas por
+COPY (psycopg3) para uma tabela temporária e depois
+INSERT ... ON CONFLICT em climate_data, deduplicadas pela chave única
+(source_api, latitude, longitude, date).
 """
 
+import json
+from datetime import date as date_type
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+import pandas as pd
 from loguru import logger
+from psycopg.types.json import Jsonb
+from sqlalchemy import select, text
 from sqlalchemy.exc import SQLAlchemyError
 
 from backend.database.connection import get_db_context
 from backend.database.models import APIVariables, ClimateData
+from backend.database.models.climate_data import TYPED_COLUMNS
 
 
 # ==============================================================================
@@ -51,7 +62,9 @@ def get_variable_mapping(source_api: str) -> Dict[str, str]:
 
 
 def harmonize_data(
-    raw_data: Dict[str, Any], source_api: str
+    raw_data: Dict[str, Any],
+    source_api: str,
+    mapping: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
     """
     Harmoniza dados de uma API para formato padronizado.
@@ -59,6 +72,8 @@ def harmonize_data(
     Args:
         raw_data: Dados originais da API
         source_api: Nome da API fonte
+        mapping: Mapeamento já carregado (get_variable_mapping); evita
+            uma consulta por registro ao harmonizar lotes
 
     Returns:
         Dict com dados em formato padronizado
@@ -79,7 +94,8 @@ def harmonize_data(
         {'temp_max_c': 28.5, 'humidity_percent': 65.0}
     """
     try:
-        mapping = get_variable_mapping(source_api)
+        if mapping is None:
+            mapping = get_variable_mapping(source_api)
         harmonized = {}
 
         for api_var, value in raw_data.items():
@@ -164,6 +180,8 @@ def save_climate_data(
         1
     """
     try:
+        mapping = get_variable_mapping(source_api) if auto_harmonize else None
+
         with get_db_context() as db:
             climate_objects = []
 
@@ -171,7 +189,9 @@ def save_climate_data(
                 # Harmoniza dados se solicitado
                 harmonized = None
                 if auto_harmonize and "raw_data" in d:
-                    harmonized = harmonize_data(d["raw_data"], source_api)
+                    harmonized = harmonize_data(
+                        d["raw_data"], source_api, mapping
+                    )
 
                 # Cria objeto ClimateData
                 climate_obj = ClimateData(
@@ -192,6 +212,9 @@ def save_climate_data(
 
             # Inserção bulk
             if climate_objects:
+                ensure_climate_partitions(
+                    db, (obj.date.year for obj in climate_objects)
+                )
                 db.add_all(climate_objects)
                 db.commit()
                 count = len(climate_objects)
@@ -212,6 +235,284 @@ def save_climate_data(
         raise
 
 
+# ==============================================================================
+# PARTIÇÕES ANUAIS (migration 003)
+# ==============================================================================
+
+_PARTITION_PREFIX = "climate_data_y"
+
+
+def ensure_climate_partitions(db, years: Iterable[int]) -> None:
+    """
+    Cria (se faltarem) as partições anuais de climate_data.
+
+    Args:
+        db: Sessão SQLAlchemy (mesma transação da gravação)
+        years: Anos que serão gravados
+    """
+    for year in sorted(set(years)):
+        db.execute(
+            text(
+                "SELECT public.ensure_climate_data_partition("
+                "make_date(:year, 1, 1))"
+            ),
+            {"year": year},
+        )
+
+
+def list_climate_partitions() -> Dict[int, str]:
+    """Partições anuais existentes: {ano: nome da tabela}."""
+    with get_db_context() as db:
+        names = (
+            db.execute(
+                text(
+                    "SELECT c.relname FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid "
+                    "WHERE i.inhparent = 'public.climate_data'::regclass"
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+    partitions = {}
+    for name in names:
+        suffix = name[len(_PARTITION_PREFIX) :]
+        if name.startswith(_PARTITION_PREFIX) and suffix.isdigit():
+            partitions[int(suffix)] = name
+    return partitions
+
+
+def drop_climate_partitions_before(year: int) -> List[str]:
+    """
+    Remove as partições anteriores a `year` (retenção).
+
+    DETACH + DROP de cada partição inteira: sem DELETE linha a linha,
+    sem bloat e sem VACUUM posterior.
+
+    Returns:
+        Nomes das partições removidas
+    """
+    old = [
+        name
+        for part_year, name in sorted(list_climate_partitions().items())
+        if part_year < year
+    ]
+    if not old:
+        return []
+
+    with get_db_context() as db:
+        for name in old:
+            # Nome validado por list_climate_partitions (prefixo + ano)
+            db.execute(
+                text(
+                    f"ALTER TABLE public.climate_data "
+                    f'DETACH PARTITION public."{name}"'
+                )
+            )
+            db.execute(text(f'DROP TABLE public."{name}"'))
+        db.commit()
+
+    logger.info(f"🗑️ Partições removidas de climate_data: {old}")
+    return old
+
+
+# ==============================================================================
+# INGESTÃO EM MASSA - COPY + UPSERT
+# ==============================================================================
+
+_STAGING_TABLE = "climate_data_staging"
+
+# Ordem das colunas no COPY (= ordem das tuplas de _build_copy_rows)
+_COPY_COLUMNS = (
+    "row_no",
+    "source_api",
+    "latitude",
+    "longitude",
+    "elevation",
+    "timezone",
+    "date",
+    "raw_data",
+    "harmonized_data",
+    "eto_mm_day",
+    "eto_method",
+    "quality_flags",
+    "processing_metadata",
+)
+
+_CREATE_STAGING_SQL = f"""
+CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} (
+    row_no bigint NOT NULL,
+    source_api varchar(50) NOT NULL,
+    latitude double precision NOT NULL,
+    longitude double precision NOT NULL,
+    elevation double precision,
+    timezone varchar(50),
+    date date NOT NULL,
+    raw_data jsonb NOT NULL,
+    harmonized_data jsonb,
+    eto_mm_day double precision,
+    eto_method varchar(50),
+    quality_flags jsonb,
+    processing_metadata jsonb
+) ON COMMIT DROP
+"""
+
+# Partições dos anos presentes no lote (antes do INSERT)
+_ENSURE_STAGING_PARTITIONS_SQL = f"""
+SELECT public.ensure_climate_data_partition(make_date(y, 1, 1))
+FROM (
+    SELECT DISTINCT extract(year FROM date)::integer AS y
+    FROM {_STAGING_TABLE}
+) AS years
+"""
+
+# Última linha de cada chave vence (DISTINCT ON + row_no DESC): um
+# mesmo INSERT ... ON CONFLICT não pode atualizar a linha duas vezes.
+# Campos opcionais ausentes no lote novo preservam o valor gravado.
+_UPSERT_SQL = f"""
+WITH upserted AS (
+    INSERT INTO public.climate_data AS cd (
+        source_api, latitude, longitude, elevation, timezone, date,
+        raw_data, harmonized_data, eto_mm_day, eto_method,
+        quality_flags, processing_metadata, created_at, updated_at
+    )
+    SELECT DISTINCT ON (source_api, latitude, longitude, date)
+        source_api, latitude, longitude, elevation, timezone, date,
+        raw_data, harmonized_data, eto_mm_day, eto_method,
+        quality_flags, processing_metadata, now(), now()
+    FROM {_STAGING_TABLE}
+    ORDER BY source_api, latitude, longitude, date, row_no DESC
+    ON CONFLICT ON CONSTRAINT uq_climate_data_location_date DO UPDATE SET
+        elevation = COALESCE(EXCLUDED.elevation, cd.elevation),
+        timezone = COALESCE(EXCLUDED.timezone, cd.timezone),
+        raw_data = EXCLUDED.raw_data,
+        harmonized_data = COALESCE(
+            EXCLUDED.harmonized_data, cd.harmonized_data
+        ),
+        eto_mm_day = COALESCE(EXCLUDED.eto_mm_day, cd.eto_mm_day),
+        eto_method = COALESCE(EXCLUDED.eto_method, cd.eto_method),
+        quality_flags = COALESCE(EXCLUDED.quality_flags, cd.quality_flags),
+        processing_metadata = COALESCE(
+            EXCLUDED.processing_metadata, cd.processing_metadata
+        ),
+        updated_at = now()
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT
+    count(*) FILTER (WHERE inserted),
+    count(*) FILTER (WHERE NOT inserted)
+FROM upserted
+"""
+
+
+def _json_dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
+def _jsonb(value: Optional[Dict[str, Any]]) -> Optional[Jsonb]:
+    return None if value is None else Jsonb(value, dumps=_json_dumps)
+
+
+def _build_copy_rows(
+    data: Iterable[Dict[str, Any]],
+    source_api: str,
+    mapping: Optional[Dict[str, str]],
+) -> Iterator[Tuple[Any, ...]]:
+    """
+    Converte registros (formato de save_climate_data) em tuplas do COPY.
+
+    Gerador: as linhas vão direto para o COPY, sem lista intermediária.
+    """
+    for row_no, d in enumerate(data):
+        raw_data = d.get("raw_data", {})
+        harmonized = (
+            harmonize_data(raw_data, source_api, mapping)
+            if mapping is not None and "raw_data" in d
+            else None
+        )
+        day = d["date"]
+        if isinstance(day, datetime):
+            day = day.date()
+
+        yield (
+            row_no,
+            source_api,
+            d["latitude"],
+            d["longitude"],
+            d.get("elevation"),
+            d.get("timezone"),
+            day,
+            _jsonb(raw_data),
+            _jsonb(harmonized),
+            d.get("eto_mm_day"),
+            d.get("eto_method", "penman_monteith"),
+            _jsonb(d.get("quality_flags")),
+            _jsonb(d.get("processing_metadata")),
+        )
+
+
+def bulk_upsert_climate_data(
+    data: Iterable[Dict[str, Any]],
+    source_api: str,
+    auto_harmonize: bool = True,
+) -> Dict[str, int]:
+    """
+    Ingestão em massa: COPY para tabela temporária + upsert.
+
+    Os registros (mesmo formato de save_climate_data) são enviados por
+    COPY para uma tabela temporária e inseridos em climate_data com
+    INSERT ... ON CONFLICT na chave (source_api, latitude, longitude,
+    date). Chaves repetidas no lote valem pela última ocorrência;
+    chaves já gravadas são atualizadas. Tudo em uma transação.
+
+    Args:
+        data: Registros (lista ou gerador) com latitude, longitude,
+            date, raw_data e campos opcionais
+        source_api: Nome da API fonte
+        auto_harmonize: Se True, harmoniza dados (mapeamento carregado
+            uma única vez)
+
+    Returns:
+        {"inserted": novos registros, "updated": registros atualizados}
+
+    Examples:
+        >>> bulk_upsert_climate_data(records, 'nasa_power')
+        {'inserted': 10950, 'updated': 0}
+    """
+    mapping = get_variable_mapping(source_api) if auto_harmonize else None
+    columns = ", ".join(_COPY_COLUMNS)
+
+    try:
+        with get_db_context() as db:
+            # Conexão psycopg3 por trás da sessão (mesma transação)
+            dbapi_conn = db.connection().connection.driver_connection
+            with dbapi_conn.cursor() as cursor:
+                cursor.execute(_CREATE_STAGING_SQL)
+                with cursor.copy(
+                    f"COPY {_STAGING_TABLE} ({columns}) FROM STDIN"
+                ) as copy:
+                    for row in _build_copy_rows(data, source_api, mapping):
+                        copy.write_row(row)
+                cursor.execute(_ENSURE_STAGING_PARTITIONS_SQL)
+                cursor.execute(_UPSERT_SQL)
+                inserted, updated = cursor.fetchone()
+            db.commit()
+
+        logger.info(
+            f"✅ Upsert de {source_api}: {inserted} inseridos, "
+            f"{updated} atualizados (COPY)"
+        )
+        return {"inserted": inserted, "updated": updated}
+
+    except SQLAlchemyError as e:
+        logger.error(f"❌ Erro SQLAlchemy no upsert em massa: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"❌ Erro no upsert em massa de {source_api}: {e}")
+        raise
+
+
 # ==============================================================================
 # QUERIES E UTILITÁRIOS
 # ==============================================================================
@@ -253,6 +554,67 @@ def get_climate_data(
     return results
 
 
+FRAME_COLUMNS = ("source_api", *TYPED_COLUMNS, "eto_mm_day")
+
+
+def get_climate_frame(
+    latitude: float,
+    longitude: float,
+    start_date: datetime,
+    end_date: datetime,
+    source_api: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Busca as variáveis numéricas como DataFrame (sem objetos ORM).
+
+    Projeta só as colunas geradas de harmonized_data + eto_mm_day,
+    servidas pelo índice de cobertura idx_climate_data_location; o
+    JSONB não é lido nem decodificado. Preferir a get_climate_data
+    para estatísticas e leituras de vários anos.
+
+    Args:
+        latitude: Latitude
+        longitude: Longitude
+        start_date: Data inicial
+        end_date: Data final
+        source_api: Filtro opcional por API
+
+    Returns:
+        DataFrame indexado por date com source_api e colunas float64
+        (NaN onde a variável não existe)
+    """
+    stmt = (
+        select(
+            ClimateData.date,
+            *(getattr(ClimateData, column) for column in FRAME_COLUMNS),
+        )
+        .where(
+            ClimateData.latitude == latitude,
+            ClimateData.longitude == longitude,
+            ClimateData.date >= start_date,
+            ClimateData.date <= end_date,
+        )
+        .order_by(ClimateData.date)
+    )
+    if source_api:
+        stmt = stmt.where(ClimateData.source_api == source_api)
+
+    with get_db_context() as db:
+        rows = db.execute(stmt).all()
+
+    return _rows_to_frame(rows)
+
+
+def _rows_to_frame(rows: List[Tuple[Any, ...]]) -> pd.DataFrame:
+    """Tuplas (date, *FRAME_COLUMNS) -> DataFrame tipado."""
+    frame = pd.DataFrame.from_records(rows, columns=("date", *FRAME_COLUMNS))
+    numeric = [column for column in FRAME_COLUMNS if column != "source_api"]
+    # Colunas só com NULL viriam como object
+    frame[numeric] = frame[numeric].astype("float64")
+    frame["date"] = pd.to_datetime(frame["date"])
+    return frame.set_index("date")
+
+
 def check_data_exists(
     latitude: float, longitude: float, date: datetime, source_api: str
 ) -> bool:
@@ -281,3 +643,37 @@ def check_data_exists(
         )
 
     return count > 0
+
+
+def get_existing_dates(
+    latitude: float,
+    longitude: float,
+    start_date: datetime,
+    end_date: datetime,
+    source_api: str,
+) -> Set[date_type]:
+    """
+    Dias já gravados de uma localização/fonte em uma única consulta.
+
+    Substitui chamadas repetidas de check_data_exists (uma COUNT por
+    dia) ao decidir o que falta baixar de um período.
+
+    Returns:
+        Conjunto de datas presentes em climate_data
+    """
+    with get_db_context() as db:
+        rows = (
+            db.query(ClimateData.date)
+            .filter(
+                ClimateData.latitude == latitude,
+                ClimateData.longitude == longitude,
+                ClimateData.date >= start_date,
+                ClimateData.date <= end_date,
+                ClimateData.source_api == source_api,
+            )
+            .all()
+        )
+
+    return {
+        day.date() if isinstance(day, datetime) else day for (day,) in rows
+    }
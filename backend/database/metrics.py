@@ -0,0 +1,21 @@
+"""
+Métricas Prometheus do pool de conexões PostgreSQL.
+
+Ficam na camada de banco para que `connection.py` não dependa do pacote
+da API (as demais métricas estão em
+`backend.api.middleware.prometheus_metrics`).
+"""
+
+from prometheus_client import Gauge
+
+DB_POOL_CAPACITY = Gauge(
+    "db_pool_size",
+    "Configured connection pool size",
+    ["engine"],
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out from the pool",
+    ["engine"],
+)
@@ -10,7 +10,10 @@ from backend.database.models.user_favorites import (
     FavoriteLocation,
     UserFavorites,
 )
-from backend.database.models.visitor_stats import VisitorStats
+from backend.database.models.visitor_stats import (
+    VisitorHourlyStats,
+    VisitorStats,
+)
 
 __all__ = [
     "AdminUser",
@@ -20,5 +23,6 @@ __all__ = [
     "CacheMetadata",
     "UserFavorites",
     "FavoriteLocation",
+    "VisitorHourlyStats",
     "VisitorStats",
 ]
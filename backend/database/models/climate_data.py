@@ -8,15 +8,51 @@ Suporta 6 fontes de dados com JSONB flexível:
 - met_norway: MET Norway (hoje a +5d, forecast nórdico)
 - nws_forecast: NWS Forecast (hoje a +7d, forecast USA)
 - nws_stations: NWS Stations (hoje-1d a hoje, real-time USA)
+
+A tabela é particionada por ano (RANGE em date, migration 003): uma
+partição climate_data_yYYYY por ano, criada sob demanda pela função
+ensure_climate_data_partition(date).
 """
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Float, Index, Integer, String
+from sqlalchemy import (
+    Column,
+    Computed,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    event,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 
 from backend.database.connection import Base
 
+# Colunas numéricas geradas a partir de harmonized_data (migration 004):
+# coluna -> chaves aceitas no JSONB, a primeira numérica presente vale
+TYPED_COLUMNS = {
+    "temp_max_c": ("temp_max_c", "temp_max"),
+    "temp_min_c": ("temp_min_c", "temp_min"),
+    "humidity_percent": ("humidity_percent", "relative_humidity_mean"),
+    "wind_speed_ms": ("wind_speed_ms", "wind_speed_2m_mean"),
+    "solar_radiation_mjm2": ("solar_radiation_mjm2", "solar_radiation"),
+    "precipitation_mm": ("precipitation_mm", "precipitation_sum_mm"),
+}
+
+
+def _harmonized_number(column: str) -> Computed:
+    """Expressão GENERATED ... STORED que extrai o valor numérico."""
+    parts = [
+        f"CASE WHEN jsonb_typeof(harmonized_data -> '{key}') = 'number' "
+        f"THEN (harmonized_data ->> '{key}')::double precision END"
+        for key in TYPED_COLUMNS[column]
+    ]
+    return Computed(f"COALESCE({', '.join(parts)})", persisted=True)
+
 
 class ClimateData(Base):
     """
@@ -83,19 +119,39 @@ class ClimateData(Base):
 
     __tablename__ = "climate_data"
     __table_args__ = (
-        # Índices compostos para otimização
-        Index("idx_climate_location_date", "latitude", "longitude", "date"),
-        Index("idx_climate_source_date", "source_api", "date"),
-        Index("idx_climate_date", "date"),
-        # Schema público
-        {"schema": "public"},
+        # Um registro por fonte/localização/dia (alvo do ON CONFLICT
+        # em bulk_upsert_climate_data; criado na migração 001)
+        UniqueConstraint(
+            "source_api",
+            "latitude",
+            "longitude",
+            "date",
+            name="uq_climate_data_location_date",
+        ),
+        # Índices compostos para otimização; o de localização cobre as
+        # colunas numéricas (index-only scan em get_climate_frame)
+        Index(
+            "idx_climate_data_location",
+            "latitude",
+            "longitude",
+            "date",
+            postgresql_include=[
+                "source_api",
+                *TYPED_COLUMNS,
+                "eto_mm_day",
+            ],
+        ),
+        Index("idx_climate_data_source_date", "source_api", "date"),
+        # BRIN: datas chegam em ordem, índice minúsculo por partição
+        Index("idx_climate_data_date_brin", "date", postgresql_using="brin"),
+        # Schema público, particionada por ano
+        {"schema": "public", "postgresql_partition_by": "RANGE (date)"},
     )
 
     # === Identificação ===
+    # Em tabela particionada a PK precisa conter a chave (id, date)
     id = Column(Integer, primary_key=True, autoincrement=True)
-    source_api = Column(
-        String(50), nullable=False, index=True, comment="Fonte da API"
-    )
+    source_api = Column(String(50), nullable=False, comment="Fonte da API")
 
     # === Localização ===
     latitude = Column(
@@ -115,7 +171,10 @@ class ClimateData(Base):
 
     # === Temporal ===
     date = Column(
-        DateTime, nullable=False, comment="Data dos dados climáticos"
+        DateTime,
+        primary_key=True,
+        nullable=False,
+        comment="Data dos dados climáticos (chave de partição)",
     )
     created_at = Column(
         DateTime,
@@ -143,6 +202,16 @@ class ClimateData(Base):
         comment="Dados harmonizados em formato padronizado",
     )
 
+    # === Variáveis numéricas (geradas de harmonized_data) ===
+    temp_max_c = Column(Float, _harmonized_number("temp_max_c"))
+    temp_min_c = Column(Float, _harmonized_number("temp_min_c"))
+    humidity_percent = Column(Float, _harmonized_number("humidity_percent"))
+    wind_speed_ms = Column(Float, _harmonized_number("wind_speed_ms"))
+    solar_radiation_mjm2 = Column(
+        Float, _harmonized_number("solar_radiation_mjm2")
+    )
+    precipitation_mm = Column(Float, _harmonized_number("precipitation_mm"))
+
     # === Resultado ETo ===
     eto_mm_day = Column(
         Float,
@@ -196,3 +265,37 @@ class ClimateData(Base):
                 self.created_at.isoformat() if self.created_at else None
             ),
         }
+
+
+# Criação sob demanda da partição anual (mesma função da migration 003)
+ENSURE_PARTITION_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION public.ensure_climate_data_partition(p_day date)
+RETURNS text AS $$
+DECLARE
+    v_year integer := extract(year FROM p_day)::integer;
+    v_name text := format('climate_data_y%s', v_year);
+BEGIN
+    IF to_regclass(format('public.%I', v_name)) IS NULL THEN
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS public.%I '
+                'PARTITION OF public.climate_data '
+                'FOR VALUES FROM (%L) TO (%L)',
+                v_name,
+                make_date(v_year, 1, 1),
+                make_date(v_year + 1, 1, 1)
+            );
+        EXCEPTION WHEN duplicate_table OR unique_violation THEN
+            NULL;
+        END;
+    END IF;
+    RETURN v_name;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+@event.listens_for(ClimateData.__table__, "after_create")
+def _create_partition_function(target, connection, **kw):
+    """Garante a função de partições também via Base.metadata.create_all."""
+    connection.execute(text(ENSURE_PARTITION_FUNCTION_SQL))
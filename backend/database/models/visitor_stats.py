@@ -345,6 +345,67 @@ class VisitorStats(Base):
         }
 
 
+class VisitorHourlyStats(Base):
+    """
+    Série temporal de visitas por hora (UTC).
+
+    Consolidada periodicamente a partir dos buckets horários do Redis
+    (VisitorCounterService.sync_to_database), uma linha por hora.
+
+    Attributes:
+        bucket: Início da hora (UTC), chave primária
+        page_views: Carregamentos de página na hora
+        unique_visitors: Visitantes únicos na hora (HyperLogLog, ~0,81%)
+        updated_at: Última consolidação da hora
+    """
+
+    __tablename__ = "visitor_hourly_stats"
+
+    bucket = Column(
+        DateTime,
+        primary_key=True,
+        comment="Início da hora (UTC)",
+    )
+    page_views = Column(
+        Integer,
+        nullable=False,
+        server_default="0",
+        comment="Carregamentos de página na hora",
+    )
+    unique_visitors = Column(
+        Integer,
+        nullable=False,
+        server_default="0",
+        comment="Visitantes únicos na hora (estimativa HyperLogLog)",
+    )
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="Data/hora da última consolidação",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<VisitorHourlyStats(bucket={self.bucket}, "
+            f"views={self.page_views}, unique={self.unique_visitors})>"
+        )
+
+    def to_dict(self) -> dict:
+        """
+        Converte para dicionário.
+
+        Returns:
+            dict: Visitas da hora
+        """
+        return {
+            "bucket": self.bucket,
+            "page_views": self.page_views,
+            "unique_visitors": self.unique_visitors,
+        }
+
+
 # Índices para performance
 Index(
     "idx_visitor_visitor_id",
@@ -367,4 +428,4 @@ Index(
 )
 
 
-__all__ = ["Visitor", "VisitorStats"]
+__all__ = ["Visitor", "VisitorHourlyStats", "VisitorStats"]
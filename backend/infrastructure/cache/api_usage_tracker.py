@@ -4,13 +4,23 @@ API Usage Tracker - Monitor daily API consumption.
 Rastreia consumo diário de cada API climática e alerta
 quando próximo dos limites.
 
+- APIs com limite: reserve_api_quota checa e incrementa numa única ida
+  ao Redis (script Lua, janela deslizante de 24h) antes da chamada;
+  workers concorrentes não ultrapassam o limite
+- APIs sem limite: contagem acumulada no processo e gravada em lote
+  (um pipeline para todas as APIs)
+
 Usage:
     from backend.infrastructure.cache.api_usage_tracker import (
+        ensure_api_quota,
         track_api_call,
         get_api_usage,
         check_api_quota,
     )
 
+    # Reservar antes de chamar (APIQuotaExceededError se esgotada)
+    await ensure_api_quota("nasa_power")
+
     # Registrar chamada
     track_api_call("nasa_power", requests_count=1)
 
@@ -22,12 +32,16 @@ Usage:
         logger.warning("NASA POWER quota exceeded!")
 """
 
-from datetime import datetime
+import asyncio
+import atexit
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from loguru import logger
 from redis import Redis
-
-from backend.core.config import settings
+from redis.asyncio import Redis as AsyncRedis
 
 # API Limits (requests per day)
 API_LIMITS = {
@@ -37,16 +51,102 @@ API_LIMITS = {
     "openmeteo_forecast": 10000,  # Open-Meteo: 10k/dia free tier
     "openmeteo_archive": 10000,  # Open-Meteo: 10k/dia free tier
     "met_norway": None,  # MET Norway: fair use (sem limite rígido)
+    "opentopo": 1000,  # OpenTopoData público: 1000 req/dia
 }
 
 # Warning thresholds (% of limit)
 WARNING_THRESHOLD = 0.80  # 80%
 CRITICAL_THRESHOLD = 0.95  # 95%
 
+# TTL dos contadores diários (manter histórico 2 dias)
+USAGE_TTL = 86400 * 2
+
+# APIs sem limite: contagem acumulada no processo e gravada em lote
+USAGE_FLUSH_EVERY = 50  # requests pendentes
+USAGE_FLUSH_INTERVAL = 10.0  # segundos
+
+# Janela deslizante de 24h sobre os contadores diários:
+# uso = hoje + ontem * (fração do dia que ainda não passou).
+# Checa e reserva na mesma operação (atômica no Redis).
+# KEYS[1] = contador de hoje, KEYS[2] = contador de ontem
+# ARGV = pedidos, limite, TTL, fração do dia decorrida
+# Retorna {1 = reservado / 0 = negado, uso na janela}
+_RESERVE_LUA = """
+local requested = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local used = current + math.floor(previous * (1 - tonumber(ARGV[4])))
+if used + requested > limit then
+    return {0, used}
+end
+redis.call('INCRBY', KEYS[1], requested)
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return {1, used + requested}
+"""
+
+
+class APIQuotaExceededError(RuntimeError):
+    """Quota diária da API esgotada (reserva negada)."""
+
+    def __init__(self, api_name: str, used: int, limit: int):
+        # args completos: a exceção volta intacta do pickle (Celery)
+        super().__init__(api_name, used, limit)
+        self.api_name = api_name
+        self.used = used
+        self.limit = limit
+
+    def __str__(self) -> str:
+        return (
+            f"{self.api_name}: quota diária esgotada ({self.used}/"
+            f"{self.limit} requests nas últimas 24h)"
+        )
+
+
+_redis_lock = threading.Lock()
+_redis: Optional[Redis] = None
+# event loop -> cliente redis.asyncio (conexões pertencem ao loop)
+_async_redis: Dict[asyncio.AbstractEventLoop, AsyncRedis] = {}
+
+
+def _redis_url() -> str:
+    from config.settings.app_config import get_settings
+
+    return get_settings().redis.redis_url
+
 
 def _get_redis() -> Redis:
-    """Get Redis connection."""
-    return Redis.from_url(settings.redis.redis_url, decode_responses=True)
+    """Cliente Redis do processo (pool criado na primeira chamada)."""
+    global _redis
+    if _redis is None:
+        with _redis_lock:
+            if _redis is None:
+                _redis = Redis.from_url(_redis_url(), decode_responses=True)
+    return _redis
+
+
+def _get_async_redis() -> AsyncRedis:
+    """Cliente redis.asyncio do loop corrente."""
+    loop = asyncio.get_running_loop()
+    for closed in [lp for lp in _async_redis if lp.is_closed()]:
+        del _async_redis[closed]
+    client = _async_redis.get(loop)
+    if client is None:
+        client = AsyncRedis.from_url(_redis_url(), decode_responses=True)
+        _async_redis[loop] = client
+    return client
+
+
+def reset_api_usage_clients() -> None:
+    """
+    Esquece os clientes Redis sem fechá-los.
+
+    Usado no processo filho após fork (Celery prefork).
+    """
+    global _redis
+    with _redis_lock:
+        _redis = None
+    _async_redis.clear()
 
 
 def _get_usage_key(api_name: str, date: str | None = None) -> str:
@@ -56,10 +156,221 @@ def _get_usage_key(api_name: str, date: str | None = None) -> str:
     return f"api_usage:{api_name}:{date}"
 
 
+def _window_args(
+    api_name: str, requests_count: int, limit: int
+) -> Tuple[list, list]:
+    """Chaves (hoje, ontem) e argumentos do script de reserva."""
+    now = datetime.now()
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    keys = [
+        _get_usage_key(api_name, now.strftime("%Y-%m-%d")),
+        _get_usage_key(
+            api_name, (now - timedelta(days=1)).strftime("%Y-%m-%d")
+        ),
+    ]
+    elapsed = (now - midnight).total_seconds() / 86400
+    return keys, [requests_count, limit, USAGE_TTL, elapsed]
+
+
+def _log_usage_level(api_name: str, current_usage: int, limit: int) -> None:
+    """Alerta quando o uso passa dos limiares de aviso."""
+    usage_percent = current_usage / limit
+
+    if usage_percent >= CRITICAL_THRESHOLD:
+        logger.critical(
+            f"🚨 {api_name.upper()} CRITICAL: {current_usage}/{limit} "
+            f"requests ({usage_percent:.1%}) - NEAR LIMIT!"
+        )
+    elif usage_percent >= WARNING_THRESHOLD:
+        logger.warning(
+            f"⚠️ {api_name.upper()} WARNING: {current_usage}/{limit} "
+            f"requests ({usage_percent:.1%})"
+        )
+
+
+class UsageAccumulator:
+    """
+    Contagem por processo das APIs sem limite.
+
+    Sem quota a proteger, não há por que ir ao Redis a cada request:
+    as contagens somam em memória e são gravadas todas juntas (um
+    pipeline INCRBY + EXPIRE) a cada USAGE_FLUSH_EVERY requests ou
+    USAGE_FLUSH_INTERVAL segundos.
+    """
+
+    def __init__(
+        self,
+        flush_every: int = USAGE_FLUSH_EVERY,
+        flush_interval: float = USAGE_FLUSH_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending: Dict[str, int] = {}
+        self._last_flush = clock()
+
+    def add(self, api_name: str, requests_count: int = 1) -> bool:
+        """Soma requests; True quando é hora de gravar."""
+        with self._lock:
+            self._pending[api_name] = (
+                self._pending.get(api_name, 0) + requests_count
+            )
+            return (
+                sum(self._pending.values()) >= self.flush_every
+                or self._clock() - self._last_flush >= self.flush_interval
+            )
+
+    def drain(self) -> Dict[str, int]:
+        """Retira as contagens pendentes (por chave Redis do dia)."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = self._clock()
+        return {_get_usage_key(api): n for api, n in pending.items()}
+
+    def restore(self, counts: Dict[str, int]) -> None:
+        """Devolve contagens cuja gravação falhou."""
+        with self._lock:
+            for key, n in counts.items():
+                api = key.split(":")[1]
+                self._pending[api] = self._pending.get(api, 0) + n
+
+
+usage_accumulator = UsageAccumulator()
+
+
+def _queue_usage(pipe: Any, counts: Dict[str, int]) -> None:
+    for key, n in counts.items():
+        pipe.incrby(key, n)
+        pipe.expire(key, USAGE_TTL)
+
+
+def flush_api_usage() -> None:
+    """Grava as contagens acumuladas em um único pipeline."""
+    counts = usage_accumulator.drain()
+    if not counts:
+        return
+    try:
+        with _get_redis().pipeline(transaction=False) as pipe:
+            _queue_usage(pipe, counts)
+            pipe.execute()
+    except Exception as e:
+        logger.warning(f"Falha ao gravar uso das APIs: {e}")
+        usage_accumulator.restore(counts)
+
+
+async def flush_api_usage_async(redis: Any | None = None) -> None:
+    """flush_api_usage para quem está num event loop."""
+    counts = usage_accumulator.drain()
+    if not counts:
+        return
+    try:
+        async with (redis or _get_async_redis()).pipeline(
+            transaction=False
+        ) as pipe:
+            _queue_usage(pipe, counts)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Falha ao gravar uso das APIs: {e}")
+        usage_accumulator.restore(counts)
+
+
+atexit.register(flush_api_usage)
+
+
+def reserve_api_quota(api_name: str, requests_count: int = 1) -> bool:
+    """
+    Reserva `requests_count` requests da quota, atomicamente.
+
+    Uma ida ao Redis (script Lua): confere o uso nas últimas 24h e, se
+    couber, já o incrementa — workers concorrentes não ultrapassam o
+    limite. APIs sem limite só acumulam a contagem no processo.
+
+    Returns:
+        True se reservado (pode chamar a API), False se esgotada
+    """
+    limit = API_LIMITS.get(api_name)
+    if limit is None:
+        if usage_accumulator.add(api_name, requests_count):
+            flush_api_usage()
+        return True
+
+    keys, args = _window_args(api_name, requests_count, limit)
+    try:
+        # register_script: EVALSHA (recarrega o script se o Redis não o
+        # tiver em cache) em vez de enviar o Lua a cada reserva
+        reserve = _get_redis().register_script(_RESERVE_LUA)
+        granted, used = reserve(keys=keys, args=args)
+    except Exception as e:
+        # Redis fora não derruba as consultas climáticas
+        logger.warning(f"{api_name}: quota não verificada ({e})")
+        return True
+    _log_usage_level(api_name, int(used), limit)
+    return bool(granted)
+
+
+async def reserve_api_quota_async(
+    api_name: str,
+    requests_count: int = 1,
+    redis: Any | None = None,
+) -> bool:
+    """
+    reserve_api_quota para clientes assíncronos.
+
+    Args:
+        redis: Cliente redis.asyncio (padrão: cliente do loop corrente)
+    """
+    granted, _ = await _reserve_async(api_name, requests_count, redis)
+    return granted
+
+
+async def _reserve_async(
+    api_name: str, requests_count: int, redis: Any | None
+) -> Tuple[bool, int]:
+    """Reserva e uso na janela de 24h (0 se não verificado)."""
+    limit = API_LIMITS.get(api_name)
+    if limit is None:
+        if usage_accumulator.add(api_name, requests_count):
+            await flush_api_usage_async(redis)
+        return True, 0
+
+    keys, args = _window_args(api_name, requests_count, limit)
+    try:
+        reserve = (redis or _get_async_redis()).register_script(_RESERVE_LUA)
+        granted, used = await reserve(keys=keys, args=args)
+    except Exception as e:
+        logger.warning(f"{api_name}: quota não verificada ({e})")
+        return True, 0
+    _log_usage_level(api_name, int(used), limit)
+    return bool(granted), int(used)
+
+
+async def ensure_api_quota(
+    api_name: str,
+    requests_count: int = 1,
+    redis: Any | None = None,
+) -> None:
+    """
+    Reserva quota antes de uma chamada de rede.
+
+    Raises:
+        APIQuotaExceededError: Se a reserva for negada
+    """
+    # O uso vem da própria reserva: nada de consulta síncrona no loop
+    granted, used = await _reserve_async(api_name, requests_count, redis)
+    if not granted:
+        raise APIQuotaExceededError(api_name, used, API_LIMITS[api_name])
+
+
 def track_api_call(api_name: str, requests_count: int = 1) -> int:
     """
     Track API call and return current daily usage.
 
+    Registra sem checar a quota (chamada já feita); para reservar antes
+    de chamar, use reserve_api_quota. INCRBY + EXPIRE vão em um único
+    pipeline.
+
     Args:
         api_name: Nome da API ("nasa_power", "nws_forecast", etc.)
         requests_count: Número de requests feitos (padrão: 1)
@@ -71,31 +382,18 @@ def track_api_call(api_name: str, requests_count: int = 1) -> int:
         >>> usage = track_api_call("nasa_power")
         >>> print(f"NASA POWER usage today: {usage}/1000")
     """
-    redis = _get_redis()
     key = _get_usage_key(api_name)
 
-    # Incrementar contador
-    current_usage_raw = redis.incr(key, requests_count)
+    with _get_redis().pipeline(transaction=False) as pipe:
+        pipe.incrby(key, requests_count)
+        pipe.expire(key, USAGE_TTL)
+        current_usage_raw, _ = pipe.execute()
     current_usage = int(current_usage_raw) if current_usage_raw else 0
 
-    # Definir TTL de 48h (manter histórico 2 dias)
-    redis.expire(key, 86400 * 2)
-
     # Verificar e alertar se próximo do limite
     limit = API_LIMITS.get(api_name)
     if limit is not None:
-        usage_percent = current_usage / limit
-
-        if usage_percent >= CRITICAL_THRESHOLD:
-            logger.critical(
-                f"🚨 {api_name.upper()} CRITICAL: {current_usage}/{limit} "
-                f"requests ({usage_percent:.1%}) - NEAR LIMIT!"
-            )
-        elif usage_percent >= WARNING_THRESHOLD:
-            logger.warning(
-                f"⚠️ {api_name.upper()} WARNING: {current_usage}/{limit} "
-                f"requests ({usage_percent:.1%})"
-            )
+        _log_usage_level(api_name, current_usage, limit)
 
     return current_usage
 
@@ -115,6 +413,7 @@ def get_api_usage(
         Dict com usage stats:
         {
             "requests_today": 245,
+            "window_usage": 260,  # últimas 24h
             "limit": 1000,
             "usage_percent": 24.5,
             "remaining": 755,
@@ -126,24 +425,37 @@ def get_api_usage(
     """
     redis = _get_redis()
     key = _get_usage_key(api_name, date)
+    day = datetime.strptime(date, "%Y-%m-%d") if date else datetime.now()
+    previous_key = _get_usage_key(
+        api_name, (day - timedelta(days=1)).strftime("%Y-%m-%d")
+    )
 
-    # Get current usage
-    usage_str = redis.get(key)
+    # Hoje e ontem em uma ida ao Redis
+    usage_str, previous_str = redis.mget(key, previous_key)
     current_usage = int(usage_str) if usage_str else 0
+    previous_usage = int(previous_str) if previous_str else 0
+
+    # Uso nas últimas 24h (mesma estimativa do script de reserva)
+    window_usage = current_usage
+    if date is None:
+        midnight = day.replace(hour=0, minute=0, second=0, microsecond=0)
+        elapsed = (day - midnight).total_seconds() / 86400
+        window_usage += int(previous_usage * (1 - elapsed))
 
     # Get limit
     limit = API_LIMITS.get(api_name)
 
     # Calculate stats
     if limit is not None:
-        usage_percent = (current_usage / limit) * 100
-        remaining = limit - current_usage
+        usage_percent = (window_usage / limit) * 100
+        remaining = max(limit - window_usage, 0)
     else:
         usage_percent = None
         remaining = None
 
     return {
         "requests_today": current_usage,
+        "window_usage": window_usage,
         "limit": limit,
         "usage_percent": usage_percent,
         "remaining": remaining,
@@ -154,6 +466,9 @@ def check_api_quota(api_name: str, required_requests: int = 1) -> bool:
     """
     Check if API has enough quota for required requests.
 
+    Só consulta (não reserva): entre a checagem e a chamada outro worker
+    pode consumir a quota. Para garantir o limite, use reserve_api_quota.
+
     Args:
         api_name: Nome da API
         required_requests: Número de requests necessários
@@ -175,7 +490,7 @@ def check_api_quota(api_name: str, required_requests: int = 1) -> bool:
 
     # Verificar uso atual
     stats = get_api_usage(api_name)
-    current_usage = stats["requests_today"] or 0
+    current_usage = stats["window_usage"] or 0
 
     # Verificar se tem espaço
     return (current_usage + required_requests) <= limit
@@ -222,25 +537,17 @@ def reset_api_usage(api_name: str, date: str | None = None) -> None:
 
 # Exemplo de uso em clientes de API:
 """
-# Em nasa_power_client.py, adicionar:
+# Clientes httpx: a reserva roda como event hook do pool
+# (get_http_client(..., quota="nasa_power")), antes de cada request.
 
-from backend.infrastructure.cache.api_usage_tracker import (
-    track_api_call,
-    check_api_quota,
-)
+# Demais clientes, antes de chamar a API:
+
+from backend.infrastructure.cache.api_usage_tracker import ensure_api_quota
 
 async def get_daily_data(...):
-    # Verificar quota antes de chamar API
-    if not check_api_quota("nasa_power"):
-        raise APIQuotaExceeded(
-            "NASA POWER daily limit reached. Try again tomorrow."
-        )
-    
-    # Chamar API
+    # Reserva atômica; APIQuotaExceededError se esgotada
+    await ensure_api_quota("nasa_power")
+
     response = await client.get(url)
-    
-    # Registrar chamada
-    track_api_call("nasa_power")
-    
     return process_response(response)
 """
@@ -0,0 +1,195 @@
+"""
+Manutenção incremental do cache Redis (SCAN + pipelines).
+
+Substitui o padrão KEYS + um TTL/DELETE por chave:
+- KEYS percorre o keyspace inteiro de uma vez e bloqueia o Redis
+  compartilhado; SCAN avança por cursor, SCAN_COUNT chaves por passo
+- Cada lote de chaves faz uma única ida ao Redis por operação
+  (TTL / MEMORY USAGE em pipeline, um UNLINK para o lote todo)
+- Orçamento de tempo: ao estourar `time_budget`, a varredura para e o
+  cursor fica salvo em Redis; a próxima execução continua dali
+- Pausa curta entre lotes para não monopolizar o servidor
+
+Usage:
+    maintenance = CacheMaintenance(redis_client)
+    report = maintenance.cleanup("climate:*", min_ttl=3600)
+    report = maintenance.stats("climate:*")
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional
+
+from redis import Redis
+
+logger = logging.getLogger(__name__)
+
+# Chaves pedidas ao SCAN por passo (dica: o Redis pode devolver mais/menos)
+SCAN_COUNT = 500
+
+# Tempo máximo de uma execução de manutenção (segundos)
+MAINTENANCE_TIME_BUDGET = 30.0
+
+# Pausa entre lotes (segundos)
+BATCH_PAUSE = 0.01
+
+# Cursor salvo entre execuções: {prefixo}{operação}:{padrão}
+CURSOR_KEY_PREFIX = "cache:maintenance:cursor:"
+CURSOR_TTL = 7 * 86400
+
+
+def key_source(key: bytes | str) -> str:
+    """Segundo segmento da chave: climate:{source}:... → source."""
+    if isinstance(key, bytes):
+        key = key.decode(errors="replace")
+    parts = key.split(":", 2)
+    return parts[1] if len(parts) > 2 else "other"
+
+
+@dataclass
+class MaintenanceReport:
+    """Resultado de uma varredura (possivelmente parcial)."""
+
+    scanned: int = 0
+    removed: int = 0
+    kept: int = 0
+    batches: int = 0
+    complete: bool = True
+    elapsed_seconds: float = 0.0
+    keys_by_source: Dict[str, int] = field(default_factory=dict)
+    bytes_by_source: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, source: str, size: int = 0) -> None:
+        self.keys_by_source[source] = self.keys_by_source.get(source, 0) + 1
+        self.bytes_by_source[source] = (
+            self.bytes_by_source.get(source, 0) + size
+        )
+
+
+class CacheMaintenance:
+    """Varredura SCAN com lotes em pipeline e orçamento de tempo."""
+
+    def __init__(
+        self,
+        redis: Redis,
+        scan_count: int = SCAN_COUNT,
+        time_budget: Optional[float] = MAINTENANCE_TIME_BUDGET,
+        pause: float = BATCH_PAUSE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.redis = redis
+        self.scan_count = scan_count
+        self.time_budget = time_budget
+        self.pause = pause
+        self._clock = clock
+
+    def _batches(
+        self,
+        match: str,
+        report: MaintenanceReport,
+        resume_key: Optional[str] = None,
+        bounded: bool = True,
+    ) -> Iterator[List[bytes]]:
+        """
+        Lotes de chaves do SCAN dentro do orçamento de tempo.
+
+        Com `resume_key`, começa do cursor salvo e, se o orçamento
+        acabar, salva o cursor atual (ao completar, o apaga).
+        `bounded=False` ignora o orçamento (varre até o fim).
+        """
+        budget = self.time_budget if bounded else None
+        started = self._clock()
+        cursor = 0
+        if resume_key:
+            saved = self.redis.get(resume_key)
+            cursor = int(saved) if saved else 0
+
+        try:
+            while True:
+                cursor, keys = self.redis.scan(
+                    cursor=cursor, match=match, count=self.scan_count
+                )
+                cursor = int(cursor)
+                if keys:
+                    report.batches += 1
+                    report.scanned += len(keys)
+                    yield keys
+                if cursor == 0:
+                    break
+                if budget is not None and self._clock() - started >= budget:
+                    report.complete = False
+                    break
+                if self.pause:
+                    time.sleep(self.pause)
+        finally:
+            report.elapsed_seconds = round(self._clock() - started, 3)
+
+        if resume_key:
+            if report.complete:
+                self.redis.delete(resume_key)
+            else:
+                self.redis.set(resume_key, cursor, ex=CURSOR_TTL)
+                logger.info(
+                    f"Manutenção parcial de {match}: orçamento de "
+                    f"{budget}s esgotado, continua no cursor {cursor}"
+                )
+
+    def cleanup(
+        self, match: str = "climate:*", min_ttl: int = 3600
+    ) -> MaintenanceReport:
+        """
+        Remove (UNLINK) chaves sem expiração ou com TTL < `min_ttl`.
+
+        Incremental: continua do cursor da execução anterior quando
+        ela parou por orçamento.
+        """
+        report = MaintenanceReport()
+        resume_key = f"{CURSOR_KEY_PREFIX}cleanup:{match}"
+        for keys in self._batches(match, report, resume_key):
+            with self.redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.ttl(key)
+                ttls = pipe.execute()
+
+            # -2: a chave expirou entre o SCAN e o TTL
+            expired = [
+                key for key, ttl in zip(keys, ttls) if -2 < ttl < min_ttl
+            ]
+            if expired:
+                self.redis.unlink(*expired)
+            report.removed += len(expired)
+            report.kept += sum(1 for ttl in ttls if ttl >= min_ttl)
+            for key in expired:
+                report.add(key_source(key))
+        return report
+
+    def stats(
+        self, match: str = "climate:*", memory: bool = True
+    ) -> MaintenanceReport:
+        """Chaves e bytes (MEMORY USAGE) por fonte."""
+        report = MaintenanceReport()
+        for keys in self._batches(match, report):
+            sizes = [0] * len(keys)
+            if memory:
+                with self.redis.pipeline(transaction=False) as pipe:
+                    for key in keys:
+                        pipe.memory_usage(key)
+                    sizes = [size or 0 for size in pipe.execute()]
+            for key, size in zip(keys, sizes):
+                report.add(key_source(key), size)
+        return report
+
+    def count(self, match: str) -> int:
+        """Número de chaves do padrão (sem orçamento de tempo)."""
+        report = MaintenanceReport()
+        for _ in self._batches(match, report, bounded=False):
+            pass
+        return report.scanned
+
+    def unlink_matching(self, match: str) -> int:
+        """UNLINK de todas as chaves do padrão, lote a lote."""
+        report = MaintenanceReport()
+        for keys in self._batches(match, report, bounded=False):
+            report.removed += self.redis.unlink(*keys)
+        return report.removed
@@ -20,6 +20,8 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from backend.infrastructure.cache.cache_maintenance import CacheMaintenance
+
 logger = logging.getLogger(__name__)
 
 
@@ -262,8 +264,9 @@ class SessionCache:
         if session_id:
             try:
                 pattern = f"{self.session_prefix}{session_id}:*"
-                keys = self.redis.keys(pattern)
-                stats["session_locations_cached"] = len(keys)
+                stats["session_locations_cached"] = CacheMaintenance(
+                    self.redis, pause=0
+                ).count(pattern)
             except Exception as e:
                 logger.warning(f"⚠️  Erro getting session size: {e}")
 
@@ -288,13 +291,9 @@ class SessionCache:
                 cache_key = self._make_cache_key(location_id)
                 removed = self.redis.delete(cache_key)
             else:
-                # Remover todas as chaves de cache
-                pattern = f"{self.cache_prefix}*"
-                keys = self.redis.keys(pattern)
-                if keys:
-                    removed = self.redis.delete(*keys)
-                else:
-                    removed = 0
+                # Remover todas as chaves de cache (SCAN + UNLINK por lote)
+                maintenance = CacheMaintenance(self.redis, pause=0)
+                removed = maintenance.unlink_matching(f"{self.cache_prefix}*")
 
             logger.info(f"🗑️  Cache limpo: {removed} chaves removidas")
             return removed
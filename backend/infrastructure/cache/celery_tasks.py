@@ -8,6 +8,7 @@ from backend.api.middleware.prometheus_metrics import (
     CELERY_TASK_DURATION,
     CELERY_TASKS_TOTAL,
 )
+from backend.infrastructure.cache.cache_maintenance import SCAN_COUNT
 
 # from config.settings import get_settings
 from config.settings.app_config import get_settings
@@ -25,9 +26,14 @@ async def cleanup_expired_data():
     start_time = time.time()
     try:
         redis_client = Redis.from_url(REDIS_URL)
-        expired_keys = await redis_client.keys("forecast:expired:*")
+        expired_keys = [
+            key
+            async for key in redis_client.scan_iter(
+                match="forecast:expired:*", count=SCAN_COUNT
+            )
+        ]
         if expired_keys:
-            await redis_client.delete(*expired_keys)
+            await redis_client.unlink(*expired_keys)
             logger.info(f"Removidas {len(expired_keys)} chaves expiradas")
 
         logger.info("Limpeza de dados expirados concluída com sucesso")
@@ -54,10 +60,22 @@ async def update_popular_ranking():
     start_time = time.time()
     try:
         redis_client = Redis.from_url(REDIS_URL)
-        keys = await redis_client.keys("acessos:*")
-        for key in keys:
-            acessos = int(await redis_client.get(key) or 0)
-            await redis_client.zadd("ranking_acessos", {key.decode(): acessos})
+        keys = [
+            key
+            async for key in redis_client.scan_iter(
+                match="acessos:*", count=SCAN_COUNT
+            )
+        ]
+        if keys:
+            # Um MGET + um ZADD em vez de GET/ZADD por chave
+            values = await redis_client.mget(keys)
+            await redis_client.zadd(
+                "ranking_acessos",
+                {
+                    key.decode(): int(value or 0)
+                    for key, value in zip(keys, values)
+                },
+            )
 
         top_keys = await redis_client.zrange(
             "ranking_acessos", 0, 9, desc=True
@@ -8,20 +8,77 @@ Features:
 - Chaves únicas por fonte + coordenadas + período
 - Async/await para alta performance
 - Graceful degradation se Redis indisponível
+- Payloads via cache_codecs: listas de modelos em colunas (zstd),
+  demais objetos (DataFrames) em pickle puro
+- Store diário (get_range): uma chave por dia, busca só os dias
+  faltantes e aproveita janelas sobrepostas (7/14/21/30 dias)
+- Requests idênticos em voo coalescidos (request_coalescer), no
+  processo e entre workers via lock Redis
 """
 
-import pickle
-from datetime import datetime
-from typing import Any
+import asyncio
+import json
+from datetime import date, datetime, time, timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Tuple
 
 from loguru import logger
 from redis.asyncio import Redis
 
+from backend.api.services.request_coalescer import coalesce
+from backend.infrastructure.cache.cache_codecs import (
+    CacheCodecError,
+    dumps,
+    loads,
+)
+from backend.core.utils.stage_timer import mark_cache
+
 # from config.settings import get_settings
 from config.settings.app_config import get_settings
 
 settings = get_settings()
 
+# Busca de um sub-período: (início, fim) -> {dia: registro}
+DayFetcher = Callable[[date, date], Awaitable[Dict[date, Any]]]
+# TTL (segundos) de um dia salvo, quando a fonte não segue a idade
+DayTTL = Callable[[date], int]
+
+
+def _as_date(value: date | datetime) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def missing_ranges(
+    start: date,
+    end: date,
+    present: Iterable[date],
+    merge_gap_days: int = 0,
+) -> List[Tuple[date, date]]:
+    """
+    Sub-períodos contíguos de [start, end] ausentes em `present`.
+
+    Buracos separados por até `merge_gap_days` dias já presentes são
+    unidos em um único sub-período (uma chamada à API em vez de duas).
+
+    Example:
+        1-10 jan com 3-7 jan em cache -> [(1, 2 jan), (8, 10 jan)]
+    """
+    present = set(present)
+    ranges: List[Tuple[date, date]] = []
+    day = start
+    while day <= end:
+        if day in present:
+            day += timedelta(days=1)
+            continue
+        run_start = day
+        while day <= end and day not in present:
+            day += timedelta(days=1)
+        run_end = day - timedelta(days=1)
+        if ranges and (run_start - ranges[-1][1]).days - 1 <= merge_gap_days:
+            ranges[-1] = (ranges[-1][0], run_end)
+        else:
+            ranges.append((run_start, run_end))
+    return ranges
+
 
 class ClimateCacheService:
     """
@@ -35,6 +92,9 @@ class ClimateCacheService:
 
     Chave do cache: {prefix}:{source}:{lat}:{lon}:{start}:{end}
     Exemplo: climate:nasa:48.86:2.35:20241001:20241008
+
+    Store diário: {prefix}:{source}:{lat}:{lon}:day:{YYYYMMDD}, cada
+    dia com o TTL da sua própria idade (get_range).
     """
 
     # TTL constants (em segundos)
@@ -42,6 +102,17 @@ class ClimateCacheService:
     TTL_RECENT = 86400  # 1 dia
     TTL_VERY_RECENT = 43200  # 12 horas
     TTL_FORECAST = 3600  # 1 hora
+    # Dia que a fonte ainda não tem (ex.: NASA POWER, hoje-1):
+    # evita buscá-lo de novo a cada request
+    TTL_EMPTY_DAY = 3600  # 1 hora
+
+    # Buracos de até N dias em cache são rebuscados junto com os
+    # vizinhos: uma chamada maior custa menos que duas
+    RANGE_MERGE_GAP_DAYS = 3
+
+    # Validade do lock de request em voo (e espera máxima de quem
+    # aguarda outro worker); cobre períodos longos em chunks
+    INFLIGHT_LOCK_TTL = 120  # segundos
 
     def __init__(self, prefix: str = "climate"):
         """
@@ -178,9 +249,18 @@ class ClimateCacheService:
                 except ImportError:
                     pass
 
-                return pickle.loads(data)
+                try:
+                    value = loads(data)
+                except CacheCodecError as e:
+                    # Formato/schema antigo: trata como MISS
+                    logger.warning(f"Cache inválido ignorado ({key}): {e}")
+                    mark_cache(False)
+                    return None
+                mark_cache(True)
+                return value
 
             logger.info(f"❌ Cache MISS: {key}")
+            mark_cache(False)
 
             # Incrementa métrica Prometheus
             try:
@@ -216,19 +296,21 @@ class ClimateCacheService:
             lon: Longitude
             start: Data inicial
             end: Data final
-            data: Dados a serem salvos (serão serializados com pickle)
+            data: Dados a serem salvos (serializados por cache_codecs)
 
         Returns:
             bool: True se salvou com sucesso, False caso contrário
         """
-        if not self.redis or not data:
+        # DataFrame não tem valor booleano; vazio = nada a salvar
+        empty = data.empty if hasattr(data, "empty") else not data
+        if not self.redis or empty:
             return False
 
         key = self._make_key(source, lat, lon, start, end)
         ttl = self._get_ttl(start)
 
         try:
-            serialized = pickle.dumps(data)
+            serialized = dumps(data)
             await self.redis.setex(key, ttl, serialized)
 
             ttl_hours = ttl / 3600
@@ -252,6 +334,231 @@ class ClimateCacheService:
             logger.error(f"Erro ao salvar cache: {e}")
             return False
 
+    def _make_day_key(
+        self, source: str, lat: float, lon: float, day: date
+    ) -> str:
+        """Chave de um dia do store diário."""
+        return (
+            f"{self.prefix}:{source}:{round(lat, 2)}:{round(lon, 2)}:"
+            f"day:{day.strftime('%Y%m%d')}"
+        )
+
+    def _make_meta_key(self, source: str, lat: float, lon: float) -> str:
+        """Chave dos metadados da localização (ex.: elevação)."""
+        return f"{self.prefix}:{source}:{round(lat, 2)}:{round(lon, 2)}:meta"
+
+    async def get_days(
+        self,
+        source: str,
+        lat: float,
+        lon: float,
+        start: date | datetime,
+        end: date | datetime,
+    ) -> Dict[date, Any]:
+        """
+        Busca os dias em cache do período (um único MGET).
+
+        Returns:
+            {dia: registro}; registro None = dia sem dados na fonte.
+            Dias ausentes do dict não estão em cache.
+        """
+        if not self.redis:
+            return {}
+
+        start, end = _as_date(start), _as_date(end)
+        days = [
+            start + timedelta(days=i) for i in range((end - start).days + 1)
+        ]
+        keys = [self._make_day_key(source, lat, lon, day) for day in days]
+
+        try:
+            values = await self.redis.mget(keys)
+        except Exception as e:
+            logger.error(f"Erro ao buscar dias em cache: {e}")
+            return {}
+
+        return {
+            day: json.loads(value)
+            for day, value in zip(days, values)
+            if value is not None
+        }
+
+    async def set_days(
+        self,
+        source: str,
+        lat: float,
+        lon: float,
+        records: Dict[date, Any],
+        day_ttl: DayTTL | None = None,
+    ) -> bool:
+        """
+        Salva registros diários, cada um com TTL pela idade do dia.
+
+        Args:
+            records: {dia: registro JSON-serializável}; None marca
+                dia sem dados na fonte (TTL_EMPTY_DAY)
+            day_ttl: TTL por dia no lugar do TTL pela idade (ex.:
+                forecast, em que dias futuros mudam a cada rodada)
+        """
+        if not self.redis or not records:
+            return False
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for day, record in records.items():
+                    if record is None:
+                        ttl = self.TTL_EMPTY_DAY
+                    elif day_ttl is not None:
+                        ttl = day_ttl(day)
+                    else:
+                        ttl = self._get_ttl(datetime.combine(day, time()))
+                    pipe.setex(
+                        self._make_day_key(source, lat, lon, day),
+                        ttl,
+                        json.dumps(record, separators=(",", ":")),
+                    )
+                await pipe.execute()
+            return True
+
+        except Exception as e:
+            logger.error(f"Erro ao salvar dias em cache: {e}")
+            return False
+
+    async def get_range(
+        self,
+        source: str,
+        lat: float,
+        lon: float,
+        start: date | datetime,
+        end: date | datetime,
+        fetch: DayFetcher,
+        day_ttl: DayTTL | None = None,
+    ) -> Dict[date, Any]:
+        """
+        Retorna o período completo buscando na fonte só o que falta.
+
+        Os dias em cache são lidos de uma vez; os sub-períodos
+        faltantes são buscados em paralelo com `fetch`, salvos (dias
+        sem retorno viram marcadores vazios de TTL curto) e unidos
+        ao resultado em ordem cronológica.
+
+        Chamadas concorrentes com a mesma chave (fonte, coordenadas,
+        período) compartilham uma única execução: no processo, os
+        demais aguardam o líder; em outros workers, esperam o lock
+        Redis do líder e leem os dias que ele salvou.
+
+        Args:
+            source: Nome da fonte (ex: 'nasa_power')
+            lat: Latitude
+            lon: Longitude
+            start: Data inicial
+            end: Data final
+            fetch: Coroutine (início, fim) -> {dia: registro}
+            day_ttl: TTL por dia dos registros novos (padrão: idade)
+
+        Returns:
+            {dia: registro} ordenado, só com dias que têm dados
+        """
+        start, end = _as_date(start), _as_date(end)
+        key = self._make_key(source, lat, lon, start, end)
+        result = await coalesce(
+            key,
+            lambda: self._get_range(
+                source, lat, lon, start, end, fetch, day_ttl
+            ),
+            redis=self.redis,
+            lock_ttl=self.INFLIGHT_LOCK_TTL,
+        )
+        # Cópia: o dict é compartilhado entre os chamadores coalescidos
+        return dict(result)
+
+    async def _get_range(
+        self,
+        source: str,
+        lat: float,
+        lon: float,
+        start: date,
+        end: date,
+        fetch: DayFetcher,
+        day_ttl: DayTTL | None = None,
+    ) -> Dict[date, Any]:
+        """Corpo de get_range (executado pelo líder da coalescência)."""
+        cached = await self.get_days(source, lat, lon, start, end)
+        missing = missing_ranges(
+            start, end, cached, merge_gap_days=self.RANGE_MERGE_GAP_DAYS
+        )
+        total_days = (end - start).days + 1
+        # Span da etapa (fetch): hit, miss ou partial
+        if cached:
+            mark_cache(True)
+
+        if missing:
+            mark_cache(False)
+            logger.info(
+                f"Cache parcial {source}: {len(cached)}/{total_days} dias, "
+                f"buscando {len(missing)} sub-período(s) {missing}"
+            )
+            fetched = await asyncio.gather(
+                *(
+                    fetch(range_start, range_end)
+                    for range_start, range_end in missing
+                )
+            )
+            new_records: Dict[date, Any] = {}
+            for (range_start, range_end), records in zip(missing, fetched):
+                for i in range((range_end - range_start).days + 1):
+                    day = range_start + timedelta(days=i)
+                    record = records.get(day)
+                    if record is None and cached.get(day) is not None:
+                        # Sobreposição de buracos unidos: mantém o cache
+                        continue
+                    new_records[day] = record
+            await self.set_days(source, lat, lon, new_records, day_ttl)
+            cached.update(new_records)
+        else:
+            logger.info(f"🎯 Cache HIT diário {source}: {total_days} dias")
+
+        return {
+            day: cached[day]
+            for day in sorted(cached)
+            if cached[day] is not None
+        }
+
+    async def get_meta(
+        self, source: str, lat: float, lon: float
+    ) -> Dict[str, Any] | None:
+        """Metadados da localização salvos por set_meta()."""
+        if not self.redis:
+            return None
+
+        try:
+            value = await self.redis.get(self._make_meta_key(source, lat, lon))
+            return json.loads(value) if value is not None else None
+        except Exception as e:
+            logger.error(f"Erro ao buscar metadados em cache: {e}")
+            return None
+
+    async def set_meta(
+        self, source: str, lat: float, lon: float, meta: Dict[str, Any]
+    ) -> bool:
+        """
+        Salva metadados da localização (TTL histórico, renovado a cada
+        busca, então dura ao menos tanto quanto os dias salvos).
+        """
+        if not self.redis:
+            return False
+
+        try:
+            await self.redis.setex(
+                self._make_meta_key(source, lat, lon),
+                self.TTL_HISTORICAL,
+                json.dumps(meta, separators=(",", ":"), default=str),
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Erro ao salvar metadados em cache: {e}")
+            return False
+
     async def delete(
         self,
         source: str,
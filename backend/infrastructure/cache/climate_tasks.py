@@ -12,12 +12,13 @@ Benefits:
 - Distribui carga ao longo do tempo
 """
 
-import asyncio
 from datetime import datetime, timedelta
 
 from celery import shared_task
 from loguru import logger
 
+from backend.api.services.async_bridge import run_coro_sync
+
 # Cidades mundiais mais populares (top 50)
 POPULAR_WORLD_CITIES = [
     {"name": "Paris", "lat": 48.8566, "lon": 2.3522, "country": "França"},
@@ -295,9 +296,8 @@ def prefetch_nasa_popular_cities(self):
         # Pre-fetch cada cidade
         for idx, city in enumerate(POPULAR_WORLD_CITIES, 1):
             try:
-                # Usa asyncio para chamar método async
-                loop = asyncio.get_event_loop()
-                data = loop.run_until_complete(
+                # Loop persistente do processo (pools HTTP reaproveitados)
+                data = run_coro_sync(
                     client.get_daily_data(
                         lat=city["lat"],
                         lon=city["lon"],
@@ -340,8 +340,8 @@ def prefetch_nasa_popular_cities(self):
         )
 
         # Fecha conexões
-        loop.run_until_complete(cache.close())
-        loop.run_until_complete(client.close())
+        run_coro_sync(cache.close())
+        run_coro_sync(client.close())
 
         return result
 
@@ -351,59 +351,75 @@ def prefetch_nasa_popular_cities(self):
         raise self.retry(exc=e, countdown=300)  # 5 minutos
 
 
+def _drop_expired_climate_partitions(retention_years: int) -> list:
+    """Remove partições de climate_data mais antigas que a retenção."""
+    if retention_years <= 0:
+        return []
+
+    from backend.database.data_storage import drop_climate_partitions_before
+
+    oldest_kept = datetime.now().year - retention_years + 1
+    try:
+        return drop_climate_partitions_before(oldest_kept)
+    except Exception as e:
+        logger.error(f"❌ Erro ao remover partições antigas: {e}")
+        return []
+
+
 @shared_task(name="climate.cleanup_old_cache")
 def cleanup_old_cache():
     """
     Remove entradas de cache expiradas antigas.
 
     Execução: Diariamente às 02:00 BRT via Celery Beat
-    Remove: Chaves com padrão 'climate:*' expiradas há mais de 7 dias
+    Remove: Chaves 'climate:*' sem expiração ou com TTL < 1 hora e,
+    com POSTGRES_CLIMATE_DATA_RETENTION_YEARS > 0, as partições
+    anuais de climate_data fora da retenção (DROP da partição inteira)
+
+    A varredura é incremental (SCAN) e limitada a
+    MAINTENANCE_TIME_BUDGET segundos; o que faltar fica para a
+    próxima execução.
 
     Returns:
         dict: Estatísticas de limpeza
     """
     try:
-        from redis.asyncio import Redis
+        from redis import Redis
 
+        from backend.infrastructure.cache.cache_maintenance import (
+            CacheMaintenance,
+        )
         from config.settings import get_settings
 
         settings = get_settings()
 
         logger.info("🧹 Iniciando limpeza de cache climático antigo")
 
-        loop = asyncio.get_event_loop()
         redis = Redis.from_url(
             settings.redis.redis_url, decode_responses=False
         )
-
-        # Busca todas as chaves 'climate:*'
-        keys = loop.run_until_complete(redis.keys("climate:*"))
-
-        removed_count = 0
-        kept_count = 0
-
-        for key in keys:
-            ttl = loop.run_until_complete(redis.ttl(key))
-
-            # Remove se TTL expirado (< 0) ou muito baixo (< 1 hora)
-            if ttl < 0 or ttl < 3600:
-                loop.run_until_complete(redis.delete(key))
-                removed_count += 1
-            else:
-                kept_count += 1
+        try:
+            report = CacheMaintenance(redis).cleanup("climate:*", min_ttl=3600)
+        finally:
+            redis.close()
 
         logger.info(
-            f"✅ Limpeza completa: {removed_count} removidas, "
-            f"{kept_count} mantidas"
+            f"✅ Limpeza {'completa' if report.complete else 'parcial'}: "
+            f"{report.removed} removidas, {report.kept} mantidas "
+            f"em {report.elapsed_seconds}s"
         )
 
-        loop.run_until_complete(redis.close())
-
         return {
             "status": "success",
-            "removed": removed_count,
-            "kept": kept_count,
-            "total_scanned": len(keys),
+            "removed": report.removed,
+            "kept": report.kept,
+            "total_scanned": report.scanned,
+            "complete": report.complete,
+            "removed_by_source": report.keys_by_source,
+            "elapsed_seconds": report.elapsed_seconds,
+            "dropped_partitions": _drop_expired_climate_partitions(
+                settings.database.CLIMATE_DATA_RETENTION_YEARS
+            ),
         }
 
     except Exception as e:
@@ -417,46 +433,54 @@ def generate_cache_stats():
     Gera estatísticas de uso do cache.
 
     Execução: A cada hora via Celery Beat
-    Métricas: Hit rate, dados populares, tamanho do cache
+    Métricas: Chaves e memória (MEMORY USAGE) por fonte
 
     Returns:
         dict: Estatísticas de cache
     """
     try:
-        from redis.asyncio import Redis
+        from redis import Redis
 
+        from backend.infrastructure.cache.cache_maintenance import (
+            CacheMaintenance,
+        )
         from config.settings import get_settings
 
         settings = get_settings()
-        loop = asyncio.get_event_loop()
         redis = Redis.from_url(
             settings.redis.redis_url, decode_responses=False
         )
-
-        # Conta chaves por fonte
-        sources = ["nasa", "met", "nws", "openmeteo"]
-        stats = {}
-
-        for source in sources:
-            keys = loop.run_until_complete(redis.keys(f"climate:{source}:*"))
-            stats[source] = {
-                "total_keys": len(keys),
-                "memory_mb": 0,
-            }  # TODO: calcular tamanho real
-
-        # Total geral
-        total_keys = loop.run_until_complete(redis.dbsize())
+        try:
+            report = CacheMaintenance(redis).stats("climate:*")
+            # Total geral
+            total_keys = redis.dbsize()
+        finally:
+            redis.close()
+
+        # Fontes conhecidas sempre presentes, mesmo sem chaves
+        sources = dict.fromkeys(["nasa", "met", "nws", "openmeteo"], 0)
+        sources.update(report.keys_by_source)
+        stats = {
+            source: {
+                "total_keys": count,
+                "memory_bytes": report.bytes_by_source.get(source, 0),
+                "memory_mb": round(
+                    report.bytes_by_source.get(source, 0) / 1024**2, 2
+                ),
+            }
+            for source, count in sources.items()
+        }
 
         result = {
             "timestamp": datetime.now().isoformat(),
             "sources": stats,
             "total_keys_db": total_keys,
+            "complete": report.complete,
+            "elapsed_seconds": report.elapsed_seconds,
         }
 
         logger.info(f"📊 Cache stats: {result}")
 
-        loop.run_until_complete(redis.close())
-
         return result
 
     except Exception as e:
@@ -737,10 +761,7 @@ def prefetch_openmeteo_forecast_popular_cities(self):
         )
 
         # Fecha cache
-        import asyncio
-
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(cache.close())
+        run_coro_sync(cache.close())
 
         return result
 
@@ -849,10 +870,7 @@ def prefetch_openmeteo_archive_popular_cities(self):
         )
 
         # Fecha cache
-        import asyncio
-
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(cache.close())
+        run_coro_sync(cache.close())
 
         return result
 
@@ -981,10 +999,7 @@ def prefetch_met_norway_nordic_cities(self):
         )
 
         # Fecha cache
-        import asyncio
-
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(cache.close())
+        run_coro_sync(cache.close())
 
         return result
 
@@ -3,18 +3,26 @@ Configuração do Celery para tarefas assíncronas do EVAonline.
 Centraliza todas as configurações do Celery para a aplicação.
 """
 
-import json
-from datetime import datetime
+import logging
+from functools import partial
 
 from celery import Celery
+from celery.exceptions import Ignore
 from celery.schedules import crontab
+from celery.signals import worker_process_init, worker_process_shutdown
 from kombu import Queue
-from redis import Redis
 
 from backend.api.middleware.prometheus_metrics import (
     CELERY_TASK_DURATION,
     CELERY_TASKS_TOTAL,
 )
+from backend.infrastructure.celery.progress import (
+    ProgressEmitter,
+    get_progress_redis,
+    progress_channel,
+    progress_message,
+    reset_progress_redis,
+)
 
 # from config.settings import get_settings
 from config.settings.app_config import (
@@ -41,28 +49,74 @@ celery_app = Celery(
 
 # Classe base para tarefas com monitoramento e progresso
 class MonitoredProgressTask(celery_app.Task):
-    def publish_progress(self, task_id, progress, status="PROGRESS"):
+    def publish_progress(self, task_id, progress, status="PROGRESS", **extra):
         """Publica progresso no canal Redis para WebSocket."""
         try:
-            # Usar broker_url configurado (compatibilidade)
-            redis_client = Redis.from_url(broker_url, decode_responses=True)
-            redis_client.publish(
-                f"task_status:{task_id}",
-                json.dumps(
-                    {
-                        "status": status,
-                        "info": progress,
-                        "timestamp": datetime.now().isoformat(),
-                    }
-                ),
+            # Pool do processo: sem conexão nova a cada mensagem
+            get_progress_redis(broker_url).publish(
+                progress_channel(task_id),
+                progress_message(status, progress, **extra),
             )
-            redis_client.close()
         except Exception as e:
             # Não bloqueia a task se falhar publicação de progresso
-            import logging
-
             logging.warning(f"Falha ao publicar progresso: {e}")
 
+    def update_state(self, task_id=None, state=None, meta=None, **kwargs):
+        """
+        Grava o estado no backend e o empurra para os WebSockets.
+
+        A gravação é síncrona (store_result não sobrescreve um estado
+        final já gravado); só a mensagem pub/sub é agrupada, no máximo
+        uma a cada PROGRESS_MIN_INTERVAL, valendo sempre a mais recente.
+        """
+        super().update_state(task_id=task_id, state=state, meta=meta, **kwargs)
+        task_id = task_id or self.request.id
+        if task_id:
+            progress_emitter.submit(
+                task_id,
+                partial(
+                    self.publish_progress, task_id, meta or {}, status=state
+                ),
+            )
+
+    def on_success(self, retval, task_id, args, kwargs):
+        """
+        Mensagem final: o WebSocket fecha ao recebê-la.
+
+        Sem o retval: ele já está no result backend (gravado antes do
+        on_success), de onde o WebSocket o lê.
+        """
+        progress_emitter.submit(
+            task_id,
+            partial(
+                self.publish_progress,
+                task_id,
+                {},
+                status="SUCCESS",
+                final=True,
+            ),
+            final=True,
+        )
+
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        """Falha definitiva (retries esgotados)."""
+        progress_emitter.submit(
+            task_id,
+            partial(
+                self.publish_progress,
+                task_id,
+                {},
+                status="FAILURE",
+                error=str(exc),
+                final=True,
+            ),
+            final=True,
+        )
+
+    def on_retry(self, exc, task_id, args, kwargs, einfo):
+        """Retry não tem mensagem final: descarta o progresso pendente."""
+        progress_emitter.discard(task_id)
+
     def __call__(self, *args, **kwargs):
         """Rastreia duração e status da tarefa para Prometheus."""
         import time
@@ -74,6 +128,14 @@ class MonitoredProgressTask(celery_app.Task):
                 task_name=self.name, status="SUCCESS"
             ).inc()
             return result
+        except Ignore:
+            # replace() e afins: o resultado final vem de outra task
+            CELERY_TASKS_TOTAL.labels(
+                task_name=self.name, status="IGNORED"
+            ).inc()
+            if self.request.id:
+                progress_emitter.discard(self.request.id)
+            raise
         except Exception:
             CELERY_TASKS_TOTAL.labels(
                 task_name=self.name, status="FAILURE"
@@ -85,9 +147,39 @@ class MonitoredProgressTask(celery_app.Task):
             )
 
 
+# Um emissor por processo; cada item é a escrita a executar no envio
+progress_emitter = ProgressEmitter(lambda task_id, write: write())
+
 # Definir classe base para todas as tarefas
 celery_app.Task = MonitoredProgressTask
 
+
+@worker_process_init.connect
+def _reset_http_pools(**kwargs):
+    """Processo filho não reaproveita conexões HTTP/Redis herdadas do pai."""
+    from backend.api.services.async_bridge import reset_bridge_loop
+    from backend.api.services.http_pool import reset_http_clients
+    from backend.infrastructure.cache.api_usage_tracker import (
+        reset_api_usage_clients,
+        usage_accumulator,
+    )
+
+    reset_bridge_loop()
+    reset_http_clients()
+    reset_progress_redis()
+    reset_api_usage_clients()
+    # Contagens herdadas do pai já são gravadas por ele
+    usage_accumulator.drain()
+
+
+@worker_process_shutdown.connect
+def _flush_api_usage(**kwargs):
+    """Grava as contagens de uso das APIs pendentes no processo."""
+    from backend.infrastructure.cache.api_usage_tracker import flush_api_usage
+
+    flush_api_usage()
+
+
 # Configurações principais
 celery_app.conf.update(
     # Serialização
@@ -102,6 +194,12 @@ celery_app.conf.update(
     task_routes={
         "backend.infrastructure.celery.tasks.eto_calculation."
         "calculate_eto_task": {"queue": "eto"},
+        "backend.infrastructure.celery.tasks.calculate_eto_batch*": {
+            "queue": "eto"
+        },
+        "backend.infrastructure.celery.tasks.merge_eto_batch_results": {
+            "queue": "eto"
+        },
         "backend.core.eto_calculation.*": {"queue": "eto_processing"},
         "backend.api.services.data_download.*": {"queue": "data_download"},
         "backend.api.services.openmeteo.*": {"queue": "elevation"},
@@ -0,0 +1,170 @@
+"""
+Emissão de progresso das tasks Celery para os WebSockets.
+
+Antes cada update_state abria uma conexão Redis nova (Redis.from_url),
+publicava uma mensagem e fechava — e o calculate_eto_task chama
+update_state a cada etapa. Aqui:
+
+- um único cliente Redis (ConnectionPool) por processo do worker,
+  recriado no worker_process_init (o filho não herda sockets do pai);
+- ProgressEmitter: agrupa atualizações rápidas da mesma task em no
+  máximo um envio a cada PROGRESS_MIN_INTERVAL segundos. A primeira
+  atualização sai na hora; as seguintes dentro da janela substituem
+  umas às outras e só a mais recente é enviada ao fim da janela.
+  Mensagens finais (SUCCESS/FAILURE) saem sempre na hora e descartam
+  o progresso pendente.
+
+Usage:
+    emitter = ProgressEmitter(send)
+    emitter.submit(task_id, item)              # agrupado
+    emitter.submit(task_id, item, final=True)  # imediato
+    emitter.discard(task_id)                   # encerra sem mensagem final
+"""
+
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from redis import ConnectionPool, Redis
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "task_status:"
+
+# Intervalo mínimo entre dois envios de progresso da mesma task
+PROGRESS_MIN_INTERVAL = 0.2
+
+# Conexões simultâneas do pool de publicação (por processo do worker)
+PROGRESS_POOL_MAX_CONNECTIONS = 8
+
+_client_lock = threading.Lock()
+_client: Optional[Redis] = None
+
+
+def get_progress_redis(redis_url: str) -> Redis:
+    """Cliente Redis do processo (pool criado na primeira chamada)."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = Redis(
+                    connection_pool=ConnectionPool.from_url(
+                        redis_url,
+                        max_connections=PROGRESS_POOL_MAX_CONNECTIONS,
+                        decode_responses=True,
+                    )
+                )
+    return _client
+
+
+def reset_progress_redis() -> None:
+    """Descarta o pool herdado (chamar no processo filho do worker)."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            # inuse_connections=False: não fecha sockets do processo pai
+            _client.connection_pool.disconnect(inuse_connections=False)
+        _client = None
+
+
+def progress_channel(task_id: str) -> str:
+    return f"{CHANNEL_PREFIX}{task_id}"
+
+
+def progress_message(status: str, info: Any, **extra) -> str:
+    """Mensagem JSON do canal task_status:{task_id}."""
+    return json.dumps(
+        {
+            "status": status,
+            "info": info,
+            "timestamp": datetime.now().isoformat(),
+            **extra,
+        },
+        default=str,
+    )
+
+
+class ProgressEmitter:
+    """Agrupa atualizações de progresso por task (leading + trailing)."""
+
+    def __init__(
+        self,
+        send: Callable[[str, Any], None],
+        min_interval: float = PROGRESS_MIN_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._send = send
+        self.min_interval = min_interval
+        self._clock = clock
+        # Envios acontecem sob o lock: um flush atrasado nunca passa
+        # na frente (nem por cima) de uma mensagem final
+        self._lock = threading.Lock()
+        self._last_sent: Dict[str, float] = {}
+        self._pending: Dict[str, Any] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        self.sent = 0
+        self.coalesced = 0
+
+    def submit(self, task_id: str, item: Any, final: bool = False) -> None:
+        """Envia `item` agora ou o agenda para o fim da janela da task."""
+        with self._lock:
+            if final:
+                self._cancel(task_id)
+                self._last_sent.pop(task_id, None)
+                self._emit(task_id, item)
+                return
+
+            now = self._clock()
+            last = self._last_sent.get(task_id)
+            if last is None or now - last >= self.min_interval:
+                self._cancel(task_id)
+                self._last_sent[task_id] = now
+                self._emit(task_id, item)
+                return
+
+            if task_id in self._pending:
+                self.coalesced += 1
+            self._pending[task_id] = item
+            if task_id not in self._timers:
+                timer = threading.Timer(
+                    last + self.min_interval - now,
+                    self.flush,
+                    args=(task_id,),
+                )
+                timer.daemon = True
+                self._timers[task_id] = timer
+                timer.start()
+
+    def flush(self, task_id: str) -> None:
+        """Envia a atualização pendente da task, se houver."""
+        with self._lock:
+            self._timers.pop(task_id, None)
+            if task_id not in self._pending:
+                return
+            item = self._pending.pop(task_id)
+            self._last_sent[task_id] = self._clock()
+            self._emit(task_id, item)
+
+    def discard(self, task_id: str) -> None:
+        """Esquece a task (sem envio final), descartando o pendente."""
+        with self._lock:
+            self._cancel(task_id)
+            self._last_sent.pop(task_id, None)
+
+    def _cancel(self, task_id: str) -> None:
+        timer = self._timers.pop(task_id, None)
+        if timer is not None:
+            timer.cancel()
+        if self._pending.pop(task_id, None) is not None:
+            self.coalesced += 1
+
+    def _emit(self, task_id: str, item: Any) -> None:
+        try:
+            self._send(task_id, item)
+            self.sent += 1
+        except Exception as e:
+            # Não bloqueia a task se falhar publicação de progresso
+            logger.warning(f"Falha ao publicar progresso: {e}")
@@ -3,13 +3,22 @@ Celery tasks para EVAonline.
 
 Tasks disponíveis:
 - eto_calculation: Cálculo ETo com progresso em tempo real
+- eto_batch: Cálculo ETo de muitos locais (chord por partes)
 - data_download: Download histórico + envio por email
 """
 
 from .eto_calculation import calculate_eto_task
+from .eto_batch import (
+    calculate_eto_batch,
+    calculate_eto_batch_chunk,
+    merge_eto_batch_results,
+)
 from .data_download import process_historical_download
 
 __all__ = [
     "calculate_eto_task",
+    "calculate_eto_batch",
+    "calculate_eto_batch_chunk",
+    "merge_eto_batch_results",
     "process_historical_download",
 ]
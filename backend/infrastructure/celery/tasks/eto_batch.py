@@ -0,0 +1,354 @@
+"""
+Tasks Celery para cálculo ETo de muitos locais (ex.: os 337 municípios
+do MATOPIBA) em um único pedido.
+
+Fluxo:
+- calculate_eto_batch: valida, e até BATCH_CHUNK_SIZE locais calcula
+  tudo no próprio worker; acima disso se substitui por um chord de
+  calculate_eto_batch_chunk + merge_eto_batch_results (o resultado
+  final continua no task_id original)
+- Em cada parte, os locais são agrupados por (fontes, período) e cada
+  grupo passa por EToProcessingService.process_locations: elevação em
+  lote, downloads concorrentes (limitados) e um único cálculo FAO-56
+- Progresso é do lote inteiro: um contador Redis somado por todas as
+  partes, publicado no canal task_status:{batch_id}
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, List, Tuple
+
+from celery import chord, shared_task
+from celery.utils.log import get_task_logger
+
+logger = get_task_logger(__name__)
+
+# Locais por subtask do chord (e limite para rodar sem fan-out)
+BATCH_CHUNK_SIZE = 50
+
+# Maior lote aceito por pedido
+MAX_BATCH_LOCATIONS = 1000
+
+# Validade do contador de progresso do lote (segundos)
+BATCH_PROGRESS_TTL = 86400
+
+
+def batch_progress_key(batch_id: str) -> str:
+    return f"eto_batch:{batch_id}:done"
+
+
+def group_locations(
+    locations: List[Dict[str, Any]],
+    start_date: str,
+    end_date: str,
+    sources: List[str] | None = None,
+    mode: str | None = None,
+) -> Dict[Tuple[Tuple[str, ...], str, str], List[Dict[str, Any]]]:
+    """
+    Agrupa os locais por (fontes, data inicial, data final).
+
+    Locais podem trazer o próprio "start_date"/"end_date"; sem
+    `sources`, as fontes de cada local vêm do ClimateSourceManager
+    (EUA, nórdicos e resto do mundo caem em grupos diferentes).
+    """
+    from backend.api.services.climate_source_manager import (
+        ClimateSourceManager,
+    )
+
+    manager = ClimateSourceManager()
+    groups: Dict[Tuple[Tuple[str, ...], str, str], List[Dict[str, Any]]] = (
+        defaultdict(list)
+    )
+    for location in locations:
+        start = location.get("start_date") or start_date
+        end = location.get("end_date") or end_date
+        selected = manager.get_sources_for_data_download(
+            lat=location["lat"],
+            lon=location["lon"],
+            start_date=datetime.strptime(start, "%Y-%m-%d"),
+            end_date=datetime.strptime(end, "%Y-%m-%d"),
+            mode=mode,
+            preferred_sources=sources,
+        )["sources"]
+        groups[(tuple(selected), start, end)].append(location)
+    return groups
+
+
+def _progress_reporter(
+    task, batch_id: str, total: int, shared: bool
+) -> Callable[[int], None]:
+    """
+    Callback de progresso do lote (chamado a cada local baixado).
+
+    Com `shared`, as partes do chord somam um contador Redis comum;
+    a publicação passa pelo progress_emitter (agrupada por batch_id).
+    """
+    from backend.infrastructure.celery.celery_config import (
+        broker_url,
+        progress_emitter,
+    )
+    from backend.infrastructure.celery.progress import get_progress_redis
+
+    key = batch_progress_key(batch_id)
+    local = 0
+
+    def advance(_: int) -> None:
+        nonlocal local
+        local += 1
+        done = local
+        if shared:
+            try:
+                with get_progress_redis(broker_url).pipeline() as pipe:
+                    pipe.incr(key)
+                    pipe.expire(key, BATCH_PROGRESS_TTL)
+                    done = pipe.execute()[0]
+            except Exception as e:
+                logger.warning(f"Contador do lote indisponível: {e}")
+        progress_emitter.submit(
+            batch_id,
+            partial(
+                task.publish_progress,
+                batch_id,
+                {
+                    "progress": 5 + int(90 * done / total),
+                    "step": "eto_processing",
+                    "message": f"{done}/{total} locais processados",
+                    "done": done,
+                    "total": total,
+                },
+            ),
+        )
+
+    return advance
+
+
+def _run_locations(
+    task,
+    locations: List[Dict[str, Any]],
+    start_date: str,
+    end_date: str,
+    sources: List[str] | None,
+    mode: str | None,
+    batch_id: str,
+    total: int,
+    shared: bool,
+) -> List[Dict[str, Any]]:
+    """Processa uma parte do lote, grupo a grupo."""
+    from backend.api.services.async_bridge import run_coro_sync
+    from backend.core.eto_calculation.eto_services import EToProcessingService
+
+    service = EToProcessingService()
+    on_progress = _progress_reporter(task, batch_id, total, shared)
+    results = []
+    groups = group_locations(locations, start_date, end_date, sources, mode)
+    for (group_sources, start, end), group in groups.items():
+        logger.info(
+            f"📦 Lote {batch_id}: {len(group)} locais, "
+            f"{start}..{end}, fontes {list(group_sources)}"
+        )
+        outputs = run_coro_sync(
+            service.process_locations(
+                group,
+                start,
+                end,
+                list(group_sources),
+                on_progress=on_progress,
+            )
+        )
+        for location, output in zip(group, outputs):
+            results.append(
+                {
+                    "index": location["index"],
+                    "id": location.get("id"),
+                    "lat": location["lat"],
+                    "lon": location["lon"],
+                    **output,
+                }
+            )
+    return results
+
+
+def _merge(
+    parts: List[List[Dict[str, Any]]], batch_id: str, chunks: int
+) -> Dict[str, Any]:
+    results = sorted(
+        (result for part in parts for result in part),
+        key=lambda result: result["index"],
+    )
+    failed = sum(1 for result in results if "error" in result)
+    return {
+        "batch_id": batch_id,
+        "total_locations": len(results),
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "chunks": chunks,
+        "results": results,
+    }
+
+
+@shared_task(
+    bind=True,
+    name="backend.infrastructure.celery.tasks.calculate_eto_batch",
+)
+def calculate_eto_batch(
+    self,
+    locations: List[Dict[str, Any]],
+    start_date: str,
+    end_date: str,
+    sources: List[str] | None = None,
+    mode: str | None = None,
+    chunk_size: int = BATCH_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """
+    Calcula ETo para uma lista de locais com progresso do lote.
+
+    Args:
+        self: Contexto Celery (bind=True)
+        locations: Dicts com "lat", "lon" e, opcionais, "id",
+            "elevation", "start_date", "end_date"
+        start_date, end_date: Período padrão (YYYY-MM-DD)
+        sources: Fontes climáticas (None = auto-select por local)
+        mode: Modo de operação (None = auto-detect)
+        chunk_size: Locais por subtask do chord
+
+    Returns:
+        Dict com um resultado por local (ordem de entrada):
+        {
+            "batch_id": "abc-123",
+            "total_locations": 337,
+            "succeeded": 335,
+            "failed": 2,
+            "chunks": 7,
+            "results": [{"index": 0, "id": ..., "lat": ..., **eto}, ...]
+        }
+
+    Raises:
+        ValueError: Se lote vazio ou acima de MAX_BATCH_LOCATIONS
+    """
+    batch_id = self.request.id
+    if not locations:
+        raise ValueError("Lote sem locais")
+    if len(locations) > MAX_BATCH_LOCATIONS:
+        raise ValueError(
+            f"Lote com {len(locations)} locais "
+            f"(máximo {MAX_BATCH_LOCATIONS})"
+        )
+
+    # Índice de entrada: o reducer reordena os resultados por ele
+    locations = [{**loc, "index": i} for i, loc in enumerate(locations)]
+    total = len(locations)
+
+    self.update_state(
+        state="PROGRESS",
+        meta={
+            "progress": 5,
+            "step": "batch_planning",
+            "message": f"Lote com {total} locais",
+            "done": 0,
+            "total": total,
+        },
+    )
+
+    if total > chunk_size:
+        chunks = [
+            locations[i : i + chunk_size] for i in range(0, total, chunk_size)
+        ]
+        logger.info(
+            f"📦 Lote {batch_id}: {total} locais em {len(chunks)} partes"
+        )
+        header = [
+            calculate_eto_batch_chunk.s(
+                chunk, start_date, end_date, sources, mode, batch_id, total
+            )
+            for chunk in chunks
+        ]
+        # O callback herda o task_id do lote: quem acompanha o
+        # batch_id recebe o resultado mesclado
+        return self.replace(
+            chord(header, merge_eto_batch_results.s(batch_id, len(chunks)))
+        )
+
+    start_time = datetime.now()
+    results = _run_locations(
+        self,
+        locations,
+        start_date,
+        end_date,
+        sources,
+        mode,
+        batch_id,
+        total,
+        shared=False,
+    )
+    merged = _merge([results], batch_id, chunks=1)
+    merged["processing_time_seconds"] = round(
+        (datetime.now() - start_time).total_seconds(), 2
+    )
+    logger.info(
+        f"✅ Lote {batch_id}: {merged['succeeded']}/{total} locais "
+        f"em {merged['processing_time_seconds']}s"
+    )
+    return merged
+
+
+@shared_task(
+    bind=True,
+    name="backend.infrastructure.celery.tasks.calculate_eto_batch_chunk",
+)
+def calculate_eto_batch_chunk(
+    self,
+    locations: List[Dict[str, Any]],
+    start_date: str,
+    end_date: str,
+    sources: List[str] | None,
+    mode: str | None,
+    batch_id: str,
+    total: int,
+) -> List[Dict[str, Any]]:
+    """Uma parte do chord de calculate_eto_batch."""
+    from backend.infrastructure.celery.celery_config import progress_emitter
+
+    try:
+        return _run_locations(
+            self,
+            locations,
+            start_date,
+            end_date,
+            sources,
+            mode,
+            batch_id,
+            total,
+            shared=True,
+        )
+    finally:
+        # A mensagem final é do merge: a parte só envia o pendente e
+        # libera a janela do batch_id neste processo
+        progress_emitter.flush(batch_id)
+        progress_emitter.discard(batch_id)
+
+
+@shared_task(
+    bind=True,
+    name="backend.infrastructure.celery.tasks.merge_eto_batch_results",
+)
+def merge_eto_batch_results(
+    self,
+    parts: List[List[Dict[str, Any]]],
+    batch_id: str,
+    chunks: int,
+) -> Dict[str, Any]:
+    """Reducer do chord: junta as partes na ordem de entrada."""
+    from backend.infrastructure.celery.celery_config import broker_url
+    from backend.infrastructure.celery.progress import get_progress_redis
+
+    merged = _merge(parts, batch_id, chunks)
+    try:
+        get_progress_redis(broker_url).delete(batch_progress_key(batch_id))
+    except Exception as e:
+        logger.warning(f"Falha ao remover contador do lote: {e}")
+    logger.info(
+        f"✅ Lote {batch_id}: {merged['succeeded']}/"
+        f"{merged['total_locations']} locais em {chunks} partes"
+    )
+    return merged
@@ -33,6 +33,7 @@ def calculate_eto_task(
     sources: list[str] | None = None,
     elevation: float | None = None,
     mode: str | None = None,
+    include_timings: bool = False,
 ) -> dict[str, Any]:
     """
     Calcula ETo para localização com progresso em tempo real.
@@ -44,6 +45,8 @@ def calculate_eto_task(
         sources: Fontes climáticas (None = auto-select)
         elevation: Elevação em metros (None = buscar via OpenTopo)
         mode: Modo de operação (None = auto-detect)
+        include_timings: Incluir o bloco "timings" (segundos por etapa
+            do pipeline) no resultado
 
     Returns:
         Dict com resultado completo:
@@ -53,16 +56,16 @@ def calculate_eto_task(
             "quality_metrics": {...},
             "sources_used": [...],
             "task_id": "abc-123",
-            "processing_time_seconds": 12.5
+            "processing_time_seconds": 12.5,
+            "timings": {...}  # só com include_timings
         }
 
     Raises:
         ValidationError: Se parâmetros inválidos
         APIError: Se todas as fontes falharem
     """
-    import asyncio
+    from backend.api.services.async_bridge import run_coro_sync
     from backend.core.eto_calculation.eto_services import EToProcessingService
-    from backend.database.connection import get_db
     from backend.api.services.climate_validation import (
         ClimateValidationService,
     )
@@ -156,8 +159,7 @@ def calculate_eto_task(
         )
 
         # Inicializar serviço de processamento
-        db = next(get_db())
-        service = EToProcessingService(db_session=db)
+        service = EToProcessingService()
 
         # ========== STEP 4: CÁLCULO ETo (60-90%) ==========
         self.update_state(
@@ -169,18 +171,20 @@ def calculate_eto_task(
             },
         )
 
-        # O process_location_with_sources já faz download +
-        # processamento completo
-        result = asyncio.run(
-            service.process_location_with_sources(
+        # O process_location já faz download + processamento completo
+        result = run_coro_sync(
+            service.process_location(
                 latitude=lat,
                 longitude=lon,
                 start_date=start_date,
                 end_date=end_date,
                 sources=selected_sources,
                 elevation=elevation,
+                include_timings=include_timings,
             )
         )
+        if "error" in result:
+            raise RuntimeError(result["error"])
 
         # ========== STEP 5: FINALIZAÇÃO (90-100%) ==========
         self.update_state(
@@ -195,7 +199,7 @@ def calculate_eto_task(
         processing_time = (datetime.now() - start_time).total_seconds()
 
         final_result = {
-            **result["data"],  # Usar apenas os dados do resultado
+            **result,
             "task_id": task_id,
             "processing_time_seconds": round(processing_time, 2),
             "sources_used": selected_sources,
@@ -2,7 +2,9 @@
 Tarefa Celery para sincronização periódica de dados de visitantes.
 
 Esta tarefa garante que os dados de contagem de visitantes sejam
-persistidos do Redis para PostgreSQL regularmente.
+persistidos do Redis para PostgreSQL regularmente: os buckets horários
+(page views + HyperLogLog de únicos) viram linhas de
+visitor_hourly_stats em um único upsert.
 """
 
 import logging
@@ -53,7 +55,8 @@ def sync_visitor_data() -> Dict[str, Any]:
             return result
 
         logger.info(
-            f"✅ Sincronização concluída: {result['total_visitors']} visitantes"
+            f"✅ Sincronização concluída: {result['total_visitors']} "
+            f"visitantes, {result['hours_synced']} horas consolidadas"
         )
         return result
 
@@ -1,9 +1,11 @@
-import asyncio
 from datetime import datetime
 
 import redis
 from sqlalchemy.orm import Session
 
+from backend.core.analytics.visitor_counter_service import (
+    VisitorCounterService,
+)
 from backend.database.connection import get_db
 from backend.database.models import VisitorStats
 
@@ -13,17 +15,16 @@ class VisitorTracker:
     Rastreia visitantes com garantia de persistência.
 
     Estratégia:
-    1. Redis: contagem rápida e em tempo real
+    1. Redis: contagem rápida e em tempo real (um pipeline por visita,
+       únicos em HyperLogLog - ver VisitorCounterService)
     2. PostgreSQL: persistência permanente
-    3. Sincronização: a cada 1h ou 100 visitantes
+    3. Sincronização: task periódica sync_visitor_data (fora do request)
     """
 
     def __init__(self, redis_client: redis.Redis):
         self.redis = redis_client
-        self.redis_key = "visitors:total"
-        self.redis_temp_key = "visitors:session"
-        self.sync_threshold = 100  # Sincronizar a cada 100 visitas
-        self.sync_interval = 3600  # Ou a cada 1 hora
+        self.counter = VisitorCounterService(redis_client, None)
+        self.redis_key = self.counter.REDIS_KEY_VISITORS
 
     async def increment_visitor(self, session_id: str = None) -> int:
         """
@@ -32,40 +33,20 @@ class VisitorTracker:
         Strategy:
         1. Redis: increment fast (no disk I/O)
         2. Return current count
-        3. Background: persist periodically
+        3. Background: persist periodically (Celery Beat)
         """
-        # Incrementar no Redis
-        current_count = self.redis.incr(self.redis_key)
+        result = self.counter.increment_visitor(session_id)
+        return result.get("total_visitors", 0)
 
-        # Adicionar session a set (para analytics)
-        if session_id:
-            self.redis.sadd(self.redis_temp_key, session_id)
-
-        # Se atingir threshold, sincronizar com DB
-        if current_count % self.sync_threshold == 0:
-            asyncio.create_task(self._sync_to_database(current_count))
-
-        return current_count
-
-    async def _sync_to_database(self, count: int, db: Session = None):
+    async def _sync_to_database(self, db: Session = None):
         """Sincroniza contagem Redis → PostgreSQL"""
         if db is None:
             db = next(get_db())
-
-        try:
-            stats = db.query(VisitorStats).first()
-            if stats:
-                stats.total_visitors = count
-                stats.last_sync = datetime.utcnow()
-            else:
-                stats = VisitorStats(total_visitors=count, last_sync=datetime.utcnow())
-                db.add(stats)
-
-            db.commit()
-            print(f"✅ Visitantes sincronizados: {count}")
-        except Exception as e:
-            print(f"❌ Erro sincronização: {e}")
-            db.rollback()
+        result = VisitorCounterService(self.redis, db).sync_to_database()
+        if "error" in result:
+            print(f"❌ Erro sincronização: {result['error']}")
+        else:
+            print(f"✅ Visitantes sincronizados: {result['total_visitors']}")
 
     async def get_total_visitors(self) -> int:
         """
@@ -85,5 +66,5 @@ class VisitorTracker:
         return redis_count
 
     def get_unique_sessions_today(self) -> int:
-        """Retorna sessions únicas hoje"""
-        return self.redis.scard(self.redis_temp_key)
+        """Retorna sessions únicas hoje (estimativa HyperLogLog)"""
+        return self.redis.pfcount(self.counter._day_key(datetime.utcnow()))
@@ -1,6 +1,7 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from prometheus_fastapi_instrumentator import Instrumentator
 
 from backend.api.routes import api_router
 from backend.api.websocket.websocket_service import router as websocket_router
@@ -17,9 +18,30 @@ logger = get_logger()
 settings = get_legacy_settings()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup/shutdown da aplicação."""
+    yield
+    # Fecha os pools HTTP compartilhados dos clientes climáticos
+    from backend.api.services.http_pool import close_http_clients
+
+    await close_http_clients()
+
+    # Encerra o assinante Redis de progresso dos WebSockets
+    from backend.api.websocket.progress_hub import progress_hub
+
+    await progress_hub.close()
+
+    # Fecha o pool assíncrono do PostgreSQL
+    from backend.database.connection import async_engine
+
+    await async_engine.dispose()
+
+
 def create_application() -> FastAPI:
     app = FastAPI(
         title="EVAonline",
+        lifespan=lifespan,
         version="1.0.0",
         openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
         docs_url=f"{settings.API_V1_PREFIX}/docs",
@@ -35,8 +57,11 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Adicionar middleware Prometheus
-    from backend.api.middleware.prometheus import PrometheusMiddleware
+    # Adicionar middleware Prometheus (única camada de métricas HTTP)
+    from backend.api.middleware.prometheus import (
+        PrometheusMiddleware,
+        metrics_endpoint,
+    )
 
     app.add_middleware(PrometheusMiddleware)
 
@@ -44,8 +69,8 @@ def create_application() -> FastAPI:
     app.include_router(api_router, prefix=settings.API_V1_PREFIX)
     app.include_router(websocket_router)
 
-    # Configurar métricas Prometheus
-    Instrumentator().instrument(app).expose(app, endpoint="/metrics")
+    # Expor métricas Prometheus
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
 
     # Servir arquivos estáticos do frontend
     from fastapi.staticfiles import StaticFiles
@@ -3,6 +3,7 @@ Fixtures compartilhadas para todos os testes do EVAonline
 """
 
 import asyncio
+import contextlib
 import os
 from typing import AsyncGenerator, Generator
 from unittest.mock import MagicMock
@@ -256,4 +257,6 @@ def cleanup_after_test():
     """Limpa recursos após cada teste"""
     yield
     # Cleanup code aqui se necessário
-    asyncio.get_event_loop().run_until_complete(asyncio.sleep(0))
+    # Sem loop corrente ou loop já fechado (testes async): ignora
+    with contextlib.suppress(RuntimeError):
+        asyncio.get_event_loop().run_until_complete(asyncio.sleep(0))
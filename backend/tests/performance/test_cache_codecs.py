@@ -0,0 +1,145 @@
+"""
+Performance Tests - Cache Codecs
+
+Tests: Benchmark de tamanho do payload e latência de get/set
+(cache_codecs vs pickle puro). DataFrames ficam no pickle: um codec
+colunar medido aqui era 6-13x mais lento no get/set
+"""
+
+import asyncio
+import pickle
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from loguru import logger
+
+from backend.api.services.nasa_power.nasa_power_client import NASAPowerData
+from backend.infrastructure.cache import cache_codecs, climate_cache
+from backend.infrastructure.cache.climate_cache import ClimateCacheService
+
+ROUNDS = 20
+
+
+class _MemoryRedis:
+    """Redis assíncrono em memória (sem rede)."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+
+def _daily_frame(years: int) -> pd.DataFrame:
+    index = pd.date_range("1991-01-01", periods=365 * years, freq="D")
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        rng.normal(20, 5, (len(index), 8)).round(2),
+        index=index,
+        columns=[
+            "T2M_MAX",
+            "T2M_MIN",
+            "T2M",
+            "RH2M",
+            "WS2M",
+            "ALLSKY_SFC_SW_DWN",
+            "PRECTOTCORR",
+            "ETo",
+        ],
+    )
+
+
+def _nasa_records(days: int):
+    rng = np.random.default_rng(0)
+    return [
+        NASAPowerData(
+            date=day.strftime("%Y-%m-%d"),
+            temp_max=round(float(rng.normal(30, 3)), 2),
+            temp_min=round(float(rng.normal(18, 3)), 2),
+            temp_mean=round(float(rng.normal(24, 3)), 2),
+            humidity=round(float(rng.uniform(40, 90)), 2),
+            wind_speed=round(float(rng.uniform(0, 6)), 2),
+            solar_radiation=round(float(rng.uniform(10, 30)), 2),
+            precipitation=None if i % 7 else 0.0,
+        )
+        for i, day in enumerate(pd.date_range("2015-01-01", periods=days))
+    ]
+
+
+def _measure(cache: ClimateCacheService, data):
+    start, end = datetime(1991, 1, 1), datetime(2020, 12, 31)
+
+    async def scenario():
+        set_time = get_time = 0.0
+        for _ in range(ROUNDS):
+            t0 = time.perf_counter()
+            await cache.set("bench", -22.7, -47.6, start, end, data)
+            t1 = time.perf_counter()
+            result = await cache.get("bench", -22.7, -47.6, start, end)
+            t2 = time.perf_counter()
+            set_time += t1 - t0
+            get_time += t2 - t1
+        size = len(next(iter(cache.redis.data.values())))
+        return size, set_time / ROUNDS, get_time / ROUNDS, result
+
+    return asyncio.run(scenario())
+
+
+@pytest.fixture
+def cache_service(monkeypatch):
+    # Logs de HIT/SAVE por chamada distorcem a medição
+    monkeypatch.setattr(climate_cache, "logger", _SilentLogger())
+    cache = ClimateCacheService(prefix="bench")
+    cache.redis = _MemoryRedis()
+    return cache
+
+
+class _SilentLogger:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+@pytest.mark.performance
+class TestCacheCodecBenchmark:
+    """Compara cache_codecs com o pickle de objetos inteiros."""
+
+    @pytest.mark.parametrize(
+        "label, data, columnar",
+        [
+            ("DataFrame 30 anos", _daily_frame(30), False),
+            ("NASAPowerData x 3650", _nasa_records(3650), True),
+        ],
+    )
+    def test_payload_size_and_latency(
+        self, cache_service, monkeypatch, label, data, columnar
+    ):
+        size, set_s, get_s, result = _measure(cache_service, data)
+        (payload,) = cache_service.redis.data.values()
+
+        cache_service.redis = _MemoryRedis()
+        monkeypatch.setattr(climate_cache, "dumps", pickle.dumps)
+        monkeypatch.setattr(climate_cache, "loads", pickle.loads)
+        p_size, p_set_s, p_get_s, p_result = _measure(cache_service, data)
+
+        logger.info(
+            f"\n{label}"
+            f"\n  codec:  {size / 1024:8.1f} KiB  set {set_s * 1e3:6.2f} ms"
+            f"  get {get_s * 1e3:6.2f} ms"
+            f"\n  pickle: {p_size / 1024:8.1f} KiB"
+            f"  set {p_set_s * 1e3:6.2f} ms  get {p_get_s * 1e3:6.2f} ms"
+        )
+        if isinstance(data, pd.DataFrame):
+            pd.testing.assert_frame_equal(result, p_result)
+        else:
+            assert result == p_result
+        if columnar:
+            assert size < p_size / 2
+        else:
+            # Sem codec colunar: o mesmo pickle puro de antes
+            assert not payload.startswith(cache_codecs.MAGIC)
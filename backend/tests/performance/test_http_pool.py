@@ -0,0 +1,128 @@
+"""
+Performance Tests - Shared HTTP Pool
+
+Tests: Benchmark de reuso de conexões (cliente por request vs pool)
+"""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from loguru import logger
+
+from backend.api.services import http_pool
+
+REQUESTS = 100
+CONCURRENCY = 10
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Servidor HTTP/1.1 local que conta conexões TCP aceitas."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+async def _run(fetch, url):
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one():
+        async with semaphore:
+            return await fetch(url)
+
+    started = time.perf_counter()
+    responses = await asyncio.gather(*(one() for _ in range(REQUESTS)))
+    assert all(r.status_code == 200 for r in responses)
+    return time.perf_counter() - started
+
+
+@pytest.mark.performance
+class TestHTTPPoolReuse:
+    """Compara conexões abertas com e sem o pool compartilhado."""
+
+    def test_connection_reuse_rate(self, local_server):
+        host, port = local_server.server_address
+        url = f"http://{host}:{port}/"
+
+        async def per_request_client(url):
+            # Comportamento antigo: cliente novo por chamada
+            async with httpx.AsyncClient() as client:
+                return await client.get(url)
+
+        async def pooled_client(url):
+            return await http_pool.get_http_client("bench").get(url)
+
+        async def scenario():
+            local_server.connections = 0
+            per_request = await _run(per_request_client, url)
+            per_request_conns = local_server.connections
+
+            local_server.connections = 0
+            pooled = await _run(pooled_client, url)
+            pooled_conns = local_server.connections
+            stats = http_pool.http_pool_stats()["bench"]
+            await http_pool.close_http_clients()
+            return per_request, per_request_conns, pooled, pooled_conns, stats
+
+        per_request, per_request_conns, pooled, pooled_conns, stats = (
+            asyncio.run(scenario())
+        )
+
+        logger.info(
+            f"\nper-request client: {REQUESTS} requests, "
+            f"{per_request_conns} connections, {per_request:.3f}s"
+            f"\npooled client:      {REQUESTS} requests, "
+            f"{pooled_conns} connections, {pooled:.3f}s, "
+            f"reuse rate {stats['reuse_rate']:.1%}"
+        )
+        assert per_request_conns == REQUESTS
+        assert pooled_conns <= CONCURRENCY
+        assert stats["requests"] == REQUESTS
+        assert stats["connections_opened"] == pooled_conns
+        assert stats["reuse_rate"] >= 1 - CONCURRENCY / REQUESTS
+
+    def test_pools_are_scoped_to_the_event_loop(self):
+        async def get():
+            return http_pool.get_http_client("bench")
+
+        async def same_loop():
+            return await get() is await get()
+
+        assert asyncio.run(same_loop())
+        first = asyncio.run(get())
+        second = asyncio.run(get())
+
+        # Loops encerrados são descartados; cada loop tem seu cliente
+        assert first is not second
+        assert len(http_pool._registry) == 1
+        http_pool.reset_http_clients()
@@ -0,0 +1,135 @@
+"""
+Performance Tests - Metrics middleware
+
+Tests: Custo por request da instrumentação HTTP (stack antigo:
+BaseHTTPMiddleware + prometheus_fastapi_instrumentator, vs middleware
+ASGI puro) e número de séries criadas por caminhos com IDs.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from loguru import logger
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+from prometheus_fastapi_instrumentator import Instrumentator
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from backend.api.middleware.prometheus import PrometheusMiddleware
+
+REQUESTS = 2000
+
+
+def _legacy_stack(registry):
+    """Stack anterior: label pelo caminho cru + instrumentator."""
+    requests = Counter(
+        "api_requests_total",
+        "Total API requests",
+        ["method", "endpoint", "status_code"],
+        registry=registry,
+    )
+    duration = Histogram(
+        "api_request_duration_seconds",
+        "API request duration in seconds",
+        ["method", "endpoint"],
+        registry=registry,
+    )
+    active = Gauge(
+        "api_active_requests",
+        "Number of currently active requests",
+        ["method", "endpoint"],
+        registry=registry,
+    )
+
+    class LegacyMiddleware(BaseHTTPMiddleware):
+        async def dispatch(self, request: Request, call_next):
+            method, path = request.method, request.url.path
+            active.labels(method=method, endpoint=path).inc()
+            start = time.time()
+            try:
+                response = await call_next(request)
+                requests.labels(
+                    method=method,
+                    endpoint=path,
+                    status_code=response.status_code,
+                ).inc()
+                duration.labels(method=method, endpoint=path).observe(
+                    time.time() - start
+                )
+                return response
+            finally:
+                active.labels(method=method, endpoint=path).dec()
+
+    app = _app()
+    app.add_middleware(LegacyMiddleware)
+    Instrumentator(registry=registry).instrument(app)
+    return app, requests
+
+
+def _app():
+    app = FastAPI()
+
+    @app.get("/visitor/{visitor_id}")
+    async def visitor(visitor_id: str):
+        return {"visitor_id": visitor_id}
+
+    return app
+
+
+async def _per_request_us(app):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        for i in range(50):  # aquecimento
+            await client.get(f"/visitor/warm-{i}")
+        started = time.perf_counter()
+        for i in range(REQUESTS):
+            response = await client.get(f"/visitor/{i}")
+            assert response.status_code == 200
+        return (time.perf_counter() - started) / REQUESTS * 1e6
+
+
+def _series(counter, method="GET"):
+    return sum(
+        1
+        for metric in counter.collect()
+        for sample in metric.samples
+        if sample.name.endswith("_total")
+        and sample.labels.get("method") == method
+    )
+
+
+@pytest.mark.performance
+class TestMetricsMiddlewareOverhead:
+    """Compara o stack antigo com o middleware ASGI puro."""
+
+    def test_per_request_cost_and_series(self):
+        from backend.api.middleware.prometheus_metrics import API_REQUESTS
+
+        bare = asyncio.run(_per_request_us(_app()))
+
+        legacy_app, legacy_requests = _legacy_stack(CollectorRegistry())
+        legacy = asyncio.run(_per_request_us(legacy_app))
+
+        asgi_app = _app()
+        asgi_app.add_middleware(PrometheusMiddleware)
+        series_before = _series(API_REQUESTS)
+        asgi = asyncio.run(_per_request_us(asgi_app))
+        asgi_series = _series(API_REQUESTS) - series_before
+
+        logger.info(
+            f"\n{REQUESTS} requests, custo por request:"
+            f"\nsem instrumentação:          {bare:8.1f} µs"
+            f"\nBaseHTTPMiddleware + instr.: {legacy:8.1f} µs "
+            f"(+{legacy - bare:.1f} µs, "
+            f"{_series(legacy_requests)} séries)"
+            f"\nASGI puro:                   {asgi:8.1f} µs "
+            f"(+{asgi - bare:.1f} µs, {asgi_series} séries novas)"
+        )
+        # Um ID por request criava uma série por request
+        assert _series(legacy_requests) >= REQUESTS
+        assert asgi_series <= 1
+        assert asgi < legacy
@@ -0,0 +1,80 @@
+"""
+Unit Tests - Async bridge
+
+Testa o event loop persistente usado pelos sync adapters.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from backend.api.services import async_bridge
+from backend.api.services.async_bridge import (
+    get_bridge_loop,
+    reset_bridge_loop,
+    run_coro_sync,
+    shutdown_bridge_loop,
+)
+
+
+async def _current_loop():
+    return asyncio.get_running_loop()
+
+
+@pytest.fixture(autouse=True)
+def fresh_bridge():
+    shutdown_bridge_loop()
+    yield
+    shutdown_bridge_loop()
+
+
+@pytest.mark.unit
+class TestAsyncBridge:
+    """Um loop por processo, reaproveitado entre chamadas."""
+
+    def test_loop_persists_across_calls(self):
+        first = run_coro_sync(_current_loop())
+        second = run_coro_sync(_current_loop())
+
+        assert first is second is get_bridge_loop()
+        assert async_bridge._thread.name == "async-bridge"
+
+    def test_call_from_thread_with_running_loop(self):
+        async def caller():
+            return run_coro_sync(_current_loop())
+
+        loop = asyncio.run(caller())
+
+        assert loop is get_bridge_loop()
+
+    def test_call_inside_bridge_loop_raises(self):
+        async def nested():
+            return run_coro_sync(_current_loop())
+
+        with pytest.raises(RuntimeError):
+            run_coro_sync(nested())
+
+    def test_timeout_cancels_coroutine(self):
+        cancelled = threading.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            run_coro_sync(slow(), timeout=0.05)
+
+        assert cancelled.wait(1)
+
+    def test_reset_starts_new_loop(self):
+        first = run_coro_sync(_current_loop())
+
+        reset_bridge_loop()
+        second = run_coro_sync(_current_loop())
+
+        assert first is not second
+        first.call_soon_threadsafe(first.stop)
@@ -97,3 +97,146 @@ class TestPrometheusMiddleware:
 
         # Deve ter labels com method
         assert 'method="GET"' in metrics or "method='GET'" in metrics
+
+
+@pytest.mark.unit
+class TestPrometheusRouteLabels:
+    """Labels pelo template da rota, tamanhos e requisições ativas."""
+
+    @staticmethod
+    def _client():
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from backend.api.middleware.prometheus import PrometheusMiddleware
+
+        app = FastAPI()
+        app.add_middleware(PrometheusMiddleware)
+
+        @app.post("/bench/items/{item_id}")
+        async def echo(item_id: str, payload: dict):
+            return {"id": item_id, **payload}
+
+        return TestClient(app)
+
+    @staticmethod
+    def _sample(name, **labels):
+        from prometheus_client import REGISTRY
+
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    def test_labels_use_route_template(self):
+        labels = {"method": "POST", "endpoint": "/bench/items/{item_id}"}
+        before = self._sample(
+            "api_requests_total", status_code="200", **labels
+        )
+
+        client = self._client()
+        for item_id in ("a", "b", "c"):
+            client.post(f"/bench/items/{item_id}", json={"x": 1})
+
+        assert (
+            self._sample("api_requests_total", status_code="200", **labels)
+            == before + 3
+        )
+        assert not self._sample(
+            "api_requests_total",
+            method="POST",
+            endpoint="/bench/items/a",
+            status_code="200",
+        )
+
+    def test_unmatched_paths_share_one_series(self):
+        from backend.api.middleware.prometheus import UNMATCHED_ENDPOINT
+
+        labels = {
+            "method": "GET",
+            "endpoint": UNMATCHED_ENDPOINT,
+            "status_code": "404",
+        }
+        before = self._sample("api_requests_total", **labels)
+
+        client = self._client()
+        client.get("/nope/1")
+        client.get("/nope/2")
+
+        assert self._sample("api_requests_total", **labels) == before + 2
+
+    def test_starlette_routes_and_mounts_are_labelled(self):
+        from starlette.routing import Mount, Route, Router
+        from starlette.staticfiles import StaticFiles
+
+        from backend.api.middleware.prometheus import (
+            UNMATCHED_ENDPOINT,
+            metrics_endpoint,
+            route_template,
+        )
+
+        assets = StaticFiles(directory=".", check_dir=False)
+        router = Router(
+            [
+                Route("/metrics", metrics_endpoint),
+                Mount("/frontend/assets", app=assets),
+            ]
+        )
+
+        # Scopes como os do Starlette 0.49, sem scope["route"]
+        def template(endpoint):
+            return route_template({"router": router, "endpoint": endpoint})
+
+        assert template(metrics_endpoint) == "/metrics"
+        assert template(assets) == "/frontend/assets/{path}"
+        assert route_template({"router": router}) == UNMATCHED_ENDPOINT
+
+    def test_metrics_route_is_not_unmatched(self):
+        from backend.api.middleware.prometheus import metrics_endpoint
+
+        client = self._client()
+        client.app.add_route("/metrics", metrics_endpoint)
+        labels = {"method": "GET", "endpoint": "/metrics"}
+        before = self._sample(
+            "api_requests_total", status_code="200", **labels
+        )
+
+        assert client.get("/metrics").status_code == 200
+        assert (
+            self._sample("api_requests_total", status_code="200", **labels)
+            == before + 1
+        )
+
+    @pytest.mark.parametrize(
+        "expected_metric",
+        [
+            "api_requests_total",
+            "api_request_duration_seconds",
+            "api_response_size_bytes",
+        ],
+    )
+    def test_metrics_endpoint_exposes_standard_metrics(self, expected_metric):
+        from backend.api.middleware.prometheus import metrics_endpoint
+
+        client = self._client()
+        client.app.add_route("/metrics", metrics_endpoint)
+        client.post("/bench/items/m", json={"x": 1})
+
+        response = client.get("/metrics")
+
+        assert "text/plain" in response.headers["content-type"]
+        assert (
+            expected_metric in response.text
+        ), f"Metric '{expected_metric}' not found in /metrics"
+
+    def test_records_sizes_and_releases_active_gauge(self):
+        labels = {"method": "POST", "endpoint": "/bench/items/{item_id}"}
+        before = self._sample("api_request_size_bytes_sum", **labels)
+        before_response = self._sample("api_response_size_bytes_sum", **labels)
+
+        response = self._client().post("/bench/items/z", content=b'{"k": "v"}')
+
+        assert (
+            self._sample("api_request_size_bytes_sum", **labels) == before + 10
+        )
+        assert self._sample(
+            "api_response_size_bytes_sum", **labels
+        ) == before_response + len(response.content)
+        assert self._sample("api_active_requests", method="POST") == 0
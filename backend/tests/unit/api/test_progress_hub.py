@@ -0,0 +1,154 @@
+"""
+Unit Tests - ProgressHub
+
+Testa o fan-out de progresso (um assinante Redis por processo).
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from backend.api.websocket import progress_hub as hub_module
+from backend.api.websocket.progress_hub import ProgressHub
+
+
+class _FakePubSub:
+    """PubSub simulado: entrega mensagens colocadas em `inbox`."""
+
+    def __init__(self, inbox):
+        self.inbox = inbox
+        self.patterns = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def psubscribe(self, pattern):
+        await self.gate.wait()
+        self.patterns.append(pattern)
+
+    async def listen(self):
+        while True:
+            message = await self.inbox.get()
+            if isinstance(message, Exception):
+                raise message
+            yield message
+
+    async def aclose(self):
+        pass
+
+
+class _FakeRedis:
+    def __init__(self, pubsub):
+        self._pubsub = pubsub
+
+    def pubsub(self, **kwargs):
+        return self._pubsub
+
+    async def aclose(self):
+        pass
+
+
+def _pmessage(task_id, payload):
+    return {
+        "type": "pmessage",
+        "channel": f"task_status:{task_id}",
+        "data": json.dumps(payload),
+    }
+
+
+@pytest.fixture
+def hub_with_inbox(monkeypatch):
+    inbox = asyncio.Queue()
+    pubsub = _FakePubSub(inbox)
+    monkeypatch.setattr(
+        hub_module.Redis, "from_url", lambda *a, **k: _FakeRedis(pubsub)
+    )
+    hub = ProgressHub("redis://test", queue_size=2, reconnect_delay=0)
+    return hub, inbox, pubsub
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestProgressHub:
+    """Um PSUBSCRIBE por processo, uma fila por socket."""
+
+    async def test_single_subscriber_fans_out_to_all_sockets(
+        self, hub_with_inbox
+    ):
+        hub, inbox, pubsub = hub_with_inbox
+        first = await hub.subscribe("abc")
+        second = await hub.subscribe("abc")
+        other = await hub.subscribe("xyz")
+
+        await inbox.put(_pmessage("abc", {"status": "PROGRESS"}))
+        message = await asyncio.wait_for(first.get(), 1)
+
+        assert message == {"status": "PROGRESS"}
+        assert second.get_nowait() == {"status": "PROGRESS"}
+        assert other.empty()
+        assert pubsub.patterns == ["task_status:*"]
+        await hub.close()
+
+    async def test_subscribe_waits_for_psubscribe(self, hub_with_inbox):
+        hub, inbox, pubsub = hub_with_inbox
+        pubsub.gate.clear()
+
+        pending = asyncio.ensure_future(hub.subscribe("abc"))
+        await asyncio.sleep(0.01)
+        assert not pending.done()
+
+        pubsub.gate.set()
+        queue = await asyncio.wait_for(pending, 1)
+        assert pubsub.patterns == ["task_status:*"]
+
+        await inbox.put(_pmessage("abc", {"status": "PROGRESS"}))
+        assert await asyncio.wait_for(queue.get(), 1) == {"status": "PROGRESS"}
+        await hub.close()
+
+    async def test_subscribe_timeout_unregisters_queue(self, hub_with_inbox):
+        hub, _, pubsub = hub_with_inbox
+        hub.subscribe_timeout = 0.01
+        pubsub.gate.clear()
+
+        with pytest.raises(TimeoutError):
+            await hub.subscribe("abc")
+
+        assert hub.stats()["watched_tasks"] == 0
+        await hub.close()
+
+    async def test_reconnect_sends_resync(self, hub_with_inbox):
+        hub, inbox, pubsub = hub_with_inbox
+        queue = await hub.subscribe("abc")
+
+        await inbox.put(ConnectionError("redis caiu"))
+        message = await asyncio.wait_for(queue.get(), 1)
+
+        assert message is hub_module.RESYNC
+        assert pubsub.patterns == ["task_status:*", "task_status:*"]
+        await hub.close()
+
+    async def test_slow_socket_drops_oldest_progress(self):
+        hub = ProgressHub("redis://test", queue_size=2)
+        hub._ensure_listener = lambda: None
+        hub._subscribed.set()
+        queue = await hub.subscribe("abc")
+
+        for step in range(3):
+            hub.publish_local("abc", {"progress": step})
+        hub.publish_local("abc", {"status": "SUCCESS", "final": True})
+
+        assert queue.get_nowait() == {"progress": 2}
+        assert queue.get_nowait()["final"] is True
+        assert hub.stats()["dropped"] == 2
+
+    async def test_unsubscribe_stops_delivery(self):
+        hub = ProgressHub("redis://test")
+        hub._ensure_listener = lambda: None
+        hub._subscribed.set()
+        queue = await hub.subscribe("abc")
+
+        hub.unsubscribe("abc", queue)
+        hub.publish_local("abc", {"progress": 50})
+
+        assert queue.empty()
+        assert hub.stats()["watched_tasks"] == 0
@@ -65,25 +65,6 @@ class TestMetricsEndpoint:
         content = response.text
         assert "# TYPE" in content or "# HELP" in content
 
-    @pytest.mark.parametrize(
-        "expected_metric",
-        [
-            "http_requests_total",
-            "http_request_duration_seconds",
-            "api_requests_total",
-        ],
-    )
-    def test_metrics_contains_standard_metrics(
-        self, api_client, expected_metric
-    ):
-        """Testa que métricas padrão Prometheus existem."""
-        response = api_client.get("/metrics")
-        content = response.text
-
-        assert (
-            expected_metric in content
-        ), f"Metric '{expected_metric}' not found in /metrics"
-
 
 @pytest.mark.unit
 class TestRootEndpoint:
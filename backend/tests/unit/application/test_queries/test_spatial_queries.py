@@ -4,7 +4,13 @@ Tests for Spatial Queries
 Tests: Query handlers para consultas espaciais (PostGIS)
 """
 
+from unittest.mock import MagicMock
+
+import numpy as np
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.api.services.nws_stations.station_finder import StationFinder
 
 
 @pytest.mark.unit
@@ -20,3 +26,77 @@ class TestSpatialQueries:
         """Testa query de estações mais próximas."""
         # TODO: Implementar teste de ST_Distance + ORDER BY
         assert True
+
+
+def _session_returning(rows):
+    result = MagicMock()
+    result.fetchall.return_value = rows
+    session = MagicMock(spec=AsyncSession)
+    session.execute.return_value = result
+    return session
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBatchLookups:
+    """Testa as consultas em lote (KNN LATERAL) e o formato colunar."""
+
+    async def test_stations_batch_is_one_query_with_columnar_result(self):
+        session = _session_returning(
+            [
+                (0, 11, "A001", "Pira", -22.7, -47.6, 546.0, "inmet", 1.5),
+                (0, 12, "A002", "Lime", -22.6, -47.4, None, "inmet", 20.0),
+                (2, 31, "A777", "Bals", -7.5, -46.0, 280.0, "inmet", 3.2),
+            ]
+        )
+        finder = StationFinder(session)
+
+        result = await finder.find_stations_batch(
+            [-22.7, 10.0, -7.5], [-47.6, 10.0, -46.0], k=2
+        )
+
+        session.execute.assert_awaited_once()
+        query, params = session.execute.await_args.args
+        assert "LATERAL" in str(query) and "<->" in str(query)
+        assert params["lats"] == [-22.7, 10.0, -7.5]
+        assert params["k"] == 2
+        np.testing.assert_array_equal(result["target_index"], [0, 0, 2])
+        assert result["distance_km"].dtype == np.float64
+        assert np.isnan(result["elevation_m"][1])
+        assert list(result["station_code"]) == ["A001", "A002", "A777"]
+
+    async def test_cities_batch_returns_normals_matrix(self):
+        months = [1, 2, 12]
+        normals = (
+            [5.2, 5.0, 5.4],  # eto_normal
+            [1.1, 1.0, 1.2],  # eto_daily_std
+            [220.0, 180.0, None],  # precip_normal
+            [15.0, 14.0, 16.0],  # precip_daily_std
+            [0.6, 0.55, 0.62],  # rain_probability
+        )
+        session = _session_returning(
+            [
+                (1, 5, "Piracicaba", -22.7, -47.6, 546.0, 2.1, months)
+                + normals,
+                (3, 9, "Balsas", -7.5, -46.0, 280.0, 4.0) + (None,) * 6,
+            ]
+        )
+        finder = StationFinder(session)
+
+        result = await finder.find_studied_cities_batch(
+            [0.0, -22.7, 0.0, -7.5], [0.0, -47.6, 0.0, -46.0]
+        )
+
+        np.testing.assert_array_equal(result["target_index"], [1, 3])
+        assert result["eto_normal"].shape == (2, 12)
+        assert result["eto_normal"][0, 0] == 5.2
+        assert result["eto_normal"][0, 11] == 5.4
+        assert np.isnan(result["eto_normal"][0, 5])
+        assert np.isnan(result["precip_normal"][0, 11])
+        assert np.isnan(result["eto_normal"][1]).all()
+
+    async def test_without_session_returns_empty_columns(self):
+        result = await StationFinder().find_stations_batch([-22.7], [-47.6])
+
+        assert result["station_id"].shape == (0,)
+        assert result["distance_km"].dtype == np.float64
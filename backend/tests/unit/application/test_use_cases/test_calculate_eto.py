@@ -4,8 +4,12 @@ Tests for CalculateETO Use Case
 Tests: Cálculo de evapotranspiração de referência
 """
 
+import numpy as np
+import pandas as pd
 import pytest
 
+from backend.core.eto_calculation.eto_services import EToCalculationService
+
 
 @pytest.mark.unit
 class TestCalculateETOUseCase:
@@ -14,3 +18,100 @@ class TestCalculateETOUseCase:
     def test_placeholder(self):
         """Placeholder - implementar testes reais."""
         assert True
+
+
+@pytest.fixture
+def weather_frame():
+    """Série diária sintética com algumas linhas inválidas."""
+    rng = np.random.default_rng(42)
+    n = 400
+    t_min = rng.uniform(5, 25, n)
+    t_max = t_min + rng.uniform(2, 14, n)
+    df = pd.DataFrame(
+        {
+            "T2M_MAX": t_max,
+            "T2M_MIN": t_min,
+            "T2M_MEAN": (t_max + t_min) / 2,
+            "RH2M": rng.uniform(20, 95, n),
+            "WS2M": rng.uniform(0.5, 6, n),
+            "PRECTOTCORR": rng.uniform(0, 20, n),
+            "ALLSKY_SFC_SW_DWN": rng.uniform(8, 30, n),
+            "latitude": -22.7,
+            "longitude": -47.6,
+            "date": pd.date_range("2020-01-01", periods=n).strftime(
+                "%Y-%m-%d"
+            ),
+            "elevation_m": 546.0,
+        }
+    )
+    df.loc[0, "RH2M"] = np.nan
+    df.loc[1, "T2M_MAX"] = 80.0
+    df.loc[2, "T2M_MIN"] = df.loc[2, "T2M_MAX"] + 1
+    df.loc[3, "date"] = "2020-02-30"
+    df.loc[4, "T2M_MEAN"] = np.nan
+    return df
+
+
+@pytest.mark.unit
+class TestCalculateEt0Batch:
+    """Testa o cálculo FAO-56 vetorizado contra o caminho escalar."""
+
+    @pytest.mark.parametrize(
+        "factors", [None, {"pressure": 95.0, "gamma": 0.0632}]
+    )
+    def test_matches_scalar_path(self, weather_frame, factors):
+        service = EToCalculationService()
+        batch = service.calculate_et0_batch(
+            weather_frame, elevation_factors=factors
+        )
+
+        for i, (_, row) in enumerate(weather_frame.iterrows()):
+            scalar = service.calculate_et0(
+                row.to_dict(), elevation_factors=factors
+            )
+            assert batch["et0_mm_day"][i] == scalar["et0_mm_day"]
+            assert batch["quality"][i] == scalar["quality"]
+            assert batch["errors"][i] == scalar.get("error")
+            for name, value in scalar["components"].items():
+                np.testing.assert_equal(batch["components"][name][i], value)
+
+    def test_invalid_rows_are_flagged(self, weather_frame):
+        batch = EToCalculationService().calculate_et0_batch(weather_frame)
+
+        assert list(batch["quality"][:5]) == ["low"] * 5
+        assert batch["errors"][0].startswith("Umidade relativa inválida")
+        assert batch["errors"][1] == "T2M_MAX inválida: 80.0°C"
+        assert batch["errors"][3].startswith("day is out of range")
+        # T2M_MEAN ausente não é erro de validação, só qualidade baixa
+        assert batch["errors"][4] is None
+        assert batch["et0_mm_day"][4] == 0
+        assert np.isnan(batch["components"]["Ra"][0])
+
+    def test_dict_of_arrays_broadcasts_scalars(self):
+        batch = EToCalculationService().calculate_et0_batch(
+            {
+                "T2M_MAX": [30.0, 31.0],
+                "T2M_MIN": [18.0, 19.0],
+                "T2M_MEAN": [24.0, 25.0],
+                "RH2M": [60.0, 55.0],
+                "WS2M": [2.0, 2.5],
+                "PRECTOTCORR": [0.0, 1.2],
+                "ALLSKY_SFC_SW_DWN": [22.0, 24.0],
+                "latitude": -10.2,
+                "longitude": -48.3,
+                "date": ["2024-09-01", "2024-09-02"],
+                "elevation_m": 230.0,
+            }
+        )
+
+        assert batch["et0_mm_day"].shape == (2,)
+        assert list(batch["quality"]) == ["high", "high"]
+
+    def test_missing_column_fails_every_row(self, weather_frame):
+        batch = EToCalculationService().calculate_et0_batch(
+            weather_frame.drop(columns=["WS2M"])
+        )
+
+        assert (batch["et0_mm_day"] == 0).all()
+        assert set(batch["quality"]) == {"low"}
+        assert batch["errors"][0] == "Variáveis obrigatórias ausentes: WS2M"
@@ -4,8 +4,15 @@ Tests for GetClimateData Use Case
 Tests: Obtenção de dados climáticos (NASA Power, Met Norway)
 """
 
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
 import pytest
 
+from backend.api.services import data_download
+
 
 @pytest.mark.unit
 class TestGetClimateDataUseCase:
@@ -14,3 +21,81 @@ class TestGetClimateDataUseCase:
     def test_placeholder(self):
         """Placeholder - implementar testes reais."""
         assert True
+
+
+def _frame(start, days, value):
+    index = pd.date_range(start, periods=days, name="date")
+    return pd.DataFrame({"T2M_MAX": value, "T2M_MIN": value - 10}, index)
+
+
+@pytest.fixture
+def fake_sources():
+    """Fontes simuladas: uma rápida, uma lenta e uma com erro."""
+
+    async def fake_fetch(source, lat, lon, start, end):
+        if source == "nasa_power":
+            await asyncio.sleep(0.05)
+            return _frame(start, 10, 30.0), []
+        if source == "openmeteo_archive":
+            await asyncio.sleep(0.05)
+            return _frame(start, 10, 31.0), ["openmeteo_archive: aviso"]
+        if source == "met_norway":
+            raise RuntimeError("HTTP 503")
+        await asyncio.sleep(10)
+
+    sources = [
+        "nasa_power",
+        "openmeteo_archive",
+        "met_norway",
+        "nws_forecast",
+    ]
+    manager = MagicMock()
+    manager.get_sources_for_data_download.side_effect = (
+        lambda preferred_sources=None, **kwargs: {
+            "sources": preferred_sources or sources,
+            "warnings": [],
+        }
+    )
+    with (
+        patch.object(data_download, "_fetch_source", fake_fetch),
+        patch.object(
+            data_download, "ClimateSourceManager", return_value=manager
+        ),
+    ):
+        yield
+
+
+@pytest.mark.unit
+class TestDownloadWeatherDataFanOut:
+    """Testa o download concorrente de múltiplas fontes."""
+
+    async def test_partial_results_when_source_is_slow(self, fake_sources):
+        started = time.perf_counter()
+        df, warnings = await data_download.download_weather_data(
+            "data fusion",
+            "2024-01-01",
+            "2024-01-10",
+            longitude=-47.6,
+            latitude=-22.7,
+            source_timeouts={"nws_forecast": 0.3},
+        )
+        elapsed = time.perf_counter() - started
+
+        # Fontes em paralelo: limitado pela mais lenta (timeout), não a soma
+        assert elapsed < 1.0
+        assert len(df) == 20
+        assert list(df["T2M_MAX"].iloc[[0, 10]]) == [30.0, 31.0]
+        assert "openmeteo_archive: aviso" in warnings
+        assert "nws_forecast: timed out after 0.3s" in warnings
+        assert any(w.startswith("met_norway: error") for w in warnings)
+
+    async def test_all_sources_failing_raises(self, fake_sources):
+        with pytest.raises(ValueError, match="No sources provided"):
+            await data_download.download_weather_data(
+                ["met_norway", "nws_forecast"],
+                "2024-01-01",
+                "2024-01-10",
+                longitude=-47.6,
+                latitude=-22.7,
+                source_timeouts={"nws_forecast": 0.1},
+            )
@@ -10,6 +10,10 @@ from backend.core.data_processing.kalman_ensemble import (
     SimpleKalmanFilter,
     HistoricalDataLoader,
     KalmanState,
+    adaptive_kalman_scan,
+    month_resets,
+    monthly_tables,
+    simple_kalman_scan,
 )
 
 
@@ -217,14 +221,67 @@ class TestHistoricalDataLoader:
         cache_key = (round(lat, 2), round(lon, 2))
         assert cache_key in loader._cache
 
-        # Second call (should be cached - returns True even for None)
+        # Second call (cached) must report the same outcome
         has_ref2, ref2 = loader.get_reference_for_location(lat, lon)
 
-        # When cached, always returns True (even if ref is None)
-        assert has_ref2 is True
-        # But ref values should match
+        assert has_ref2 is has_ref1
         assert ref1 == ref2
 
+    def test_cache_is_bounded(self):
+        """Test that the LRU cache evicts the oldest entries"""
+        loader = HistoricalDataLoader()
+        loader.CACHE_MAXSIZE = 3
+
+        for i in range(5):
+            loader.get_reference_for_location(-10.0 - i, -48.0)
+
+        assert len(loader._cache) == 3
+        assert (-10.0, -48.0) not in loader._cache
+        assert (-14.0, -48.0) in loader._cache
+
+    def test_index_matches_brute_force_haversine(self):
+        """Test KD-tree lookup against an exhaustive haversine search"""
+        loader = HistoricalDataLoader()
+        if not loader.cities:
+            pytest.skip("Sem relatórios históricos")
+
+        rng = np.random.default_rng(0)
+        lats = rng.uniform(-25, 0, 200)
+        lons = rng.uniform(-55, -40, 200)
+        idx, dist = loader.nearest_cities(lats, lons, max_dist_km=300)
+
+        coords = np.radians([loader.city_coords[c] for c in loader.cities])
+        plat, plon = np.radians(lats)[:, None], np.radians(lons)[:, None]
+        a = (
+            np.sin((coords[:, 0] - plat) / 2) ** 2
+            + np.cos(plat)
+            * np.cos(coords[:, 0])
+            * np.sin((coords[:, 1] - plon) / 2) ** 2
+        )
+        brute = 2 * loader.EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+        expected = np.where(brute.min(axis=1) <= 300, brute.argmin(axis=1), -1)
+
+        np.testing.assert_array_equal(idx, expected)
+        np.testing.assert_allclose(
+            dist[idx >= 0], brute.min(axis=1)[idx >= 0], rtol=1e-9
+        )
+
+    def test_reference_uses_preparsed_table(self):
+        """Test reference dicts are built from the in-memory table"""
+        loader = HistoricalDataLoader()
+        if not loader.cities:
+            pytest.skip("Sem relatórios históricos")
+
+        lat, lon = loader.city_coords[loader.cities[0]]
+        with patch("builtins.open") as mock_file:
+            has_ref, ref = loader.get_reference_for_location(lat, lon)
+
+        mock_file.assert_not_called()
+        assert has_ref is True
+        assert ref["city"] == loader.cities[0]
+        assert ref["distance_km"] == 0.0
+        assert all(v >= 0.5 for v in ref["eto_stds"].values())
+
     def test_distance_calculation(self):
         """Test geographic distance calculation"""
         loader = HistoricalDataLoader()
@@ -1033,3 +1090,89 @@ class TestCoverageEnhancement:
 if __name__ == "__main__":
     # Run tests with verbose output
     pytest.main([__file__, "-v", "--tb=short"])
+
+
+class TestKalmanScanKernels:
+    """Kernels vetorizados devem reproduzir os filtros escalares"""
+
+    @staticmethod
+    def _reference(rng):
+        return {
+            "eto_normals": {m: rng.uniform(2, 8) for m in range(1, 13)},
+            "eto_stds": {m: rng.uniform(0.1, 2) for m in range(1, 13)},
+            "eto_p01": {m: rng.uniform(0.5, 3) for m in range(1, 13)},
+            "eto_p99": {m: rng.uniform(6, 10) for m in range(1, 13)},
+        }
+
+    @staticmethod
+    def _legacy_eto(values, months, ref):
+        result, month, kf = [], None, None
+        for z, m in zip(values, months):
+            if np.isnan(z):
+                result.append(np.nan)
+                continue
+            if month != m:
+                kf = AdaptiveKalmanFilter(
+                    ref["eto_normals"][m],
+                    ref["eto_stds"][m],
+                    ref["eto_p01"].get(m),
+                    ref["eto_p99"].get(m),
+                )
+                month = m
+            result.append(kf.update(z))
+        return np.array(result)
+
+    @pytest.mark.parametrize("n_locations", [1, 3, 60])
+    def test_adaptive_scan_matches_filter(self, n_locations):
+        rng = np.random.default_rng(7)
+        months = pd.date_range("2019-11-01", periods=120).month.to_numpy()
+        obs = rng.uniform(-1, 14, (n_locations, len(months)))
+        obs[rng.random(obs.shape) < 0.15] = np.nan
+        refs = [self._reference(rng) for _ in range(n_locations)]
+        tables = [monthly_tables(ref, "eto") for ref in refs]
+
+        result = adaptive_kalman_scan(
+            obs,
+            months,
+            month_resets(np.broadcast_to(months, obs.shape), ~np.isnan(obs)),
+            *(np.stack([t[k] for t in tables]) for k in tables[0]),
+        )
+
+        for i, ref in enumerate(refs):
+            np.testing.assert_array_equal(
+                result[i], self._legacy_eto(obs[i], months, ref)
+            )
+
+    def test_simple_scan_matches_filter(self):
+        values = np.array([5.0, 7.5, np.nan, 2.0, 30.0, 4.4])
+        kf = SimpleKalmanFilter(initial_value=5.0)
+        expected = [
+            kf.update(v) if not np.isnan(v) else np.nan for v in values
+        ]
+
+        result, estimate, error = simple_kalman_scan(values)
+
+        np.testing.assert_array_equal(result, expected)
+        assert estimate[0] == kf.estimate
+        assert error[0] == kf.error
+
+    def test_month_resets_rules(self):
+        months = np.array([1, 1, 2, 2, 1, 1])
+        valid = np.array([True, True, False, False, True, True])
+
+        # Precipitação: todo passo conta para a troca de mês
+        expected = [True, False, True, False, True, False]
+        assert month_resets(months).tolist() == expected
+        # ETo: passos inválidos são ignorados
+        expected = [True, False, False, False, False, False]
+        assert month_resets(months, valid).tolist() == expected
+
+    def test_monthly_tables_defaults(self):
+        tables = monthly_tables(
+            {"precip_normals": {1: 80.0}, "precip_p01": {1: None}}, "precip"
+        )
+
+        assert tables["normals"][1] == 80.0
+        assert tables["normals"][2] == 100.0
+        assert tables["stds"][5] == 10.0
+        assert np.isnan(tables["p01"][1])
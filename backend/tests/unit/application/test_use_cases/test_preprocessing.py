@@ -0,0 +1,137 @@
+"""
+Tests for the preprocessing pipeline (validation, IQR outliers, imputation)
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.core.data_processing.data_preprocessing import (
+    data_impute,
+    data_initial_validate,
+    detect_outliers_iqr,
+    preprocessing,
+)
+
+
+@pytest.fixture
+def weather_df():
+    index = pd.date_range("2024-01-01", periods=14, freq="D")
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "T2M_MAX": rng.normal(31.0, 1.5, 14),
+            "T2M_MIN": rng.normal(19.0, 1.5, 14),
+            "RH2M": rng.normal(70.0, 5.0, 14),
+            "WS2M": rng.normal(2.0, 0.3, 14),
+            "ALLSKY_SFC_SW_DWN": rng.normal(20.0, 2.0, 14),
+            "PRECTOTCORR": rng.exponential(3.0, 14),
+        },
+        index=index,
+    )
+
+
+@pytest.mark.unit
+class TestInitialValidate:
+    """Testa os limites físicos aplicados em bloco."""
+
+    def test_out_of_range_values_become_nan(self, weather_df):
+        weather_df.iloc[2, weather_df.columns.get_loc("RH2M")] = 120.0
+        weather_df.iloc[5, weather_df.columns.get_loc("T2M_MAX")] = 75.0
+
+        result, warnings = data_initial_validate(weather_df, -22.7)
+
+        assert np.isnan(result["RH2M"].iloc[2])
+        assert np.isnan(result["T2M_MAX"].iloc[5])
+        assert result["RH2M"].isna().sum() == 1
+        assert (
+            "Invalid values in RH2M: 1 records (7.14%) replaced with NaN."
+            in warnings
+        )
+
+    def test_existing_nan_is_not_counted_as_replaced(self, weather_df):
+        weather_df.iloc[3, weather_df.columns.get_loc("WS2M")] = np.nan
+
+        _, warnings = data_initial_validate(weather_df, -22.7)
+
+        assert not any("Invalid values in WS2M" in w for w in warnings)
+
+    def test_input_frame_is_not_modified(self, weather_df):
+        weather_df.iloc[2, weather_df.columns.get_loc("RH2M")] = 120.0
+        original = weather_df.copy()
+
+        result, _ = data_initial_validate(weather_df, -22.7)
+
+        pd.testing.assert_frame_equal(weather_df, original)
+        assert {"Ra", "dr", "delta", "omega_s"} <= set(result.columns)
+
+    def test_radiation_above_ra_is_rejected(self, weather_df):
+        weather_df.iloc[0, weather_df.columns.get_loc("ALLSKY_SFC_SW_DWN")] = (
+            44.0
+        )
+
+        result, _ = data_initial_validate(weather_df, -22.7)
+
+        assert np.isnan(result["ALLSKY_SFC_SW_DWN"].iloc[0])
+
+
+@pytest.mark.unit
+class TestOutliersAndImputation:
+    """Testa IQR vetorizado e interpolação por coluna."""
+
+    def test_iqr_removes_spike_in_unvalidated_column(self, weather_df):
+        weather_df["soil_moisture"] = np.linspace(0.2, 0.3, 14)
+        weather_df.iloc[7, weather_df.columns.get_loc("soil_moisture")] = 5.0
+
+        result, warnings = detect_outliers_iqr(weather_df)
+
+        assert np.isnan(result["soil_moisture"].iloc[7])
+        assert result["soil_moisture"].isna().sum() == 1
+        # Colunas já validadas fisicamente não passam pelo IQR
+        pd.testing.assert_series_equal(
+            result["T2M_MAX"], weather_df["T2M_MAX"]
+        )
+        assert any(
+            "Detected 1 outliers in soil_moisture" in w for w in warnings
+        )
+
+    def test_constant_column_is_skipped(self, weather_df):
+        weather_df["soil_moisture"] = 0.25
+
+        _, warnings = detect_outliers_iqr(weather_df)
+
+        assert any("no variance" in w for w in warnings)
+
+    def test_gaps_are_interpolated_and_edges_filled(self, weather_df):
+        weather_df["T2M_MAX"] = np.arange(14, dtype=float)
+        weather_df.iloc[[0, 4, 5, 13], 0] = np.nan
+
+        result, warnings = data_impute(weather_df)
+
+        expected = np.arange(14, dtype=float)
+        expected[0], expected[13] = 1.0, 12.0
+        np.testing.assert_allclose(result["T2M_MAX"], expected)
+        assert "Imputed 4 missing values in T2M_MAX" in warnings[0]
+        assert weather_df["T2M_MAX"].isna().sum() == 4
+
+    def test_all_nan_column_is_reported(self, weather_df):
+        weather_df["empty"] = np.nan
+
+        result, warnings = data_impute(weather_df)
+
+        assert result["empty"].isna().all()
+        assert "could not be imputed" in warnings[-1]
+
+
+@pytest.mark.unit
+def test_summary_counts_values_per_step(weather_df):
+    weather_df.iloc[2, weather_df.columns.get_loc("RH2M")] = 120.0
+    weather_df.iloc[6, weather_df.columns.get_loc("WS2M")] = -1.0
+
+    result, warnings = preprocessing(weather_df, -22.7)
+
+    assert not result[["RH2M", "WS2M"]].isna().any().any()
+    assert warnings[-1] == (
+        "Preprocessing summary: 2 validation corrections, "
+        "0 outlier removals, 2 imputations performed."
+    )
@@ -39,3 +39,80 @@ def mock_db_session():
     """Mock da sessão de banco de dados."""
     mock_session = Mock()
     return mock_session
+
+
+class InMemoryAsyncRedis:
+    """Subconjunto de redis.asyncio.Redis em memória (bytes, TTLs)."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    async def setex(self, key, ttl, value):
+        if isinstance(value, str):
+            value = value.encode()
+        self.data[key] = value
+        self.ttls[key] = int(ttl)
+        return True
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        if isinstance(value, str):
+            value = value.encode()
+        self.data[key] = value
+        if px is not None:
+            self.ttls[key] = int(px) // 1000
+        return True
+
+    async def exists(self, *keys):
+        return sum(key in self.data for key in keys)
+
+    async def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            if self.data.pop(key, None) is not None:
+                deleted += 1
+            self.ttls.pop(key, None)
+        return deleted
+
+    def pipeline(self, transaction=True):
+        return _InMemoryPipeline(self)
+
+
+class _InMemoryPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        commands, self.commands = self.commands, []
+        return [
+            await getattr(self.redis, name)(*args, **kwargs)
+            for name, args, kwargs in commands
+        ]
+
+
+@pytest.fixture
+def memory_redis():
+    """Redis assíncrono em memória (sem servidor)."""
+    return InMemoryAsyncRedis()
@@ -0,0 +1,214 @@
+"""
+Tests for bulk ClimateData ingestion (COPY + upsert)
+"""
+
+from contextlib import contextmanager
+from datetime import date, datetime
+
+import pytest
+
+from backend.database import data_storage
+from backend.database.data_storage import (
+    _COPY_COLUMNS,
+    _build_copy_rows,
+    bulk_upsert_climate_data,
+)
+
+MAPPING = {"T2M_MAX": "temp_max_c", "T2M_MIN": "temp_min_c"}
+
+
+def _record(day, t_max=30.0, **extra):
+    return {
+        "latitude": -22.75,
+        "longitude": -45.25,
+        "date": day,
+        "raw_data": {"T2M_MAX": t_max, "T2M_MIN": 18.0},
+        **extra,
+    }
+
+
+class _FakeCopy:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write_row(self, row):
+        self.rows.append(row)
+
+
+class _FakeCursor:
+    """Cursor psycopg simulado: registra SQL e linhas do COPY."""
+
+    def __init__(self):
+        self.statements = []
+        self.copied = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql):
+        self.statements.append(sql)
+
+    def copy(self, sql):
+        self.statements.append(sql)
+        return _FakeCopy(self.copied)
+
+    def fetchone(self):
+        return (len(self.copied), 0)
+
+
+class _FakeSession:
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.committed = False
+
+    def connection(self):
+        driver = type("Driver", (), {"cursor": lambda _: self._cursor})()
+        pool_conn = type("PoolConn", (), {"driver_connection": driver})()
+        return type("Conn", (), {"connection": pool_conn})()
+
+    def commit(self):
+        self.committed = True
+
+
+@pytest.mark.unit
+class TestBuildCopyRows:
+    """Testa a conversão de registros em tuplas do COPY."""
+
+    def test_rows_follow_copy_column_order(self):
+        (row,) = _build_copy_rows(
+            [_record(datetime(2024, 1, 1), elevation=600.0)],
+            "nasa_power",
+            MAPPING,
+        )
+        values = dict(zip(_COPY_COLUMNS, row))
+
+        assert len(row) == len(_COPY_COLUMNS)
+        assert values["row_no"] == 0
+        assert values["date"] == date(2024, 1, 1)
+        assert values["elevation"] == 600.0
+        assert values["eto_method"] == "penman_monteith"
+        assert values["harmonized_data"].obj == {
+            "temp_max_c": 30.0,
+            "temp_min_c": 18.0,
+        }
+
+    def test_without_mapping_harmonized_is_null(self):
+        (row,) = _build_copy_rows(
+            [_record(date(2024, 1, 1))], "nasa_power", None
+        )
+        values = dict(zip(_COPY_COLUMNS, row))
+
+        assert values["harmonized_data"] is None
+        assert values["quality_flags"] is None
+
+    def test_rows_are_generated_lazily(self):
+        records = (_record(date(2024, 1, d)) for d in range(1, 4))
+
+        rows = _build_copy_rows(records, "nasa_power", MAPPING)
+
+        assert next(rows)[0] == 0
+        assert next(rows)[0] == 1
+
+
+@pytest.mark.unit
+class TestBulkUpsert:
+    """Testa o fluxo COPY -> upsert com conexão simulada."""
+
+    @pytest.fixture
+    def fake_db(self, monkeypatch):
+        cursor = _FakeCursor()
+        session = _FakeSession(cursor)
+        mapping_calls = []
+
+        @contextmanager
+        def fake_context():
+            yield session
+
+        def fake_mapping(source_api):
+            mapping_calls.append(source_api)
+            return MAPPING
+
+        monkeypatch.setattr(data_storage, "get_db_context", fake_context)
+        monkeypatch.setattr(data_storage, "get_variable_mapping", fake_mapping)
+        return cursor, session, mapping_calls
+
+    def test_copy_then_upsert_in_one_transaction(self, fake_db):
+        cursor, session, mapping_calls = fake_db
+        records = [_record(date(2024, 1, d)) for d in range(1, 31)]
+
+        result = bulk_upsert_climate_data(records, "nasa_power")
+
+        assert result == {"inserted": 30, "updated": 0}
+        assert len(cursor.copied) == 30
+        assert mapping_calls == ["nasa_power"]
+        assert session.committed
+        create, copy, partitions, upsert = cursor.statements
+        assert "CREATE TEMP TABLE" in create and "ON COMMIT DROP" in create
+        assert copy.startswith("COPY climate_data_staging (row_no,")
+        assert "ensure_climate_data_partition" in partitions
+        assert "DISTINCT ON" in upsert
+        assert "ON CONFLICT ON CONSTRAINT uq_climate_data_location_date" in (
+            upsert
+        )
+
+    def test_auto_harmonize_off_skips_mapping_query(self, fake_db):
+        _, _, mapping_calls = fake_db
+
+        bulk_upsert_climate_data(
+            [_record(date(2024, 1, 1))], "nasa_power", auto_harmonize=False
+        )
+
+        assert mapping_calls == []
+
+
+@pytest.mark.unit
+def test_rows_to_frame_is_typed_and_date_indexed():
+    rows = [
+        (
+            date(2024, 1, 1),
+            "nasa_power",
+            30.1,
+            18.0,
+            65.0,
+            2.1,
+            20.5,
+            0.0,
+            4.2,
+        ),
+        (
+            date(2024, 1, 2),
+            "nasa_power",
+            None,
+            17.5,
+            70.0,
+            1.9,
+            18.0,
+            3.2,
+            None,
+        ),
+    ]
+
+    frame = data_storage._rows_to_frame(rows)
+
+    assert list(frame.columns) == list(data_storage.FRAME_COLUMNS)
+    assert frame.index[0] == datetime(2024, 1, 1)
+    assert frame["temp_max_c"].dtype == "float64"
+    assert frame["temp_max_c"].isna().tolist() == [False, True]
+    assert frame["eto_mm_day"].iloc[0] == 4.2
+
+
+@pytest.mark.unit
+def test_rows_to_frame_empty_result():
+    frame = data_storage._rows_to_frame([])
+
+    assert frame.empty
+    assert frame["eto_mm_day"].dtype == "float64"
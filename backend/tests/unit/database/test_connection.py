@@ -0,0 +1,80 @@
+"""
+Tests for the async session layer and pool metrics
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.pool import QueuePool
+
+from backend.api.services.nws_stations.station_finder import StationFinder
+from backend.database.connection import _instrument_pool, get_async_db
+from backend.database.metrics import DB_POOL_CAPACITY, DB_POOL_CHECKED_OUT
+
+
+def _gauge(gauge, engine):
+    return gauge.labels(engine=engine)._value.get()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_async_db_yields_async_session():
+    dependency = get_async_db()
+
+    session = await dependency.__anext__()
+
+    assert isinstance(session, AsyncSession)
+    with pytest.raises(StopAsyncIteration):
+        await dependency.__anext__()
+
+
+@pytest.mark.unit
+def test_pool_gauges_follow_checkout_and_checkin():
+    pool = QueuePool(lambda: MagicMock(), pool_size=3, max_overflow=0)
+    _instrument_pool(pool, "test")
+
+    first = pool.connect()
+    second = pool.connect()
+    assert _gauge(DB_POOL_CAPACITY, "test") == 3
+    assert _gauge(DB_POOL_CHECKED_OUT, "test") == 2
+
+    first.close()
+    second.close()
+    assert _gauge(DB_POOL_CHECKED_OUT, "test") == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestStationFinderSessions:
+    """StationFinder aceita AsyncSession e Session síncrona."""
+
+    async def test_async_session_is_awaited(self):
+        session = MagicMock(spec=AsyncSession)
+        session.execute.return_value = []
+
+        stations = await StationFinder(session).find_stations_in_radius(
+            -22.7, -47.6
+        )
+
+        assert stations == []
+        session.execute.assert_awaited_once()
+
+    async def test_sync_session_runs_off_the_event_loop(self):
+        station_row = (1, "A001", "Piracicaba", -22.7, -47.6, 546.0, "BR")
+        threads = []
+
+        def fake_execute(query, params):
+            threads.append(threading.current_thread())
+            return [station_row + ("inmet", None, None, [], 1.2, 0.02)]
+
+        session = MagicMock()
+        session.execute.side_effect = fake_execute
+
+        stations = await StationFinder(session).find_stations_in_radius(
+            -22.7, -47.6
+        )
+
+        assert stations[0]["station_code"] == "A001"
+        assert threads[0] is not threading.main_thread()
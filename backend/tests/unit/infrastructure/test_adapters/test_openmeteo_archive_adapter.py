@@ -0,0 +1,200 @@
+"""
+Tests for Open-Meteo Archive client - chunked fetch and rate limiting
+"""
+
+import time
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from backend.api.services import rate_limiter
+from backend.api.services.openmeteo_archive.openmeteo_archive_client import (
+    OpenMeteoArchiveClient,
+)
+from backend.api.services.rate_limiter import TokenBucketRateLimiter
+from backend.infrastructure.cache.climate_cache import ClimateCacheService
+
+
+class _FakeDaily:
+    def __init__(self, start, end, n_vars):
+        self.t0 = int(datetime.strptime(start, "%Y-%m-%d").timestamp())
+        self.n = (
+            datetime.strptime(end, "%Y-%m-%d")
+            - datetime.strptime(start, "%Y-%m-%d")
+        ).days + 1
+        self.values = np.arange(self.n, dtype=np.float32)
+        self.n_vars = n_vars
+
+    def Time(self):
+        return self.t0
+
+    def TimeEnd(self):
+        return self.t0 + self.n * 86400
+
+    def Interval(self):
+        return 86400
+
+    def Variables(self, i):
+        values = self.values + i
+
+        class _Var:
+            def ValuesAsNumpy(self):
+                return values
+
+        return _Var()
+
+
+class _FakeResponse:
+    def __init__(self, daily):
+        self.daily = daily
+
+    def Latitude(self):
+        return -22.7
+
+    def Longitude(self):
+        return -47.6
+
+    def Elevation(self):
+        return 546.0
+
+    def Timezone(self):
+        return b"America/Sao_Paulo"
+
+    def TimezoneAbbreviation(self):
+        return b"-03"
+
+    def UtcOffsetSeconds(self):
+        return -10800
+
+    def Daily(self):
+        return self.daily
+
+
+class _FakeSDK:
+    """Cliente openmeteo_requests simulado (bloqueante, 50 ms/request)."""
+
+    def __init__(self, fail_first=0):
+        self.calls = []
+        self.fail_first = fail_first
+
+    def weather_api(self, url, params):
+        self.calls.append(params["start_date"])
+        time.sleep(0.05)
+        if self.fail_first:
+            self.fail_first -= 1
+            raise RuntimeError("Minutely API request limit exceeded")
+        daily = _FakeDaily(
+            params["start_date"], params["end_date"], len(params["daily"])
+        )
+        return [_FakeResponse(daily)]
+
+
+@pytest.fixture
+def archive_client(tmp_path, monkeypatch):
+    monkeypatch.setitem(
+        rate_limiter.RATE_LIMITS_PER_MINUTE, "openmeteo_archive", 10**9
+    )
+    client = OpenMeteoArchiveClient(cache_dir=str(tmp_path / "cache"))
+    client.client = _FakeSDK()
+    return client
+
+
+@pytest.mark.unit
+class TestOpenMeteoArchiveChunkedFetch:
+    """Testa o download concorrente de períodos longos."""
+
+    async def test_chunks_run_concurrently_and_merge_in_order(
+        self, archive_client
+    ):
+        started = time.perf_counter()
+        result = await archive_client.get_climate_data(
+            -22.7, -47.6, "1991-01-01", "2020-12-31"
+        )
+        elapsed = time.perf_counter() - started
+
+        data = result["climate_data"]
+        assert result["metadata"]["num_chunks"] == 7
+        # 7 chunks x 50 ms, até 4 simultâneos
+        assert elapsed < 7 * 0.05
+        assert len(data["dates"]) == 10958
+        assert data["dates"][0] == datetime(1991, 1, 1)
+        assert data["dates"][-1] == datetime(2020, 12, 31)
+        assert all(np.diff([d.toordinal() for d in data["dates"]]) == 1)
+        assert data["temperature_2m_mean"][:2] == [0.0, 1.0]
+        assert data["wind_speed_2m_mean"][1] == 10.0 * 0.748
+
+    async def test_rate_limited_chunk_is_retried(
+        self, archive_client, monkeypatch
+    ):
+        monkeypatch.setattr(archive_client.config, "RATE_LIMIT_BACKOFF", 0)
+        archive_client.client = _FakeSDK(fail_first=1)
+
+        result = await archive_client.get_climate_data(
+            -22.7, -47.6, "2000-01-01", "2015-12-31"
+        )
+
+        assert len(archive_client.client.calls) == 5
+        assert len(result["climate_data"]["dates"]) == 5844
+
+
+@pytest.mark.unit
+class TestOpenMeteoArchiveDayCache:
+    """Testa o cache diário (hits parciais) do cliente Archive."""
+
+    async def test_overlapping_request_only_fetches_new_days(
+        self, archive_client, memory_redis
+    ):
+        cache = ClimateCacheService(prefix="test")
+        cache.redis = memory_redis
+        archive_client.cache = cache
+
+        first = await archive_client.get_climate_data(
+            -22.7, -47.6, "2024-01-01", "2024-01-31"
+        )
+        inner = await archive_client.get_climate_data(
+            -22.7, -47.6, "2024-01-10", "2024-01-20"
+        )
+        extended = await archive_client.get_climate_data(
+            -22.7, -47.6, "2024-01-15", "2024-02-10"
+        )
+
+        assert archive_client.client.calls == ["2024-01-01", "2024-02-01"]
+        assert inner["location"]["elevation"] == 546.0
+        assert inner["climate_data"]["dates"][0] == datetime(2024, 1, 10)
+        assert (
+            inner["climate_data"]["temperature_2m_mean"]
+            == first["climate_data"]["temperature_2m_mean"][9:20]
+        )
+        assert len(extended["climate_data"]["dates"]) == 27
+
+
+@pytest.mark.unit
+class TestTokenBucketRateLimiter:
+    """Testa o balde de tokens em memória e o fallback do Redis."""
+
+    async def test_waits_when_bucket_is_empty(self):
+        limiter = TokenBucketRateLimiter(
+            f"test-{time.monotonic()}", rate_per_minute=600, capacity=2
+        )
+
+        assert await limiter.acquire() == 0
+        assert await limiter.acquire() == 0
+        waited = await limiter.acquire()
+
+        # 10 tokens/s -> ~0.1 s para o terceiro token
+        assert 0.05 < waited < 0.2
+
+    async def test_falls_back_to_local_bucket_on_redis_error(self, mocker):
+        script = mocker.AsyncMock(side_effect=ConnectionError("down"))
+        redis = mocker.Mock()
+        redis.register_script.return_value = script
+        limiter = TokenBucketRateLimiter(
+            f"test-{time.monotonic()}", rate_per_minute=60, redis=redis
+        )
+
+        assert await limiter.acquire(5) == 0
+        assert await limiter.acquire(5) == 0
+        assert limiter.redis is None
+        script.assert_awaited_once()
+        redis.eval.assert_not_called()
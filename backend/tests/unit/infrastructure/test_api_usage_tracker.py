@@ -0,0 +1,267 @@
+"""
+Unit Tests - API usage tracker
+
+Testa a reserva atômica de quota (janela deslizante), o acúmulo em
+lote das APIs sem limite e o hook de quota do pool HTTP.
+"""
+
+import asyncio
+import pickle
+
+import httpx
+import pytest
+
+from backend.api.services import http_pool
+from backend.infrastructure.cache import api_usage_tracker as tracker
+from backend.infrastructure.cache.api_usage_tracker import (
+    APIQuotaExceededError,
+    UsageAccumulator,
+)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def incrby(self, key, n):
+        self.calls.append(("incrby", key, n))
+
+    def expire(self, key, ttl):
+        self.calls.append(("expire", key, ttl))
+
+    def execute(self):
+        self.redis.round_trips += 1
+        results = []
+        for name, key, arg in self.calls:
+            if name == "incrby":
+                self.redis.values[key] = self.redis.values.get(key, 0) + arg
+                results.append(self.redis.values[key])
+            else:
+                results.append(True)
+        return results
+
+
+class _FakeRedis:
+    """Executa a lógica do script de reserva em Python."""
+
+    def __init__(self, values=None):
+        self.values = dict(values or {})
+        self.round_trips = 0
+
+    def eval(self, script, numkeys, today, yesterday, n, limit, ttl, frac):
+        self.round_trips += 1
+        used = self.values.get(today, 0) + int(
+            self.values.get(yesterday, 0) * (1 - frac)
+        )
+        if used + n > limit:
+            return [0, used]
+        self.values[today] = self.values.get(today, 0) + n
+        return [1, used + n]
+
+    def register_script(self, script):
+        def run(keys, args):
+            return self.eval(script, len(keys), *keys, *args)
+
+        return run
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _AsyncFakeRedis(_FakeRedis):
+    def register_script(self, script):
+        run = _FakeRedis.register_script(self, script)
+
+        async def arun(keys, args):
+            return run(keys, args)
+
+        return arun
+
+    def pipeline(self, transaction=True):
+        pipe = _FakePipeline(self)
+        execute = pipe.execute
+
+        async def aexecute():
+            return execute()
+
+        pipe.execute = aexecute
+        return pipe
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = _FakeRedis()
+    monkeypatch.setattr(tracker, "_get_redis", lambda: fake)
+    monkeypatch.setattr(tracker, "usage_accumulator", UsageAccumulator())
+    return fake
+
+
+@pytest.mark.unit
+class TestQuotaReservation:
+    """Checa e reserva em uma ida ao Redis."""
+
+    def test_reserves_until_limit(self, redis, monkeypatch):
+        monkeypatch.setitem(tracker.API_LIMITS, "nasa_power", 3)
+
+        granted = [tracker.reserve_api_quota("nasa_power") for _ in range(4)]
+
+        assert granted == [True, True, True, False]
+        assert redis.round_trips == 4
+        assert list(redis.values.values()) == [3]
+
+    def test_window_counts_part_of_yesterday(self, redis, monkeypatch):
+        monkeypatch.setitem(tracker.API_LIMITS, "nasa_power", 10)
+        keys, args = tracker._window_args("nasa_power", 1, 10)
+        redis.values[keys[1]] = 1000  # ontem esgotado
+
+        # No início do dia quase todo o uso de ontem ainda conta
+        monkeypatch.setattr(
+            tracker, "_window_args", lambda *a: (keys, [*args[:3], 0.0])
+        )
+        assert not tracker.reserve_api_quota("nasa_power")
+
+        monkeypatch.setattr(
+            tracker, "_window_args", lambda *a: (keys, [*args[:3], 1.0])
+        )
+        assert tracker.reserve_api_quota("nasa_power")
+
+    def test_ensure_raises_when_exhausted(self, monkeypatch):
+        monkeypatch.setitem(tracker.API_LIMITS, "opentopo", 2)
+        monkeypatch.setattr(tracker, "_get_redis", None)  # sem I/O síncrono
+        fake = _AsyncFakeRedis()
+
+        async def run():
+            await tracker.ensure_api_quota("opentopo", 2, redis=fake)
+            await tracker.ensure_api_quota("opentopo", redis=fake)
+
+        with pytest.raises(APIQuotaExceededError) as exc:
+            asyncio.run(run())
+
+        assert exc.value.limit == 2
+        assert exc.value.used == 2
+        assert fake.round_trips == 2
+
+    def test_quota_error_survives_pickle(self):
+        error = APIQuotaExceededError("nasa_power", 1000, 1000)
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert (restored.api_name, restored.used, restored.limit) == (
+            "nasa_power",
+            1000,
+            1000,
+        )
+        assert str(restored) == str(error)
+        assert "1000/1000" in str(error)
+
+    def test_redis_failure_fails_open(self, monkeypatch):
+        def broken():
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(tracker, "_get_redis", broken)
+
+        assert tracker.reserve_api_quota("nasa_power")
+
+
+@pytest.mark.unit
+class TestUsageAccumulator:
+    """APIs sem limite: um pipeline para todas as contagens."""
+
+    def test_flushes_all_apis_in_one_pipeline(self, redis):
+        tracker.usage_accumulator.flush_every = 5
+
+        for api in ["met_norway", "nws_forecast"] * 2:
+            tracker.reserve_api_quota(api)
+        assert redis.round_trips == 0
+
+        tracker.reserve_api_quota("nws_stations")
+
+        assert redis.round_trips == 1
+        assert sorted(redis.values.values()) == [1, 2, 2]
+        assert not tracker.usage_accumulator.drain()
+
+    def test_failed_flush_keeps_counts(self, monkeypatch):
+        accumulator = UsageAccumulator()
+        monkeypatch.setattr(tracker, "usage_accumulator", accumulator)
+
+        def broken():
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(tracker, "_get_redis", broken)
+        accumulator.add("met_norway", 3)
+
+        tracker.flush_api_usage()
+
+        assert list(accumulator.drain().values()) == [3]
+
+
+@pytest.mark.unit
+class TestHttpPoolQuotaHook:
+    """get_http_client(quota=...) reserva antes de cada request."""
+
+    def test_request_blocked_before_network(self, monkeypatch):
+        reserved = []
+        sent = []
+
+        async def fake_ensure(api_name, requests_count=1, redis=None):
+            reserved.append(api_name)
+            if len(reserved) > 1:
+                raise APIQuotaExceededError(api_name, 1, 1)
+
+        def handler(request):
+            sent.append(request.url)
+            return httpx.Response(200, json={})
+
+        monkeypatch.setattr(tracker, "ensure_api_quota", fake_ensure)
+        monkeypatch.setattr(
+            http_pool,
+            "_pool_settings",
+            lambda: {"limits": httpx.Limits(), "http2": False},
+        )
+        monkeypatch.setattr(http_pool, "_registry", {})
+
+        async def run():
+            client = http_pool.get_http_client(
+                "power.test", base_url="http://power.test", quota="nasa_power"
+            )
+            client._transport = httpx.MockTransport(handler)
+            await client.get("/daily")
+            with pytest.raises(APIQuotaExceededError):
+                await client.get("/daily")
+            await client.aclose()
+
+        asyncio.run(run())
+
+        assert reserved == ["nasa_power", "nasa_power"]
+        assert len(sent) == 1
+
+
+class TestHttp2Fallback:
+    def test_warns_once_without_h2(self, monkeypatch):
+        from loguru import logger
+
+        monkeypatch.setattr(http_pool, "HTTP2_AVAILABLE", False)
+        monkeypatch.setattr(http_pool, "_http2_warned", False)
+        messages = []
+        sink = logger.add(messages.append, level="WARNING")
+        try:
+            first = http_pool._pool_settings()
+            http_pool._pool_settings()
+        finally:
+            logger.remove(sink)
+
+        assert first["http2"] is False
+        assert len([m for m in messages if "h2" in m]) == 1
@@ -0,0 +1,137 @@
+"""
+Tests for cache codecs - columnar serialization of cache payloads
+"""
+
+import json
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.api.services.nasa_power.nasa_power_client import NASAPowerData
+from backend.infrastructure.cache import cache_codecs
+from backend.infrastructure.cache.cache_codecs import (
+    CacheCodecError,
+    ModelRecordsCodec,
+    dumps,
+    loads,
+)
+
+
+@pytest.fixture
+def weather_df():
+    index = pd.date_range("2024-01-01", periods=400, freq="D", name="date")
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(
+        {
+            "T2M_MAX": rng.normal(30, 3, 400),
+            "T2M_MIN": rng.normal(18, 3, 400),
+            "RH2M": rng.uniform(40, 90, 400),
+        },
+        index=index,
+    )
+    df.iloc[5, 1] = np.nan
+    return df
+
+
+def _records(rows):
+    days = pd.date_range("2024-01-01", periods=rows).strftime("%Y-%m-%d")
+    return [
+        NASAPowerData(
+            date=day,
+            temp_max=30.0 + i % 5,
+            humidity=None if i % 7 == 0 else 70.5,
+        )
+        for i, day in enumerate(days)
+    ]
+
+
+def _kind(payload):
+    header_len = cache_codecs._PREAMBLE.unpack_from(payload)[3]
+    start = cache_codecs._PREAMBLE.size
+    return json.loads(payload[start : start + header_len])["kind"]
+
+
+@pytest.mark.unit
+class TestDataFrames:
+    """DataFrames seguem no pickle (mais rápido que o codec colunar)."""
+
+    def test_roundtrip_uses_plain_pickle(self, weather_df):
+        payload = dumps(weather_df)
+
+        result = loads(payload)
+
+        pd.testing.assert_frame_equal(result, weather_df)
+        assert result.index.freq == weather_df.index.freq
+        assert not payload.startswith(cache_codecs.MAGIC)
+
+
+@pytest.mark.unit
+class TestModelRecordsCodec:
+    """Testa listas de modelos pydantic."""
+
+    @pytest.mark.parametrize("compression", ["none", "zlib", "zstd"])
+    def test_roundtrip_preserves_none(self, monkeypatch, compression):
+        monkeypatch.setattr(cache_codecs, "COMPRESSION_MIN_BYTES", 0)
+        records = _records(ModelRecordsCodec.MIN_ROWS)
+
+        payload = dumps(records, compression=compression)
+        result = loads(payload)
+
+        assert result == records
+        assert result[0].humidity is None
+        assert _kind(payload) == "models"
+        assert payload[5] == cache_codecs.COMPRESSION_IDS[compression]
+
+    def test_short_lists_stay_with_pickle(self):
+        records = _records(ModelRecordsCodec.MIN_ROWS - 1)
+
+        payload = dumps(records)
+
+        assert not payload.startswith(cache_codecs.MAGIC)
+        assert loads(payload) == records
+
+    def test_schema_change_is_rejected(self, monkeypatch):
+        payload = dumps(_records(ModelRecordsCodec.MIN_ROWS))
+        monkeypatch.setattr(
+            NASAPowerData,
+            "model_fields",
+            {"date": NASAPowerData.model_fields["date"]},
+        )
+
+        with pytest.raises(CacheCodecError):
+            loads(payload)
+
+
+@pytest.mark.unit
+class TestPayloadFormat:
+    """Testa header versionado, fallback e payloads legados."""
+
+    def test_legacy_pickle_payload_is_read(self, weather_df):
+        assert loads(pickle.dumps({"a": 1})) == {"a": 1}
+
+    def test_unsupported_object_falls_back_to_pickle(self):
+        payload = dumps({"elevation": 546.0})
+
+        assert payload == pickle.dumps(
+            {"elevation": 546.0}, protocol=pickle.HIGHEST_PROTOCOL
+        )
+        assert loads(payload) == {"elevation": 546.0}
+
+    def test_enveloped_pickle_payload_is_read(self, monkeypatch):
+        # Entradas gravadas com o pickle dentro do envelope
+        monkeypatch.setattr(
+            cache_codecs, "_CODECS", [cache_codecs.PickleCodec()]
+        )
+        payload = dumps({"elevation": 546.0})
+
+        assert payload.startswith(cache_codecs.MAGIC)
+        assert loads(payload) == {"elevation": 546.0}
+
+    def test_unknown_version_is_rejected(self):
+        payload = bytearray(dumps(_records(ModelRecordsCodec.MIN_ROWS)))
+        payload[4] = cache_codecs.FORMAT_VERSION + 1
+
+        with pytest.raises(CacheCodecError):
+            loads(bytes(payload))
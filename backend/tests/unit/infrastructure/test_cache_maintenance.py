@@ -0,0 +1,156 @@
+"""
+Unit Tests - CacheMaintenance
+
+Testa a varredura SCAN em lotes (TTL / MEMORY USAGE em pipeline,
+UNLINK por lote) e o orçamento de tempo com cursor retomável.
+"""
+
+from fnmatch import fnmatchcase
+
+import pytest
+
+from backend.infrastructure.cache.cache_maintenance import (
+    CacheMaintenance,
+    key_source,
+)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name, args))
+
+    def execute(self):
+        self.redis.round_trips += 1
+        return [getattr(self.redis, name)(*args) for name, args in self.calls]
+
+
+class _FakeRedis:
+    """Keyspace em memória; SCAN pagina `count` chaves por cursor."""
+
+    def __init__(self, ttls):
+        self.ttls = dict(ttls)
+        # Ordem fixa: como no Redis, apagar não desloca o cursor
+        self.order = sorted(self.ttls)
+        self.values = {}
+        self.round_trips = 0
+        self.scans = 0
+
+    def scan(self, cursor=0, match=None, count=10):
+        self.scans += 1
+        page = self.order[cursor : cursor + count]
+        following = cursor + count
+        matched = [
+            k
+            for k in page
+            if k in self.ttls and fnmatchcase(k.decode(), match)
+        ]
+        return (following if following < len(self.order) else 0), matched
+
+    def ttl(self, key):
+        return self.ttls.get(key, -2)
+
+    def memory_usage(self, key):
+        return 100 if key in self.ttls else None
+
+    def unlink(self, *keys):
+        self.round_trips += 1
+        return sum(self.ttls.pop(key, None) is not None for key in keys)
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = str(value).encode()
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+def _keyspace():
+    ttls = {}
+    for i in range(6):
+        ttls[f"climate:nasa:{i}".encode()] = 7200 if i % 2 else 60
+        ttls[f"climate:met:{i}".encode()] = -1 if i == 0 else 86400
+    ttls[b"session:abc:1"] = 10
+    return ttls
+
+
+@pytest.mark.unit
+class TestCacheMaintenance:
+    """Sem KEYS e sem uma ida ao Redis por chave."""
+
+    def test_cleanup_unlinks_short_ttl_in_batches(self):
+        redis = _FakeRedis(_keyspace())
+
+        report = CacheMaintenance(redis, scan_count=4, pause=0).cleanup(
+            "climate:*", min_ttl=3600
+        )
+
+        assert report.complete
+        assert report.scanned == 12
+        assert report.removed == 4  # 3 nasa com TTL 60 + met sem TTL
+        assert report.kept == 8
+        assert report.keys_by_source == {"met": 1, "nasa": 3}
+        assert b"session:abc:1" in redis.ttls
+        # Por lote: 1 pipeline de TTL + no máximo 1 UNLINK
+        assert redis.round_trips <= 2 * report.batches
+
+    def test_stats_reports_bytes_per_source(self):
+        redis = _FakeRedis(_keyspace())
+
+        report = CacheMaintenance(redis, scan_count=5, pause=0).stats()
+
+        assert report.keys_by_source == {"met": 6, "nasa": 6}
+        assert report.bytes_by_source == {"met": 600, "nasa": 600}
+
+    def test_budget_stops_and_next_run_resumes(self):
+        redis = _FakeRedis(_keyspace())
+        ticks = iter(range(100))
+        maintenance = CacheMaintenance(
+            redis,
+            scan_count=4,
+            time_budget=1,
+            pause=0,
+            clock=lambda: next(ticks),
+        )
+
+        first = maintenance.cleanup("climate:*")
+        assert not first.complete
+        assert redis.scans == 1
+        saved = list(redis.values.values())
+        assert saved == [b"4"]
+
+        maintenance.time_budget = None
+        second = maintenance.cleanup("climate:*")
+
+        assert second.complete
+        assert first.scanned + second.scanned == 12
+        assert first.removed + second.removed == 4
+        assert not redis.values
+
+    def test_count_and_unlink_matching_ignore_budget(self):
+        redis = _FakeRedis(_keyspace())
+        maintenance = CacheMaintenance(
+            redis, scan_count=2, time_budget=0, pause=0
+        )
+
+        assert maintenance.count("climate:met:*") == 6
+        assert maintenance.unlink_matching("climate:nasa:*") == 6
+        assert maintenance.count("climate:*") == 6
+
+    def test_key_source(self):
+        assert key_source(b"climate:nasa:nasa_power:1:2") == "nasa"
+        assert key_source("climate") == "other"
@@ -0,0 +1,410 @@
+"""
+Tests for ClimateCacheService - per-day store and partial cache hits
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from backend.api.services.geographic_utils import GeographicUtils
+from backend.api.services.nasa_power.nasa_power_client import (
+    NASAPowerClient,
+    NASAPowerData,
+)
+from backend.api.services.openmeteo_archive.openmeteo_archive_client import (
+    OpenMeteoArchiveClient,
+)
+from backend.api.services.openmeteo_forecast.openmeteo_forecast_client import (
+    OpenMeteoForecastClient,
+)
+from backend.infrastructure.cache.climate_cache import (
+    ClimateCacheService,
+    missing_ranges,
+)
+
+
+@pytest.fixture
+def cache(memory_redis):
+    service = ClimateCacheService(prefix="test")
+    service.redis = memory_redis
+    return service
+
+
+class _RecordingFetcher:
+    """Fonte simulada: um registro por dia, registra sub-períodos."""
+
+    def __init__(self, skip=(), delay=0.0):
+        self.calls = []
+        self.skip = set(skip)
+        self.delay = delay
+
+    async def __call__(self, start, end):
+        self.calls.append((start, end))
+        await asyncio.sleep(self.delay)
+        days = (end - start).days + 1
+        return {
+            start + timedelta(days=i): {"t": float((start + timedelta(i)).day)}
+            for i in range(days)
+            if start + timedelta(days=i) not in self.skip
+        }
+
+
+@pytest.mark.unit
+class TestMissingRanges:
+    """Testa o cálculo dos sub-períodos faltantes."""
+
+    def test_gaps_become_contiguous_ranges(self):
+        present = [date(2024, 1, d) for d in range(3, 8)]
+
+        assert missing_ranges(
+            date(2024, 1, 1), date(2024, 1, 10), present
+        ) == [
+            (date(2024, 1, 1), date(2024, 1, 2)),
+            (date(2024, 1, 8), date(2024, 1, 10)),
+        ]
+
+    def test_small_gaps_are_merged(self):
+        present = [date(2024, 1, 5), date(2024, 1, 6)]
+
+        assert missing_ranges(
+            date(2024, 1, 1), date(2024, 1, 10), present, merge_gap_days=2
+        ) == [(date(2024, 1, 1), date(2024, 1, 10))]
+
+
+@pytest.mark.unit
+class TestClimateCacheGetRange:
+    """Testa hits parciais do store diário."""
+
+    async def test_overlapping_windows_fetch_only_missing_days(self, cache):
+        fetch = _RecordingFetcher()
+        await cache.get_range(
+            "nasa", -22.7, -47.6, date(2024, 1, 1), date(2024, 1, 31), fetch
+        )
+
+        # Janela contida na anterior: nenhuma chamada à fonte
+        inner = await cache.get_range(
+            "nasa", -22.7, -47.6, date(2024, 1, 1), date(2024, 1, 30), fetch
+        )
+        # Janela estendida: só os dias novos
+        extended = await cache.get_range(
+            "nasa", -22.7, -47.6, date(2024, 1, 25), date(2024, 2, 5), fetch
+        )
+
+        assert fetch.calls == [
+            (date(2024, 1, 1), date(2024, 1, 31)),
+            (date(2024, 2, 1), date(2024, 2, 5)),
+        ]
+        assert list(inner) == [
+            date(2024, 1, 1) + timedelta(days=i) for i in range(30)
+        ]
+        assert len(extended) == 12
+        assert extended[date(2024, 2, 5)] == {"t": 5.0}
+
+    async def test_each_day_gets_ttl_of_its_age(self, cache, memory_redis):
+        today = date.today()
+        start = today - timedelta(days=60)
+        end = today + timedelta(days=3)
+
+        await cache.get_range(
+            "openmeteo", 1.0, 2.0, start, end, _RecordingFetcher()
+        )
+
+        def ttl(day):
+            return memory_redis.ttls[
+                cache._make_day_key("openmeteo", 1.0, 2.0, day)
+            ]
+
+        assert ttl(start) == cache.TTL_HISTORICAL
+        assert ttl(today - timedelta(days=10)) == cache.TTL_RECENT
+        assert ttl(today - timedelta(days=1)) == cache.TTL_VERY_RECENT
+        assert ttl(end) == cache.TTL_FORECAST
+
+    async def test_days_missing_at_source_are_not_refetched(
+        self, cache, memory_redis
+    ):
+        end = date(2024, 3, 10)
+        fetch = _RecordingFetcher(skip={end})
+
+        first = await cache.get_range(
+            "nasa", 0.0, 0.0, date(2024, 3, 1), end, fetch
+        )
+        second = await cache.get_range(
+            "nasa", 0.0, 0.0, date(2024, 3, 1), end, fetch
+        )
+
+        assert len(fetch.calls) == 1
+        assert end not in first and end not in second
+        marker = cache._make_day_key("nasa", 0.0, 0.0, end)
+        assert memory_redis.ttls[marker] == cache.TTL_EMPTY_DAY
+
+    async def test_redis_failure_falls_back_to_source(self, cache, mocker):
+        cache.redis.mget = mocker.AsyncMock(side_effect=ConnectionError)
+        fetch = _RecordingFetcher()
+
+        result = await cache.get_range(
+            "nasa", 0.0, 0.0, date(2024, 1, 1), date(2024, 1, 7), fetch
+        )
+
+        assert len(result) == 7
+        assert len(fetch.calls) == 1
+
+
+@pytest.mark.unit
+class TestRequestCoalescing:
+    """Testa a coalescência de requests idênticos em voo."""
+
+    async def test_concurrent_identical_requests_share_one_fetch(self, cache):
+        fetch = _RecordingFetcher(delay=0.05)
+
+        results = await asyncio.gather(
+            *(
+                cache.get_range(
+                    "nasa",
+                    -22.75,
+                    -47.75,
+                    date(2024, 1, 1),
+                    date(2024, 1, 7),
+                    fetch,
+                )
+                for _ in range(5)
+            )
+        )
+
+        assert len(fetch.calls) == 1
+        assert all(result == results[0] for result in results)
+        assert results[0] is not results[1]
+
+    async def test_waits_for_leader_in_other_worker(self, cache, memory_redis):
+        start, end = date(2024, 1, 1), date(2024, 1, 7)
+        lock_key = "inflight:" + cache._make_key(
+            "nasa", 0.25, 0.25, start, end
+        )
+        await memory_redis.set(lock_key, "other-worker", nx=True)
+        leader = _RecordingFetcher()
+        follower = _RecordingFetcher()
+
+        async def other_worker_finishes():
+            await asyncio.sleep(0.1)
+            records = await leader(start, end)
+            await cache.set_days("nasa", 0.25, 0.25, records)
+            await memory_redis.delete(lock_key)
+
+        result, _ = await asyncio.gather(
+            cache.get_range("nasa", 0.25, 0.25, start, end, follower),
+            other_worker_finishes(),
+        )
+
+        assert len(result) == 7
+        assert follower.calls == []
+
+    async def test_lock_is_released_after_fetch(self, cache, memory_redis):
+        await cache.get_range(
+            "nasa",
+            0.25,
+            0.25,
+            date(2024, 1, 1),
+            date(2024, 1, 7),
+            _RecordingFetcher(),
+        )
+
+        assert not [k for k in memory_redis.data if k.startswith("inflight")]
+
+
+@pytest.mark.unit
+class TestGridSnapping:
+    """Testa o ajuste de coordenadas para a grade da fonte."""
+
+    def test_points_in_same_cell_snap_to_its_center(self):
+        assert GeographicUtils.snap_to_grid(-22.7085, -47.6476, 0.5) == (
+            -22.75,
+            -47.75,
+        )
+        assert GeographicUtils.snap_to_grid(-22.51, -47.99, 0.5) == (
+            -22.75,
+            -47.75,
+        )
+
+    def test_grid_edges_stay_inside_valid_range(self):
+        assert GeographicUtils.snap_to_grid(90.0, 180.0, 0.5) == (
+            89.75,
+            179.75,
+        )
+        assert GeographicUtils.snap_to_grid(-90.0, -180.0, 0.1) == (
+            -89.95,
+            -179.95,
+        )
+
+    @pytest.mark.parametrize(
+        "point, node",
+        [
+            ((-22.7085, -47.6476), (-22.5, -47.5)),
+            ((-22.76, -47.82), (-23.0, -48.125)),
+            ((10.3, 0.3), (10.5, 0.0)),
+            ((10.3, 0.32), (10.5, 0.625)),
+            ((-15.8, -47.9), (-16.0, -48.125)),
+        ],
+    )
+    def test_nasa_power_points_snap_to_native_nodes(self, point, node):
+        # Grade MERRA-2 do POWER: lat -90 + 0.5j, lon -180 + 0.625i
+        assert GeographicUtils.snap_to_node(*point, 0.5, 0.625) == node
+
+    def test_node_grid_edges_wrap_longitude(self):
+        assert GeographicUtils.snap_to_node(90.0, 180.0, 0.5, 0.625) == (
+            90.0,
+            -180.0,
+        )
+        assert GeographicUtils.snap_to_node(-89.9, 179.8, 0.5, 0.625) == (
+            -90.0,
+            -180.0,
+        )
+
+
+@pytest.mark.unit
+class TestNASAPowerDayCache:
+    """Testa o NASAPowerClient com o store diário."""
+
+    async def test_fill_value_days_are_not_cached_as_data(self, cache, mocker):
+        def records(start, end):
+            days = (end - start).days + 1
+            return [
+                NASAPowerData(
+                    date=(start + timedelta(days=i)).strftime("%Y-%m-%d"),
+                    temp_max=-999.0 if i == days - 1 else 30.0,
+                    temp_min=-999.0 if i == days - 1 else 18.0,
+                )
+                for i in range(days)
+            ]
+
+        fetch = mocker.patch.object(
+            NASAPowerClient,
+            "_fetch_from_api",
+            side_effect=lambda lat, lon, s, e, community: records(s, e),
+        )
+        client = NASAPowerClient(cache=cache)
+
+        data = await client.get_daily_data(
+            -22.7, -47.6, datetime(2024, 1, 1), datetime(2024, 1, 14)
+        )
+        again = await client.get_daily_data(
+            -22.7, -47.6, datetime(2024, 1, 7), datetime(2024, 1, 14)
+        )
+
+        assert len(data) == 13
+        assert again == data[6:]
+        assert fetch.call_count == 1
+
+    async def test_nearby_clicks_share_one_fetch(self, cache, mocker):
+        fetch = mocker.patch.object(
+            NASAPowerClient,
+            "_fetch_from_api",
+            return_value=[
+                NASAPowerData(date="2024-01-01", temp_max=30.0, temp_min=18.0)
+            ],
+        )
+        client = NASAPowerClient(cache=cache)
+
+        for lat, lon in [(-22.71, -47.65), (-22.6, -47.7), (-22.4, -47.3)]:
+            await client.get_daily_data(
+                lat, lon, datetime(2024, 1, 1), datetime(2024, 1, 1)
+            )
+
+        assert fetch.call_count == 1
+        assert fetch.call_args.args[:2] == (-22.5, -47.5)
+
+
+@pytest.mark.unit
+class TestOpenMeteoArchiveDayCache:
+    """Chave de cache e requisição no centro da mesma célula."""
+
+    async def test_api_gets_cell_centre(self, cache, mocker, tmp_path):
+        def period(lat, lng, start, end):
+            return {
+                "location": {"latitude": lat, "longitude": lng},
+                "climate_data": {
+                    "dates": [datetime.fromisoformat(start)],
+                    "temperature_2m_max": [30.0],
+                },
+            }
+
+        fetch = mocker.patch.object(
+            OpenMeteoArchiveClient,
+            "_fetch_climate_data",
+            side_effect=period,
+        )
+        client = OpenMeteoArchiveClient(cache=cache, cache_dir=str(tmp_path))
+
+        # Mesma célula de 0.1°: a segunda vem do cache
+        for lat, lng in [(-22.72, -47.63), (-22.78, -47.67)]:
+            result = await client.get_climate_data(
+                lat, lng, "2024-01-01", "2024-01-01"
+            )
+
+        assert fetch.call_count == 1
+        assert fetch.call_args.args[:2] == GeographicUtils.snap_to_grid(
+            -22.72, -47.63, client.config.GRID_RESOLUTION
+        )
+        assert result["climate_data"]["temperature_2m_max"] == [30.0]
+
+
+@pytest.mark.unit
+class TestOpenMeteoForecastDayCache:
+    """Forecast no store diário, com os TTLs de previsão."""
+
+    async def test_overlapping_windows_fetch_missing_days(
+        self, cache, memory_redis, mocker, tmp_path
+    ):
+        def period(lat, lng, start, end):
+            first = date.fromisoformat(start)
+            days = (date.fromisoformat(end) - first).days + 1
+            return {
+                "location": {"latitude": lat, "longitude": lng},
+                "climate_data": {
+                    "dates": [first + timedelta(days=i) for i in range(days)],
+                    "temperature_2m_max": [25.0] * days,
+                },
+            }
+
+        fetch = mocker.patch.object(
+            OpenMeteoForecastClient,
+            "_fetch_climate_data",
+            side_effect=period,
+        )
+        client = OpenMeteoForecastClient(cache=cache, cache_dir=str(tmp_path))
+        today = date.today()
+
+        await client.get_climate_data(
+            -22.72,
+            -47.63,
+            (today - timedelta(days=6)).isoformat(),
+            (today + timedelta(days=2)).isoformat(),
+        )
+        result = await client.get_climate_data(
+            -22.78,
+            -47.67,
+            (today - timedelta(days=13)).isoformat(),
+            (today + timedelta(days=2)).isoformat(),
+        )
+
+        key_lat, key_lng = GeographicUtils.snap_to_grid(
+            -22.72, -47.63, client.config.GRID_RESOLUTION
+        )
+        assert fetch.call_count == 2
+        assert fetch.call_args.args == (
+            key_lat,
+            key_lng,
+            (today - timedelta(days=13)).isoformat(),
+            (today - timedelta(days=7)).isoformat(),
+        )
+        assert len(result["climate_data"]["dates"]) == 16
+
+        ttls = [
+            memory_redis.ttls[
+                cache._make_day_key("openmeteo_forecast", key_lat, key_lng, d)
+            ]
+            for d in (today - timedelta(days=1), today)
+        ]
+        assert ttls == [
+            client.config.CACHE_TTL,
+            client.config.FORECAST_CACHE_TTL,
+        ]
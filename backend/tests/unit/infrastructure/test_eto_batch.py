@@ -0,0 +1,230 @@
+"""
+Unit Tests - ETo em lote
+
+Testa EToProcessingService.process_locations e a task
+calculate_eto_batch (agrupamento, fan-out em chord e merge).
+"""
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+from celery.exceptions import Ignore
+from prometheus_client import REGISTRY
+
+from backend.api.services.weather_utils import ElevationUtils
+from backend.core.eto_calculation import eto_services
+from backend.core.eto_calculation.eto_services import EToProcessingService
+from backend.infrastructure.celery.celery_config import progress_emitter
+from backend.infrastructure.celery.tasks import eto_batch
+
+
+def _fused_frame(t_max: float, days: int = 3) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-15", periods=days),
+            "T2M_MAX": np.linspace(t_max, t_max + 2, days),
+            "T2M_MIN": 18.0,
+            "T2M": t_max - 5,
+            "T2M_MEAN": t_max - 5,
+            "RH2M": 65.0,
+            "WS2M": 2.0,
+            "ALLSKY_SFC_SW_DWN": 22.0,
+            "PRECTOTCORR": 1.0,
+            "fusion_mode": "global_fallback",
+        }
+    )
+
+
+@pytest.mark.unit
+class TestProcessLocations:
+    """Downloads limitados, um cálculo FAO-56 para todo o lote."""
+
+    def test_batch_kernel_matches_per_location(self):
+        service = EToProcessingService()
+        sites = [(-10.2, 31.0, 250.0), (-5.5, 34.0, 900.0)]
+
+        single = [
+            service._calculate_raw_eto(
+                _fused_frame(t),
+                lat,
+                elev,
+                ElevationUtils.get_elevation_correction_factor(elev),
+            )
+            for lat, t, elev in sites
+        ]
+        batch = service._calculate_raw_eto_batch(
+            [_fused_frame(t) for _, t, _ in sites],
+            [lat for lat, _, _ in sites],
+            [elev for _, _, elev in sites],
+        )
+
+        for expected, got in zip(single, batch):
+            assert got["et0_mm"].tolist() == expected["et0_mm"].tolist()
+            assert (got["et0_mm"] > 0).all()
+
+    def test_results_in_input_order_with_errors(self, monkeypatch):
+        service = EToProcessingService()
+        active = 0
+        peak = 0
+
+        async def fake_elevations(locations, use_precise):
+            return [(100.0, {"value": 100.0})] * len(locations)
+
+        async def fake_fuse(lat, lon, start, end, sources, warnings):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if lat == 0:
+                raise ValueError("Nenhuma fonte retornou dados válidos")
+            warnings.append(f"ok {lat}")
+            return _fused_frame(30.0)
+
+        monkeypatch.setattr(service, "_get_best_elevations", fake_elevations)
+        monkeypatch.setattr(service, "_download_and_fuse", fake_fuse)
+        locations = [{"lat": lat, "lon": -45.0} for lat in (-9, 0, -7, -6)]
+        progress = []
+
+        results = asyncio.run(
+            service.process_locations(
+                locations,
+                "2024-01-15",
+                "2024-01-17",
+                ["nasa_power"],
+                concurrency=2,
+                on_progress=progress.append,
+            )
+        )
+
+        assert peak == 2
+        assert progress == [1, 2, 3, 4]
+        assert [r.get("location", {}).get("lat") for r in results] == [
+            -9,
+            None,
+            -7,
+            -6,
+        ]
+        assert "error" in results[1]
+        assert results[0]["warnings"] == ["ok -9"]
+        assert len(results[2]["et0_series"]) == 3
+
+    def test_batch_elevation_closes_client_on_error(self, monkeypatch):
+        closed = []
+
+        class FailingClient:
+            async def get_elevations_batch(self, points):
+                raise ConnectionError("OpenTopo fora")
+
+            async def close(self):
+                closed.append(True)
+
+        async def fake_elevation(lat, lon, user_elev, use_precise):
+            return 100.0, {"value": 100.0}
+
+        service = EToProcessingService()
+        monkeypatch.setattr(eto_services, "OpenTopoClient", FailingClient)
+        monkeypatch.setattr(service, "_get_best_elevation", fake_elevation)
+
+        elevations = asyncio.run(
+            service._get_best_elevations([{"lat": -9, "lon": -45}], True)
+        )
+
+        assert closed == [True]
+        assert elevations == [(100.0, {"value": 100.0})]
+
+
+@pytest.mark.unit
+class TestEToBatchTask:
+    """Grupos por fonte/período, chord acima de chunk_size."""
+
+    def test_group_locations_by_sources_and_period(self):
+        groups = eto_batch.group_locations(
+            [
+                {"lat": -9.0, "lon": -45.0},
+                {"lat": -8.0, "lon": -46.0, "start_date": "2024-02-01"},
+                {"lat": -7.0, "lon": -47.0},
+            ],
+            "2024-01-01",
+            "2024-03-01",
+            sources=["nasa_power"],
+            mode="historical_email",
+        )
+
+        sizes = {key[1]: len(group) for key, group in groups.items()}
+        assert sizes == {"2024-01-01": 2, "2024-02-01": 1}
+
+    def test_merge_restores_input_order(self):
+        merged = eto_batch._merge(
+            [
+                [{"index": 2}, {"index": 3, "error": "x"}],
+                [{"index": 0}, {"index": 1}],
+            ],
+            "batch-1",
+            chunks=2,
+        )
+
+        assert [r["index"] for r in merged["results"]] == [0, 1, 2, 3]
+        assert merged["succeeded"] == 3
+        assert merged["failed"] == 1
+
+    def test_large_batch_replaced_by_chord(self, monkeypatch):
+        task = eto_batch.calculate_eto_batch
+        replaced = []
+        monkeypatch.setattr(task, "update_state", lambda **kw: None)
+        monkeypatch.setattr(task, "replace", replaced.append)
+        locations = [{"lat": -9.0 + i * 0.01, "lon": -45.0} for i in range(5)]
+
+        task.run(locations, "2024-01-01", "2024-01-31", chunk_size=2)
+
+        (sig,) = replaced
+        chunks = [part.args[0] for part in sig.tasks]
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert chunks[2][0]["index"] == 4
+        assert sig.body.task.endswith("merge_eto_batch_results")
+
+    def test_replace_is_not_counted_as_failure(self, monkeypatch):
+        task = eto_batch.calculate_eto_batch
+
+        def replace(sig):
+            raise Ignore()
+
+        def count(status):
+            labels = {"task_name": task.name, "status": status}
+            return REGISTRY.get_sample_value("celery_tasks_total", labels) or 0
+
+        monkeypatch.setattr(task, "update_state", lambda **kw: None)
+        monkeypatch.setattr(task, "replace", replace)
+        before = count("IGNORED"), count("FAILURE")
+        locations = [{"lat": -9.0 + i * 0.01, "lon": -45.0} for i in range(3)]
+
+        with pytest.raises(Ignore):
+            task(locations, "2024-01-01", "2024-01-31", chunk_size=2)
+
+        assert (count("IGNORED"), count("FAILURE")) == (
+            before[0] + 1,
+            before[1],
+        )
+
+    def test_chunk_releases_progress_window(self, monkeypatch):
+        def fake_run(task, locations, *args, **kwargs):
+            progress_emitter.submit("batch-9", lambda: None)
+            return []
+
+        monkeypatch.setattr(eto_batch, "_run_locations", fake_run)
+
+        eto_batch.calculate_eto_batch_chunk.run(
+            [], "2024-01-01", "2024-01-31", None, None, "batch-9", 10
+        )
+
+        assert "batch-9" not in progress_emitter._last_sent
+
+    def test_rejects_oversized_batch(self, monkeypatch):
+        monkeypatch.setattr(eto_batch, "MAX_BATCH_LOCATIONS", 2)
+
+        with pytest.raises(ValueError):
+            eto_batch.calculate_eto_batch.run(
+                [{"lat": 0, "lon": 0}] * 3, "2024-01-01", "2024-01-31"
+            )
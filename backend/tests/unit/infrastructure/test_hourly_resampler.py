@@ -0,0 +1,203 @@
+"""
+Unit Tests - HourlyResampler
+
+Testa a reamostragem colunar horária → diária e os agregadores MET
+Norway / NWS que passaram a usá-la.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from backend.api.services.nws_forecast.nws_forecast_client import (
+    NWSForecastClient,
+)
+from backend.api.services.weather_utils import (
+    HourlyResampler,
+    METNorwayAggregationUtils,
+    WeatherAggregationUtils,
+    WeatherConversionUtils,
+)
+
+
+@pytest.mark.unit
+class TestHourlyResampler:
+    """Parse em lote, expansão de intervalos e estatísticas por dia."""
+
+    def test_parse_timestamps_normalizes_offsets_to_utc(self):
+        times = HourlyResampler.parse_timestamps(
+            [
+                "2024-01-15T12:00:00Z",
+                "2024-01-15T09:00:00-03:00",
+                "2024-01-15T12:00:00",
+                None,
+            ]
+        )
+
+        expected = np.datetime64("2024-01-15T12:00:00", "s")
+        assert (times[:3] == expected).all()
+        assert np.isnat(times[3])
+
+    def test_parse_timestamps_accepts_only_datetimes(self):
+        brt = timezone(timedelta(hours=-3))
+        times = HourlyResampler.parse_timestamps(
+            [datetime(2024, 1, 15, 12), datetime(2024, 1, 15, 9, tzinfo=brt)]
+        )
+
+        assert times[0] == np.datetime64("2024-01-15T12:00:00", "s")
+        assert times[1] == times[0]
+
+    def test_expand_intervals_repeat_split_and_start(self):
+        valid_times = [
+            "2024-01-15T00:00:00+00:00/PT2H",
+            "2024-01-15T02:00:00+00:00/P1DT1H",
+        ]
+
+        times, temps = HourlyResampler.expand_intervals(
+            valid_times, [10.0, 20.0]
+        )
+        _, precip = HourlyResampler.expand_intervals(
+            valid_times, [4.0, 25.0], how="split"
+        )
+        start_times, _ = HourlyResampler.expand_intervals(
+            valid_times, [1.0, 2.0], how="start"
+        )
+
+        assert len(times) == 27
+        assert times[1] - times[0] == HourlyResampler.HOUR
+        assert temps[:3].tolist() == [10.0, 10.0, 20.0]
+        assert precip.sum() == pytest.approx(29.0)
+        assert precip[0] == pytest.approx(2.0)
+        assert len(start_times) == 2
+
+    def test_resample_daily_ignores_nan_and_uses_local_days(self):
+        times = HourlyResampler.parse_timestamps(
+            [
+                "2024-01-15T01:00:00Z",  # 14/01 22h em São Paulo
+                "2024-01-15T12:00:00Z",
+                "2024-01-15T15:00:00Z",
+            ]
+        )
+        columns = {
+            "temp": np.array([18.0, 25.0, np.nan]),
+            "rain": np.array([np.nan, np.nan, np.nan]),
+        }
+        how = {
+            "temp_max": ("temp", "max"),
+            "temp_mean": ("temp", "mean"),
+            "rain_sum": ("rain", "sum"),
+        }
+
+        days_utc, rows_utc, _ = HourlyResampler.resample_daily(
+            times, columns, how
+        )
+        days, rows, stats = HourlyResampler.resample_daily(
+            times, columns, how, tz="America/Sao_Paulo"
+        )
+
+        assert days_utc.astype(object).tolist() == [date(2024, 1, 15)]
+        assert rows_utc.tolist() == [3]
+        assert days.astype(object).tolist() == [
+            date(2024, 1, 14),
+            date(2024, 1, 15),
+        ]
+        assert rows.tolist() == [1, 2]
+        assert stats["temp_max"].tolist() == [18.0, 25.0]
+        assert stats["temp_mean"].tolist() == [18.0, 25.0]
+        assert np.isnan(stats["rain_sum"]).all()
+
+
+def _met_entry(time, temp, precip_1h=None, max_6h=None):
+    data = {"instant": {"details": {"air_temperature": temp}}}
+    if precip_1h is not None:
+        data["next_1_hours"] = {"details": {"precipitation_amount": precip_1h}}
+    if max_6h is not None:
+        data["next_6_hours"] = {"details": {"air_temperature_max": max_6h}}
+    return {"time": time, "data": data}
+
+
+@pytest.mark.unit
+class TestMETNorwayAggregation:
+    """Mesmas regras de antes, agora sobre colunas."""
+
+    def test_daily_records(self):
+        timeseries = [
+            _met_entry("2024-01-15T00:00:00Z", 10.0, precip_1h=1.0),
+            _met_entry("2024-01-15T01:00:00Z", 14.0, precip_1h=0.5),
+            _met_entry("2024-01-16T00:00:00Z", 8.0, max_6h=12.0),
+            _met_entry("2024-01-20T00:00:00Z", 30.0),
+        ]
+        start = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 17, tzinfo=timezone.utc)
+
+        raw = METNorwayAggregationUtils.aggregate_hourly_to_daily(
+            timeseries, start, end
+        )
+        records = METNorwayAggregationUtils.calculate_daily_aggregations(
+            raw, WeatherConversionUtils()
+        )
+
+        assert [r["date"] for r in records] == [
+            date(2024, 1, 15),
+            date(2024, 1, 16),
+        ]
+        first, second = records
+        assert first["temp_mean"] == 12.0
+        assert first["temp_max"] == 14.0
+        assert first["precipitation_sum"] == 1.5
+        assert first["humidity_mean"] is None
+        assert second["temp_max"] == 12.0  # 6h preferido
+        assert second["precipitation_sum"] == 0.0
+
+    def test_generic_bucketing_keeps_mapped_entries(self):
+        result = WeatherAggregationUtils.aggregate_hourly_to_daily(
+            timeseries=[
+                {"time": "2024-01-15T12:00:00Z", "air_temperature": 20.5},
+                {"time": "bad", "air_temperature": 1.0},
+            ],
+            start_date=datetime(2024, 1, 15, tzinfo=timezone.utc),
+            end_date=datetime(2024, 1, 16, tzinfo=timezone.utc),
+            field_mapping={"air_temperature": "temperature_2m"},
+        )
+
+        assert list(result) == ["2024-01-15"]
+        entry = result["2024-01-15"][0]
+        assert entry["temperature_2m"] == 20.5
+        assert entry["time"] == datetime(2024, 1, 15, 12, tzinfo=timezone.utc)
+
+
+@pytest.mark.unit
+class TestNWSGridParsing:
+    """Camadas do grid expandidas para horas e alinhadas."""
+
+    def test_parse_forecast_grid_data(self):
+        start = datetime.now(timezone.utc).replace(
+            minute=0, second=0, microsecond=0
+        ) + timedelta(hours=1)
+        iso = start.isoformat()
+        response = {
+            "properties": {
+                "temperature": {
+                    "uom": "wmoUnit:degC",
+                    "values": [{"validTime": f"{iso}/PT3H", "value": 20.0}],
+                },
+                "windSpeed": {
+                    "uom": "wmoUnit:km_h-1",
+                    "values": [{"validTime": f"{iso}/PT3H", "value": 36.0}],
+                },
+                "quantitativePrecipitation": {
+                    "values": [{"validTime": f"{iso}/PT3H", "value": 6.0}]
+                },
+            }
+        }
+
+        hours = NWSForecastClient()._parse_forecast_grid_data(response)
+
+        assert len(hours) == 3
+        assert [h.temp_celsius for h in hours] == [20.0] * 3
+        assert hours[0].wind_speed_ms == pytest.approx(10.0)
+        assert hours[0].wind_speed_2m_ms == pytest.approx(7.48)
+        assert sum(h.precip_mm for h in hours) == pytest.approx(6.0)
+        assert hours[0].humidity_percent is None
+        assert hours[0].timestamp == start.strftime("%Y-%m-%dT%H:%M:%S+00:00")
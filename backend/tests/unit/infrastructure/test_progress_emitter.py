@@ -0,0 +1,170 @@
+"""
+Unit Tests - ProgressEmitter / MonitoredProgressTask
+
+Testa o agrupamento de progresso: o estado vai direto ao result
+backend e só a mensagem pub/sub é agrupada.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.infrastructure.celery import celery_config
+from backend.infrastructure.celery.progress import ProgressEmitter
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def emitter():
+    sent = []
+    clock = _Clock()
+    emitter = ProgressEmitter(
+        lambda task_id, item: sent.append((task_id, item)),
+        min_interval=0.2,
+        clock=clock,
+    )
+    yield emitter, sent, clock
+    for timer in list(emitter._timers.values()):
+        timer.cancel()
+
+
+@pytest.mark.unit
+class TestProgressEmitter:
+    """No máximo um envio por janela; a final sai sempre na hora."""
+
+    def test_first_update_is_sent_immediately(self, emitter):
+        emitter, sent, _ = emitter
+
+        emitter.submit("abc", 10)
+
+        assert sent == [("abc", 10)]
+        assert not emitter._timers
+
+    def test_updates_within_window_are_coalesced(self, emitter):
+        emitter, sent, clock = emitter
+        emitter.submit("abc", 10)
+
+        clock.now += 0.05
+        emitter.submit("abc", 20)
+        emitter.submit("abc", 30)
+        assert sent == [("abc", 10)]
+
+        emitter.flush("abc")
+
+        assert sent == [("abc", 10), ("abc", 30)]
+        assert emitter.coalesced == 1
+
+    def test_tasks_have_independent_windows(self, emitter):
+        emitter, sent, clock = emitter
+        emitter.submit("abc", 10)
+        clock.now += 0.05
+
+        emitter.submit("xyz", 1)
+
+        assert sent == [("abc", 10), ("xyz", 1)]
+
+    def test_final_discards_pending_progress(self, emitter):
+        emitter, sent, clock = emitter
+        emitter.submit("abc", 10)
+        clock.now += 0.05
+        emitter.submit("abc", 90)
+
+        emitter.submit("abc", "done", final=True)
+        emitter.flush("abc")
+
+        assert sent == [("abc", 10), ("abc", "done")]
+        assert "abc" not in emitter._last_sent
+
+    def test_discard_forgets_task(self, emitter):
+        emitter, sent, clock = emitter
+        emitter.submit("abc", 10)
+        clock.now += 0.05
+        emitter.submit("abc", 20)
+
+        emitter.discard("abc")
+        emitter.flush("abc")
+
+        assert sent == [("abc", 10)]
+        assert not emitter._timers
+        assert "abc" not in emitter._last_sent
+
+    def test_send_failure_does_not_raise(self):
+        def send(task_id, item):
+            raise ConnectionError("redis fora")
+
+        emitter = ProgressEmitter(send)
+        emitter.submit("abc", 10)
+
+        assert emitter.sent == 0
+
+
+@celery_config.celery_app.task(name="tests.progress_emitter.noop")
+def _noop_task():
+    return None
+
+
+@pytest.fixture
+def task_emitter(monkeypatch):
+    sent = []
+    emitter = ProgressEmitter(
+        lambda task_id, item: sent.append(task_id), min_interval=60
+    )
+    monkeypatch.setattr(celery_config, "progress_emitter", emitter)
+    backend = MagicMock()
+    monkeypatch.setattr(
+        celery_config.MonitoredProgressTask, "backend", backend
+    )
+    publish = MagicMock()
+    monkeypatch.setattr(
+        celery_config.MonitoredProgressTask, "publish_progress", publish
+    )
+    yield _noop_task, emitter, backend, sent
+    emitter.discard("abc")
+
+
+@pytest.mark.unit
+class TestUpdateState:
+    """store_result em toda chamada; pub/sub agrupado por task."""
+
+    def test_state_is_stored_synchronously(self, task_emitter):
+        task, emitter, backend, sent = task_emitter
+
+        for step in range(3):
+            task.update_state("abc", "PROGRESS", {"step": step})
+
+        states = [c.args[:3] for c in backend.store_result.call_args_list]
+        assert states == [("abc", {"step": s}, "PROGRESS") for s in range(3)]
+        assert sent == ["abc"]
+        assert "abc" in emitter._pending
+
+    def test_retry_discards_pending_progress(self, task_emitter):
+        task, emitter, _, sent = task_emitter
+        task.update_state("abc", "PROGRESS", {"step": 1})
+        task.update_state("abc", "PROGRESS", {"step": 2})
+
+        task.on_retry(RuntimeError("timeout"), "abc", (), {}, None)
+
+        assert sent == ["abc"]
+        assert not emitter._timers
+        assert "abc" not in emitter._last_sent
+
+    def test_success_message_omits_retval(self, task_emitter, monkeypatch):
+        task, emitter, _, _ = task_emitter
+        submitted = []
+        monkeypatch.setattr(
+            emitter,
+            "submit",
+            lambda task_id, item, final=False: submitted.append(item),
+        )
+
+        task.on_success({"eto": [1.0] * 1000}, "abc", (), {})
+
+        (item,) = submitted
+        assert item.keywords == {"status": "SUCCESS", "final": True}
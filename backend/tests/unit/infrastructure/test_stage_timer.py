@@ -0,0 +1,185 @@
+"""
+Unit Tests - Tempo por etapa do pipeline ETo
+
+Testa os spans (context manager e decorator), a marcação de cache,
+o bloco `timings` de process_location e o profiler de execuções
+lentas.
+"""
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+from prometheus_client import REGISTRY
+
+from backend.core.eto_calculation.eto_services import EToProcessingService
+from backend.core.utils import stage_timer
+from backend.core.utils.stage_timer import (
+    collect_timings,
+    mark_cache,
+    profile_if_slow,
+    stage,
+    timed,
+)
+
+
+def _observations(stage_name, source="all", cache="none"):
+    return (
+        REGISTRY.get_sample_value(
+            "eto_stage_duration_seconds_count",
+            {"stage": stage_name, "source": source, "cache": cache},
+        )
+        or 0
+    )
+
+
+def _fused_frame(days: int = 3) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-15", periods=days),
+            "T2M_MAX": np.linspace(30.0, 32.0, days),
+            "T2M_MIN": 18.0,
+            "T2M": 25.0,
+            "T2M_MEAN": 25.0,
+            "RH2M": 65.0,
+            "WS2M": 2.0,
+            "ALLSKY_SFC_SW_DWN": 22.0,
+            "PRECTOTCORR": 1.0,
+            "fusion_mode": "global_fallback",
+        }
+    )
+
+
+@pytest.mark.unit
+class TestStageTimer:
+    """Uma observação por span, com fonte e resultado do cache."""
+
+    def test_context_manager_and_decorators(self):
+        @timed("test_sync")
+        def sync_step():
+            return 1
+
+        @timed("test_async", source="nasa_power")
+        async def async_step():
+            return 2
+
+        before = (
+            _observations("test_cm"),
+            _observations("test_sync"),
+            _observations("test_async", "nasa_power"),
+        )
+
+        with stage("test_cm"):
+            pass
+        assert sync_step() == 1
+        assert asyncio.run(async_step()) == 2
+
+        assert _observations("test_cm") == before[0] + 1
+        assert _observations("test_sync") == before[1] + 1
+        assert _observations("test_async", "nasa_power") == before[2] + 1
+
+    def test_cache_marks(self):
+        before = _observations("test_cache", "met_norway", "partial")
+
+        with stage("test_cache", source="met_norway") as span:
+            mark_cache(True)
+            mark_cache(False)
+
+        assert span.cache == "partial"
+        assert (
+            _observations("test_cache", "met_norway", "partial") == before + 1
+        )
+        mark_cache(True)  # sem span ativo: não faz nada
+
+    def test_timings_collected_across_gather(self):
+        async def fetch(source, hit):
+            # A task do gather herda o span pelo contexto
+            with stage("test_fetch", source=source):
+                await asyncio.gather(asyncio.sleep(0), _mark(hit))
+
+        async def _mark(hit):
+            mark_cache(hit)
+
+        async def run():
+            with collect_timings() as timings:
+                await asyncio.gather(
+                    fetch("nasa_power", True), fetch("met_norway", False)
+                )
+            return timings.as_dict()
+
+        timings = asyncio.run(run())
+
+        stages = timings["stages"]
+        assert stages["test_fetch:nasa_power"]["cache"] == "hit"
+        assert stages["test_fetch:met_norway"]["cache"] == "miss"
+        assert stages["test_fetch:nasa_power"]["calls"] == 1
+        assert timings["total_seconds"] >= 0
+
+    def test_process_location_timings_block(self, monkeypatch):
+        service = EToProcessingService()
+
+        async def fake_elevation(lat, lon, user_elev, use_precise):
+            return 100.0, {"value": 100.0}
+
+        async def fake_fuse(lat, lon, start, end, sources, warnings):
+            with stage("download"), stage("fetch", source="nasa_power"):
+                mark_cache(True)
+            return _fused_frame()
+
+        monkeypatch.setattr(service, "_get_best_elevation", fake_elevation)
+        monkeypatch.setattr(service, "_download_and_fuse", fake_fuse)
+
+        plain = asyncio.run(
+            service.process_location(
+                -10.0, -47.0, "2024-01-15", "2024-01-17", ["nasa_power"]
+            )
+        )
+        timed_result = asyncio.run(
+            service.process_location(
+                -10.0,
+                -47.0,
+                "2024-01-15",
+                "2024-01-17",
+                ["nasa_power"],
+                include_timings=True,
+            )
+        )
+
+        assert "timings" not in plain
+        stages = timed_result["timings"]["stages"]
+        assert {"elevation", "download", "fao56", "build_result"} <= set(
+            stages
+        )
+        assert stages["fetch:nasa_power"]["cache"] == "hit"
+        assert timed_result["et0_series"] == plain["et0_series"]
+
+
+@pytest.mark.unit
+class TestProfileIfSlow:
+    """Perfil salvo só com ETO_PROFILE ativo e acima do limiar."""
+
+    def test_disabled_by_default(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("ETO_PROFILE", raising=False)
+        monkeypatch.setattr(stage_timer, "PROFILE_DIR", tmp_path)
+
+        with profile_if_slow("test"):
+            sum(range(1000))
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_saves_cprofile_when_slow(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("ETO_PROFILE", "cprofile")
+        monkeypatch.setenv("ETO_PROFILE_THRESHOLD", "0")
+        monkeypatch.setattr(stage_timer, "PROFILE_DIR", tmp_path)
+
+        with profile_if_slow("test"):
+            sum(range(1000))
+
+        (profile,) = tmp_path.iterdir()
+        assert profile.suffix == ".prof"
+
+        monkeypatch.setenv("ETO_PROFILE_THRESHOLD", "60")
+        with profile_if_slow("test"):
+            pass
+        assert len(list(tmp_path.iterdir())) == 1
@@ -0,0 +1,199 @@
+"""
+Unit Tests - Contador de visitantes
+
+Testa o pipeline único por carregamento de página (INCR + HyperLogLog)
+e a consolidação dos buckets horários em um único upsert.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from starlette.requests import Request
+
+from backend.api.routes import visitor_routes
+from backend.core.analytics.visitor_counter_service import (
+    VisitorCounterService,
+    visitor_fingerprint,
+)
+from backend.infrastructure.visitor_tracking import VisitorTracker
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name, args))
+
+    def execute(self):
+        self.redis.round_trips += 1
+        return [getattr(self.redis, name)(*args) for name, args in self.calls]
+
+
+class _FakeRedis:
+    """Contadores e HyperLogLogs (conjuntos exatos) em memória."""
+
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+        self.ttls = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def incr(self, key):
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+    def expire(self, key, ttl):
+        self.ttls[key] = ttl
+        return True
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value):
+        self.values[key] = value
+
+    def pfadd(self, key, *items):
+        members = self.sets.setdefault(key, set())
+        before = len(members)
+        members.update(items)
+        return int(len(members) > before)
+
+    def pfcount(self, *keys):
+        return len(set().union(*(self.sets.get(k, set()) for k in keys)))
+
+
+@pytest.mark.unit
+class TestVisitorCounterService:
+    """Trabalho constante por visita; consolidação em lote."""
+
+    def test_increment_is_one_round_trip(self):
+        redis = _FakeRedis()
+        service = VisitorCounterService(redis, None)
+
+        for visitor in ["a", "b", "a", "c", "a"]:
+            result = service.increment_visitor(visitor)
+
+        assert redis.round_trips == 5
+        assert result["total_visitors"] == 5
+        assert result["current_hour_visitors"] == 5
+        assert result["unique_visitors_today"] == 3
+        assert all(ttl > 0 for ttl in redis.ttls.values())
+
+    def test_get_stats_reads_in_one_round_trip(self):
+        redis = _FakeRedis()
+        service = VisitorCounterService(redis, None)
+        service.increment_visitor("a")
+        service.increment_visitor("a")
+        redis.round_trips = 0
+
+        stats = service.get_stats()
+
+        assert redis.round_trips == 1
+        assert stats["current_hour_visitors"] == 2
+        assert stats["current_hour_unique_visitors"] == 1
+
+    def test_sync_upserts_hours_in_one_statement(self):
+        redis = _FakeRedis()
+        db = MagicMock()
+        db.query.return_value.first.return_value = None
+        service = VisitorCounterService(redis, db)
+        for visitor in ["a", "b", "b"]:
+            service.increment_visitor(visitor)
+        redis.round_trips = 0
+
+        result = service.sync_to_database()
+
+        assert result["status"] == "synced"
+        assert result["hours_synced"] == 1
+        assert result["unique_visitors_today"] == 2
+        assert redis.round_trips == 1
+        (call,) = db.execute.call_args_list
+        sql = str(call.args[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (bucket) DO UPDATE" in sql
+        stats = db.add.call_args.args[0]
+        assert stats.total_visitors == 3
+        assert stats.peak_hour.endswith(":00")
+        db.commit.assert_called_once()
+
+    def test_fingerprint_is_stable_and_anonymous(self):
+        first = visitor_fingerprint("10.0.0.1", "Mozilla")
+
+        assert first == visitor_fingerprint("10.0.0.1", "Mozilla")
+        assert first != visitor_fingerprint("10.0.0.2", "Mozilla")
+        assert "10.0.0.1" not in first
+
+
+def _request(host, headers=()):
+    return Request(
+        {
+            "type": "http",
+            "client": (host, 50000),
+            "headers": [(b"user-agent", b"Mozilla"), *headers],
+        }
+    )
+
+
+def _counted_visitors(request, visitor_id):
+    redis = _FakeRedis()
+    asyncio.run(
+        visitor_routes.increment_visitor_count(
+            request, visitor_id, redis_client=redis, db=None
+        )
+    )
+    return set().union(*redis.sets.values())
+
+
+@pytest.mark.unit
+class TestIncrementRoute:
+    """visitor_id e cabeçalhos de IP só valem vindos do frontend."""
+
+    def test_public_client_cannot_choose_identity(self, monkeypatch):
+        monkeypatch.setattr(visitor_routes, "FRONTEND_API_TOKEN", None)
+        request = _request("203.0.113.9", [(b"x-forwarded-for", b"1.2.3.4")])
+
+        assert _counted_visitors(request, "forjado") == {
+            visitor_fingerprint("203.0.113.9", "Mozilla")
+        }
+
+    def test_local_frontend_sends_cookie_id(self, monkeypatch):
+        monkeypatch.setattr(visitor_routes, "FRONTEND_API_TOKEN", None)
+
+        assert _counted_visitors(_request("127.0.0.1"), "abc123") == {"abc123"}
+
+    def test_token_required_when_configured(self, monkeypatch):
+        monkeypatch.setattr(visitor_routes, "FRONTEND_API_TOKEN", "s3cret")
+        signed = _request("10.0.0.5", [(b"x-frontend-token", b"s3cret")])
+
+        assert _counted_visitors(signed, "abc123") == {"abc123"}
+        assert _counted_visitors(_request("127.0.0.1"), "abc123") == {
+            visitor_fingerprint("127.0.0.1", "Mozilla")
+        }
+
+
+@pytest.mark.unit
+class TestVisitorTracker:
+    """VisitorTracker usa os mesmos contadores do serviço."""
+
+    @pytest.mark.asyncio
+    async def test_sessions_counted_once(self):
+        redis = _FakeRedis()
+        tracker = VisitorTracker(redis)
+
+        for session in ["s1", "s2", "s1"]:
+            total = await tracker.increment_visitor(session)
+
+        assert total == 3
+        assert tracker.get_unique_sessions_today() == 2
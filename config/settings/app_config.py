@@ -36,6 +36,12 @@ class DatabaseSettings(BaseSettings):
         default=3600, description="Connection recycle time in seconds"
     )
 
+    # Retenção de climate_data (partições anuais)
+    CLIMATE_DATA_RETENTION_YEARS: int = Field(
+        default=0,
+        description="Years of climate_data partitions to keep (0 = keep all)",
+    )
+
     @property
     def database_url(self) -> str:
         """Retorna a URL de conexão ao banco de dados."""
@@ -206,6 +212,20 @@ class ClimateAPISettings(BaseSettings):
         default="https://api.weather.gov/", description="NWS API base URL"
     )
 
+    # Pool HTTP compartilhado (backend/api/services/http_pool.py)
+    HTTP_MAX_CONNECTIONS: int = Field(
+        default=100, description="Max connections per host pool"
+    )
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        default=20, description="Idle keep-alive connections per host pool"
+    )
+    HTTP_KEEPALIVE_EXPIRY: float = Field(
+        default=30.0, description="Idle connection expiry in seconds"
+    )
+    HTTP2_ENABLED: bool = Field(
+        default=True, description="Use HTTP/2 (needs httpx[http2])"
+    )
+
     # Cache
     CACHE_ENABLED: bool = Field(default=True, description="Enable API cache")
     CACHE_EXPIRE: int = Field(
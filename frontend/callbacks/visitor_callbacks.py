@@ -3,14 +3,40 @@ Callback para contador de visitantes em tempo real.
 """
 
 import logging
+import os
+import uuid
+
+import flask
 import requests
-from dash import Input, Output, callback, no_update
+from dash import Input, Output, callback, callback_context, no_update
 
 logger = logging.getLogger(__name__)
 
 # URL da API backend
 API_BASE_URL = "http://localhost:8000/api/v1"
 
+# Identificador do navegador: atrás do nginx o IP visto aqui é o do proxy
+VISITOR_COOKIE = "eva_visitor_id"
+VISITOR_COOKIE_MAX_AGE = 365 * 86400  # 1 ano
+
+# Mesmo valor configurado no backend (visitor_id só é aceito com ele)
+FRONTEND_API_TOKEN = os.getenv("FRONTEND_API_TOKEN")
+
+
+def _visitor_id() -> str:
+    """ID do navegador (cookie); criado na primeira visita."""
+    visitor_id = flask.request.cookies.get(VISITOR_COOKIE)
+    if not visitor_id:
+        visitor_id = uuid.uuid4().hex
+        callback_context.response.set_cookie(
+            VISITOR_COOKIE,
+            visitor_id,
+            max_age=VISITOR_COOKIE_MAX_AGE,
+            httponly=True,
+            samesite="Lax",
+        )
+    return visitor_id
+
 
 @callback(
     [
@@ -75,9 +101,16 @@ def increment_visitor_on_page_load(pathname):
         no_update: Não atualiza o n_intervals (apenas trigger para efeito colateral)
     """
     try:
-        # Chamar API para incrementar contador
+        # Chamar API para incrementar contador; o cookie do navegador
+        # identifica o visitante único no backend
+        headers = {"User-Agent": flask.request.headers.get("User-Agent", "")}
+        if FRONTEND_API_TOKEN:
+            headers["X-Frontend-Token"] = FRONTEND_API_TOKEN
         response = requests.post(
-            f"{API_BASE_URL}/visitors/increment", timeout=3
+            f"{API_BASE_URL}/visitors/increment",
+            params={"visitor_id": _visitor_id()},
+            headers=headers,
+            timeout=3,
         )
 
         if response.status_code == 200: